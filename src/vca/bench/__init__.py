@@ -0,0 +1,8 @@
+"""vca.bench
+
+Performance benchmarks for the Virtual Chat Assistant.
+
+Each module in this package is runnable with python -m and writes its results
+as JSON so runs can be compared against a stored baseline to catch
+regressions. Benchmarks use only the standard library.
+"""
@@ -0,0 +1,294 @@
+"""vca.bench.classifier
+
+Scaling benchmark for IntentClassifier.classify_result.
+
+User story 49 classifier scaling benchmark
+The intents module documents a performance policy (user story 35) but the
+classifier was never measured. This benchmark generates deterministic
+synthetic rule sets from a handful of phrases up to tens of thousands, and
+input corpora with a realistic length mix including inputs at
+InputValidator.MAX_LEN. For every rule set size it records throughput and tail
+latency of classify_result and writes the results as JSON. A stored baseline
+can be compared against to catch regressions.
+
+Usage
+    python -m vca.bench.classifier --sizes 10,1000,50000 --out results.json
+    python -m vca.bench.classifier --baseline baseline.json
+    python -m vca.bench.classifier --save-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.core.intents import Intent, IntentClassifier
+from vca.core.validator import InputValidator
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 50000)
+DEFAULT_CALLS = 2000
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "classifier.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "classifier_baseline.json"
+
+# Intents that own synonym groups, with the rule labels the classifier already
+# has confidence values for. Token groups only exist for help and exit.
+_PHRASE_RULES: tuple[tuple[Intent, str], ...] = (
+    (Intent.HELP, "help_phrase"),
+    (Intent.HISTORY, "history_phrase"),
+    (Intent.THANKS, "thanks_phrase"),
+    (Intent.GOODBYE, "goodbye_phrase"),
+    (Intent.GREETING, "greeting_phrase"),
+)
+_TOKEN_RULES: tuple[tuple[Intent, str], ...] = (
+    (Intent.HELP, "help_token"),
+    (Intent.EXIT, "exit_token"),
+)
+
+# Length buckets for the mixed corpus: name, weight, min words, max words.
+# Most chat input is short, a few messages are long, and some are pastes that
+# hit the validator limit.
+_LENGTH_BUCKETS: tuple[tuple[str, float, int, int], ...] = (
+    ("short", 0.55, 1, 5),
+    ("medium", 0.30, 6, 30),
+    ("long", 0.10, 31, 200),
+    ("max_len", 0.05, 0, 0),
+)
+
+
+def _pseudo_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+
+def build_vocabulary(size: int, seed: int = 0) -> list[str]:
+    """Return size distinct lowercase pseudo words, deterministic for a seed."""
+    rng = random.Random(seed)
+    words: list[str] = []
+    seen: set[str] = set()
+    while len(words) < max(0, int(size)):
+        w = _pseudo_word(rng)
+        if w not in seen:
+            seen.add(w)
+            words.append(w)
+    return words
+
+
+def build_rule_set(
+    phrase_count: int, seed: int = 0
+) -> dict[Intent, list[tuple[str, set[str], str]]]:
+    """Generate a synonym group table with phrase_count values in total.
+
+    The result has the same shape as IntentClassifier._SYNONYM_GROUPS. About a
+    fifth of the values are single token matches, the rest are phrases of one
+    to four words.
+    """
+    phrase_count = max(1, int(phrase_count))
+    rng = random.Random(seed)
+    vocab = build_vocabulary(max(50, phrase_count), seed=seed)
+
+    buckets: dict[tuple[Intent, str, str], set[str]] = {}
+    produced = 0
+    while produced < phrase_count:
+        if rng.random() < 0.2:
+            intent, rule = rng.choice(_TOKEN_RULES)
+            key = (intent, "token", rule)
+            value = rng.choice(vocab)
+        else:
+            intent, rule = rng.choice(_PHRASE_RULES)
+            key = (intent, "phrase", rule)
+            value = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 4)))
+
+        values = buckets.setdefault(key, set())
+        if value not in values:
+            values.add(value)
+            produced += 1
+
+    groups: dict[Intent, list[tuple[str, set[str], str]]] = {}
+    for (intent, match_type, rule), values in buckets.items():
+        groups.setdefault(intent, []).append((match_type, values, rule))
+    return groups
+
+
+def synthetic_classifier(
+    groups: dict[Intent, list[tuple[str, set[str], str]]],
+) -> IntentClassifier:
+    """Build a classifier instance that uses the given synonym groups."""
+    cls = type(
+        "SyntheticIntentClassifier",
+        (IntentClassifier,),
+        {"_SYNONYM_GROUPS": groups, "_COMPILED_GROUPS": {}},
+    )
+    return cls()
+
+
+def _rule_words(groups: dict[Intent, list[tuple[str, set[str], str]]]) -> list[str]:
+    words: set[str] = set()
+    for intent_groups in groups.values():
+        for _match_type, values, _rule in intent_groups:
+            for value in values:
+                words.update(value.split())
+    return sorted(words)
+
+
+def _sentence(
+    rng: random.Random, words: int, rule_vocab: list[str], filler: list[str]
+) -> str:
+    out: list[str] = []
+    for _ in range(words):
+        pool = rule_vocab if rule_vocab and rng.random() < 0.3 else filler
+        out.append(rng.choice(pool))
+    text = " ".join(out)
+    if rng.random() < 0.25:
+        text += "?"
+    return text
+
+
+def build_corpus(
+    count: int,
+    groups: dict[Intent, list[tuple[str, set[str], str]]],
+    *,
+    seed: int = 0,
+    bucket: str | None = None,
+) -> list[str]:
+    """Generate count cleaned inputs with a realistic length distribution.
+
+    When bucket is given, every input is drawn from that length bucket only.
+    Inputs in the max_len bucket are exactly InputValidator.MAX_LEN characters
+    long after cleaning.
+    """
+    rng = random.Random(seed + 1)
+    rule_vocab = _rule_words(groups)
+    filler = build_vocabulary(500, seed=seed + 2)
+    validator = InputValidator()
+    max_len = validator.MAX_LEN
+
+    names = [b[0] for b in _LENGTH_BUCKETS]
+    weights = [b[1] for b in _LENGTH_BUCKETS]
+    spans = {b[0]: (b[2], b[3]) for b in _LENGTH_BUCKETS}
+
+    corpus: list[str] = []
+    for _ in range(max(0, int(count))):
+        name = bucket if bucket is not None else rng.choices(names, weights)[0]
+        if name == "max_len":
+            text = ""
+            while len(text) < max_len:
+                text += _sentence(rng, 20, rule_vocab, filler) + " "
+            text = text[:max_len].rstrip().ljust(max_len, "x")
+        else:
+            low, high = spans[name]
+            text = _sentence(rng, rng.randint(low, high), rule_vocab, filler)
+        corpus.append(validator.clean(text).text)
+    return corpus
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    calls: int = DEFAULT_CALLS,
+    seed: int = 0,
+    warmup: int = 50,
+    max_seconds: float | None = 10.0,
+) -> dict:
+    """Benchmark classify_result for each rule set size and return the payload."""
+    cases: list[dict] = []
+    for size in sizes:
+        groups = build_rule_set(size, seed=seed)
+        classifier = synthetic_classifier(groups)
+
+        for corpus_name, bucket in (("mixed", None), ("max_len", "max_len")):
+            corpus = build_corpus(calls + warmup, groups, seed=seed, bucket=bucket)
+            samples = time_calls(
+                classifier.classify_result,
+                corpus,
+                warmup=warmup,
+                max_seconds=max_seconds,
+            )
+            stats = summarise(samples)
+            case = {
+                "case": f"rules_{int(size)}_{corpus_name}",
+                "rule_phrases": int(size),
+                "corpus": corpus_name,
+                "mean_input_chars": (
+                    sum(len(t) for t in corpus) / len(corpus) if corpus else 0.0
+                ),
+            }
+            case.update(stats.to_dict())
+            cases.append(case)
+
+    return result_envelope("classifier", cases)
+
+
+def _parse_sizes(raw: str) -> list[int]:
+    sizes = [int(part) for part in raw.split(",") if part.strip()]
+    if not sizes or any(s <= 0 for s in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.classifier",
+        description="Benchmark IntentClassifier against synthetic rule sets.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-seconds", type=float, default=10.0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store this run as the baseline instead of comparing against it",
+    )
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(
+        args.sizes,
+        calls=max(1, args.calls),
+        seed=args.seed,
+        max_seconds=args.max_seconds,
+    )
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<24} calls={case['calls']:<6} "
+            f"throughput={case['throughput_per_s']:.0f}/s "
+            f"p50={case['p50_us']:.1f}us p99={case['p99_us']:.1f}us "
+            f"max={case['max_us']:.1f}us"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
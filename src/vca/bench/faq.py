@@ -0,0 +1,174 @@
+"""vca.bench.faq
+
+Build time and lookup latency of FaqIndex at growing sizes.
+
+User story 55 FAQ index benchmark
+Generates deterministic synthetic FAQ sets where questions start with the
+common openers real FAQs use ("how do i", "what is", ...) followed by topic
+words. For each size it times the lazy index build and three lookup kinds:
+exact questions with different casing and a trailing "?", near misses with
+the words reordered, and questions that match nothing.
+
+Usage
+    python -m vca.bench.faq --sizes 1000,10000,100000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.classifier import build_vocabulary
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.core.faq_index import FaqIndex, FaqPair, faq_key
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_CALLS = 2000
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "faq.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "faq_baseline.json"
+
+_OPENERS = (
+    "how do i",
+    "how can i",
+    "what is",
+    "what are",
+    "where is",
+    "can you",
+    "why does",
+    "when should i",
+    "is it possible to",
+)
+
+
+def build_faq_pairs(count: int, seed: int = 0) -> list[FaqPair]:
+    """Return count distinct synthetic question and answer pairs."""
+    rng = random.Random(seed)
+    vocab = build_vocabulary(max(200, count // 20), seed=seed)
+    pairs: list[FaqPair] = []
+    seen: set[str] = set()
+    while len(pairs) < max(0, int(count)):
+        words = [rng.choice(vocab) for _ in range(rng.randint(2, 5))]
+        question = rng.choice(_OPENERS) + " " + " ".join(words)
+        if question in seen:
+            continue
+        seen.add(question)
+        pairs.append((question, f"Answer {len(pairs)}"))
+    return pairs
+
+
+def build_queries(
+    pairs: Sequence[FaqPair], count: int, seed: int = 0
+) -> dict[str, list[str]]:
+    """Return exact, near miss and no match queries for pairs."""
+    rng = random.Random(seed + 1)
+    exact: list[str] = []
+    near: list[str] = []
+    for _ in range(max(1, count)):
+        question, _answer = rng.choice(pairs)
+        exact.append(question.upper() + "?")
+        words = question.split()
+        rng.shuffle(words)
+        near.append(" ".join(words) + " ?")
+    misses = [
+        " ".join(
+            rng.choice(("tell", "me", "a", "joke", "zzqx", "blorp")) for _ in range(4)
+        )
+        for _ in range(max(1, count))
+    ]
+    return {"exact": exact, "near": near, "miss": misses}
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    calls: int = DEFAULT_CALLS,
+    seed: int = 0,
+) -> dict:
+    """Time index build and lookups for every FAQ set size."""
+    cases: list[dict] = []
+    for size in sizes:
+        pairs = build_faq_pairs(size, seed=seed)
+        index = FaqIndex(pairs)
+
+        start = time.perf_counter()
+        index.match("warm up")
+        build_s = time.perf_counter() - start
+
+        for kind, queries in build_queries(pairs, calls, seed=seed).items():
+            keys = [faq_key(q) for q in queries]
+            hits = sum(1 for k in keys if index.match(k) is not None)
+            stats = summarise(time_calls(index.match, keys, warmup=50))
+            case = {
+                "case": f"faq_{int(size)}_{kind}",
+                "entries": int(size),
+                "lookup": kind,
+                "build_s": build_s,
+                "hit_rate": hits / len(keys),
+            }
+            case.update(stats.to_dict())
+            cases.append(case)
+
+    return result_envelope("faq", cases)
+
+
+def _parse_sizes(raw: str) -> list[int]:
+    sizes = [int(part) for part in raw.split(",") if part.strip()]
+    if not sizes or any(s <= 0 for s in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.faq",
+        description="Benchmark FaqIndex build and lookup latency.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(args.sizes, calls=max(1, args.calls), seed=args.seed)
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<20} build={case['build_s']:.2f}s "
+            f"hits={case['hit_rate']:.2f} p50={case['p50_us']:.1f}us "
+            f"p99={case['p99_us']:.1f}us max={case['max_us']:.1f}us"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""vca.bench.faq_semantic
+
+Build, load and lookup latency of SemanticFaqMatcher at 10k and 100k FAQs.
+
+User story 57 semantic FAQ benchmark
+Uses the synthetic FAQ sets from vca.bench.faq. For each size it times
+vectorising the questions, saving and loading the matrix, and lookups for
+reordered questions and questions that match nothing. Each lookup is one
+matrix vector product over every entry, so latency grows linearly with the
+number of FAQs and the vector dimensions.
+
+Needs NumPy. Without it the benchmark prints a message and exits with 2.
+
+Usage
+    python -m vca.bench.faq_semantic --sizes 10000,100000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.faq import _parse_sizes, build_faq_pairs, build_queries
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.core.faq_index import faq_key
+from vca.core.faq_semantic import (
+    DEFAULT_DIMENSIONS,
+    SemanticFaqMatcher,
+    numpy_available,
+)
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_SIZES = (10000, 100000)
+DEFAULT_CALLS = 500
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "faq_semantic.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "faq_semantic_baseline.json"
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    calls: int = DEFAULT_CALLS,
+    dimensions: int = DEFAULT_DIMENSIONS,
+    seed: int = 0,
+) -> dict:
+    """Time matrix build, save, load and lookups for every FAQ set size."""
+    cases: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            pairs = build_faq_pairs(size, seed=seed)
+
+            start = time.perf_counter()
+            matcher = SemanticFaqMatcher.build(pairs, dimensions=dimensions)
+            build_s = time.perf_counter() - start
+
+            path = Path(tmp) / f"faq_{size}.vec.npz"
+            start = time.perf_counter()
+            matcher.save(path)
+            save_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = SemanticFaqMatcher.load(path, pairs)
+            load_s = time.perf_counter() - start
+            assert loaded is not None
+
+            queries = build_queries(pairs, calls, seed=seed)
+            for kind in ("near", "miss"):
+                keys = [faq_key(q) for q in queries[kind]]
+                hits = sum(1 for k in keys if loaded.match(k) is not None)
+                stats = summarise(time_calls(loaded.match, keys, warmup=20))
+                case = {
+                    "case": f"semantic_{int(size)}_{kind}",
+                    "entries": int(size),
+                    "dimensions": loaded.dimensions,
+                    "lookup": kind,
+                    "build_s": build_s,
+                    "save_s": save_s,
+                    "load_s": load_s,
+                    "file_bytes": path.stat().st_size,
+                    "hit_rate": hits / len(keys),
+                }
+                case.update(stats.to_dict())
+                cases.append(case)
+
+    return result_envelope("faq_semantic", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.faq_semantic",
+        description="Benchmark semantic FAQ matching.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--dimensions", type=int, default=DEFAULT_DIMENSIONS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not numpy_available():
+        print("numpy is not installed, nothing to benchmark")
+        return 2
+
+    payload = run_benchmark(
+        args.sizes,
+        calls=max(1, args.calls),
+        dimensions=args.dimensions,
+        seed=args.seed,
+    )
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<24} build={case['build_s']:.2f}s "
+            f"load={case['load_s']:.2f}s size={case['file_bytes'] // 1024}KiB "
+            f"hits={case['hit_rate']:.2f} p50={case['p50_us']:.1f}us "
+            f"p99={case['p99_us']:.1f}us"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
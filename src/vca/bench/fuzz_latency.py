@@ -0,0 +1,376 @@
+"""vca.bench.fuzz_latency
+
+Worst case latency fuzzing for the per turn text processing stages.
+
+User story 50 pathological input budget
+User input is arbitrary text. The validator loops a punctuation regex until a
+fixpoint, the classifier and engine tokenise with a word regex, and topic
+extraction runs several regex scans. This harness searches for inputs that
+maximise CPU time in each of those stages: long punctuation runs, combining
+mark stacks, emoji sequences, mixed scripts, control characters and inputs
+that look like the patterns the regexes are built around.
+
+The search is deterministic for a seed. Candidates come from a set of
+generators and are then mutated (duplicated, spliced, padded) while keeping
+the slowest inputs found per stage. The report lists the worst cases and
+assert_within_budgets turns the per stage time budgets into assertions so a
+pathological paste cannot stall a worker.
+
+Usage
+    python -m vca.bench.fuzz_latency --iterations 2000 --out report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Mapping, Sequence
+
+from vca.bench.timing import result_envelope, write_results
+from vca.bench.turn_allocations import _MemoryHistory, _NullInteractionLog
+from vca.core.engine import ChatEngine
+from vca.core.validator import InputValidator
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "fuzz_latency.json"
+
+# Raw inputs are allowed to be larger than the validator limit because a paste
+# reaches the validator before truncation.
+DEFAULT_MAX_RAW_CHARS = InputValidator.MAX_LEN * 8
+
+# Per stage wall time budgets in milliseconds for a single call. These are
+# deliberately generous so they hold on slow machines, while still catching
+# super linear behaviour such as catastrophic regex backtracking.
+DEFAULT_BUDGETS_MS: dict[str, float] = {
+    "validate": 25.0,
+    "classify": 25.0,
+    "multi_intent": 10.0,
+    "topic": 10.0,
+}
+
+_PUNCT = "!?.,"
+_EMOJI = (
+    "\U0001f604",
+    "\U0001f44d\U0001f3fd",
+    "\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466",
+    "\U0001f3f3\ufe0f\u200d\U0001f308",
+    "\U0001f1ec\U0001f1e7",
+)
+_COMBINING = ("\u0301", "\u0308", "\u0327", "\u20dd", "\u0489")
+_SCRIPTS = (
+    "hello",
+    "\u041f\u0440\u0438\u0432\u0435\u0442",
+    "\u0645\u0631\u062d\u0628\u0627",
+    "\u4f60\u597d\u4e16\u754c",
+    "\u3053\u3093\u306b\u3061\u306f",
+    "\u05e9\u05dc\u05d5\u05dd",
+    "\u0928\u092e\u0938\u094d\u0924\u0947",
+    "\u0393\u03b5\u03b9\u03ac",
+)
+_CONTROL = ("\t", "\n", "\r\n", "\x00", "\x0b", "\x1f", "\x7f", "\u00a0", "\u2028")
+
+
+@dataclass(frozen=True)
+class WorstCase:
+    """The slowest input found for a stage."""
+
+    stage: str
+    elapsed_us: float
+    raw_length: int
+    generator: str
+    preview: str
+
+
+@dataclass
+class FuzzReport:
+    """Result of a fuzzing run, worst cases first for every stage."""
+
+    iterations: int
+    seed: int
+    max_raw_chars: int
+    worst: dict[str, list[WorstCase]] = field(default_factory=dict)
+
+    def worst_us(self, stage: str) -> float:
+        cases = self.worst.get(stage, [])
+        return cases[0].elapsed_us if cases else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "iterations": self.iterations,
+            "seed": self.seed,
+            "max_raw_chars": self.max_raw_chars,
+            "worst": {
+                stage: [asdict(c) for c in cases] for stage, cases in self.worst.items()
+            },
+        }
+
+
+def _stages() -> dict[str, Callable[[str], object]]:
+    """Build the stage callables.
+
+    validate takes the raw input. The later stages take the cleaned text, the
+    same as in the engine pipeline, so their timings exclude validation.
+    """
+    engine = ChatEngine(history=_MemoryHistory(), interaction_log=_NullInteractionLog())
+    return {
+        "validate": engine._validator.clean,
+        "classify": engine._classifier.classify_result,
+        "multi_intent": engine._looks_like_multi_intent,
+        "topic": engine._responder.extract_topic_from_last_user_message,
+    }
+
+
+def _fit(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit]
+
+
+def _gen_punct_run(rng: random.Random, limit: int) -> str:
+    ch = rng.choice(_PUNCT)
+    return ch * rng.randint(limit // 2, limit)
+
+
+def _gen_alternating_punct(rng: random.Random, limit: int) -> str:
+    unit = "".join(rng.choice(_PUNCT) * rng.randint(1, 5) for _ in range(4))
+    return _fit(unit * (limit // max(1, len(unit)) + 1), limit)
+
+
+def _gen_spaced_punct(rng: random.Random, limit: int) -> str:
+    unit = rng.choice(_PUNCT) * 4 + rng.choice(("\t", " ", "\n", "\x00"))
+    return _fit(unit * (limit // len(unit) + 1), limit)
+
+
+def _gen_combining_stack(rng: random.Random, limit: int) -> str:
+    base = rng.choice("aeiouAEIOU")
+    marks = "".join(rng.choice(_COMBINING) for _ in range(rng.randint(50, 500)))
+    unit = base + marks
+    return _fit(unit * (limit // len(unit) + 1), limit)
+
+
+def _gen_emoji(rng: random.Random, limit: int) -> str:
+    parts: list[str] = []
+    size = 0
+    while size < limit:
+        part = rng.choice(_EMOJI) + rng.choice(("", "!!!!", " ", "\u200d"))
+        parts.append(part)
+        size += len(part)
+    return _fit("".join(parts), limit)
+
+
+def _gen_mixed_scripts(rng: random.Random, limit: int) -> str:
+    parts: list[str] = []
+    size = 0
+    while size < limit:
+        part = rng.choice(_SCRIPTS) + rng.choice((" ", "", "?", "'"))
+        parts.append(part)
+        size += len(part)
+    return _fit("".join(parts), limit)
+
+
+def _gen_controls(rng: random.Random, limit: int) -> str:
+    return "".join(rng.choice(_CONTROL) for _ in range(limit // 2))
+
+
+def _gen_apostrophes(rng: random.Random, limit: int) -> str:
+    unit = rng.choice(("a'", "ab'c", "'", "a''"))
+    return _fit(unit * (limit // len(unit) + 1), limit)
+
+
+def _gen_capitalised(rng: random.Random, limit: int) -> str:
+    unit = rng.choice(("Tell ", "What ", "Ab", "AbcDef", "I "))
+    return _fit(unit * (limit // len(unit) + 1), limit)
+
+
+def _gen_topic_keywords(rng: random.Random, limit: int) -> str:
+    unit = rng.choice(("about ", "regarding ", "about", "regarding  ", "the a an "))
+    return _fit(unit * (limit // len(unit) + 1), limit)
+
+
+def _gen_help_exit_words(rng: random.Random, limit: int) -> str:
+    unit = rng.choice(("help exit ", "h q ", "commands bye ", "help"))
+    return _fit(unit * (limit // len(unit) + 1), limit)
+
+
+_GENERATORS: dict[str, Callable[[random.Random, int], str]] = {
+    "punct_run": _gen_punct_run,
+    "alternating_punct": _gen_alternating_punct,
+    "spaced_punct": _gen_spaced_punct,
+    "combining_stack": _gen_combining_stack,
+    "emoji": _gen_emoji,
+    "mixed_scripts": _gen_mixed_scripts,
+    "controls": _gen_controls,
+    "apostrophes": _gen_apostrophes,
+    "capitalised": _gen_capitalised,
+    "topic_keywords": _gen_topic_keywords,
+    "help_exit_words": _gen_help_exit_words,
+}
+
+
+def _mutate(rng: random.Random, text: str, other: str, limit: int) -> str:
+    """Apply one random structural mutation, keeping the result within limit."""
+    if not text:
+        return _fit(other, limit)
+    op = rng.randrange(5)
+    i = rng.randrange(len(text))
+    if op == 0:
+        out = text + text
+    elif op == 1:
+        out = text[:i] + other[: rng.randint(1, max(1, len(other)))] + text[i:]
+    elif op == 2:
+        out = text[:i] + rng.choice(_PUNCT) * rng.randint(4, 400) + text[i:]
+    elif op == 3:
+        out = text[:i] + rng.choice(_COMBINING) * rng.randint(1, 200) + text[i:]
+    else:
+        out = text[i:] + text[:i]
+    return _fit(out, limit)
+
+
+def _time_once(fn: Callable[[str], object], text: str, repeats: int) -> float:
+    """Return the fastest of repeats timings in microseconds to reduce noise."""
+    best = None
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter_ns()
+        fn(text)
+        elapsed = time.perf_counter_ns() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return (best or 0) / 1000.0
+
+
+def run_fuzz(
+    iterations: int = 500,
+    *,
+    seed: int = 0,
+    max_raw_chars: int = DEFAULT_MAX_RAW_CHARS,
+    keep: int = 5,
+    repeats: int = 2,
+) -> FuzzReport:
+    """Search for slow inputs and return the worst keep cases per stage."""
+    rng = random.Random(seed)
+    stages = _stages()
+    validator = InputValidator()
+    limit = max(1, int(max_raw_chars))
+
+    # stage -> list of (elapsed_us, generator, text), slowest first
+    pools: dict[str, list[tuple[float, str, str]]] = {s: [] for s in stages}
+
+    def record(stage: str, elapsed: float, origin: str, text: str) -> None:
+        pool = pools[stage]
+        if any(t == text for _e, _o, t in pool):
+            return
+        pool.append((elapsed, origin, text))
+        pool.sort(key=lambda item: item[0], reverse=True)
+        del pool[keep:]
+
+    names = sorted(_GENERATORS)
+    for step in range(max(0, int(iterations))):
+        # Seed every generator once, then split between fresh candidates and
+        # mutations of the current slowest inputs.
+        if step < len(names) or rng.random() < 0.4:
+            origin = (
+                names[step % len(names)] if step < len(names) else rng.choice(names)
+            )
+            text = _GENERATORS[origin](rng, rng.randint(1, limit))
+        else:
+            stage = rng.choice(list(stages))
+            pool = pools[stage] or pools["validate"]
+            _e, parent_origin, parent = rng.choice(pool)
+            donor = _GENERATORS[rng.choice(names)](rng, rng.randint(1, 64))
+            origin = parent_origin + "+mut"
+            text = _mutate(rng, parent, donor, limit)
+
+        cleaned = validator.clean(text).text
+        for stage, fn in stages.items():
+            arg = text if stage == "validate" else cleaned
+            record(stage, _time_once(fn, arg, repeats), origin, text)
+
+    report = FuzzReport(iterations=int(iterations), seed=seed, max_raw_chars=limit)
+    for stage, pool in pools.items():
+        report.worst[stage] = [
+            WorstCase(
+                stage=stage,
+                elapsed_us=elapsed,
+                raw_length=len(text),
+                generator=origin,
+                preview=repr(text[:60]),
+            )
+            for elapsed, origin, text in pool
+        ]
+    return report
+
+
+def budget_violations(
+    report: FuzzReport, budgets_ms: Mapping[str, float] | None = None
+) -> list[str]:
+    """Return readable lines for every stage whose worst case exceeds its budget."""
+    budgets = DEFAULT_BUDGETS_MS if budgets_ms is None else budgets_ms
+    lines: list[str] = []
+    for stage, budget in budgets.items():
+        worst = report.worst_us(stage)
+        if worst > float(budget) * 1000.0:
+            case = report.worst[stage][0]
+            lines.append(
+                f"stage={stage} worst_ms={worst / 1000.0:.2f} budget_ms={budget:.2f} "
+                f"generator={case.generator} raw_length={case.raw_length}"
+            )
+    return lines
+
+
+def assert_within_budgets(
+    report: FuzzReport, budgets_ms: Mapping[str, float] | None = None
+) -> None:
+    """Raise AssertionError when any stage exceeds its per call time budget."""
+    violations = budget_violations(report, budgets_ms)
+    assert not violations, "Per stage time budget exceeded: " + "; ".join(violations)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.fuzz_latency",
+        description="Search for inputs that maximise per turn CPU time.",
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-raw-chars", type=int, default=DEFAULT_MAX_RAW_CHARS)
+    parser.add_argument("--keep", type=int, default=5)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    args = parser.parse_args(argv)
+
+    report = run_fuzz(
+        args.iterations,
+        seed=args.seed,
+        max_raw_chars=args.max_raw_chars,
+        keep=max(1, args.keep),
+    )
+    write_results(
+        args.out,
+        result_envelope(
+            "fuzz_latency",
+            [
+                {"case": stage, "worst_us": report.worst_us(stage)}
+                for stage in report.worst
+            ],
+        )
+        | {"report": report.to_dict()},
+    )
+
+    for stage, cases in report.worst.items():
+        print(f"{stage}:")
+        for c in cases:
+            print(
+                f"  {c.elapsed_us:10.1f}us len={c.raw_length:<6} "
+                f"{c.generator:<28} {c.preview}"
+            )
+    print(f"Report written to {args.out}")
+
+    violations = budget_violations(report)
+    for line in violations:
+        print("BUDGET EXCEEDED " + line)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
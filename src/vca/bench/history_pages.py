@@ -0,0 +1,138 @@
+"""vca.bench.history_pages
+
+Latency of paged history reads against a full history load.
+
+User story 60 paged history benchmark
+Writes synthetic JSONL histories of growing size and times read_page for the
+newest, a middle and the oldest page, read_since for a date in the middle,
+and load_turns of the whole file for comparison. The line index is built
+once before timing, as it is after the first paged read in a session.
+
+Usage
+    python -m vca.bench.history_pages --sizes 100,1000,10000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.faq import _parse_sizes
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.domain.constants import HISTORY_PAGE_SIZE
+from vca.domain.paths import DATA_DIR
+from vca.storage.history_store import HistoryStore
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_CALLS = 500
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "history_pages.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "history_pages_baseline.json"
+
+_START = _dt.datetime(2026, 1, 1, tzinfo=_dt.timezone.utc)
+
+
+def write_history(path: Path, turns: int) -> None:
+    """Write turns synthetic turns, one minute apart, in the store's format."""
+    with path.open("w", encoding="utf-8", newline="\n") as f:
+        for i in range(turns):
+            ts = (_START + _dt.timedelta(minutes=i)).isoformat()
+            for role, content in (
+                ("user", f"question number {i} about the coursework"),
+                ("assistant", f"I think you are asking a question: number {i}"),
+            ):
+                rec = {"ts": ts, "role": role, "content": content}
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES, *, calls: int = DEFAULT_CALLS
+) -> dict:
+    """Time paged reads and a full load for every history size."""
+    cases: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = Path(tmp) / f"history_{size}.jsonl"
+            write_history(path, size)
+            store = HistoryStore(path, max_turns=size)
+
+            start = time.perf_counter()
+            pages = store.read_page(1, HISTORY_PAGE_SIZE).pages
+            index_s = time.perf_counter() - start
+
+            middle = _START + _dt.timedelta(minutes=size // 2)
+            runs = {
+                "page_newest": lambda _: store.read_page(1, HISTORY_PAGE_SIZE),
+                "page_middle": lambda _: store.read_page(
+                    max(1, pages // 2), HISTORY_PAGE_SIZE
+                ),
+                "page_oldest": lambda _: store.read_page(pages, HISTORY_PAGE_SIZE),
+                "since_middle": lambda _: store.read_since(middle, HISTORY_PAGE_SIZE),
+                "load_all": lambda _: store.load_turns(max_turns=0),
+            }
+            for name, fn in runs.items():
+                n = max(5, calls // 20) if name == "load_all" else calls
+                stats = summarise(time_calls(fn, range(n), warmup=3))
+                case = {
+                    "case": f"history_{int(size)}_{name}",
+                    "turns": int(size),
+                    "index_build_s": index_s,
+                }
+                case.update(stats.to_dict())
+                cases.append(case)
+
+    return result_envelope("history_pages", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.history_pages",
+        description="Benchmark paged history reads.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(args.sizes, calls=max(1, args.calls))
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<30} p50={case['p50_us']:.1f}us "
+            f"p99={case['p99_us']:.1f}us index={case['index_build_s'] * 1000:.1f}ms"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""vca.bench.history_search
+
+Latency of history search against scanning the whole history.
+
+User story 61 history search benchmark
+Writes synthetic JSONL histories of growing size with their search logs and
+times HistoryStore.search_turns for a rare word, a common word combined with
+a rare one, a common word alone and an intent facet. A linear scan of the
+loaded turns for the rare word is timed for comparison. The search log is
+loaded once before timing, as it is after the first search in a session.
+
+Usage
+    python -m vca.bench.history_search --sizes 1000,10000,100000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.faq import _parse_sizes
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.domain.constants import HISTORY_PAGE_SIZE
+from vca.domain.paths import DATA_DIR
+from vca.storage.history_search import HistorySearchIndex
+from vca.storage.history_store import HistoryStore
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_CALLS = 200
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "history_search.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "history_search_baseline.json"
+
+_START = _dt.datetime(2026, 1, 1, tzinfo=_dt.timezone.utc)
+_TOPICS = ("paris", "exams", "library", "weather", "deadline", "python", "music")
+_INTENTS = ("question", "greeting", "unknown", "history")
+
+
+def write_history(path: Path, turns: int) -> None:
+    """Write turns synthetic turns and their search log."""
+    rows = []
+    with path.open("w", encoding="utf-8", newline="\n") as f:
+        for i in range(turns):
+            ts = (_START + _dt.timedelta(minutes=i)).isoformat()
+            topic = _TOPICS[i % len(_TOPICS)]
+            user = f"tell me about {topic} please, note{i % 997}"
+            assistant = f"I think you are asking a question about {topic}"
+            intent = _INTENTS[i % len(_INTENTS)]
+            f.write(
+                json.dumps(
+                    {"ts": ts, "role": "user", "content": user, "intent": intent}
+                )
+                + "\n"
+            )
+            f.write(
+                json.dumps({"ts": ts, "role": "assistant", "content": assistant}) + "\n"
+            )
+            rows.append((user, assistant, ts, intent))
+    HistorySearchIndex(path).rebuild(rows)
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES, *, calls: int = DEFAULT_CALLS
+) -> dict:
+    """Time indexed searches and a linear scan for every history size."""
+    cases: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = Path(tmp) / f"history_{size}.jsonl"
+            write_history(path, size)
+            store = HistoryStore(path, max_turns=size)
+
+            start = time.perf_counter()
+            store.search_turns("paris", limit=HISTORY_PAGE_SIZE)
+            load_s = time.perf_counter() - start
+
+            def scan(_):
+                return [
+                    t
+                    for t in store.load_turns(max_turns=0)
+                    if "note7" in t.user_text.casefold().split()
+                ]
+
+            runs = {
+                "rare": lambda _: store.search_turns("note7", limit=HISTORY_PAGE_SIZE),
+                "common_and_rare": lambda _: store.search_turns(
+                    "about note7", limit=HISTORY_PAGE_SIZE
+                ),
+                "common": lambda _: store.search_turns(
+                    "paris", limit=HISTORY_PAGE_SIZE
+                ),
+                "intent": lambda _: store.search_turns(
+                    "paris", "question", limit=HISTORY_PAGE_SIZE
+                ),
+                "linear_scan": scan,
+            }
+            for name, fn in runs.items():
+                n = max(3, calls // 40) if name == "linear_scan" else calls
+                stats = summarise(time_calls(fn, range(n), warmup=2))
+                case = {
+                    "case": f"history_{int(size)}_{name}",
+                    "turns": int(size),
+                    "index_load_s": load_s,
+                }
+                case.update(stats.to_dict())
+                cases.append(case)
+
+    return result_envelope("history_search", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.history_search",
+        description="Benchmark history search.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(args.sizes, calls=max(1, args.calls))
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<32} p50={case['p50_us']:.1f}us "
+            f"p99={case['p99_us']:.1f}us load={case['index_load_s'] * 1000:.1f}ms"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""vca.bench.idle_expiry
+
+Cost of finding idle sessions with a TimerWheel and with a scan.
+
+User story 72 idle expiry
+Each size starts with that many sessions last seen at random times within
+one TTL. The clock then moves one second at a time for steps seconds. Every
+second a few sessions get a turn (a touch), and the sessions idle for a TTL
+are found and removed (a check), about sessions / TTL of them per second.
+The wheel files each touch as a deadline and a check advances it; the scan
+keeps the last seen time of each session in a dict and a check walks the
+whole dict. Both must expire the same sessions.
+
+Usage
+    python -m vca.bench.idle_expiry --sizes 10000,100000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.faq import _parse_sizes
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    write_results,
+)
+from vca.domain.paths import DATA_DIR
+from vca.domain.timer_wheel import TimerWheel
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+DEFAULT_TTL = 1800
+DEFAULT_STEPS = 120
+DEFAULT_TOUCHES = 100
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "idle_expiry.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "idle_expiry_baseline.json"
+
+
+def _workload(
+    size: int, ttl: int, steps: int, touches: int, seed: int = 72
+) -> tuple[list[float], list[list[int]]]:
+    rng = random.Random(seed)
+    seen = [rng.uniform(0, ttl) for _ in range(size)]
+    touched = [[rng.randrange(size) for _ in range(touches)] for _ in range(steps)]
+    return seen, touched
+
+
+def run_wheel(seen: list[float], steps: list[list[int]], ttl: int) -> dict:
+    wheel = TimerWheel(start=0.0)
+    for session, last in enumerate(seen):
+        wheel.schedule(session, last + ttl)
+    touch_ns: list[int] = []
+    check_ns: list[int] = []
+    expired: list[int] = []
+    clock = time.perf_counter_ns
+    now = float(ttl)
+    for touched in steps:
+        now += 1
+        start = clock()
+        for session in touched:
+            wheel.schedule(session, now + ttl)
+        touch_ns.append((clock() - start) // len(touched))
+        start = clock()
+        expired.extend(wheel.advance(now))
+        check_ns.append(clock() - start)
+    return {"touch": touch_ns, "check": check_ns, "expired": expired}
+
+
+def run_scan(seen: list[float], steps: list[list[int]], ttl: int) -> dict:
+    last_seen = dict(enumerate(seen))
+    touch_ns: list[int] = []
+    check_ns: list[int] = []
+    expired: list[int] = []
+    clock = time.perf_counter_ns
+    now = float(ttl)
+    for touched in steps:
+        now += 1
+        start = clock()
+        for session in touched:
+            last_seen[session] = now
+        touch_ns.append((clock() - start) // len(touched))
+        start = clock()
+        idle = [s for s, last in last_seen.items() if last + ttl <= now]
+        for session in idle:
+            del last_seen[session]
+        expired.extend(idle)
+        check_ns.append(clock() - start)
+    return {"touch": touch_ns, "check": check_ns, "expired": expired}
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    ttl: int = DEFAULT_TTL,
+    steps: int = DEFAULT_STEPS,
+    touches: int = DEFAULT_TOUCHES,
+) -> dict:
+    cases: list[dict] = []
+    for size in sizes:
+        seen, touched = _workload(size, ttl, steps, touches)
+        runs = {"wheel": run_wheel, "scan": run_scan}
+        results = {name: fn(seen, touched, ttl) for name, fn in runs.items()}
+        same = sorted(results["wheel"]["expired"]) == sorted(results["scan"]["expired"])
+        for name, result in results.items():
+            for op in ("touch", "check"):
+                case = {
+                    "case": f"idle_{int(size)}_{name}_{op}",
+                    "sessions": int(size),
+                    "expired": len(result["expired"]),
+                    "same_expired": same,
+                }
+                case.update(summarise(result[op]).to_dict())
+                cases.append(case)
+    return result_envelope("idle_expiry", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.idle_expiry",
+        description="Benchmark idle session expiry with a timer wheel and a scan.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--ttl", type=int, default=DEFAULT_TTL)
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS)
+    parser.add_argument("--touches", type=int, default=DEFAULT_TOUCHES)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(
+        args.sizes,
+        ttl=max(1, args.ttl),
+        steps=max(1, args.steps),
+        touches=max(1, args.touches),
+    )
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<30} p50={case['p50_us']:.1f}us "
+            f"p99={case['p99_us']:.1f}us expired={case['expired']}"
+        )
+    print(f"Results written to {args.out}")
+    if not all(case["same_expired"] for case in payload["cases"]):
+        print("Wheel and scan expired different sessions")
+        return 1
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
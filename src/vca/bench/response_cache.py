@@ -0,0 +1,178 @@
+"""vca.bench.response_cache
+
+Reply latency with and without the response cache.
+
+User story 64 response cache benchmark
+Builds a synthetic knowledge base and replays a corpus of questions and
+greetings in which a few distinct inputs repeat often, as they do in real
+sessions. Every reply goes through ResponseGenerator.generate, once without
+a cache and once with a ResponseCache, and the per call latency and the
+cache hit rate are recorded. Replies are compared as well, so a run fails if
+the cache ever changes an answer.
+
+Usage
+    python -m vca.bench.response_cache --turns 5000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.core.response_cache import DEFAULT_CACHE_SIZE, ResponseCache
+from vca.core.responses import ResponseGenerator
+from vca.domain.paths import DATA_DIR
+from vca.domain.session import Message
+from vca.kb.index import KnowledgeBase, Passage, build_index
+
+DEFAULT_TURNS = 5000
+DEFAULT_PASSAGES = 2000
+DEFAULT_DISTINCT = 150
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "response_cache.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "response_cache_baseline.json"
+
+_WORDS = (
+    "sprint velocity backlog storage history exit library exam deadline python "
+    "module lecture coursework report review test coverage release branch merge"
+).split()
+
+
+def _passages(count: int, rng: random.Random) -> list[Passage]:
+    return [
+        Passage(
+            f"doc{i % 40}.md",
+            " ".join(rng.choice(_WORDS) for _ in range(30)) + f" item{i}.",
+        )
+        for i in range(count)
+    ]
+
+
+def replay_corpus(turns: int, distinct: int, seed: int = 64) -> list[tuple]:
+    """Return (intent, text, recent) triples where a few inputs dominate."""
+    rng = random.Random(seed)
+    questions = [
+        "what is " + " ".join(rng.sample(_WORDS, 3)) + "?" for _ in range(distinct)
+    ]
+    recents = [
+        [Message("user", "Tell me about Python"), Message("user", "x")],
+        [Message("user", "what about the library"), Message("user", "x")],
+        [Message("user", "x")],
+    ]
+    weights = [1.0 / (rank + 1) for rank in range(distinct)]
+    corpus = []
+    for _ in range(turns):
+        intent = "greeting" if rng.random() < 0.1 else "question"
+        text = "hello" if intent == "greeting" else rng.choices(questions, weights)[0]
+        corpus.append((intent, text, rng.choice(recents)))
+    return corpus
+
+
+def run_benchmark(
+    *,
+    turns: int = DEFAULT_TURNS,
+    passages: int = DEFAULT_PASSAGES,
+    distinct: int = DEFAULT_DISTINCT,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> dict:
+    """Replay the corpus without and with the cache."""
+    rng = random.Random(7)
+    corpus = replay_corpus(turns, distinct)
+    cases: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "kb.idx"
+        build_index(_passages(passages, rng), path)
+        kb = KnowledgeBase(path)
+        try:
+            plain = ResponseGenerator(knowledge_base=kb)
+            checked = ResponseGenerator(
+                knowledge_base=kb, response_cache=ResponseCache(cache_size)
+            )
+            mismatches = sum(
+                plain.generate(i, t, r) != checked.generate(i, t, r)
+                for i, t, r in corpus
+            )
+
+            cache = ResponseCache(cache_size)
+            cached = ResponseGenerator(knowledge_base=kb, response_cache=cache)
+
+            for name, responder in (("uncached", plain), ("cached", cached)):
+                stats = summarise(
+                    time_calls(lambda c: responder.generate(*c), corpus, warmup=0)
+                )
+                case = {
+                    "case": f"replay_{int(turns)}_{name}",
+                    "turns": int(turns),
+                    "distinct_questions": int(distinct),
+                    "mismatches": int(mismatches),
+                    "hit_rate": cache.stats()["hit_rate"] if name == "cached" else 0.0,
+                }
+                case.update(stats.to_dict())
+                cases.append(case)
+        finally:
+            kb.close()
+
+    return result_envelope("response_cache", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.response_cache",
+        description="Benchmark the response cache on a replayed corpus.",
+    )
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS)
+    parser.add_argument("--passages", type=int, default=DEFAULT_PASSAGES)
+    parser.add_argument("--distinct", type=int, default=DEFAULT_DISTINCT)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(
+        turns=max(1, args.turns),
+        passages=max(1, args.passages),
+        distinct=max(1, args.distinct),
+        cache_size=max(1, args.cache_size),
+    )
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<24} p50={case['p50_us']:.1f}us "
+            f"p99={case['p99_us']:.1f}us hit_rate={case['hit_rate']:.2f} "
+            f"mismatches={case['mismatches']}"
+        )
+    print(f"Results written to {args.out}")
+    if payload["cases"] and payload["cases"][0]["mismatches"]:
+        return 1
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
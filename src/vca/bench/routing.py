@@ -0,0 +1,158 @@
+"""vca.bench.routing
+
+Routing and dispatch overhead of response handlers.
+
+User story 54 handler dispatch benchmark
+Compares the previous dispatch, which built a dict of bound methods on every
+route call and invoked handlers with a try/except TypeError retry, against
+the HandlerRegistry lookup with a precomputed call adapter. Handler bodies
+are replaced by trivial functions so only the routing cost is measured. A
+two argument handler is timed separately because the previous dispatch paid
+for a failed call and an exception before reaching it.
+
+Usage
+    python -m vca.bench.routing --calls 50000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.core.handler_registry import HandlerRegistry
+from vca.core.intents import Intent
+from vca.core.responses import ResponseGenerator
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_CALLS = 50000
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "routing.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "routing_baseline.json"
+
+_INTENTS = [i for i in Intent] + ["ambiguous", "not an intent"]
+
+
+def _three_args(_text, _recent, _context=None) -> str:
+    return ""
+
+
+def _two_args(_text, _recent) -> str:
+    return ""
+
+
+class _LegacyDispatch:
+    """The dispatch ResponseGenerator used before the handler registry."""
+
+    def __init__(self, handler) -> None:
+        for name in ResponseGenerator._BUILTIN_HANDLERS.values():
+            setattr(self, name, handler)
+
+    def route(self, intent):
+        if intent is None:
+            safe_intent = "unknown"
+        elif hasattr(intent, "value"):
+            safe_intent = str(intent.value)
+        else:
+            safe_intent = str(intent)
+
+        safe_intent = safe_intent.strip().casefold()
+
+        handlers = {
+            "empty": self.handle_empty,
+            "help": self.handle_help,
+            "history": self.handle_history,
+            "exit": self.handle_exit,
+            "greeting": self.handle_greeting,
+            "question": self.handle_question,
+            "thanks": self.handle_thanks,
+            "goodbye": self.handle_goodbye,
+            "ambiguous": self.handle_ambiguous,
+            "unknown": self.handle_unknown,
+        }
+
+        return handlers.get(safe_intent, self.handle_unknown)
+
+    def dispatch(self, intent) -> str:
+        handler = self.route(intent)
+        try:
+            return handler("text", None, None)
+        except TypeError:
+            return handler("text", None)
+
+
+def _registry_with(handler) -> HandlerRegistry:
+    registry = HandlerRegistry()
+    for intent in ResponseGenerator._BUILTIN_HANDLERS:
+        registry.register(intent, handler)
+    return registry
+
+
+def run_benchmark(*, calls: int = DEFAULT_CALLS) -> dict:
+    """Time route plus invoke for the legacy dispatch and the registry."""
+    stream = [_INTENTS[i % len(_INTENTS)] for i in range(max(1, calls))]
+    cases: list[dict] = []
+
+    for arity, handler in (("three_args", _three_args), ("two_args", _two_args)):
+        legacy = _LegacyDispatch(handler)
+        registry = _registry_with(handler)
+
+        def via_registry(intent, registry=registry) -> str:
+            return registry.lookup(intent)("text", None, None)
+
+        for name, fn in (("legacy", legacy.dispatch), ("registry", via_registry)):
+            stats = summarise(time_calls(fn, stream, warmup=200))
+            case = {"case": f"{name}_{arity}", "dispatch": name, "handler": arity}
+            case.update(stats.to_dict())
+            cases.append(case)
+
+    return result_envelope("routing", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.routing",
+        description="Benchmark response handler routing and dispatch.",
+    )
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(calls=args.calls)
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<20} mean={case['mean_us']:.3f}us "
+            f"p99={case['p99_us']:.3f}us"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
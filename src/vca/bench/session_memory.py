@@ -0,0 +1,198 @@
+"""vca.bench.session_memory
+
+Bytes held by one conversation session at full capacity.
+
+User story 65 compact domain objects
+A full session holds HISTORY_MAX_TURNS * 2 messages and HISTORY_MAX_TURNS
+turns, so per object overhead adds up. This benchmark fills sessions to that
+capacity and measures the memory they hold with tracemalloc. Message texts
+are created before tracing starts and are shared by every layout, so the
+numbers compare what the session itself keeps.
+
+User story 66 turn ring
+The current session is filled the way ChatEngine fills it: a user message,
+the assistant reply, then the stored copy of the turn read back from the
+history store. It is compared with a copy of the earlier layout, plain
+frozen dataclasses with a datetime per message, kept both as two Message
+objects and as one ChatTurn with two ISO timestamps per turn.
+
+User story 68 byte budgets
+With --max-bytes the ring is also filled with that byte budget per session
+(case session_ring_budget), to show the memory the budget saves and what
+counting the bytes costs per message.
+
+Usage
+    python -m vca.bench.session_memory --sessions 20 --max-bytes 16384
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Sequence
+
+from vca.bench.timing import result_envelope, write_results
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.constants import HISTORY_MAX_TURNS
+from vca.domain.paths import DATA_DIR
+from vca.domain.session import ConversationSession
+from vca.domain.topics import extract_topic
+
+DEFAULT_SESSIONS = 20
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "session_memory.json"
+
+
+@dataclass(frozen=True)
+class _LegacyMessage:
+    role: str
+    content: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    topic: str | None = None
+    intent: str | None = None
+
+
+@dataclass(frozen=True)
+class _LegacyTurn:
+    user_text: str
+    assistant_text: str
+    user_ts: str | None = None
+    assistant_ts: str | None = None
+    intent: str | None = None
+    confidence: float | None = None
+    rule: str | None = None
+
+
+def _utc_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def session_texts(turns: int) -> list[tuple[str, str]]:
+    """Return (user text, assistant text) for each turn."""
+    return [
+        (
+            f"tell me about topic number {i} please",
+            f"Here is what I know about topic {i}.",
+        )
+        for i in range(turns)
+    ]
+
+
+def fill_session(
+    texts: list[tuple[str, str]], max_bytes: int = 0
+) -> ConversationSession:
+    session = ConversationSession(max_bytes=max_bytes)
+    for user, assistant in texts:
+        session.add_message("user", user)
+        session.add_message("assistant", assistant, intent="question")
+        session.adopt_stored_turn(
+            ChatTurn(user, assistant, _utc_iso(), _utc_iso(), "question", 0.9, "kw")
+        )
+    return session
+
+
+def fill_legacy_session(texts: list[tuple[str, str]]) -> object:
+    messages: deque = deque()
+    turns: deque = deque()
+    for user, assistant in texts:
+        messages.append(_LegacyMessage("user", user, topic=extract_topic(user)))
+        messages.append(_LegacyMessage("assistant", assistant, intent="question"))
+        turns.append(
+            _LegacyTurn(user, assistant, _utc_iso(), _utc_iso(), "question", 0.9, "kw")
+        )
+    return messages, turns
+
+
+def measure(
+    fill: Callable[[list], object], texts: list, sessions: int
+) -> tuple[float, float]:
+    """Return (bytes per session, microseconds per message) for fill.
+
+    The build time comes from a second, untraced pass, because tracemalloc
+    slows every allocation down.
+    """
+    tracemalloc.start()
+    try:
+        before, _peak = tracemalloc.get_traced_memory()
+        kept = [fill(texts) for _ in range(sessions)]
+        after, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    start = time.perf_counter_ns()
+    kept = [fill(texts) for _ in range(sessions)]
+    elapsed_ns = time.perf_counter_ns() - start
+    del kept
+    per_message_us = elapsed_ns / 1000 / (sessions * len(texts) * 2)
+    return (after - before) / sessions, per_message_us
+
+
+def run_benchmark(
+    *,
+    sessions: int = DEFAULT_SESSIONS,
+    turns: int = HISTORY_MAX_TURNS,
+    max_bytes: int = 0,
+) -> dict:
+    texts = session_texts(turns)
+    fills: list[tuple[str, Callable[[list], object]]] = [
+        ("ring", fill_session),
+        ("legacy", fill_legacy_session),
+    ]
+    if max_bytes > 0:
+        fills.append(("ring_budget", lambda t: fill_session(t, max_bytes)))
+    cases: list[dict] = []
+    for name, fill in fills:
+        per_session, per_message_us = measure(fill, texts, sessions)
+        sample = fill(texts)
+        messages = len(texts) * 2
+        if isinstance(sample, ConversationSession):
+            messages = len(sample.messages)
+        cases.append(
+            {
+                "case": f"session_{name}",
+                "sessions": int(sessions),
+                "messages": messages,
+                "turns": len(texts),
+                "max_bytes": int(max_bytes) if name == "ring_budget" else 0,
+                "bytes_per_session": per_session,
+                "bytes_per_message": per_session / messages,
+                "build_us_per_message": per_message_us,
+            }
+        )
+    return result_envelope("session_memory", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.session_memory",
+        description="Measure the memory held by full conversation sessions.",
+    )
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--turns", type=int, default=HISTORY_MAX_TURNS)
+    parser.add_argument("--max-bytes", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(
+        sessions=max(1, args.sessions),
+        turns=max(1, args.turns),
+        max_bytes=max(0, args.max_bytes),
+    )
+    write_results(args.out, payload)
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<20} {case['bytes_per_session']:.0f}B per session "
+            f"({case['bytes_per_message']:.0f}B per message) "
+            f"build={case['build_us_per_message']:.2f}us per message"
+        )
+    print(f"Results written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
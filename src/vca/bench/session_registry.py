@@ -0,0 +1,228 @@
+"""vca.bench.session_registry
+
+Turn latency and memory of SessionRegistry with many synthetic sessions.
+
+User story 71 session registry
+Every session first gets one turn, so each of them is created once and all
+but the last max_hot are evicted to snapshot files. Then a second pass sends
+turns to session ids drawn from a skewed distribution (a few sessions are
+busy, most are rarely seen), which mixes hot hits with rehydrations from
+snapshots. Turn latency is reported separately for hits and misses, with
+the registry counters and the memory the hot sessions hold.
+
+Sessions use a history store that keeps nothing, so the numbers are the
+cost of the registry, the engines and the snapshots, not of history files.
+
+Usage
+    python -m vca.bench.session_registry --sessions 100000 --max-hot 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    write_results,
+)
+from vca.core.session_registry import SessionRegistry
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_SESSIONS = 100_000
+DEFAULT_MAX_HOT = 1000
+DEFAULT_TURNS = 100_000
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "session_registry.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "session_registry_baseline.json"
+
+_TEXTS = (
+    "hello",
+    "what is python?",
+    "tell me about Paris",
+    "thanks",
+    "help",
+    "history",
+)
+
+
+class _NullHistory:
+    """History store that saves nothing."""
+
+    def load_turns(self, max_turns: int | None = None) -> list[ChatTurn]:
+        return []
+
+    def save_turn(self, user_text: str, assistant_text: str) -> None:
+        return
+
+    def clear_file(self) -> None:
+        return
+
+    def flush(self) -> None:
+        return
+
+    def close(self) -> None:
+        return
+
+
+class _NullLog:
+    def append_event(self, *args, **kwargs) -> None:
+        return
+
+    def flush(self) -> None:
+        return
+
+    def close(self) -> None:
+        return
+
+
+def skewed_ids(sessions: int, turns: int, seed: int = 71) -> list[str]:
+    """Return turns session ids where low numbered sessions are the busiest."""
+    rng = random.Random(seed)
+    ids = []
+    for _ in range(turns):
+        index = int(rng.paretovariate(1.2)) - 1
+        ids.append(f"user-{min(index, sessions - 1)}")
+    return ids
+
+
+def _run_pass(registry: SessionRegistry, ids: list[str]) -> tuple[list, list]:
+    hits: list[int] = []
+    misses: list[int] = []
+    clock = time.perf_counter_ns
+    for i, session_id in enumerate(ids):
+        hot = session_id in registry
+        start = clock()
+        registry.process_turn(session_id, _TEXTS[i % len(_TEXTS)])
+        elapsed = clock() - start
+        (hits if hot else misses).append(elapsed)
+    return hits, misses
+
+
+def _case(name: str, samples: list[int], **extra) -> dict:
+    case = {"case": name}
+    case.update(extra)
+    case.update(summarise(samples).to_dict())
+    return case
+
+
+def _registry(root: Path, max_hot: int) -> SessionRegistry:
+    return SessionRegistry(
+        root,
+        max_hot=max_hot,
+        history_factory=lambda _session_id: _NullHistory(),
+        interaction_log=_NullLog(),
+    )
+
+
+def hot_session_bytes(root: Path, sessions: int) -> float:
+    """Return the memory one hot session holds after a turn, in bytes."""
+    registry = _registry(root, sessions)
+    registry.process_turn("warmup", "hello")
+    tracemalloc.start()
+    try:
+        _run_pass(registry, [f"user-{i}" for i in range(sessions)])
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / sessions
+
+
+def run_benchmark(
+    *,
+    sessions: int = DEFAULT_SESSIONS,
+    max_hot: int = DEFAULT_MAX_HOT,
+    turns: int = DEFAULT_TURNS,
+) -> dict:
+    cases: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = _registry(Path(tmp) / "sessions", max_hot)
+        _hits, created = _run_pass(registry, [f"user-{i}" for i in range(sessions)])
+        cases.append(
+            _case(
+                "create",
+                created,
+                sessions=int(sessions),
+                max_hot=registry.max_hot,
+                evictions=registry.evictions,
+                bytes_per_hot_session=hot_session_bytes(
+                    Path(tmp) / "memory", min(sessions, max_hot)
+                ),
+            )
+        )
+
+        before = registry.stats()
+        hits, misses = _run_pass(registry, skewed_ids(sessions, turns))
+        after = registry.stats()
+        lookups = len(hits) + len(misses)
+        counters = {
+            key: after[key] - before[key]
+            for key in ("hits", "misses", "rehydrated", "evictions")
+        }
+        counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+        cases.append(_case("skewed_hit", hits, **counters))
+        cases.append(_case("skewed_miss", misses, **counters))
+        registry.close()
+    return result_envelope("session_registry", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.session_registry",
+        description="Benchmark SessionRegistry with many synthetic sessions.",
+    )
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--max-hot", type=int, default=DEFAULT_MAX_HOT)
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(
+        sessions=max(1, args.sessions),
+        max_hot=max(1, args.max_hot),
+        turns=max(1, args.turns),
+    )
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<12} calls={case['calls']} p50={case['p50_us']:.1f}us "
+            f"p99={case['p99_us']:.1f}us"
+        )
+    skewed = payload["cases"][-1]
+    print(
+        f"skewed hit_rate={skewed['hit_rate']:.3f} "
+        f"rehydrated={skewed['rehydrated']} evictions={skewed['evictions']} "
+        f"bytes_per_hot_session={payload['cases'][0]['bytes_per_hot_session']:.0f}"
+    )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""vca.bench.session_resume
+
+Startup time of ChatEngine with a full history file.
+
+User story 69 session snapshots
+Without a snapshot the engine reads up to history_max_turns turns from the
+history file and replays them into the session. With a snapshot written by
+the previous shutdown it restores the session in one read. This benchmark
+writes a history file of each size once, then times engine construction
+both ways and reports the peak memory allocated while starting.
+
+User story 70 resident turns
+The resident cases start the engine with resident_turns, which reads only
+the newest turns, and time restart (reset_session) with and without it.
+
+Usage
+    python -m vca.bench.session_resume --sizes 100,500 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Sequence
+
+from vca.bench.faq import _parse_sizes
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.core.engine import ChatEngine
+from vca.domain.constants import HISTORY_MAX_TURNS
+from vca.domain.paths import DATA_DIR
+from vca.storage.history_store import HistoryStore
+
+DEFAULT_SIZES = (100, HISTORY_MAX_TURNS)
+DEFAULT_CALLS = 30
+RESIDENT_TURNS = 5
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "session_resume.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "session_resume_baseline.json"
+
+
+def write_history(directory: Path, turns: int) -> Path:
+    """Fill a history file through a real engine and leave a snapshot next to it."""
+    path = directory / "history.jsonl"
+    engine = ChatEngine(
+        history=HistoryStore(path=path, max_turns=max(turns, 1)),
+        snapshot_path=directory / "session.snapshot",
+    )
+    for i in range(turns):
+        engine.process_turn(f"tell me about topic number {i}")
+    engine.shutdown()
+    return path
+
+
+def peak_bytes(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES, *, calls: int = DEFAULT_CALLS
+) -> dict:
+    cases: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            directory = Path(tmp) / str(size)
+            directory.mkdir()
+            history_path = write_history(directory, size)
+            snapshot = directory / "session.snapshot"
+
+            def start(snapshot_path: Path | None, resident: int = 0) -> ChatEngine:
+                store = HistoryStore(path=history_path, max_turns=max(size, 1))
+                return ChatEngine(
+                    history=store, snapshot_path=snapshot_path, resident_turns=resident
+                )
+
+            eager = start(None)
+            resident = start(None, RESIDENT_TURNS)
+            runs = {
+                "replay": lambda _: start(None),
+                "snapshot": lambda _: start(snapshot),
+                "resident": lambda _: start(None, RESIDENT_TURNS),
+                "restart": lambda _: eager.reset_session() or eager,
+                "restart_resident": lambda _: resident.reset_session() or resident,
+            }
+            for name, fn in runs.items():
+                engine = fn(None)
+                stats = summarise(time_calls(fn, range(calls), warmup=2))
+                case = {
+                    "case": f"resume_{int(size)}_{name}",
+                    "turns": len(engine.session.turns),
+                    "snapshot_bytes": snapshot.stat().st_size,
+                    "peak_bytes": peak_bytes(lambda: fn(None)),
+                }
+                case.update(stats.to_dict())
+                cases.append(case)
+    return result_envelope("session_resume", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.session_resume",
+        description="Benchmark engine startup from history replay and snapshots.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(args.sizes, calls=max(1, args.calls))
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<30} p50={case['p50_us']:.0f}us "
+            f"p99={case['p99_us']:.0f}us peak={case['peak_bytes']}B"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
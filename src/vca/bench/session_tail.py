@@ -0,0 +1,118 @@
+"""vca.bench.session_tail
+
+Latency of reading the newest messages and turns of a session.
+
+User story 67 tail views
+Every turn reads the last ten messages (recent_messages) and the last three
+turns (recent_turns) of the session. This benchmark fills sessions of
+growing size and times both reads, a [-10:] slice of the message view, and
+for comparison the older approach that copied the whole message stream
+before slicing it. The tail reads should cost the same at every size.
+
+Usage
+    python -m vca.bench.session_tail --sizes 10,100,1000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.faq import _parse_sizes
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.domain.constants import HISTORY_MAX_TURNS
+from vca.domain.paths import DATA_DIR
+from vca.domain.session import ConversationSession
+
+DEFAULT_SIZES = (10, 100, HISTORY_MAX_TURNS * 2)
+DEFAULT_CALLS = 2000
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "session_tail.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "session_tail_baseline.json"
+
+
+def filled_session(messages: int) -> ConversationSession:
+    """Return a session holding messages messages, mostly answered turns."""
+    session = ConversationSession()
+    for i in range(messages // 2):
+        session.add_message("user", f"tell me about topic number {i}")
+        if i % 25 == 24:
+            session.add_assistant_message("Did you mean help or exit?")
+        else:
+            session.add_message("assistant", f"Topic {i} is a topic.", "question")
+    return session
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES, *, calls: int = DEFAULT_CALLS
+) -> dict:
+    """Time the tail reads for every session size."""
+    cases: list[dict] = []
+    for size in sizes:
+        session = filled_session(size)
+        runs = {
+            "recent_messages": lambda _: session.recent_messages(limit=10),
+            "recent_turns": lambda _: session.recent_turns(limit=3),
+            "messages_tail_slice": lambda _: session.messages[-10:],
+            "copy_then_slice": lambda _: list(session.messages)[-10:],
+        }
+        for name, fn in runs.items():
+            stats = summarise(time_calls(fn, range(calls), warmup=10))
+            case = {
+                "case": f"session_{int(size)}_{name}",
+                "messages": len(session.messages),
+                "turns": len(session.turns),
+            }
+            case.update(stats.to_dict())
+            cases.append(case)
+    return result_envelope("session_tail", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.session_tail",
+        description="Benchmark reading the newest messages of a session.",
+    )
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(args.sizes, calls=max(1, args.calls))
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<36} p50={case['p50_us']:.2f}us "
+            f"p99={case['p99_us']:.2f}us"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""vca.bench.sharded_history
+
+Concurrent history writers on one shared file and on per session shards.
+
+User story 73 sharded history
+Each worker thread plays one session and saves turns as fast as it can.
+In the shared case every worker has its own HistoryStore on the same file,
+as separate processes would, so they all take turns on one FileLock. A
+writer that cannot get the lock within its retries skips the turn, so the
+shared case also reports how many turns were lost. In the sharded case the
+workers write through one ShardedHistoryStore and each session has its own
+file and lock.
+
+Usage
+    python -m vca.bench.sharded_history --workers 1,8 --turns 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+from vca.bench.faq import _parse_sizes
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    write_results,
+)
+from vca.domain.paths import DATA_DIR
+from vca.storage.history_store import HistoryStore
+from vca.storage.sharded_history import ShardedHistoryStore
+
+DEFAULT_WORKERS = (1, 8)
+DEFAULT_TURNS = 200
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "sharded_history.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "sharded_history_baseline.json"
+
+
+def _run_workers(
+    workers: int, turns: int, save: Callable[[int, str, str], None]
+) -> tuple[list[int], float]:
+    samples: list[list[int]] = [[] for _ in range(workers)]
+    start_line = threading.Barrier(workers + 1)
+
+    def work(worker: int) -> None:
+        clock = time.perf_counter_ns
+        out = samples[worker]
+        start_line.wait()
+        for i in range(turns):
+            start = clock()
+            save(worker, f"question {i} from {worker}", f"answer {i}")
+            out.append(clock() - start)
+
+    threads = [threading.Thread(target=work, args=(w,)) for w in range(workers)]
+    for thread in threads:
+        thread.start()
+    start_line.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    return [s for worker in samples for s in worker], elapsed
+
+
+def run_shared(root: Path, workers: int, turns: int) -> tuple[list[int], float, int]:
+    path = root / "history.jsonl"
+    limit = workers * turns
+    stores = [HistoryStore(path=path, max_turns=limit) for _ in range(workers)]
+    samples, elapsed = _run_workers(
+        workers, turns, lambda w, u, a: stores[w].save_turn(u, a)
+    )
+    saved = HistoryStore(path=path, max_turns=limit).count_turns()
+    return samples, elapsed, saved
+
+
+def run_sharded(root: Path, workers: int, turns: int) -> tuple[list[int], float, int]:
+    store = ShardedHistoryStore(root, max_turns=turns)
+    ids = [f"session-{w}" for w in range(workers)]
+    for session_id in ids:
+        store.shard(session_id)
+    samples, elapsed = _run_workers(
+        workers, turns, lambda w, u, a: store.save_turn(ids[w], u, a)
+    )
+    saved = sum(store.shard(session_id).count_turns() for session_id in ids)
+    return samples, elapsed, saved
+
+
+def run_benchmark(
+    workers: Sequence[int] = DEFAULT_WORKERS, *, turns: int = DEFAULT_TURNS
+) -> dict:
+    cases: list[dict] = []
+    runs = {"shared": run_shared, "sharded": run_sharded}
+    for count in workers:
+        for name, fn in runs.items():
+            with tempfile.TemporaryDirectory() as tmp:
+                samples, elapsed, saved = fn(Path(tmp), count, turns)
+            case = {
+                "case": f"writers_{int(count)}_{name}",
+                "workers": int(count),
+                "turns_saved": saved,
+                "turns_lost": count * turns - saved,
+                "turns_per_s": saved / elapsed if elapsed > 0 else 0.0,
+            }
+            case.update(summarise(samples).to_dict())
+            cases.append(case)
+    return result_envelope("sharded_history", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.sharded_history",
+        description="Benchmark concurrent history writers, shared and sharded.",
+    )
+    parser.add_argument("--workers", type=_parse_sizes, default=list(DEFAULT_WORKERS))
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(args.workers, turns=max(1, args.turns))
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        print(
+            f"{case['case']:<20} p50={case['p50_us']:.0f}us "
+            f"p99={case['p99_us']:.0f}us turns/s={case['turns_per_s']:.0f} "
+            f"lost={case['turns_lost']}"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
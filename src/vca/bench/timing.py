@@ -0,0 +1,214 @@
+"""vca.bench.timing
+
+Shared timing, result file and baseline comparison helpers for benchmarks.
+
+Latencies are collected per call in nanoseconds so tail percentiles are
+reported, not just averages. Result files are plain JSON with a list of cases,
+each case identified by its "case" key, so two runs can be compared case by
+case.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Summary of per call latencies for one benchmark case.
+
+    Attributes:
+        calls: Number of timed calls
+        total_s: Sum of all timed call durations in seconds
+        throughput_per_s: Calls per second over the timed calls
+        mean_us: Mean latency in microseconds
+        p50_us: Median latency in microseconds
+        p95_us: 95th percentile latency in microseconds
+        p99_us: 99th percentile latency in microseconds
+        max_us: Worst observed latency in microseconds
+    """
+
+    calls: int
+    total_s: float
+    throughput_per_s: float
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    max_us: float
+
+    def to_dict(self) -> dict[str, float | int]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Regression:
+    """One metric of one case that is worse than the baseline allows."""
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+    ratio: float
+
+
+# Metrics where a larger value is worse. Throughput is compared the other way.
+_LATENCY_METRICS = ("p50_us", "p95_us", "p99_us")
+_THROUGHPUT_METRIC = "throughput_per_s"
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Return the nearest rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    pct = max(0.0, min(100.0, float(pct)))
+    rank = int(round(pct / 100.0 * (len(sorted_values) - 1)))
+    return float(sorted_values[rank])
+
+
+def summarise(samples_ns: Sequence[int]) -> LatencyStats:
+    """Summarise raw nanosecond samples into LatencyStats."""
+    if not samples_ns:
+        return LatencyStats(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    ordered = sorted(samples_ns)
+    total_ns = sum(ordered)
+    calls = len(ordered)
+    total_s = total_ns / 1e9
+    return LatencyStats(
+        calls=calls,
+        total_s=total_s,
+        throughput_per_s=(calls / total_s) if total_s > 0 else 0.0,
+        mean_us=total_ns / calls / 1000.0,
+        p50_us=percentile(ordered, 50) / 1000.0,
+        p95_us=percentile(ordered, 95) / 1000.0,
+        p99_us=percentile(ordered, 99) / 1000.0,
+        max_us=ordered[-1] / 1000.0,
+    )
+
+
+def time_calls(
+    fn: Callable[[Any], object],
+    inputs: Iterable[Any],
+    *,
+    warmup: int = 0,
+    max_seconds: float | None = None,
+    clock_ns: Callable[[], int] = time.perf_counter_ns,
+) -> list[int]:
+    """Call fn once per input and return the per call latencies in nanoseconds.
+
+    The first warmup inputs are executed but not recorded. When max_seconds is
+    set, timing stops early once the recorded calls exceed that budget so very
+    slow cases still finish.
+    """
+    samples: list[int] = []
+    budget_ns = None if max_seconds is None else int(max_seconds * 1e9)
+    spent_ns = 0
+    skipped = 0
+
+    for item in inputs:
+        start = clock_ns()
+        fn(item)
+        elapsed = clock_ns() - start
+
+        if skipped < warmup:
+            skipped += 1
+            continue
+
+        samples.append(elapsed)
+        spent_ns += elapsed
+        if budget_ns is not None and spent_ns >= budget_ns:
+            break
+
+    return samples
+
+
+def result_envelope(benchmark: str, cases: list[dict[str, Any]]) -> dict[str, Any]:
+    """Wrap benchmark cases with the metadata needed to interpret them later."""
+    return {
+        "benchmark": benchmark,
+        "created_utc": _dt.datetime.now(tz=_dt.timezone.utc)
+        .replace(microsecond=0)
+        .isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": cases,
+    }
+
+
+def write_results(path: str | Path, payload: Mapping[str, Any]) -> Path:
+    """Write a result payload as indented JSON, creating parent folders."""
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", "utf-8")
+    return out
+
+
+def load_results(path: str | Path) -> dict[str, Any] | None:
+    """Load a result payload, returning None when missing or unreadable."""
+    try:
+        obj = json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(obj, dict) or not isinstance(obj.get("cases"), list):
+        return None
+    return obj
+
+
+def compare_to_baseline(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    tolerance: float = 0.25,
+) -> list[Regression]:
+    """Compare two result payloads case by case.
+
+    A latency percentile regresses when it is more than tolerance above the
+    baseline. Throughput regresses when it falls more than tolerance below the
+    baseline. Cases missing from either side are ignored.
+    """
+    tolerance = max(0.0, float(tolerance))
+    base_cases = {
+        str(c.get("case")): c
+        for c in baseline.get("cases", [])
+        if isinstance(c, Mapping)
+    }
+
+    regressions: list[Regression] = []
+    for case in current.get("cases", []):
+        if not isinstance(case, Mapping):
+            continue
+        name = str(case.get("case"))
+        base = base_cases.get(name)
+        if base is None:
+            continue
+
+        for metric in _LATENCY_METRICS:
+            old = float(base.get(metric, 0.0) or 0.0)
+            new = float(case.get(metric, 0.0) or 0.0)
+            if old > 0 and new > old * (1.0 + tolerance):
+                regressions.append(Regression(name, metric, old, new, new / old))
+
+        old_tp = float(base.get(_THROUGHPUT_METRIC, 0.0) or 0.0)
+        new_tp = float(case.get(_THROUGHPUT_METRIC, 0.0) or 0.0)
+        if old_tp > 0 and new_tp < old_tp * (1.0 - tolerance):
+            regressions.append(
+                Regression(name, _THROUGHPUT_METRIC, old_tp, new_tp, new_tp / old_tp)
+            )
+
+    return regressions
+
+
+def format_regressions(regressions: Iterable[Regression]) -> list[str]:
+    """Render regressions as readable lines for console output."""
+    return [
+        f"REGRESSION case={r.case} metric={r.metric} "
+        f"baseline={r.baseline:.2f} current={r.current:.2f} ratio={r.ratio:.2f}"
+        for r in regressions
+    ]
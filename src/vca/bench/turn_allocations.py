@@ -0,0 +1,196 @@
+"""vca.bench.turn_allocations
+
+Memory allocated while ChatEngine.process_turn handles one turn.
+
+User story 53 shared text features
+A turn used to casefold and tokenise the same input in the classifier, the
+multi intent check and the FAQ lookup. This benchmark runs a realistic input
+mix through process_turn with in memory stores, so file IO does not dominate,
+and records per turn peak traced memory with tracemalloc together with the
+wall time per turn. Run it before and after a change to the pipeline to see
+the effect on allocations.
+
+It also times the text feature stages on their own (classification, the multi
+intent check and the FAQ lookup) once through the string APIs, which derive
+the features in every call, and once with a single shared PreparedInput.
+
+Usage
+    python -m vca.bench.turn_allocations --turns 2000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.timing import result_envelope, summarise, time_calls, write_results
+from vca.core.engine import ChatEngine
+from vca.core.prepared_input import PreparedInput
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_TURNS = 2000
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "turn_allocations.json"
+
+_INPUTS = (
+    "hi",
+    "help",
+    "what can you do?",
+    "Tell me about Python please",
+    "how do I exit?",
+    "thanks a lot!!!!",
+    "I want to visit London next week, any tips?",
+    "can you help me or should I just quit",
+    "history",
+    "why is the sky blue",
+)
+
+
+class _MemoryHistory:
+    """History store that keeps turns in memory only."""
+
+    def __init__(self) -> None:
+        self._turns: list[ChatTurn] = []
+
+    def load_turns(self, max_turns: int | None = None) -> list[ChatTurn]:
+        if max_turns is None:
+            return list(self._turns)
+        return self._turns[-max_turns:] if max_turns > 0 else []
+
+    def save_turn(self, user_text: str, assistant_text: str) -> None:
+        self._turns.append(ChatTurn(user_text, assistant_text))
+        if len(self._turns) > 200:
+            del self._turns[:-200]
+
+    def clear_file(self) -> None:
+        self._turns.clear()
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class _NullInteractionLog:
+    def append_event(self, *args, **kwargs) -> None:
+        return None
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _new_engine() -> ChatEngine:
+    return ChatEngine(history=_MemoryHistory(), interaction_log=_NullInteractionLog())
+
+
+def _feature_cases(engine: ChatEngine, rounds: int) -> list[dict]:
+    classifier = engine._classifier
+    responder = engine._responder
+
+    def via_strings(text: str) -> None:
+        classifier.classify(text)
+        engine._looks_like_multi_intent(text)
+        responder.faq_response_for(text)
+
+    def via_prepared(text: str) -> None:
+        prepared = PreparedInput.from_text(text)
+        classifier.classify(prepared)
+        engine._looks_like_multi_intent(prepared)
+        responder.faq_response_for(prepared)
+
+    stream = list(_INPUTS) * max(1, rounds)
+    cases: list[dict] = []
+    for name, fn in (
+        ("features_strings", via_strings),
+        ("features_prepared", via_prepared),
+    ):
+        stats = summarise(time_calls(fn, stream, warmup=len(_INPUTS)))
+        case = {"case": name}
+        case.update(stats.to_dict())
+        cases.append(case)
+    return cases
+
+
+def run_benchmark(*, turns: int = DEFAULT_TURNS) -> dict:
+    """Measure per turn peak traced memory and time for each input.
+
+    One engine cycles through the input mix like a conversation would. The
+    history command is in the mix, and it echoes recent messages, so it must
+    not be repeated back to back or its reply grows every turn.
+    """
+    engine = _new_engine()
+    for text in _INPUTS * 3:
+        engine.process_turn(text)
+        engine.session.clear_pending_clarification()
+
+    peaks: dict[str, list[int]] = {text: [] for text in _INPUTS}
+    samples_ns: dict[str, list[int]] = {text: [] for text in _INPUTS}
+    rounds = max(1, turns // len(_INPUTS))
+
+    tracemalloc.start()
+    try:
+        for _ in range(rounds):
+            for text in _INPUTS:
+                tracemalloc.reset_peak()
+                before, _peak = tracemalloc.get_traced_memory()
+                start = time.perf_counter_ns()
+                engine.process_turn(text)
+                samples_ns[text].append(time.perf_counter_ns() - start)
+                _current, peak = tracemalloc.get_traced_memory()
+                peaks[text].append(peak - before)
+                engine.session.clear_pending_clarification()
+    finally:
+        tracemalloc.stop()
+
+    cases: list[dict] = []
+    cases.extend(_feature_cases(engine, rounds))
+    for text in _INPUTS:
+        ordered = sorted(peaks[text])
+        cases.append(
+            {
+                "case": text,
+                "mean_peak_bytes": sum(ordered) / len(ordered),
+                "p50_peak_bytes": ordered[len(ordered) // 2],
+                "mean_us_traced": summarise(samples_ns[text]).mean_us,
+            }
+        )
+    return result_envelope("turn_allocations", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.turn_allocations",
+        description="Measure memory allocated per ChatEngine turn.",
+    )
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(turns=args.turns)
+    write_results(args.out, payload)
+
+    turns = [c for c in payload["cases"] if "mean_peak_bytes" in c]
+    for case in payload["cases"]:
+        if "mean_peak_bytes" in case:
+            print(
+                f"{case['case'][:40]:<42} peak={case['mean_peak_bytes']:.0f}B "
+                f"time={case['mean_us_traced']:.1f}us"
+            )
+        else:
+            print(f"{case['case']:<42} mean={case['mean_us']:.2f}us")
+    mean_peak = sum(c["mean_peak_bytes"] for c in turns) / len(turns)
+    print(f"mean peak per turn {mean_peak:.0f}B")
+    print(f"Results written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
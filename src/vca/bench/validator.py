@@ -0,0 +1,142 @@
+"""vca.bench.validator
+
+Per call cost of InputValidator.clean on realistic inputs.
+
+User story 51 fast path benchmark
+Compares clean, which takes the ASCII fast path when it can, against the
+full rule order in InputValidator._normalise_unicode for the same inputs.
+Inputs are grouped into categories that match what users actually type:
+short commands and greetings, questions, chatty sentences with repeated
+punctuation, multi line pastes, and non ASCII text which always takes the
+full path.
+
+Usage
+    python -m vca.bench.validator --calls 20000 --out results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from vca.bench.timing import (
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    result_envelope,
+    summarise,
+    time_calls,
+    write_results,
+)
+from vca.core.validator import InputValidator
+from vca.domain.paths import DATA_DIR
+
+DEFAULT_CALLS = 20000
+DEFAULT_OUT_PATH = DATA_DIR / "bench" / "validator.json"
+DEFAULT_BASELINE_PATH = DATA_DIR / "bench" / "validator_baseline.json"
+
+_SHORT = ("hi", "help", "exit", "thanks", "history", "hello there", "bye", "ok")
+_QUESTIONS = (
+    "how do I exit?",
+    "what can you do",
+    "Can you tell me about Python?",
+    "where is my history stored?",
+    "why is the sky blue?",
+)
+_CHATTY = (
+    "Tell me about Python please, what is it used for!!!! really????",
+    "wow that is great... thanks a lot!!!!!!",
+    "I want to visit London next week,,,, any tips?",
+)
+_NON_ASCII = (
+    "héllo wörld",
+    "Привет, как дела?",
+    "thanks 😄😄😄!!!!",
+    "café au lait ☕ please",
+)
+
+
+def build_inputs(seed: int = 0) -> dict[str, list[str]]:
+    """Return realistic inputs grouped by category."""
+    rng = random.Random(seed)
+    paste_lines = list(_QUESTIONS + _CHATTY)
+    pastes = [
+        "\n".join(rng.choice(paste_lines) for _ in range(rng.randint(5, 30))) + "\r\n\t"
+        for _ in range(20)
+    ]
+    return {
+        "short": list(_SHORT),
+        "question": list(_QUESTIONS),
+        "chatty": list(_CHATTY),
+        "paste": pastes,
+        "non_ascii": list(_NON_ASCII),
+    }
+
+
+def run_benchmark(*, calls: int = DEFAULT_CALLS, seed: int = 0) -> dict:
+    """Time clean against the full rule order for every input category."""
+    validator = InputValidator()
+    reference = InputValidator._normalise_unicode
+    cases: list[dict] = []
+
+    for category, inputs in build_inputs(seed).items():
+        stream = [inputs[i % len(inputs)] for i in range(max(1, calls))]
+        fast = summarise(time_calls(validator.clean, stream, warmup=100))
+        full = summarise(time_calls(reference, stream, warmup=100))
+
+        for path, stats in (("clean", fast), ("full_rules", full)):
+            case = {"case": f"{category}_{path}", "category": category}
+            case.update(stats.to_dict())
+            cases.append(case)
+
+        cases[-2]["speedup_vs_full_rules"] = (
+            full.mean_us / fast.mean_us if fast.mean_us > 0 else 0.0
+        )
+
+    return result_envelope("validator", cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.bench.validator",
+        description="Benchmark InputValidator.clean on realistic inputs.",
+    )
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    payload = run_benchmark(calls=args.calls, seed=args.seed)
+    write_results(args.out, payload)
+
+    for case in payload["cases"]:
+        speedup = case.get("speedup_vs_full_rules")
+        extra = f" speedup={speedup:.2f}x" if speedup is not None else ""
+        print(
+            f"{case['case']:<22} mean={case['mean_us']:.2f}us "
+            f"p99={case['p99_us']:.2f}us{extra}"
+        )
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline:
+        write_results(args.baseline, payload)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+    for line in format_regressions(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
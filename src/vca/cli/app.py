@@ -7,6 +7,14 @@ The CLI loop is testable using injected input and output functions.
 
 User story 48
 Final integration and stability hardening.
+
+User story 59
+The stats command prints the session statistics without calling the engine.
+
+User story 63
+When a write function is given (run passes a ChunkWriter over stdout) replies
+are written chunk by chunk from ChatEngine.process_turn_stream, so long
+history views start appearing before they are complete.
 """
 
 from __future__ import annotations
@@ -14,15 +22,33 @@ from __future__ import annotations
 from collections.abc import Callable
 import logging
 import shutil
+import sys
+from typing import TextIO
 
 from vca.cli.commands import Command, parse_user_input
-from vca.cli.help_text import build_help_lines
+from vca.cli.help_text import build_help_lines, build_stats_lines
 from vca.core.engine import ChatEngine
 
 logger = logging.getLogger(__name__)
 
 InputFn = Callable[[str], str]
 OutputFn = Callable[[str], None]
+WriteFn = Callable[[str], None]
+
+
+class ChunkWriter:
+    """Writes text to a buffered stream and flushes once per chunk.
+
+    The stream defaults to sys.stdout at the time of each write.
+    """
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self._stream = stream
+
+    def __call__(self, chunk: str) -> None:
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(chunk)
+        stream.flush()
 
 
 class CliApp:
@@ -37,7 +63,7 @@ class CliApp:
 
     def run(self) -> None:
         """Run using real console IO."""
-        self.run_with_io(input_fn=input, output_fn=print)
+        self.run_with_io(input_fn=input, output_fn=print, write_fn=ChunkWriter())
 
     def _safe_shutdown(self) -> None:
         """Best effort shutdown hook. Never raises."""
@@ -67,13 +93,40 @@ class CliApp:
             logger.exception("CLI output error error_type=%s", type(ex).__name__)
             return False
 
+    def _stream_reply(self, text: str, output_fn: OutputFn, write_fn: WriteFn) -> None:
+        """Write the engine reply chunk by chunk as it is produced."""
+        chunks = self._engine.process_turn_stream(text)
+        started = False
+        try:
+            for chunk in chunks:
+                if not started:
+                    write_fn("Assistant: ")
+                    started = True
+                write_fn(chunk)
+            if started:
+                write_fn("\n")
+        except Exception as ex:
+            logger.exception("CLI engine error error_type=%s", type(ex).__name__)
+            if started:
+                self._safe_output(write_fn, "\n")
+            self._safe_output(
+                output_fn, "Assistant: Something went wrong. Please try again."
+            )
+        finally:
+            chunks.close()
+
     def run_with_io(
         self,
         input_fn: InputFn,
         output_fn: OutputFn,
         terminal_width: int | None = None,
+        write_fn: WriteFn | None = None,
     ) -> None:
-        """Run the CLI loop using injected IO functions for testing."""
+        """Run the CLI loop using injected IO functions for testing.
+
+        write_fn writes text without adding a newline. When it is given,
+        replies are streamed through it.
+        """
         if not self._safe_output(output_fn, "Virtual Chat Assistant"):
             self._safe_shutdown()
             return
@@ -143,6 +196,22 @@ class CliApp:
                         )
                     continue
 
+                if parsed.command == Command.STATS:
+                    try:
+                        stats = self._engine.session.stats
+                        for line in build_stats_lines(stats, width=width):
+                            if not self._safe_output(output_fn, line):
+                                self._safe_shutdown()
+                                return
+                    except Exception as ex:
+                        logger.exception(
+                            "CLI stats error error_type=%s", type(ex).__name__
+                        )
+                        self._safe_output(
+                            output_fn, "Assistant: Unable to show statistics right now."
+                        )
+                    continue
+
                 if (
                     getattr(Command, "UNKNOWN", None) is not None
                     and parsed.command == Command.UNKNOWN
@@ -176,6 +245,12 @@ class CliApp:
                         )
                     continue
 
+                if write_fn is not None and callable(
+                    getattr(self._engine, "process_turn_stream", None)
+                ):
+                    self._stream_reply(parsed.text, output_fn, write_fn)
+                    continue
+
                 try:
                     reply = self._engine.process_turn(parsed.text)
                 except Exception as ex:
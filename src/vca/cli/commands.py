@@ -16,6 +16,7 @@ class Command(str, Enum):
     HELP = "help"
     EXIT = "exit"
     RESTART = "restart"
+    STATS = "stats"
     MESSAGE = "message"
     UNKNOWN = "unknown"
 
@@ -23,6 +24,7 @@ class Command(str, Enum):
 _HELP_TOKENS = {"help", "h", "?", "commands"}
 _EXIT_TOKENS = {"exit", "quit", "q", "bye"}
 _RESTART_TOKENS = {"restart", "reset", "startover", "start over"}
+_STATS_TOKENS = {"stats", "statistics"}
 
 
 @dataclass(frozen=True)
@@ -54,6 +56,9 @@ def parse_user_input(raw_text: object) -> ParsedInput:
     if lower in _RESTART_TOKENS:
         return ParsedInput(command=Command.RESTART, text="restart")
 
+    if lower in _STATS_TOKENS:
+        return ParsedInput(command=Command.STATS, text="stats")
+
     if prefix != "":
         lower_prefix = prefix.casefold()
 
@@ -66,6 +71,9 @@ def parse_user_input(raw_text: object) -> ParsedInput:
         if lower_prefix in _RESTART_TOKENS:
             return ParsedInput(command=Command.RESTART, text="restart")
 
+        if lower_prefix in _STATS_TOKENS:
+            return ParsedInput(command=Command.STATS, text="stats")
+
         name = prefix.split()[0] if prefix.split() else prefix
         return ParsedInput(command=Command.UNKNOWN, text=name)
 
@@ -4,12 +4,18 @@ Help and usage text for the CLI.
 
 The goal is to keep help content in one place and ensure it is readable in a
 normal terminal width by wrapping long lines.
+
+User story 59
+build_stats_lines formats the running session statistics for the stats
+command.
 """
 
 from __future__ import annotations
 
 import textwrap
 
+from vca.domain.session_stats import SessionStats
+
 
 def _wrap_prefixed(prefix: str, text: str, width: int) -> list[str]:
     width = max(30, int(width))
@@ -47,6 +53,11 @@ def build_help_lines(width: int = 80) -> list[str]:
     lines.extend(
         _wrap_prefixed("Assistant: ", "restart  Start a new in memory session", width)
     )
+    lines.extend(
+        _wrap_prefixed(
+            "Assistant: ", "stats    Show statistics for this session", width
+        )
+    )
     lines.extend(_wrap_prefixed("Assistant: ", "exit     Quit the application", width))
     lines.append("Assistant:")
 
@@ -63,3 +74,33 @@ def build_help_lines(width: int = 80) -> list[str]:
     lines.extend(_wrap_prefixed("Assistant: ", "Goodbye.", width))
 
     return lines
+
+
+def build_stats_lines(stats: SessionStats, width: int = 80) -> list[str]:
+    """Return stats command output lines, wrapped to the given width."""
+    width = max(30, int(width))
+    p = "Assistant: "
+
+    lines: list[str] = []
+    lines.extend(_wrap_prefixed(p, "Session statistics", width))
+    lines.extend(
+        _wrap_prefixed(
+            p,
+            f"Messages: {stats.user_messages} from you, "
+            f"{stats.assistant_messages} from me",
+            width,
+        )
+    )
+    lines.extend(_wrap_prefixed(p, f"Characters: {stats.total_chars}", width))
+    lines.extend(_wrap_prefixed(p, f"Turns: {stats.turns}", width))
+
+    if stats.intent_counts:
+        ranked = sorted(stats.intent_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        text = ", ".join(f"{name} {count}" for name, count in ranked)
+        lines.extend(_wrap_prefixed(p, f"Intents: {text}", width))
+
+    if stats.recent_topics:
+        text = ", ".join(reversed(stats.recent_topics))
+        lines.extend(_wrap_prefixed(p, f"Recent topics: {text}", width))
+
+    return lines
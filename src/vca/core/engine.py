@@ -9,23 +9,85 @@ persistence.
 User story 36 test readiness
 Dependencies such as storage and time can be injected or mocked.
 Timing uses an injected clock for deterministic tests.
+
+User story 53 shared text features
+The validate stage builds a PreparedInput (casefolded text and word tokens)
+once per turn. Classification, the multi intent check and the FAQ lookup all
+read from it instead of deriving the same features again.
+
+User story 60 paged history
+A history request with a page number or a since date is answered from the
+persisted history store, which reads only the requested window of turns.
+
+User story 61 history search
+Each saved turn is passed its intent when the history store accepts one, so
+"history search intent:question" can find it. Search requests are answered
+from the store's search index.
+
+User story 62 turn metadata
+The classifier confidence and matched rule recorded in the turn telemetry
+are saved with the turn as well, so analysis and replay read them from the
+history instead of classifying every saved message again.
+
+User story 63 streamed responses
+process_turn_stream yields the response in chunks while it is generated
+(history views one line at a time) and saves the complete response once
+the last chunk is out. process_turn runs the same stages without yielding.
+
+User story 64 response cache
+Handlers are called through ResponseGenerator.dispatch, which answers pure
+handlers from the response cache when one is passed to the engine.
+
+User story 66 turn ring
+The session keeps each answered message once, as a turn, and derives the
+message stream from it. A turn is added by the assistant reply and then
+swapped for the copy read back from the history store. Clarifying questions
+and fallbacks are assistant only messages. The session bounds its own size,
+so the engine no longer trims it after every message.
+
+User story 68 byte budgets
+The session can also be bounded by the bytes of the texts it keeps, on its
+own (session_max_bytes) and together with the other sessions of the process
+(memory_budget). Telemetry events record the session size after the turn
+when the interaction log accepts session_bytes.
+
+User story 69 session snapshots
+With a snapshot_path, shutdown saves the session to a binary snapshot and
+the next start restores it in one read when the history file has not
+changed since. Otherwise the history is replayed as before.
+
+User story 70 resident turns
+With resident_turns the session keeps only the newest turns in memory and
+reads older ones from the history store when they are asked for. Startup
+and restart read just those turns, by index when the store has read_turns.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+import inspect
 import logging
-import re
 import time
-from typing import Callable, Protocol, runtime_checkable
+from pathlib import Path
+from typing import Callable, Generator, Iterator, Protocol, runtime_checkable
 
+from vca.core.history_query import parse_history_query
 from vca.core.intents import Intent, IntentClassifier
+from vca.core.prepared_input import WORD_RE, PreparedInput, prepare
+from vca.core.response_cache import ResponseCache
 from vca.core.responses import ResponseGenerator
 from vca.core.validator import InputValidator
-from vca.domain.constants import CONTEXT_WINDOW_TURNS
-from vca.domain.session import ConversationSession
+from vca.domain.constants import CONTEXT_WINDOW_TURNS, HISTORY_PAGE_SIZE
+from vca.domain.memory_budget import MemoryBudget
+from vca.domain.session import MAX_SESSION_MESSAGES, ConversationSession
 from vca.storage.history_store import HistoryStore
 from vca.storage.interaction_log_store import InteractionLogStore
+from vca.storage.session_snapshot import (
+    history_signature,
+    read_snapshot,
+    write_snapshot,
+)
 from vca.domain.constants import HISTORY_MAX_TURNS
 
 logger = logging.getLogger(__name__)
@@ -33,9 +95,50 @@ error_logger = logging.getLogger("vca.errors")
 
 CONFIDENCE_THRESHOLD = 0.65
 
-# Bounded in memory retention of session content to avoid unbounded growth.
-# This is a best effort bound because ConversationSession is owned elsewhere.
-_SESSION_MAX_TURNS = 200
+
+_TURN_METADATA_KEYWORDS = ("intent", "confidence", "rule")
+_EVENT_METADATA_KEYWORDS = ("session_bytes",)
+
+
+@lru_cache(maxsize=32)
+def _function_metadata_keywords(fn, keywords: tuple[str, ...]) -> tuple[str, ...]:
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    return tuple(k for k in keywords if k in params)
+
+
+def _metadata_keywords(
+    method, keywords: tuple[str, ...] = _TURN_METADATA_KEYWORDS
+) -> tuple[str, ...]:
+    """Return which of keywords a store method takes.
+
+    Fakes and older stores only take the fields they were written for
+    (the two texts for save_turn). The answer is cached per function, so
+    the turn path does not inspect signatures.
+    """
+    try:
+        return _function_metadata_keywords(
+            getattr(method, "__func__", method), keywords
+        )
+    except TypeError:
+        return ()
+
+
+def _same_newest_turns(paged: list, loaded: list) -> bool:
+    """True if loaded holds the newest of the paged turns (US70).
+
+    load_turns counts lines, not turns, so it may return fewer turns than
+    were paged, but never other ones, and none only if there are none.
+    """
+    if len(loaded) > len(paged) or (paged and not loaded):
+        return False
+    tail = paged[len(paged) - len(loaded) :]
+    return all(
+        (p.user_text, p.assistant_text) == (t.user_text, t.assistant_text)
+        for p, t in zip(tail, loaded)
+    )
 
 
 @runtime_checkable
@@ -58,6 +161,7 @@ class InteractionLogStoreLike(Protocol):
         processing_time_ms: int = 0,
         rule_match_count: int = 0,
         multiple_rules_matched: bool = False,
+        session_bytes: int = 0,
     ) -> None: ...
 
     def flush(self) -> None: ...
@@ -71,6 +175,7 @@ class _ValidatedInput:
     text: str
     input_length: int
     was_truncated: bool
+    prepared: PreparedInput | None = None
 
 
 @dataclass
@@ -82,12 +187,13 @@ class _TurnTelemetry:
     input_length: int = 0
     effective_intent: Intent | str = Intent.UNKNOWN
     confidence: float = 0.0
+    rule: str | None = None
     fallback_used: bool = False
     started: float = 0.0
 
 
 class ChatEngine:
-    _WORD_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+    _WORD_RE = WORD_RE
 
     def __init__(
         self,
@@ -95,21 +201,43 @@ class ChatEngine:
         interaction_log: InteractionLogStoreLike | None = None,
         *,
         perf_counter: Callable[[], float] | None = None,
+        response_cache: ResponseCache | None = None,
+        session_max_bytes: int = 0,
+        memory_budget: MemoryBudget | None = None,
+        snapshot_path: Path | str | None = None,
+        resident_turns: int = 0,
+        classifier: IntentClassifier | None = None,
+        responder: ResponseGenerator | None = None,
     ) -> None:
         """
         Dependency injection notes
         history and interaction_log can be replaced with fakes in unit tests.
         perf_counter can be replaced to make timing deterministic in unit tests.
+        response_cache turns on caching of pure handler replies (US64).
+        session_max_bytes and memory_budget bound the bytes the session keeps
+        (US68). 0 and None mean no byte limit.
+        snapshot_path is where shutdown saves the session and where the next
+        start looks for it before replaying history (US69). None turns
+        snapshots off.
+        resident_turns > 0 keeps only that many recent turns in memory (at
+        least CONTEXT_WINDOW_TURNS) and pages older ones in from the history
+        store when the session's turn view reaches them (US70). 0 loads the
+        whole history.
+        classifier and responder let many engines share one of each (US71).
+        A passed responder keeps its own response cache.
         """
-        self._classifier = IntentClassifier()
-        self._responder = ResponseGenerator()
+        self._classifier = classifier if classifier is not None else IntentClassifier()
+        self._responder = (
+            responder
+            if responder is not None
+            else ResponseGenerator(response_cache=response_cache)
+        )
         self._history: HistoryStoreLike = (
             history if history is not None else HistoryStore()
         )
         self._interaction_log: InteractionLogStoreLike = (
             interaction_log if interaction_log is not None else InteractionLogStore()
         )
-        self._session = ConversationSession()
         self._validator = InputValidator()
         self._loaded_turns_count = 0
         self._perf_counter = (
@@ -123,19 +251,26 @@ class ChatEngine:
             )
         except Exception:
             self._history_max_turns = HISTORY_MAX_TURNS
+        self._session_max_bytes = max(0, int(session_max_bytes))
+        self._memory_budget = memory_budget
+        self._snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
+        self._resident_turns = (
+            max(CONTEXT_WINDOW_TURNS, int(resident_turns)) if resident_turns > 0 else 0
+        )
+        read_turns = getattr(self._history, "read_turns", None)
+        self._turn_pager = (
+            self._history if self._resident_turns and callable(read_turns) else None
+        )
+        self._session = self._make_session()
+        self._resumed_from_snapshot = False
 
-        if history is not None:
+        if history is not None and not self._restore_snapshot():
             try:
-                turns = self._history.load_turns()
+                turns = self._load_history_turns(None)
                 for t in turns:
-                    self._session.add_turn(t, max_turns=self._history_max_turns)
-
-                    # keep old message stream behaviour too
-                    self._session.add_message("user", t.user_text)
-                    self._session.add_message("assistant", t.assistant_text)
+                    self._session.add_turn(t)
 
-                self._loaded_turns_count = len(turns)
-                self._enforce_bounded_session()
+                self._loaded_turns_count = self._count_loaded(turns)
             except Exception as ex:
                 logger.warning(
                     "History load failed non fatal error_type=%s", type(ex).__name__
@@ -150,9 +285,105 @@ class ChatEngine:
     def loaded_turns_count(self) -> int:
         return self._loaded_turns_count
 
+    @property
+    def resumed_from_snapshot(self) -> bool:
+        """True if the session was restored from a snapshot at startup."""
+        return self._resumed_from_snapshot
+
+    def _make_session(self) -> ConversationSession:
+        return ConversationSession(
+            max_turns=self._history_max_turns,
+            max_bytes=self._session_max_bytes,
+            budget=self._memory_budget,
+            max_messages=(
+                self._resident_turns * 2
+                if self._resident_turns
+                else MAX_SESSION_MESSAGES
+            ),
+            backing=self._turn_pager,
+        )
+
+    def _load_history_turns(self, max_turns: int | None) -> list:
+        """Read the turns a new session starts with.
+
+        US70: with resident_turns only the newest resident_turns turns are
+        read, by index when the store supports paged reads.
+        """
+        if not self._resident_turns:
+            if max_turns is None:
+                return self._history.load_turns()
+            return self._history.load_turns(max_turns=max_turns)
+        count = self._resident_turns
+        pager = self._turn_pager
+        if pager is None:
+            return self._history.load_turns(max_turns=count)
+        total = pager.read_turns(0, 0).total
+        turns = pager.read_turns(max(0, total - count), count).turns
+        # Paging must not change what the session starts with. load_turns
+        # gives up on a file with a line it cannot read, so when the two
+        # disagree the session keeps what load_turns gives and stops paging.
+        loaded = self._history.load_turns(max_turns=count)
+        if not _same_newest_turns(turns, loaded):
+            logger.warning(
+                "History paged read disagrees with load turns=%d loaded=%d",
+                len(turns),
+                len(loaded),
+            )
+            self._turn_pager = None
+            self._session.backing = None
+            return loaded
+        self._session.set_stored_total(total)
+        return turns
+
+    def _count_loaded(self, turns: list) -> int:
+        """Turns the session can show after loading, stored ones included."""
+        if self._turn_pager is not None:
+            return len(self._session.turns)
+        return len(turns)
+
+    def _history_signature(self):
+        return history_signature(getattr(self._history, "path", None))
+
+    def _restore_snapshot(self) -> bool:
+        """Restore the session from the shutdown snapshot if it is current."""
+        if self._snapshot_path is None:
+            return False
+        state = read_snapshot(
+            self._snapshot_path, self._history_signature(), self._history_max_turns
+        )
+        if state is None:
+            return False
+        session = self._make_session()
+        try:
+            session.restore_state(state)
+        except (TypeError, ValueError) as ex:
+            logger.info("Session snapshot ignored error_type=%s", type(ex).__name__)
+            return False
+        self._session = session
+        self._loaded_turns_count = len(session.turns)
+        self._resumed_from_snapshot = True
+        return True
+
+    def save_snapshot(self) -> bool:
+        """Save the session to snapshot_path for the next start.
+
+        Call it once the history store has written everything, as shutdown
+        does. Returns False if snapshots are off or the write failed.
+        """
+        if self._snapshot_path is None:
+            return False
+        return write_snapshot(
+            self._snapshot_path,
+            self._history_signature(),
+            self._history_max_turns,
+            self._session.snapshot_state(),
+        )
+
     def _new_blank_session(self) -> None:
         try:
-            self._session = ConversationSession()
+            if self._memory_budget is not None:
+                self._memory_budget.release(self._session)
+            self._session = self._make_session()
         except Exception:
             try:
                 self._session.clear()
@@ -169,27 +400,21 @@ class ChatEngine:
         self._new_blank_session()
 
         try:
-            turns = self._history.load_turns(max_turns=self._history_max_turns)
+            turns = self._load_history_turns(self._history_max_turns)
         except Exception:
             turns = []
 
         try:
             for t in turns:
-                self._session.add_turn(t, max_turns=self._history_max_turns)
-
-                # maintain the existing message stream behaviour expected by tests
-                self._session.add_message("user", t.user_text)
-                self._session.add_message("assistant", t.assistant_text)
+                self._session.add_turn(t)
         except Exception:
             pass
 
         try:
-            self._loaded_turns_count = len(turns)
+            self._loaded_turns_count = self._count_loaded(turns)
         except Exception:
             pass
 
-        self._enforce_bounded_session()
-
     def reset_session(self) -> None:
         """
         Restart behaviour for US47.
@@ -247,6 +472,11 @@ class ChatEngine:
         except Exception:
             pass
 
+        try:
+            self.save_snapshot()
+        except Exception:
+            pass
+
         try:
             logging.shutdown()
         except Exception:
@@ -282,55 +512,21 @@ class ChatEngine:
     def _invoke_handler(self, handler, text: str, recent, context_turns):
         """
         Some tests monkeypatch a handler that only accepts 2 parameters.
-        We attempt 3 first, then fallback to 2.
+        The call adapter checks the signature once per handler function and
+        passes 2 or 3 arguments, so a TypeError raised inside a handler is
+        never retried or hidden.
         """
-        try:
-            return handler(text, recent, context_turns)
-        except TypeError:
-            return handler(text, recent)
-
-    def _enforce_bounded_session(self) -> None:
-        """
-        Best effort enforcement of bounded in memory history.
-
-        Strategy
-        Use a trim method if available.
-        Otherwise attempt to trim common private attributes by convention.
-        Never raises.
-        """
-        try:
-            trim_turns = getattr(self._session, "trim_to_last_turns", None)
-            if callable(trim_turns):
-                trim_turns(_SESSION_MAX_TURNS)
-                return
-        except Exception:
-            pass
-
-        try:
-            trim_msgs = getattr(self._session, "trim_to_last_messages", None)
-            if callable(trim_msgs):
-                trim_msgs(_SESSION_MAX_TURNS * 2)
-                return
-        except Exception:
-            pass
-
-        try:
-            for attr in ("_turns", "_messages", "turns", "messages"):
-                buf = getattr(self._session, attr, None)
-                if isinstance(buf, list):
-                    limit = _SESSION_MAX_TURNS * 2
-                    if len(buf) > limit:
-                        setattr(self._session, attr, buf[-limit:])
-                        return
-        except Exception:
-            pass
+        return self._responder.dispatch(handler, text, recent, context_turns)
 
     def _stage_validate(self, raw_text: str | None) -> _ValidatedInput:
         """Validate and normalize raw user input."""
         clean = self._validator.clean(raw_text)
         text = clean.text
         return _ValidatedInput(
-            text=text, input_length=len(text), was_truncated=clean.was_truncated
+            text=text,
+            input_length=len(text),
+            was_truncated=clean.was_truncated,
+            prepared=PreparedInput.from_text(text, self._WORD_RE),
         )
 
     def _stage_load_context(self):
@@ -352,7 +548,6 @@ class ChatEngine:
         choice = self._parse_clarification_choice(text, state.options)
 
         self._session.add_message("user", text)
-        self._enforce_bounded_session()
         recent = self._session.recent_messages(limit=10)
 
         if choice is None:
@@ -371,12 +566,14 @@ class ChatEngine:
         response = self._stage_apply_truncation_note(response, validated.was_truncated)
 
         self._session.add_message("assistant", response)
-        self._enforce_bounded_session()
-        self._safe_save_history(text, response, telemetry.effective_intent)
+        if self._safe_save_history(
+            text, response, telemetry.effective_intent, telemetry
+        ):
+            self._adopt_saved_turn()
         return response
 
     def _stage_classify_intent(
-        self, text: str, telemetry: _TurnTelemetry
+        self, text: PreparedInput | str, telemetry: _TurnTelemetry
     ) -> tuple[Intent, object | None]:
         """Classify intent for the input."""
         intent = self._classifier.classify(text)
@@ -391,31 +588,33 @@ class ChatEngine:
                 telemetry.confidence = float(result.confidence)
             except Exception:
                 telemetry.confidence = 0.0
+            rule = getattr(result, "rule", None)
+            telemetry.rule = None if rule is None else str(rule)
 
         return intent, result
 
     def _stage_add_user_message(self, text: str):
         """Append the user message to the session and return recent messages."""
         self._session.add_message("user", text)
-        self._enforce_bounded_session()
         return self._session.recent_messages(limit=10)
 
     def _stage_maybe_ask_for_clarification(
         self,
-        text: str,
+        text: PreparedInput | str,
         intent: Intent,
         classifier_result: object | None,
         telemetry: _TurnTelemetry,
     ) -> str | None:
         """Decide if we should ask the user a clarifying question."""
-        if self._looks_like_multi_intent(text):
+        prepared = prepare(text)
+        text = prepared.text
+        if self._looks_like_multi_intent(prepared):
             telemetry.fallback_used = True
             options = ["exit", "help"]
             self._session.set_pending_clarification(original_text=text, options=options)
             response = self._responder.generate_clarifying_question(options)
-            self._session.add_message("assistant", response)
-            self._enforce_bounded_session()
-            self._safe_save_history(text, response, "clarify")
+            self._session.add_assistant_message(response)
+            self._safe_save_history(text, response, "clarify", telemetry)
             return response
 
         confidence = telemetry.confidence
@@ -433,23 +632,71 @@ class ChatEngine:
             options = self._clarification_options_from_candidates(candidates)
             self._session.set_pending_clarification(original_text=text, options=options)
             response = self._responder.generate_clarifying_question(options)
-            self._session.add_message("assistant", response)
-            self._enforce_bounded_session()
-            self._safe_save_history(text, response, "clarify")
+            self._session.add_assistant_message(response)
+            self._safe_save_history(text, response, "clarify", telemetry)
             return response
 
         return None
 
     def _stage_generate_response(
-        self, text: str, intent: Intent, recent, context_turns
+        self, text: PreparedInput | str, intent: Intent, recent, context_turns
     ) -> str:
         """Generate the assistant response for the current turn."""
-        faq = self._responder.faq_response_for(text)
+        return "".join(
+            self._stage_generate_response_chunks(text, intent, recent, context_turns)
+        )
+
+    def _stage_generate_response_chunks(
+        self, text: PreparedInput | str, intent: Intent, recent, context_turns
+    ) -> Iterator[str]:
+        """Yield the assistant response for the current turn in chunks.
+
+        History views come one line at a time, every other response is a
+        single chunk.
+        """
+        prepared = prepare(text)
+        faq = self._responder.faq_response_for(prepared, intent)
         if faq is not None:
-            return faq
+            yield faq
+            return
+
+        if intent == Intent.HISTORY:
+            paged = self._history_page_chunks(prepared.text)
+            if paged is not None:
+                yield from paged
+                return
 
         handler = self.route_intent(intent)
-        return self._invoke_handler(handler, text, recent, context_turns)
+        yield self._invoke_handler(handler, prepared.text, recent, context_turns)
+
+    def _history_page_response(self, text: str) -> str | None:
+        """Answer "history page N", "history since DATE" or "history search"."""
+        chunks = self._history_page_chunks(text)
+        return None if chunks is None else "".join(chunks)
+
+    def _history_page_chunks(self, text: str) -> Iterator[str] | None:
+        query = parse_history_query(text)
+        if query is None:
+            return None
+        if query.search is not None:
+            search_turns = getattr(self._history, "search_turns", None)
+            if not callable(search_turns):
+                return None
+            result = search_turns(query.search, query.intent, HISTORY_PAGE_SIZE)
+            return self._responder.iter_history_search(
+                result, query.search, query.intent
+            )
+        if query.since is not None:
+            read_since = getattr(self._history, "read_since", None)
+            if not callable(read_since):
+                return None
+            page = read_since(query.since, HISTORY_PAGE_SIZE)
+        else:
+            read_page = getattr(self._history, "read_page", None)
+            if not callable(read_page):
+                return None
+            page = read_page(query.page, HISTORY_PAGE_SIZE)
+        return self._responder.iter_history_page(page, since=query.since)
 
     def _stage_apply_truncation_note(self, response: str, was_truncated: bool) -> str:
         """Append the input truncated note when the validator truncated the input."""
@@ -461,20 +708,39 @@ class ChatEngine:
         self, user_text: str, response: str, intent, telemetry: _TurnTelemetry
     ) -> str:
         """Persist the completed turn and return the response."""
-        self._session.add_message("assistant", response)
-        self._enforce_bounded_session()
-        self._safe_save_history(user_text, response, intent)
+        intent_name = getattr(intent, "value", intent)
+        self._session.add_message(
+            "assistant",
+            response,
+            intent=str(intent_name) if intent_name is not None else None,
+        )
+        if self._safe_save_history(user_text, response, intent, telemetry):
+            self._adopt_saved_turn()
+
+        telemetry.effective_intent = intent
+        return response
+
+    def _adopt_saved_turn(self) -> None:
+        """Keep the stored copy of the turn just saved in the session (US42).
 
+        It carries the timestamps and metadata the history store wrote. The
+        session keeps its own copy if the store returns a different turn.
+        US70: with paged reads the session is also told the new turn count
+        of the store, so its turn view does not have to ask for it.
+        """
         try:
-            latest = self._history.load_turns(max_turns=1)
+            pager = self._turn_pager
+            if pager is None:
+                latest = self._history.load_turns(max_turns=1)
+            else:
+                total = pager.read_turns(0, 0).total
+                self._session.set_stored_total(total)
+                latest = pager.read_turns(total - 1, 1).turns
             if latest:
-                self._session.add_turn(latest[-1], max_turns=self._history_max_turns)
+                self._session.adopt_stored_turn(latest[-1])
         except Exception:
             pass
 
-        telemetry.effective_intent = intent
-        return response
-
     def _stage_log_telemetry(self, telemetry: _TurnTelemetry) -> None:
         """Log interaction telemetry for the turn."""
         try:
@@ -482,7 +748,12 @@ class ChatEngine:
             elapsed_s = end - telemetry.started
             elapsed_ms = int(elapsed_s * 1000 + 0.5)
 
-            self._interaction_log.append_event(
+            append_event = self._interaction_log.append_event
+            # US68: stores that predate session_bytes do not get it.
+            extra = {}
+            if _metadata_keywords(append_event, _EVENT_METADATA_KEYWORDS):
+                extra["session_bytes"] = self._session.retained_bytes
+            append_event(
                 input_length=telemetry.input_length,
                 intent=telemetry.effective_intent,
                 fallback_used=telemetry.fallback_used,
@@ -490,11 +761,55 @@ class ChatEngine:
                 processing_time_ms=elapsed_ms,
                 rule_match_count=telemetry.rule_match_count,
                 multiple_rules_matched=telemetry.multiple_rules_matched,
+                **extra,
             )
         except Exception:
             pass
 
     def process_turn(self, raw_text: str | None) -> str:
+        turn = self._run_turn(raw_text, stream=False)
+        while True:
+            try:
+                next(turn)
+            except StopIteration as stop:
+                return stop.value
+
+    def process_turn_stream(self, raw_text: str | None) -> Iterator[str]:
+        """Process one turn and yield the response in chunks.
+
+        Joining the chunks gives the response. The turn is saved once the
+        response is complete, also when the caller stops reading early.
+        """
+        if type(self).process_turn is not ChatEngine.process_turn:
+            # A subclass that replaces process_turn keeps full control.
+            yield self.process_turn(raw_text)
+            return
+
+        turn = self._run_turn(raw_text, stream=True)
+        streamed = False
+        try:
+            while True:
+                try:
+                    chunk = next(turn)
+                except StopIteration as stop:
+                    if not streamed:
+                        yield stop.value
+                    return
+                streamed = True
+                yield chunk
+        except GeneratorExit:
+            for _ in turn:
+                pass
+            raise
+
+    def _run_turn(
+        self, raw_text: str | None, *, stream: bool
+    ) -> Generator[str, None, str]:
+        """Run the turn stages and return the response.
+
+        With stream the response is also yielded in chunks as it is
+        generated. Early answers (clarification, errors) are only returned.
+        """
         telemetry = _TurnTelemetry(started=self._perf_counter())
 
         try:
@@ -509,8 +824,10 @@ class ChatEngine:
             if pending_response is not None:
                 return pending_response
 
+            prepared = self._prepared_input_for(validated)
+
             try:
-                intent, result = self._stage_classify_intent(validated.text, telemetry)
+                intent, result = self._stage_classify_intent(prepared, telemetry)
             except Exception as ex:
                 telemetry.fallback_used = True
                 telemetry.effective_intent = Intent.UNKNOWN
@@ -527,15 +844,24 @@ class ChatEngine:
             recent = self._stage_add_user_message(validated.text)
 
             clarification = self._stage_maybe_ask_for_clarification(
-                validated.text, intent, result, telemetry
+                prepared, intent, result, telemetry
             )
             if clarification is not None:
                 return clarification
 
+            parts: list[str] = []
             try:
-                response = self._stage_generate_response(
-                    validated.text, intent, recent, context_turns
-                )
+                if stream:
+                    for chunk in self._stage_generate_response_chunks(
+                        prepared, intent, recent, context_turns
+                    ):
+                        parts.append(chunk)
+                        yield chunk
+                    response = "".join(parts)
+                else:
+                    response = self._stage_generate_response(
+                        prepared, intent, recent, context_turns
+                    )
             except Exception as ex:
                 telemetry.fallback_used = True
                 telemetry.effective_intent = Intent.UNKNOWN
@@ -547,11 +873,18 @@ class ChatEngine:
                     )
                 except Exception:
                     pass
-                response = self._responder.fallback_error()
-
-            response = self._stage_apply_truncation_note(
-                response, validated.was_truncated
-            )
+                fallback = self._responder.fallback_error()
+                if parts:
+                    # Part of the response was already streamed, keep it.
+                    fallback = "\n" + fallback
+                if stream:
+                    yield fallback
+                response = "".join(parts) + fallback
+
+            noted = self._stage_apply_truncation_note(response, validated.was_truncated)
+            if stream and len(noted) > len(response) and noted.startswith(response):
+                yield noted[len(response) :]
+            response = noted
 
             try:
                 return self._stage_persist_and_return(
@@ -584,8 +917,7 @@ class ChatEngine:
 
             fallback = self._responder.fallback_error()
             try:
-                self._session.add_message("assistant", fallback)
-                self._enforce_bounded_session()
+                self._session.add_assistant_message(fallback)
             except Exception:
                 pass
             return fallback
@@ -593,9 +925,48 @@ class ChatEngine:
         finally:
             self._stage_log_telemetry(telemetry)
 
-    def _safe_save_history(self, user_text: str, assistant_text: str, intent) -> None:
+    @staticmethod
+    def _prepared_input_for(validated) -> PreparedInput:
+        """Return the prepared features of a validated input.
+
+        Falls back to preparing the text when the validate stage was replaced
+        by one that does not provide them.
+        """
+        prepared = getattr(validated, "prepared", None)
+        if isinstance(prepared, PreparedInput):
+            return prepared
+        return PreparedInput.from_text(validated.text)
+
+    def _safe_save_history(
+        self,
+        user_text: str,
+        assistant_text: str,
+        intent,
+        telemetry: _TurnTelemetry | None = None,
+    ) -> bool:
+        """Save the turn with whatever metadata the history store accepts.
+
+        Returns False if the store raised.
+        """
         try:
-            self._history.save_turn(user_text, assistant_text)
+            save_turn = self._history.save_turn
+            keywords = _metadata_keywords(save_turn)
+            if not keywords:
+                save_turn(user_text, assistant_text)
+                return True
+
+            intent_name = getattr(intent, "value", intent)
+            metadata = {
+                "intent": None if intent_name is None else str(intent_name),
+                "confidence": None,
+                "rule": None,
+            }
+            # Confidence and rule only exist once the classifier has run.
+            if telemetry is not None and telemetry.rule is not None:
+                metadata["confidence"] = telemetry.confidence
+                metadata["rule"] = telemetry.rule
+            save_turn(user_text, assistant_text, **{k: metadata[k] for k in keywords})
+            return True
         except Exception as ex:
             try:
                 error_logger.exception(
@@ -605,13 +976,14 @@ class ChatEngine:
                 )
             except Exception:
                 pass
+            return False
 
-    def _looks_like_multi_intent(self, text: str) -> bool:
-        t = (text or "").strip().casefold()
-        if t == "":
+    def _looks_like_multi_intent(self, text: PreparedInput | str | None) -> bool:
+        prepared = prepare(text, self._WORD_RE)
+        if prepared.lower == "":
             return False
 
-        tokens = set(self._WORD_RE.findall(t))
+        tokens = prepared.word_set
 
         help_tokens = {"help", "h", "commands"}
         exit_tokens = {"exit", "quit", "q", "bye", "goodbye"}
@@ -0,0 +1,316 @@
+"""vca.core.faq_index
+
+FAQ lookup over a data file that can hold tens of thousands of entries.
+
+User story 55 indexed FAQ
+FAQ entries are question and answer pairs. They come from the built in
+defaults in ResponseGenerator and an optional data file (FAQ_PATH, JSON or
+JSONL). A lookup first tries an exact match on the normalised question
+through a hash map. If that misses, it ranks near misses with an IDF weighted
+Jaccard score over word tokens and accepts the best entry only when the
+score reaches min_score. The high default threshold means reordered words,
+repeated words and extra punctuation still match, but a question that only
+shares common words with an FAQ does not.
+
+The index is built lazily on the first lookup. load_faq_index caches built
+indexes per file, keyed by path, size and modification time, so every engine
+in a process shares one index until the file changes.
+
+Near miss lookups stay sub millisecond at 100k entries because of three
+filters. Only the postings of the query's rarest tokens are read (prefix
+filtering: an entry that shares none of them cannot reach min_score).
+Postings are sorted by entry weight, so only entries whose total weight is
+compatible with the threshold are visited. At most max_candidates entries
+are scored per lookup.
+
+File formats
+    JSONL: one {"question": ..., "answer": ...} object per line
+    JSON: a list of such objects, or an object mapping question to answer
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+from vca.core.prepared_input import WORD_RE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_SCORE = 0.8
+DEFAULT_MAX_CANDIDATES = 2000
+
+FaqPair = tuple[str, str]
+
+
+def faq_key(raw_text: object) -> str:
+    """Normalise text to an FAQ key: trimmed, casefolded, no trailing "?"."""
+    text = "" if raw_text is None else str(raw_text)
+    key = text.strip().casefold()
+    if key.endswith("?"):
+        key = key[:-1].strip()
+    return key
+
+
+@dataclass(frozen=True)
+class FaqMatch:
+    question: str
+    answer: str
+    score: float
+    exact: bool
+
+
+def _pairs_from_object(obj: object) -> list[FaqPair]:
+    if isinstance(obj, Mapping):
+        return [(str(q), str(a)) for q, a in obj.items()]
+    pairs: list[FaqPair] = []
+    if isinstance(obj, list):
+        for item in obj:
+            if not isinstance(item, Mapping):
+                continue
+            question = item.get("question")
+            answer = item.get("answer")
+            if isinstance(question, str) and isinstance(answer, str):
+                pairs.append((question, answer))
+    return pairs
+
+
+def read_faq_file(path: Path) -> list[FaqPair]:
+    """Read question and answer pairs from a JSON or JSONL file.
+
+    A missing file gives no entries. Malformed lines or entries are skipped
+    and logged, they never stop the rest of the file from loading.
+    """
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    except Exception as ex:
+        logger.warning("FAQ file read failed error_type=%s", type(ex).__name__)
+        return []
+
+    if path.suffix.lower() == ".jsonl":
+        pairs: list[FaqPair] = []
+        skipped = 0
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                skipped += 1
+                continue
+            found = _pairs_from_object([obj])
+            skipped += 1 - len(found)
+            pairs.extend(found)
+        if skipped:
+            logger.warning("FAQ file skipped malformed lines=%d", skipped)
+        return pairs
+
+    try:
+        return _pairs_from_object(json.loads(raw))
+    except json.JSONDecodeError as ex:
+        logger.warning("FAQ file is not valid JSON error_type=%s", type(ex).__name__)
+        return []
+
+
+def unique_pairs(pairs: Iterable[FaqPair]) -> list[FaqPair]:
+    """Drop entries without a question, later duplicates replace earlier ones.
+
+    Duplicates are questions with the same faq_key. The result keeps the
+    order in which each key was first seen.
+    """
+    by_key: dict[str, FaqPair] = {}
+    for question, answer in pairs:
+        key = faq_key(question)
+        if key:
+            by_key[key] = (question, answer)
+    return list(by_key.values())
+
+
+class FaqIndex:
+    """Exact and near miss lookup over FAQ entries.
+
+    entries is either the pairs themselves or a callable returning them. The
+    callable is only invoked when the index is first used. Later entries
+    replace earlier ones with the same normalised question.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[FaqPair] | Callable[[], Iterable[FaqPair]],
+        *,
+        min_score: float = DEFAULT_MIN_SCORE,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+    ) -> None:
+        self._source = entries
+        self.min_score = min(1.0, max(0.01, float(min_score)))
+        self.max_candidates = max(1, int(max_candidates))
+        self._built = False
+
+        self._questions: list[str] = []
+        self._answers: list[str] = []
+        self._exact: dict[str, int] = {}
+        self._entry_tokens: list[frozenset[str]] = []
+        self._entry_weight = array("d")
+        self._idf: dict[str, float] = {}
+        self._unseen_idf = 0.0
+        self._postings: dict[str, array] = {}
+        self._posting_weights: dict[str, array] = {}
+
+    def __len__(self) -> int:
+        self._ensure_built()
+        return len(self._questions)
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self._build()
+
+    def _build(self) -> None:
+        source = self._source
+        pairs = source() if callable(source) else source
+
+        doc_freq: dict[str, int] = {}
+        token_sets: list[frozenset[str]] = []
+        for eid, (question, answer) in enumerate(unique_pairs(pairs)):
+            key = faq_key(question)
+            self._exact[key] = eid
+            self._questions.append(question)
+            self._answers.append(answer)
+            tokens = frozenset(WORD_RE.findall(key))
+            token_sets.append(tokens)
+            for token in tokens:
+                doc_freq[token] = doc_freq.get(token, 0) + 1
+
+        total = len(token_sets)
+        self._idf = {t: self._idf_for(total, df) for t, df in doc_freq.items()}
+        self._unseen_idf = self._idf_for(total, 0)
+
+        postings: dict[str, list[tuple[float, int]]] = {}
+        for eid, tokens in enumerate(token_sets):
+            weight = sum(self._idf[t] for t in tokens)
+            self._entry_weight.append(weight)
+            for token in tokens:
+                postings.setdefault(token, []).append((weight, eid))
+
+        for token, items in postings.items():
+            items.sort()
+            self._postings[token] = array("I", (eid for _w, eid in items))
+            self._posting_weights[token] = array("d", (w for w, _eid in items))
+
+        self._entry_tokens = token_sets
+        self._source = ()
+        self._built = True
+
+    @staticmethod
+    def _idf_for(total: int, df: int) -> float:
+        return math.log(1.0 + (total - df + 0.5) / (df + 0.5))
+
+    def match(self, key: str, tokens: Iterable[str] | None = None) -> FaqMatch | None:
+        """Return the best entry for an already normalised key, or None.
+
+        tokens may be passed when the caller already has the word tokens of
+        key, for example from a PreparedInput.
+        """
+        if key == "":
+            return None
+        self._ensure_built()
+
+        eid = self._exact.get(key)
+        if eid is not None:
+            return FaqMatch(self._questions[eid], self._answers[eid], 1.0, True)
+
+        query = set(WORD_RE.findall(key) if tokens is None else tokens)
+        if not query or not self._questions:
+            return None
+
+        idf = self._idf
+        unseen = self._unseen_idf
+        weighted = sorted(((idf.get(t, unseen), t) for t in query), reverse=True)
+        query_weight = sum(w for w, _t in weighted)
+
+        min_score = self.min_score
+        low = min_score * query_weight
+        high = query_weight / min_score
+
+        # Prefix filter: an entry that shares none of the rarest tokens whose
+        # weight exceeds (1 - min_score) of the query cannot reach min_score.
+        budget = (1.0 - min_score) * query_weight
+        seen: set[int] = set()
+        candidates: list[int] = []
+        covered = 0.0
+        for weight, token in weighted:
+            postings = self._postings.get(token)
+            if postings is not None:
+                weights = self._posting_weights[token]
+                start = bisect_left(weights, low)
+                stop = bisect_right(weights, high)
+                for eid in postings[start:stop]:
+                    if eid not in seen:
+                        seen.add(eid)
+                        candidates.append(eid)
+                        if len(candidates) >= self.max_candidates:
+                            break
+            covered += weight
+            if covered > budget or len(candidates) >= self.max_candidates:
+                break
+
+        best_eid = -1
+        best_score = 0.0
+        for eid in candidates:
+            entry_tokens = self._entry_tokens[eid]
+            shared = 0.0
+            for weight, token in weighted:
+                if token in entry_tokens:
+                    shared += weight
+            union = query_weight + self._entry_weight[eid] - shared
+            score = shared / union if union > 0 else 0.0
+            if score > best_score or (score == best_score and eid < best_eid):
+                best_eid = eid
+                best_score = score
+
+        if best_eid < 0 or best_score < min_score:
+            return None
+        return FaqMatch(
+            self._questions[best_eid], self._answers[best_eid], best_score, False
+        )
+
+
+_CACHE: dict[tuple, FaqIndex] = {}
+
+
+def load_faq_index(path: Path, defaults: Mapping[str, str] | None = None) -> FaqIndex:
+    """Return the shared index for defaults plus the entries in path.
+
+    Entries in the file replace defaults with the same question. The index
+    object is reused until the file's size or modification time changes.
+    """
+    default_pairs = tuple((defaults or {}).items())
+    try:
+        stat = path.stat()
+        signature = (str(path), stat.st_size, stat.st_mtime_ns, default_pairs)
+    except OSError:
+        signature = (str(path), -1, -1, default_pairs)
+
+    cached = _CACHE.get(signature)
+    if cached is not None:
+        return cached
+
+    def entries() -> list[FaqPair]:
+        return list(default_pairs) + read_faq_file(path)
+
+    index = FaqIndex(entries)
+    # Only the current version of the file is worth keeping.
+    _CACHE.clear()
+    _CACHE[signature] = index
+    return index
@@ -0,0 +1,318 @@
+"""vca.core.faq_semantic
+
+Paraphrase matching for FAQ questions with hashed feature vectors.
+
+User story 57 semantic FAQ matching
+FaqIndex only matches questions that share almost all of their words with an
+FAQ entry. This module adds a third step for paraphrases. Every question is
+turned into a vector by feature hashing: words, word pairs and character
+trigrams of each word are hashed with CRC32 into a fixed number of buckets,
+weighted by how rare the bucket is among the FAQ questions, and the vector
+is scaled to unit length. Words that differ only in their endings ("exit",
+"exiting") still share most of their trigrams. There is no trained model,
+the same text always gives the same vector.
+
+The FAQ vectors form one float32 matrix. A query is scored against all of
+them with a single matrix vector product and the best entry is accepted
+when its cosine similarity reaches min_score.
+
+NumPy is optional. Without it semantic matching is simply not available.
+The matrix is precomputed by
+
+    python -m vca.core.faq_semantic build
+
+and saved next to the FAQ data file (faq.jsonl gives faq.jsonl.vec.npz).
+load_semantic_matcher only uses a saved matrix whose questions and settings
+match the current FAQ entries, so a stale file is ignored rather than giving
+wrong answers. Rebuild it after editing the FAQ file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+from vca.core.faq_index import FaqMatch, FaqPair, faq_key, read_faq_file, unique_pairs
+from vca.core.prepared_input import WORD_RE
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIMENSIONS = 512
+DEFAULT_MIN_SCORE = 0.7
+FEATURE_VERSION = 1
+
+# Relative weights of the three feature kinds before IDF weighting.
+_WORD_WEIGHT = 1.0
+_PAIR_WEIGHT = 1.0
+_TRIGRAM_WEIGHT = 0.5
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def vectors_path_for(faq_path: Path) -> Path:
+    """Return where the precomputed matrix for faq_path is saved."""
+    faq_path = Path(faq_path)
+    return faq_path.with_name(faq_path.name + ".vec.npz")
+
+
+def hashed_features(key: str, dimensions: int) -> dict[int, float]:
+    """Return bucket to signed weight for a normalised question key.
+
+    The sign of each feature comes from one bit of its hash, so features
+    that collide in a bucket tend to cancel out instead of adding up.
+    """
+    words = WORD_RE.findall(key)
+    features: dict[int, float] = {}
+
+    def add(feature: str, weight: float) -> None:
+        h = zlib.crc32(feature.encode("utf-8"))
+        bucket = h % dimensions
+        sign = -1.0 if h & 0x80000000 else 1.0
+        features[bucket] = features.get(bucket, 0.0) + sign * weight
+
+    for word in words:
+        add("w:" + word, _WORD_WEIGHT)
+        padded = f"<{word}>"
+        for i in range(len(padded) - 2):
+            add("c:" + padded[i : i + 3], _TRIGRAM_WEIGHT)
+    for first, second in zip(words, words[1:]):
+        add(f"b:{first} {second}", _PAIR_WEIGHT)
+    return features
+
+
+def _signature(questions: Sequence[str], dimensions: int) -> int:
+    crc = zlib.crc32(f"v{FEATURE_VERSION}:{dimensions}".encode("ascii"))
+    for question in questions:
+        crc = zlib.crc32(faq_key(question).encode("utf-8") + b"\x00", crc)
+    return crc
+
+
+@dataclass(frozen=True)
+class SemanticFaqMatcher:
+    """Cosine similarity search over hashed FAQ question vectors.
+
+    matrix holds one unit length float32 row per entry and idf one weight
+    per bucket. Use build or load rather than the constructor.
+    """
+
+    questions: tuple[str, ...]
+    answers: tuple[str, ...]
+    matrix: object
+    idf: object
+    dimensions: int
+    min_score: float = DEFAULT_MIN_SCORE
+
+    @classmethod
+    def build(
+        cls,
+        pairs: Iterable[FaqPair],
+        *,
+        dimensions: int = DEFAULT_DIMENSIONS,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> SemanticFaqMatcher:
+        """Vectorise the questions in pairs. Requires NumPy."""
+        if np is None:
+            raise RuntimeError("semantic FAQ matching needs numpy")
+        entries = unique_pairs(pairs)
+        dimensions = max(16, int(dimensions))
+
+        rows = [hashed_features(faq_key(q), dimensions) for q, _a in entries]
+        doc_freq = np.zeros(dimensions, dtype=np.float64)
+        for features in rows:
+            doc_freq[list(features)] += 1.0
+        total = len(rows)
+        idf = (np.log((1.0 + total) / (1.0 + doc_freq)) + 1.0).astype(np.float32)
+
+        matrix = np.zeros((total, dimensions), dtype=np.float32)
+        for i, features in enumerate(rows):
+            if features:
+                buckets = list(features)
+                matrix[i, buckets] = np.fromiter(
+                    features.values(), dtype=np.float32, count=len(buckets)
+                )
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        return cls(
+            questions=tuple(q for q, _a in entries),
+            answers=tuple(a for _q, a in entries),
+            matrix=matrix,
+            idf=idf,
+            dimensions=dimensions,
+            min_score=float(min_score),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the matrix and IDF weights to path, replacing it atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            np.savez(
+                fh,
+                matrix=self.matrix,
+                idf=self.idf,
+                signature=np.array(
+                    [_signature(self.questions, self.dimensions)], dtype=np.uint32
+                ),
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        pairs: Iterable[FaqPair],
+        *,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> SemanticFaqMatcher | None:
+        """Load a saved matrix for pairs, or None if it is missing or stale."""
+        if np is None:
+            return None
+        entries = unique_pairs(pairs)
+        try:
+            with np.load(Path(path), allow_pickle=False) as data:
+                matrix = data["matrix"]
+                idf = data["idf"]
+                signature = int(data["signature"][0])
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logger.warning("FAQ vectors unreadable error_type=%s", type(ex).__name__)
+            return None
+
+        questions = tuple(q for q, _a in entries)
+        dimensions = int(idf.shape[0]) if idf.ndim == 1 else -1
+        if (
+            matrix.dtype != np.float32
+            or matrix.shape != (len(questions), dimensions)
+            or signature != _signature(questions, dimensions)
+        ):
+            logger.warning("FAQ vectors are stale, rebuild them to use them")
+            return None
+        return cls(
+            questions=questions,
+            answers=tuple(a for _q, a in entries),
+            matrix=matrix,
+            idf=idf,
+            dimensions=dimensions,
+            min_score=float(min_score),
+        )
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def vector(self, key: str):
+        """Return the unit length query vector for a normalised key."""
+        query = np.zeros(self.dimensions, dtype=np.float32)
+        features = hashed_features(key, self.dimensions)
+        if not features:
+            return query
+        buckets = list(features)
+        query[buckets] = np.fromiter(
+            features.values(), dtype=np.float32, count=len(buckets)
+        )
+        query[buckets] *= self.idf[buckets]
+        norm = float(np.linalg.norm(query))
+        if norm > 0:
+            query /= norm
+        return query
+
+    def match(self, key: str) -> FaqMatch | None:
+        """Return the most similar entry for a normalised key, or None."""
+        if key == "" or not self.questions:
+            return None
+        scores = self.matrix @ self.vector(key)
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        if math.isnan(score) or score < self.min_score:
+            return None
+        return FaqMatch(self.questions[best], self.answers[best], score, False)
+
+
+_CACHE: dict[tuple, SemanticFaqMatcher | None] = {}
+
+
+def _stat_key(path: Path) -> tuple:
+    try:
+        stat = path.stat()
+        return (str(path), stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        return (str(path), -1, -1)
+
+
+def load_semantic_matcher(
+    faq_path: Path, defaults: Mapping[str, str] | None = None
+) -> SemanticFaqMatcher | None:
+    """Return the shared matcher for defaults plus the entries in faq_path.
+
+    None means semantic matching is off: NumPy is missing, or no current
+    matrix has been saved next to the FAQ file. The result is cached until
+    either file changes.
+    """
+    if np is None:
+        return None
+    faq_path = Path(faq_path)
+    vec_path = vectors_path_for(faq_path)
+    default_pairs = tuple((defaults or {}).items())
+    signature = (_stat_key(faq_path), _stat_key(vec_path), default_pairs)
+    if signature in _CACHE:
+        return _CACHE[signature]
+
+    matcher = None
+    if signature[1][1] >= 0:
+        pairs = list(default_pairs) + read_faq_file(faq_path)
+        matcher = SemanticFaqMatcher.load(vec_path, pairs)
+    _CACHE.clear()
+    _CACHE[signature] = matcher
+    return matcher
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    from vca.core.responses import ResponseGenerator
+    from vca.domain.paths import FAQ_PATH
+
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.core.faq_semantic",
+        description="Precompute the FAQ vectors used for paraphrase matching.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="vectorise the FAQ entries and save them")
+    build.add_argument("--faq", type=Path, default=FAQ_PATH)
+    build.add_argument("--dimensions", type=int, default=DEFAULT_DIMENSIONS)
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("numpy is not installed, semantic FAQ matching is unavailable")
+        return 2
+
+    start = time.perf_counter()
+    pairs = list(ResponseGenerator._FAQ_MAP.items()) + read_faq_file(args.faq)
+    matcher = SemanticFaqMatcher.build(pairs, dimensions=args.dimensions)
+    out = vectors_path_for(args.faq)
+    matcher.save(out)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Vectorised {len(matcher)} FAQ entries ({matcher.dimensions} dimensions) "
+        f"in {elapsed:.2f}s -> {out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
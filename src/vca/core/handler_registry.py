@@ -0,0 +1,155 @@
+"""vca.core.handler_registry
+
+Intent to response handler registry.
+
+User story 54 handler dispatch
+Handlers are called as handler(text, recent, context). Older handlers, and
+some test doubles, accept only (text, recent). Dispatch used to call with
+three arguments and retry with two on TypeError, which doubled the work for
+two argument handlers and hid TypeErrors raised inside a handler.
+
+The registry inspects each handler's signature once when it is registered and
+stores a call adapter that passes the right number of arguments. Handlers
+that were not registered, for example one returned by a monkeypatched
+route_intent, get their adapter from call_adapter, which caches the
+signature check per underlying function.
+"""
+
+from __future__ import annotations
+
+import inspect
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.session import Message
+
+Handler = Callable[..., str]
+HandlerCall = Callable[
+    [Handler, str, Optional[List[Message]], Optional[List[ChatTurn]]], str
+]
+
+# Positional parameter count per plain function. None means the count is
+# unknown or unbounded (*args), in which case all three arguments are passed.
+_CAPACITY_CACHE: "weakref.WeakKeyDictionary[object, int | None]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _call_with_context(
+    handler: Handler,
+    text: str,
+    recent: Optional[List[Message]],
+    context: Optional[List[ChatTurn]],
+) -> str:
+    return handler(text, recent, context)
+
+
+def _call_without_context(
+    handler: Handler,
+    text: str,
+    recent: Optional[List[Message]],
+    _context: Optional[List[ChatTurn]],
+) -> str:
+    return handler(text, recent)
+
+
+def _positional_capacity(func: object) -> int | None:
+    try:
+        signature = inspect.signature(func)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+    count = 0
+    for param in signature.parameters.values():
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            return None
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            count += 1
+    return count
+
+
+def call_adapter(handler: Handler) -> HandlerCall:
+    """Return the adapter that calls handler with the arguments it accepts.
+
+    Bound methods are cached by their underlying function, so looking up a
+    handler through an instance attribute on every turn stays cheap.
+    """
+    func = getattr(handler, "__func__", handler)
+    try:
+        capacity = _CAPACITY_CACHE[func]
+    except (KeyError, TypeError):
+        capacity = _positional_capacity(func)
+        try:
+            _CAPACITY_CACHE[func] = capacity
+        except TypeError:
+            pass
+
+    if capacity is not None and func is not handler:
+        capacity -= 1
+
+    if capacity == 2:
+        return _call_without_context
+    return _call_with_context
+
+
+@dataclass(frozen=True)
+class RegisteredHandler:
+    """A handler together with the adapter chosen for it at registration."""
+
+    handler: Handler
+    call: HandlerCall
+
+    def __call__(
+        self,
+        text: str,
+        recent: Optional[List[Message]],
+        context: Optional[List[ChatTurn]] = None,
+    ) -> str:
+        return self.call(self.handler, text, recent, context)
+
+
+class HandlerRegistry:
+    """Maps intent names to handlers.
+
+    Keys are intent values, trimmed and casefolded, so Intent.HELP, "help"
+    and " HELP " all find the same handler. Lookups for names that were never
+    registered return the fallback entry.
+    """
+
+    def __init__(self, fallback: str = "unknown") -> None:
+        self._entries: Dict[str, RegisteredHandler] = {}
+        self._fallback = fallback
+
+    @staticmethod
+    def key_for(intent: object) -> str:
+        if intent is None:
+            return "unknown"
+        if hasattr(intent, "value"):
+            intent = intent.value
+        return str(intent).strip().casefold()
+
+    def register(self, intent: object, handler: Handler) -> RegisteredHandler:
+        """Register handler for intent, replacing any existing handler."""
+        if not callable(handler):
+            raise TypeError("handler must be callable")
+        entry = RegisteredHandler(handler=handler, call=call_adapter(handler))
+        self._entries[self.key_for(intent)] = entry
+        return entry
+
+    def lookup(self, intent: object) -> RegisteredHandler:
+        """Return the entry for intent, or the fallback entry."""
+        entry = self._entries.get(self.key_for(intent))
+        if entry is None:
+            entry = self._entries[self._fallback]
+        return entry
+
+    def __contains__(self, intent: object) -> bool:
+        return self.key_for(intent) in self._entries
+
+    def intents(self) -> list[str]:
+        return list(self._entries)
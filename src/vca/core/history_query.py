@@ -0,0 +1,66 @@
+"""vca.core.history_query
+
+Parsing of paged history requests.
+
+User story 60 paged history
+"history page 3" asks for the third page of saved turns counting back from
+the most recent, and "history since 2026-10-01" for the turns saved at or
+after a date (an ISO time such as 2026-10-01T09:30 also works, read as
+UTC). Anything else is a plain history request.
+
+User story 61 history search
+"history search <words>" asks for the saved turns containing every word,
+newest first. An "intent:<name>" word limits the search to turns saved with
+that intent, so "history search intent:question" lists saved questions.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import re
+from dataclasses import dataclass
+
+_PAGE_RE = re.compile(r"\bpage\s+(\d{1,6})\b")
+_SEARCH_RE = re.compile(r"\bsearch\b(.*)$")
+_SINCE_RE = re.compile(
+    r"\bsince\s+(\d{4}-\d{2}-\d{2}(?:[t ]\d{2}:\d{2}(?::\d{2})?)?)(?![\d:])"
+)
+
+
+@dataclass(frozen=True)
+class HistoryQuery:
+    page: int = 1
+    since: _dt.datetime | None = None
+    search: str | None = None
+    intent: str | None = None
+
+
+def parse_history_query(text: str) -> HistoryQuery | None:
+    """Return the page, since or search request in text, or None."""
+    lowered = (text or "").strip().casefold()
+
+    m = _SEARCH_RE.search(lowered)
+    if m:
+        words: list[str] = []
+        intent = None
+        for word in m.group(1).split():
+            if word.startswith("intent:") and len(word) > len("intent:"):
+                intent = word[len("intent:") :]
+            else:
+                words.append(word)
+        return HistoryQuery(search=" ".join(words), intent=intent)
+
+    m = _SINCE_RE.search(lowered)
+    if m:
+        try:
+            since = _dt.datetime.fromisoformat(m.group(1).replace(" ", "t").upper())
+        except ValueError:
+            return None
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=_dt.timezone.utc)
+        return HistoryQuery(since=since)
+
+    m = _PAGE_RE.search(lowered)
+    if m:
+        return HistoryQuery(page=max(1, int(m.group(1))))
+    return None
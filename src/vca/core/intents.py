@@ -22,14 +22,20 @@ matching on word sequences. Exact command inputs for help and exit are preferred
 User story 35 performance policy
 Regex patterns and phrase tokenization are precomputed so classify_result avoids
 repeated compilation and repeated phrase splitting.
+
+User story 53 shared text features
+classify and classify_result also accept a PreparedInput, so the casefolded
+text and word tokens the engine already derived are reused instead of being
+computed again.
 """
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+from vca.core.prepared_input import WORD_RE, PreparedInput, prepare
 
 
 class Intent(str, Enum):
@@ -147,7 +153,7 @@ class IntentClassifier:
         "will",
     )
 
-    _WORD_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+    _WORD_RE = WORD_RE
 
     # Priority ordering, higher wins.
     _PRIORITY = {
@@ -167,7 +173,7 @@ class IntentClassifier:
     # Structure:
     # intent -> list of groups
     # group for token: ("token", set[str], rule)
-    # group for phrase: ("phrase", list[list[str]], rule)
+    # group for phrase: ("phrase", list[tuple[str, ...]], rule)
     _COMPILED_GROUPS: dict[Intent, list[tuple[str, object, str]]] = {}
 
     @classmethod
@@ -179,10 +185,10 @@ class IntentClassifier:
                 if match_type == "token":
                     out_groups.append((match_type, values, rule))
                 else:
-                    phrase_words_list: list[list[str]] = []
+                    phrase_words_list: list[tuple[str, ...]] = []
                     for phrase in values:
                         phrase_lower = phrase.casefold()
-                        words = cls._WORD_RE.findall(phrase_lower)
+                        words = tuple(cls._WORD_RE.findall(phrase_lower))
                         phrase_words_list.append(words)
                     out_groups.append((match_type, phrase_words_list, rule))
             compiled[intent] = out_groups
@@ -192,8 +198,12 @@ class IntentClassifier:
         self.last_decision: IntentDecision | None = None
         self.last_result: IntentResult | None = None
 
-        if not self._COMPILED_GROUPS:
-            IntentClassifier._COMPILED_GROUPS = self._compile_groups()
+        # Compile onto the concrete class so subclasses with their own synonym
+        # groups (for example the benchmark rule sets) never replace ours,
+        # and never inherit ours when the base class was compiled first.
+        cls = type(self)
+        if not cls.__dict__.get("_COMPILED_GROUPS"):
+            cls._COMPILED_GROUPS = cls._compile_groups()
 
     @staticmethod
     def _normalize(raw_text: str | None) -> tuple[str, str]:
@@ -211,7 +221,7 @@ class IntentClassifier:
 
     @staticmethod
     def _is_exact_command(
-        lower_no_edges: str, word_list: List[str], command_tokens: set[str]
+        lower_no_edges: str, word_list: Sequence[str], command_tokens: set[str]
     ) -> bool:
         if len(word_list) != 1:
             return False
@@ -220,7 +230,9 @@ class IntentClassifier:
         return lower_no_edges in command_tokens
 
     @staticmethod
-    def _phrase_words_match(word_list: List[str], phrase_words: List[str]) -> bool:
+    def _phrase_words_match(
+        word_list: Sequence[str], phrase_words: Sequence[str]
+    ) -> bool:
         if not phrase_words:
             return False
         if len(phrase_words) == 1:
@@ -228,6 +240,8 @@ class IntentClassifier:
         if len(word_list) < len(phrase_words):
             return False
 
+        phrase_words = tuple(phrase_words)
+        word_list = tuple(word_list)
         last = len(word_list) - len(phrase_words)
         for i in range(0, last + 1):
             if word_list[i : i + len(phrase_words)] == phrase_words:
@@ -271,12 +285,14 @@ class IntentClassifier:
 
         return base
 
-    def classify(self, raw_text: str | None) -> Intent:
+    def classify(self, raw_text: PreparedInput | str | None) -> Intent:
         result = self.classify_result(raw_text)
         return result.intent
 
-    def classify_result(self, raw_text: str | None) -> IntentResult:
-        stripped, lower = self._normalize(raw_text)
+    def classify_result(self, raw_text: PreparedInput | str | None) -> IntentResult:
+        prepared = prepare(raw_text, self._WORD_RE)
+        stripped = prepared.stripped
+        lower = prepared.lower
 
         if stripped == "":
             decision = IntentDecision(Intent.EMPTY, "empty_input", [])
@@ -285,9 +301,9 @@ class IntentClassifier:
             self.last_result = result
             return result
 
-        lower_no_edges = self._strip_edge_punct(lower)
-        word_list = self._words(lower)
-        words_set = set(word_list)
+        lower_no_edges = prepared.lower_no_edges
+        word_list = prepared.words
+        words_set = prepared.word_set
 
         candidates: List[Tuple[Intent, str]] = []
         matched_help_phrase = False
@@ -0,0 +1,81 @@
+"""vca.core.prepared_input
+
+Text features of one cleaned user input, derived once per turn.
+
+User story 53 shared text features
+The classifier, the multi intent check and the FAQ lookup all need the same
+casefolded text and word tokens. ChatEngine builds a PreparedInput in its
+validate stage and passes it through the pipeline so each feature is computed
+once. The string based APIs still work and build a PreparedInput internally.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+# Word tokens used for intent matching. Matches lowercase words with an
+# optional apostrophe suffix such as "don't".
+WORD_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+# Punctuation and whitespace removed from both ends for exact command checks.
+_EDGE_CHARS = " \t\r\n!.,;:()[]{}\"'"
+
+
+@dataclass(frozen=True)
+class PreparedInput:
+    """Cleaned input and the features derived from it.
+
+    Attributes:
+        text: Cleaned text as produced by InputValidator
+        stripped: text with leading and trailing whitespace removed
+        lower: stripped, casefolded
+        lower_no_edges: lower with edge punctuation removed
+        words: Word tokens of lower in order
+        word_set: The same tokens as a set for membership checks
+        word_re: Pattern the tokens were found with
+    """
+
+    text: str
+    stripped: str
+    lower: str
+    lower_no_edges: str
+    words: tuple[str, ...]
+    word_set: frozenset[str]
+    word_re: re.Pattern[str] = field(default=WORD_RE, compare=False, repr=False)
+
+    @classmethod
+    def from_text(
+        cls, raw_text: object, word_re: re.Pattern[str] = WORD_RE
+    ) -> PreparedInput:
+        """Derive every feature from raw_text (None becomes empty).
+
+        word_re finds the word tokens, callers with their own tokenizer pass it.
+        """
+        text = "" if raw_text is None else str(raw_text)
+        stripped = text.strip()
+        lower = stripped.casefold()
+        words = tuple(word_re.findall(lower))
+        return cls(
+            text=text,
+            stripped=stripped,
+            lower=lower,
+            lower_no_edges=lower.strip(_EDGE_CHARS),
+            words=words,
+            word_set=frozenset(words),
+            word_re=word_re,
+        )
+
+
+def prepare(
+    value: PreparedInput | str | None, word_re: re.Pattern[str] = WORD_RE
+) -> PreparedInput:
+    """Return value unchanged if it is already prepared, otherwise prepare it.
+
+    A value prepared with a different word_re is tokenised again with word_re.
+    """
+    if isinstance(value, PreparedInput):
+        if value.word_re is word_re:
+            return value
+        return PreparedInput.from_text(value.text, word_re)
+    return PreparedInput.from_text(value, word_re)
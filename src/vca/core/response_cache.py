@@ -0,0 +1,103 @@
+"""vca.core.response_cache
+
+Bounded LRU cache for deterministic response handlers.
+
+User story 64 response cache
+Most handlers build their reply from a few inputs only: the input text, the
+topic of the previous user message, the number of user messages in the
+session and, for questions, the knowledge base. A handler declares exactly
+those inputs with the pure decorator, and ResponseGenerator then keys the
+cache on the handler plus the values of the declared inputs. The key is
+cheap to build because the topic and the message count are already cached
+on the session (user stories 58 and 59).
+
+Handlers without a declaration, including handlers registered or
+monkeypatched at run time, always bypass the cache. The cache is off unless
+a ResponseCache is passed in (settings key response_cache_size).
+
+Inputs a handler can declare:
+    text             the input text with surrounding whitespace removed
+    topic            the previous user topic, as used for follow up answers
+    message_count    the number of user messages in the session
+    knowledge_base   the loaded knowledge base index (a rebuilt index is a
+                     different object, so old entries stop matching)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+
+RESPONSE_INPUTS = ("text", "topic", "message_count", "knowledge_base")
+DEFAULT_CACHE_SIZE = 256
+
+_F = TypeVar("_F", bound=Callable[..., str])
+
+
+def pure(*inputs: str) -> Callable[[_F], _F]:
+    """Mark a handler whose reply depends only on the named inputs."""
+    unknown = [name for name in inputs if name not in RESPONSE_INPUTS]
+    if unknown:
+        raise ValueError(f"unknown response inputs: {', '.join(unknown)}")
+    declared = tuple(name for name in RESPONSE_INPUTS if name in inputs)
+
+    def mark(handler: _F) -> _F:
+        handler.response_inputs = declared  # type: ignore[attr-defined]
+        return handler
+
+    return mark
+
+
+def declared_inputs(handler: object) -> tuple[str, ...] | None:
+    """Return the inputs handler declared with pure, or None if it did not."""
+    inputs = getattr(handler, "response_inputs", None)
+    return inputs if isinstance(inputs, tuple) else None
+
+
+class ResponseCache:
+    """Least recently used map from response fingerprints to replies."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> str | None:
+        """Return the cached reply for key, counting a hit or a miss."""
+        reply = self._entries.get(key)
+        if reply is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return reply
+
+    def put(self, key: Hashable, reply: str) -> None:
+        self._entries[key] = reply
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def bypass(self) -> None:
+        """Count a call to a handler that cannot be cached."""
+        self.bypassed += 1
+
+    def clear(self) -> None:
+        """Drop every entry. The counters are kept."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -12,22 +12,96 @@ User story 20
 Fallback responses are more helpful and consistent.
 Unknown intent fallback differs from error fallback.
 Fallback text is centralised in this module.
+
+User story 53
+The FAQ lookup accepts a PreparedInput and reuses its casefolded text.
+
+User story 54
+Handlers live in a HandlerRegistry built once per generator. Each handler's
+call adapter is chosen at registration, and register_handler adds handlers
+for new intents without subclassing. Built in handlers are looked up on the
+generator by method name at dispatch, so a handle_* method replaced on the
+instance or class after construction is still used.
+
+User story 55
+_FAQ_MAP holds the built in FAQ entries. Entries from the FAQ data file are
+added to them in a FaqIndex, which answers exact and near miss questions.
+
+User story 56
+handle_question answers from the local knowledge base when an index has been
+built with python -m vca.kb build. The search runs under a per turn budget of
+KB_BUDGET_S and a passage is only used when it covers at least
+KB_MIN_COVERAGE of the question's content words, otherwise the question is
+echoed as before. The index loaded from KB_PATH is kept on the generator,
+and its file is checked for a rebuild at most every KB_RECHECK_S seconds
+or on the next question after reload_knowledge_base.
+
+User story 57
+When the FaqIndex finds no entry, a SemanticFaqMatcher gets a chance to
+match paraphrased questions. It is only used when NumPy is installed and the
+FAQ vectors have been precomputed next to the FAQ data file. Scoring a query
+against every entry costs milliseconds on a large FAQ, so callers that know
+the intent only run it for question like intents (_SEMANTIC_FAQ_INTENTS).
+
+User story 58
+Follow up questions use the topic cached on the earlier user Message.
+
+User story 59
+_session_suffix reads the user message count from the session stats instead
+of scanning the recent messages.
+
+User story 60
+format_history_page renders a page of persisted turns read by the engine
+for "history page N" and "history since DATE".
+
+User story 61
+format_history_search renders the turns found by "history search".
+
+User story 63
+iter_history_page and iter_history_search yield the same text one line at a
+time, so a streamed history view starts printing before it is complete.
+
+User story 64
+Handlers whose reply depends only on a few inputs declare them with pure.
+dispatch answers them from an optional ResponseCache keyed on those inputs
+and calls every other handler directly. A reply built from a knowledge base
+search that ran out of its budget is not cached, a later search with time
+to finish may find a better passage.
 """
 
 from __future__ import annotations
 
-import re
-from typing import Callable, Dict, List, Optional
-
+import datetime as _dt
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from vca.core.faq_index import FaqIndex, load_faq_index
+from vca.core.faq_semantic import SemanticFaqMatcher, load_semantic_matcher
+from vca.core.handler_registry import (
+    Handler,
+    HandlerCall,
+    HandlerRegistry,
+    RegisteredHandler,
+    call_adapter,
+)
 from vca.core.intents import Intent
+from vca.core.prepared_input import PreparedInput
+from vca.core.response_cache import ResponseCache, declared_inputs, pure
 from vca.domain.chat_turn import ChatTurn
+from vca.domain.paths import FAQ_PATH, KB_PATH
 from vca.domain.session import Message
-
-Handler = Callable[..., str]
+from vca.domain.topics import extract_topic
+from vca.kb.index import KnowledgeBase, load_knowledge_base
+from vca.storage.history_store import HistoryPage, HistorySearchResult
 
 
 class ResponseGenerator:
     _ECHO_LIMIT = 200
+    _KB_ANSWER_LIMIT = 400
+
+    KB_BUDGET_S = 0.02
+    KB_MIN_COVERAGE = 0.6
+    KB_RECHECK_S = 2.0
 
     # US20 centralised fallback text
     _FALLBACK_UNKNOWN = (
@@ -43,6 +117,56 @@ class ResponseGenerator:
         "how is history stored": "History is stored in a JSONL file at data/history.jsonl (appended after each turn).",
     }
 
+    # Intents whose misses are worth a paraphrase search (US57).
+    _SEMANTIC_FAQ_INTENTS = frozenset({"question", "unknown", "help"})
+
+    # Intent name to handler method, registered for every generator instance.
+    _BUILTIN_HANDLERS: Dict[str, str] = {
+        "empty": "handle_empty",
+        "help": "handle_help",
+        "history": "handle_history",
+        "exit": "handle_exit",
+        "greeting": "handle_greeting",
+        "question": "handle_question",
+        "thanks": "handle_thanks",
+        "goodbye": "handle_goodbye",
+        "ambiguous": "handle_ambiguous",
+        "unknown": "handle_unknown",
+    }
+
+    def __init__(
+        self,
+        faq_index: FaqIndex | None = None,
+        knowledge_base: KnowledgeBase | None = None,
+        semantic_faq: SemanticFaqMatcher | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        self._faq_index = faq_index
+        self._response_cache = response_cache
+        self._semantic_faq = semantic_faq
+        # Saved FAQ vectors only describe the default FAQ entries.
+        self._load_semantic_faq = faq_index is None and semantic_faq is None
+        self._knowledge_base = knowledge_base
+        # US56: an index loaded from KB_PATH, and when its file was checked
+        self._kb_from_path = knowledge_base is None
+        self._kb_checked_at: float | None = None
+        # Knowledge base searches that ran out of their budget (US64)
+        self._kb_timeouts = 0
+        self._registry = HandlerRegistry(fallback="unknown")
+        # Entries registered for built in intents -> their method name
+        self._builtin_entries: Dict[RegisteredHandler, str] = {}
+        for intent, name in self._BUILTIN_HANDLERS.items():
+            entry = self._registry.register(intent, getattr(self, name))
+            self._builtin_entries[entry] = name
+
+    def register_handler(self, intent: Intent | str, handler: Handler) -> None:
+        """Route intent to handler, replacing a built in handler if needed.
+
+        handler is called as handler(text, recent, context) or, if it only
+        accepts two arguments, handler(text, recent).
+        """
+        self._registry.register(intent, handler)
+
     def generate(
         self,
         intent: Intent | str | None,
@@ -50,40 +174,91 @@ class ResponseGenerator:
         recent_messages: Optional[List[Message]] = None,
         context_turns: Optional[List[ChatTurn]] = None,
     ) -> str:
-        faq = self.faq_response_for(raw_text)
+        faq = self.faq_response_for(raw_text, intent)
         if faq is not None:
             return faq
 
-        resolved_intent = self._normalize_intent(intent)
         text = "" if raw_text is None else str(raw_text)
 
-        handler = self.route(resolved_intent)
-        return self._invoke(handler, text, recent_messages, context_turns)
+        # Built in intent names resolve through Intent, so unsupported names
+        # fall back to unknown. Intents added with register_handler are used
+        # directly.
+        key = HandlerRegistry.key_for(intent)
+        if key in self._BUILTIN_HANDLERS or key not in self._registry:
+            key = self._normalize_intent(intent).value
 
-    def route(self, intent) -> Handler:
-        if intent is None:
-            safe_intent = "unknown"
-        elif hasattr(intent, "value"):
-            safe_intent = str(intent.value)
-        else:
-            safe_intent = str(intent)
-
-        safe_intent = safe_intent.strip().casefold()
-
-        handlers: Dict[str, Handler] = {
-            "empty": self.handle_empty,
-            "help": self.handle_help,
-            "history": self.handle_history,
-            "exit": self.handle_exit,
-            "greeting": self.handle_greeting,
-            "question": self.handle_question,
-            "thanks": self.handle_thanks,
-            "goodbye": self.handle_goodbye,
-            "ambiguous": self.handle_ambiguous,
-            "unknown": self.handle_unknown,
-        }
+        entry = self._lookup(key)
+        return self.dispatch(
+            entry.handler, text, recent_messages, context_turns, call=entry.call
+        )
 
-        return handlers.get(safe_intent, self.handle_unknown)
+    def route(self, intent) -> Handler:
+        return self._lookup(intent).handler
+
+    def _lookup(self, intent: object) -> RegisteredHandler:
+        """Return the registry entry for intent, built in methods looked up now."""
+        entry = self._registry.lookup(intent)
+        name = self._builtin_entries.get(entry)
+        if name is None:
+            return entry
+        handler = getattr(self, name)
+        if handler == entry.handler:
+            return entry
+        return RegisteredHandler(handler=handler, call=call_adapter(handler))
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        return self._response_cache
+
+    def dispatch(
+        self,
+        handler: Handler,
+        text: str,
+        recent: Optional[List[Message]],
+        context: Optional[List[ChatTurn]],
+        *,
+        call: HandlerCall | None = None,
+    ) -> str:
+        """Call handler, answering from the response cache when it is pure."""
+        if call is None:
+            call = call_adapter(handler)
+        cache = self._response_cache
+        if cache is None:
+            return call(handler, text, recent, context)
+
+        inputs = declared_inputs(handler)
+        if inputs is None:
+            cache.bypass()
+            return call(handler, text, recent, context)
+
+        key = self._response_key(handler, inputs, text, recent, context)
+        reply = cache.get(key)
+        if reply is None:
+            timeouts = self._kb_timeouts
+            reply = call(handler, text, recent, context)
+            if self._kb_timeouts == timeouts:
+                cache.put(key, reply)
+        return reply
+
+    def _response_key(
+        self,
+        handler: Handler,
+        inputs: tuple[str, ...],
+        text: str,
+        recent: Optional[List[Message]],
+        context: Optional[List[ChatTurn]],
+    ) -> tuple:
+        key: list = [handler]
+        for name in inputs:
+            if name == "text":
+                key.append((text or "").strip())
+            elif name == "topic":
+                key.append(self._follow_up_topic(recent, context))
+            elif name == "message_count":
+                key.append(self._session_user_count(recent))
+            else:
+                key.append(self.knowledge_base)
+        return tuple(key)
 
     def _invoke(
         self,
@@ -92,12 +267,9 @@ class ResponseGenerator:
         recent: Optional[List[Message]],
         context: Optional[List[ChatTurn]],
     ) -> str:
-        # Important: some tests monkeypatch handlers that accept only 2 args
-        # So we try 3 args first, then retry with 2 args if needed
-        try:
-            return handler(text, recent, context)
-        except TypeError:
-            return handler(text, recent)
+        # Some tests monkeypatch handlers that accept only 2 args. The adapter
+        # picks the argument count from the signature instead of retrying.
+        return call_adapter(handler)(handler, text, recent, context)
 
     def _normalize_intent(self, intent: Intent | str | None) -> Intent:
         if intent is None:
@@ -109,133 +281,113 @@ class ResponseGenerator:
         except ValueError:
             return Intent.UNKNOWN
 
-    def normalize_faq_key(self, raw_text: str | None) -> str:
-        text = "" if raw_text is None else str(raw_text)
-        key = text.strip().casefold()
+    def normalize_faq_key(self, raw_text: PreparedInput | str | None) -> str:
+        if isinstance(raw_text, PreparedInput):
+            key = raw_text.lower
+        else:
+            text = "" if raw_text is None else str(raw_text)
+            key = text.strip().casefold()
         if key.endswith("?"):
             key = key[:-1].strip()
         return key
 
-    def faq_response_for(self, raw_text: str | None) -> Optional[str]:
+    @property
+    def faq_index(self) -> FaqIndex:
+        """The FAQ index, loaded from FAQ_PATH on first use."""
+        if self._faq_index is None:
+            self._faq_index = load_faq_index(FAQ_PATH, self._FAQ_MAP)
+        return self._faq_index
+
+    @property
+    def semantic_faq(self) -> SemanticFaqMatcher | None:
+        """The paraphrase matcher, or None when it is not available."""
+        if self._load_semantic_faq:
+            self._semantic_faq = load_semantic_matcher(FAQ_PATH, self._FAQ_MAP)
+            self._load_semantic_faq = False
+        return self._semantic_faq
+
+    def faq_response_for(
+        self,
+        raw_text: PreparedInput | str | None,
+        intent: Intent | str | None = None,
+    ) -> Optional[str]:
+        """Return the FAQ answer for raw_text, or None.
+
+        The paraphrase matcher only runs when intent is None or one of
+        _SEMANTIC_FAQ_INTENTS.
+        """
         key = self.normalize_faq_key(raw_text)
         if key == "":
             return None
-        return self._FAQ_MAP.get(key)
+        tokens = raw_text.words if isinstance(raw_text, PreparedInput) else None
+        match = self.faq_index.match(key, tokens)
+        if match is None and self._wants_semantic_faq(intent):
+            semantic = self.semantic_faq
+            if semantic is not None:
+                match = semantic.match(key)
+        return match.answer if match is not None else None
+
+    def _wants_semantic_faq(self, intent: Intent | str | None) -> bool:
+        if intent is None:
+            return True
+        return HandlerRegistry.key_for(intent) in self._SEMANTIC_FAQ_INTENTS
+
+    @property
+    def knowledge_base(self) -> KnowledgeBase | None:
+        """The knowledge base, or None when no index has been built."""
+        if not self._kb_from_path:
+            return self._knowledge_base
+        now = time.monotonic()
+        checked = self._kb_checked_at
+        if checked is None or now - checked >= self.KB_RECHECK_S:
+            self._knowledge_base = load_knowledge_base(KB_PATH)
+            self._kb_checked_at = now
+        return self._knowledge_base
+
+    def reload_knowledge_base(self) -> None:
+        """Check the index file for a rebuild on the next question."""
+        self._kb_checked_at = None
+
+    def knowledge_base_answer_for(self, text: str) -> Optional[str]:
+        """Return "From source: passage" for text, or None without a good hit."""
+        kb = self.knowledge_base
+        if kb is None:
+            return None
+        hit = kb.search(text, budget_s=self.KB_BUDGET_S)
+        if hit is not None and hit.timed_out:
+            self._kb_timeouts += 1
+        if hit is None or hit.coverage < self.KB_MIN_COVERAGE:
+            return None
+        answer = hit.text.strip()
+        if len(answer) > self._KB_ANSWER_LIMIT:
+            answer = answer[: self._KB_ANSWER_LIMIT] + "..."
+        return f"From {hit.source}: {answer}"
+
+    # Keep this exact method name because your tests reference it
+    def extract_topic_from_last_user_message(self, text: str) -> str:
+        return extract_topic(text)
 
-    def _previous_user_message_from_recent(
+    def _previous_user_topic_from_recent(
         self, recent: Optional[List[Message]]
-    ) -> str:
+    ) -> Optional[str]:
+        """Topic of the user message before the current one.
+
+        Uses the topic cached on the Message, so the cost does not depend on
+        how long that message was. None means there is no earlier user text.
+        """
         if not recent:
-            return ""
+            return None
         earlier = recent[:-1]
         for m in reversed(earlier):
             if m.role == "user":
-                return m.content
-        return ""
-
-    # Keep this exact method name because your tests reference it
-    def extract_topic_from_last_user_message(self, text: str) -> str:
-        if not text:
-            return ""
-
-        ignore_capitalised = {
-            "I",
-            "Tell",
-            "Please",
-            "Can",
-            "Could",
-            "Would",
-            "Should",
-            "Do",
-            "Does",
-            "Did",
-            "What",
-            "Where",
-            "When",
-            "Why",
-            "How",
-        }
-
-        proper_nouns = re.findall(r"\b[A-Z][a-zA-Z]+\b", text)
-        for w in proper_nouns:
-            if w in ignore_capitalised:
-                continue
-            if len(w) > 2:
-                return w.lower()
-
-        lowered = text.strip().lower()
-
-        m = re.search(r"\babout\s+([a-z0-9]+)\b", lowered)
-        if m:
-            return m.group(1)
-
-        m = re.search(r"\bregarding\s+([a-z0-9]+)\b", lowered)
-        if m:
-            return m.group(1)
-
-        cleaned = re.sub(r"[^a-z0-9\s]", " ", lowered)
-        words = [w for w in cleaned.split() if w]
-        if not words:
-            return ""
-
-        stop_words = {
-            "i",
-            "you",
-            "we",
-            "they",
-            "it",
-            "is",
-            "are",
-            "was",
-            "were",
-            "the",
-            "a",
-            "an",
-            "to",
-            "for",
-            "of",
-            "on",
-            "in",
-            "and",
-            "what",
-            "where",
-            "when",
-            "why",
-            "how",
-            "tell",
-            "me",
-            "about",
-            "regarding",
-            "please",
-            "can",
-            "could",
-            "would",
-            "should",
-            "do",
-            "does",
-            "did",
-            "am",
-            "im",
-            "be",
-            "been",
-            "being",
-            "want",
-            "need",
-            "like",
-            "visiting",
-            "going",
-            "this",
-            "that",
-            "these",
-            "those",
-        }
-
-        for w in words:
-            if w not in stop_words and len(w) > 2:
-                return w
-
-        return words[0]
-
+                if not m.content:
+                    return None
+                if m.topic is not None:
+                    return m.topic
+                return self.extract_topic_from_last_user_message(m.content)
+        return None
+
+    @pure()
     def handle_empty(
         self,
         _text: str,
@@ -244,6 +396,7 @@ class ResponseGenerator:
     ) -> str:
         return "Type a message and I will respond. You can also type help."
 
+    @pure()
     def handle_help(
         self,
         _text: str,
@@ -264,6 +417,67 @@ class ResponseGenerator:
         lines = [f"{m.role}: {m.content}" for m in last_few]
         return "Recent messages:\n" + "\n".join(lines)
 
+    def format_history_page(
+        self, page: HistoryPage, since: Optional[_dt.datetime] = None
+    ) -> str:
+        return "".join(self.iter_history_page(page, since))
+
+    def iter_history_page(
+        self, page: HistoryPage, since: Optional[_dt.datetime] = None
+    ) -> Iterator[str]:
+        """Yield format_history_page in chunks, one line per chunk."""
+        if page.total == 0:
+            yield "No saved history yet."
+            return
+        if not page.turns:
+            if since is not None:
+                yield f"No saved messages since {since.isoformat()}."
+            else:
+                yield f"There is no history page {page.page}. Pages: {page.pages}."
+            return
+
+        first = page.start + 1
+        last = page.start + len(page.turns)
+        if since is not None:
+            header = f"History since {since.isoformat()}"
+        else:
+            header = f"History page {page.page} of {page.pages}"
+        yield f"{header} (turns {first}-{last} of {page.total}):"
+        yield from self._iter_turn_lines(page.turns)
+
+    def format_history_search(
+        self, result: HistorySearchResult, words: str, intent: Optional[str] = None
+    ) -> str:
+        return "".join(self.iter_history_search(result, words, intent))
+
+    def iter_history_search(
+        self, result: HistorySearchResult, words: str, intent: Optional[str] = None
+    ) -> Iterator[str]:
+        """Yield format_history_search in chunks, one line per chunk."""
+        described = " ".join(
+            part for part in (words, f"intent:{intent}" if intent else "") if part
+        )
+        if not described:
+            yield "Type history search followed by the words to look for."
+            return
+        if not result.turns:
+            yield f'No saved turns match "{described}".'
+            return
+
+        shown = len(result.turns)
+        header = f'Found {result.total} saved turns matching "{described}"'
+        if shown < result.total:
+            header += f", showing the newest {shown}"
+        yield header + ":"
+        yield from self._iter_turn_lines(result.turns)
+
+    @staticmethod
+    def _iter_turn_lines(turns: Iterable[ChatTurn]) -> Iterator[str]:
+        for turn in turns:
+            yield f"\nuser: {turn.user_text}"
+            yield f"\nassistant: {turn.assistant_text}"
+
+    @pure()
     def handle_exit(
         self,
         _text: str,
@@ -272,6 +486,7 @@ class ResponseGenerator:
     ) -> str:
         return "Goodbye."
 
+    @pure("message_count")
     def handle_greeting(
         self,
         _text: str,
@@ -280,6 +495,7 @@ class ResponseGenerator:
     ) -> str:
         return "Hello. Type help to see what I can do." + self._session_suffix(recent)
 
+    @pure("text", "topic", "message_count", "knowledge_base")
     def handle_question(
         self,
         text: str,
@@ -290,23 +506,19 @@ class ResponseGenerator:
         if preview == "":
             return "I did not catch your question. Type help for commands."
 
-        # Prefer recent messages because it always exists in engine flow
-        previous_user_text = self._previous_user_message_from_recent(recent)
+        answer = self.knowledge_base_answer_for(text)
+        if answer is not None:
+            return answer + self._session_suffix(recent)
 
-        # Fall back to context if recent was not provided
-        if previous_user_text == "" and context:
-            previous_user_text = context[-1].user_text
-
-        if previous_user_text:
-            topic = self.extract_topic_from_last_user_message(previous_user_text)
-            if topic:
-                return (
-                    "Following up on your earlier message about "
-                    + topic
-                    + ": "
-                    + preview
-                    + self._session_suffix(recent)
-                )
+        topic = self._follow_up_topic(recent, context)
+        if topic:
+            return (
+                "Following up on your earlier message about "
+                + topic
+                + ": "
+                + preview
+                + self._session_suffix(recent)
+            )
 
         return (
             "I think you are asking a question: "
@@ -314,6 +526,7 @@ class ResponseGenerator:
             + self._session_suffix(recent)
         )
 
+    @pure()
     def handle_thanks(
         self,
         _text: str,
@@ -322,6 +535,7 @@ class ResponseGenerator:
     ) -> str:
         return "You are welcome."
 
+    @pure()
     def handle_goodbye(
         self,
         _text: str,
@@ -330,6 +544,7 @@ class ResponseGenerator:
     ) -> str:
         return "Goodbye."
 
+    @pure()
     def handle_ambiguous(
         self,
         _text: str,
@@ -338,6 +553,7 @@ class ResponseGenerator:
     ) -> str:
         return "I am not fully sure what you meant. Please rephrase, or type help to see commands."
 
+    @pure()
     def handle_unknown(
         self,
         _text: str,
@@ -352,12 +568,33 @@ class ResponseGenerator:
             return stripped[: self._ECHO_LIMIT] + "..."
         return stripped
 
-    def _session_suffix(self, recent: Optional[List[Message]]) -> str:
+    def _follow_up_topic(
+        self, recent: Optional[List[Message]], context: Optional[List[ChatTurn]]
+    ) -> Optional[str]:
+        # Prefer recent messages because it always exists in engine flow
+        topic = self._previous_user_topic_from_recent(recent)
+
+        # Fall back to context if recent was not provided
+        if topic is None and context:
+            topic = self.extract_topic_from_last_user_message(context[-1].user_text)
+        return topic
+
+    @staticmethod
+    def _session_user_count(recent: Optional[List[Message]]) -> int:
+        # US59: the engine passes RecentMessages, whose stats already hold
+        # the count. Plain lists are still scanned.
+        stats = getattr(recent, "stats", None)
+        if stats is not None:
+            return stats.user_messages
         user_count = 0
         if recent:
             for m in recent:
                 if m.role == "user":
                     user_count += 1
+        return user_count
+
+    def _session_suffix(self, recent: Optional[List[Message]]) -> str:
+        user_count = self._session_user_count(recent)
         return f"  Messages this session: {user_count}" if user_count > 0 else ""
 
     def fallback_unknown(self) -> str:
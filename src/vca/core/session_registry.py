@@ -0,0 +1,235 @@
+"""vca.core.session_registry
+
+Many conversation sessions served from one process.
+
+User story 71 session registry
+A ChatEngine serves one session. SessionRegistry keeps one engine per
+session id and gives all of them the same IntentClassifier,
+ResponseGenerator and interaction log, so a session costs its engine and
+its ConversationSession and nothing else. At most max_hot sessions are kept
+in memory. When another session is needed, the least recently used one is
+evicted: its engine writes a snapshot (user story 69) to a file named after
+the session id, and its history store is closed. The next turn for an
+evicted session creates a new engine, which restores the snapshot.
+
+Snapshot files are spread over 256 subdirectories by the first two hex
+digits of a hash of the session id, so no directory grows past a few
+thousand files. Each session gets its own history store from
+history_factory. The default is a ShardedHistoryStore (user story 73) in
+the same root, so the history files sit next to the snapshots.
+
+User story 72 idle expiry
+With idle_ttl set, every turn moves the deadline of its session to idle_ttl
+seconds later in a TimerWheel. Each lookup first advances the wheel to the
+current time and evicts the sessions whose deadline passed, the same way
+as least recently used eviction, then flushes the shared interaction log.
+expire_idle does the same on demand, for a caller that wants idle sessions
+written out while no turns arrive. The cost per turn does not depend on how
+many sessions are hot.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterator
+
+from vca.core.engine import ChatEngine, HistoryStoreLike, InteractionLogStoreLike
+from vca.core.intents import IntentClassifier
+from vca.core.response_cache import ResponseCache
+from vca.core.responses import ResponseGenerator
+from vca.core.settings import Settings
+from vca.domain.memory_budget import MemoryBudget
+from vca.domain.timer_wheel import TimerWheel
+from vca.storage.interaction_log_store import InteractionLogStore
+from vca.storage.sharded_history import (  # noqa: F401
+    ShardedHistoryStore,
+    session_key,
+    session_path,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_HOT = 1000
+
+
+class SessionRegistry:
+    """Least recently used set of hot sessions over per session snapshots."""
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        max_hot: int = DEFAULT_MAX_HOT,
+        history_factory: Callable[[str], HistoryStoreLike] | None = None,
+        interaction_log: InteractionLogStoreLike | None = None,
+        response_cache: ResponseCache | None = None,
+        memory_budget: MemoryBudget | None = None,
+        session_max_bytes: int = 0,
+        resident_turns: int = 0,
+        idle_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.root = Path(root)
+        self.max_hot = max(1, int(max_hot))
+        self._shards: ShardedHistoryStore | None = None
+        if history_factory is None:
+            self._shards = ShardedHistoryStore(self.root)
+            history_factory = self._shards.shard
+        self._history_factory = history_factory
+        self._interaction_log = (
+            interaction_log if interaction_log is not None else InteractionLogStore()
+        )
+        self._classifier = IntentClassifier()
+        self._responder = ResponseGenerator(response_cache=response_cache)
+        self._memory_budget = memory_budget
+        self._session_max_bytes = session_max_bytes
+        self._resident_turns = resident_turns
+        # session id -> (engine, its history store)
+        self._hot: OrderedDict[str, tuple[ChatEngine, HistoryStoreLike]] = OrderedDict()
+        self.idle_ttl = max(0.0, float(idle_ttl))
+        self._clock = clock
+        self._idle = TimerWheel(start=clock()) if self.idle_ttl > 0 else None
+        self.hits = 0
+        self.misses = 0
+        self.rehydrated = 0
+        self.evictions = 0
+        self.expired = 0
+
+    @classmethod
+    def from_settings(
+        cls, root: Path | str, settings: Settings, **kwargs
+    ) -> "SessionRegistry":
+        """Build a registry with the session limits and caches of settings."""
+        if settings.response_cache_size > 0:
+            kwargs.setdefault(
+                "response_cache", ResponseCache(settings.response_cache_size)
+            )
+        if settings.process_max_bytes > 0:
+            kwargs.setdefault("memory_budget", MemoryBudget(settings.process_max_bytes))
+        kwargs.setdefault("session_max_bytes", settings.session_max_bytes)
+        kwargs.setdefault("resident_turns", settings.session_resident_turns)
+        kwargs.setdefault("idle_ttl", settings.session_idle_ttl)
+        return cls(root, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._hot)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._hot
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the hot session ids, least recently used first."""
+        return iter(self._hot)
+
+    def snapshot_path(self, session_id: str) -> Path:
+        return session_path(self.root, session_id, ".snapshot")
+
+    def engine(self, session_id: str) -> ChatEngine:
+        """Return the engine of session_id, loading or creating it if needed."""
+        if self._idle is not None:
+            now = self._clock()
+            self.expire_idle(now)
+            self._idle.schedule(session_id, now + self.idle_ttl)
+        entry = self._hot.get(session_id)
+        if entry is not None:
+            self._hot.move_to_end(session_id)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        while len(self._hot) >= self.max_hot:
+            self._evict_oldest()
+        history = self._history_factory(session_id)
+        engine = ChatEngine(
+            history=history,
+            interaction_log=self._interaction_log,
+            session_max_bytes=self._session_max_bytes,
+            memory_budget=self._memory_budget,
+            snapshot_path=self.snapshot_path(session_id),
+            resident_turns=self._resident_turns,
+            classifier=self._classifier,
+            responder=self._responder,
+        )
+        if engine.resumed_from_snapshot:
+            self.rehydrated += 1
+        self._hot[session_id] = (engine, history)
+        return engine
+
+    def process_turn(self, session_id: str, text: str | None) -> str:
+        """Answer text in the session session_id."""
+        return self.engine(session_id).process_turn(text)
+
+    def evict(self, session_id: str) -> bool:
+        """Write session_id to its snapshot and drop it from memory.
+
+        Returns False if the session was not hot.
+        """
+        entry = self._hot.pop(session_id, None)
+        if entry is None:
+            return False
+        if self._idle is not None:
+            self._idle.cancel(session_id)
+        self._suspend(*entry)
+        self.evictions += 1
+        return True
+
+    def expire_idle(self, now: float | None = None) -> int:
+        """Evict the sessions idle for idle_ttl seconds. Returns how many."""
+        if self._idle is None:
+            return 0
+        expired = 0
+        for session_id in self._idle.advance(self._clock() if now is None else now):
+            entry = self._hot.pop(session_id, None)
+            if entry is not None:
+                self._suspend(*entry)
+                expired += 1
+        if expired:
+            self.expired += expired
+            self._call(self._interaction_log, "flush")
+        return expired
+
+    def close(self) -> None:
+        """Evict every hot session and close the shared interaction log."""
+        while self._hot:
+            self._evict_oldest()
+        self._call(self._interaction_log, "flush", "close")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hot": len(self._hot),
+            "max_hot": self.max_hot,
+            "hits": self.hits,
+            "misses": self.misses,
+            "rehydrated": self.rehydrated,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _evict_oldest(self) -> None:
+        session_id, entry = self._hot.popitem(last=False)
+        if self._idle is not None:
+            self._idle.cancel(session_id)
+        self._suspend(*entry)
+        self.evictions += 1
+
+    def _suspend(self, engine: ChatEngine, history: HistoryStoreLike) -> None:
+        self._call(history, "flush", "close")
+        if not engine.save_snapshot():
+            logger.warning("Session snapshot not written on eviction")
+        if self._memory_budget is not None:
+            self._memory_budget.release(engine.session)
+
+    @staticmethod
+    def _call(store: object, *names: str) -> None:
+        for name in names:
+            try:
+                method = getattr(store, name, None)
+                if callable(method):
+                    method()
+            except Exception:
+                pass
@@ -4,7 +4,7 @@ Application settings management.
 
 Loads configuration from a JSON file (default: config/settings.json) with sensible
 defaults. Supports overrides for history file path, history size limits, logging
-level, and log file path.
+level, log file path, and the response cache size.
 
 Settings are loaded once at startup and used throughout the application lifecycle.
 """
@@ -29,12 +29,24 @@ class Settings:
         history_max_turns: Maximum number of turns to keep in history (1-10000)
         log_level: Python logging level (logging.DEBUG, INFO, WARNING, etc.)
         log_file_path: Path to the error log file
+        response_cache_size: Entries kept in the response cache (0 turns it off)
+        session_max_bytes: Byte budget for the texts one session keeps (0 turns it off)
+        process_max_bytes: Byte budget shared by all sessions (0 turns it off)
+        session_resident_turns: Turns kept in memory, older ones are read from
+            history when needed (0 keeps the whole history in memory)
+        session_idle_ttl: Seconds without a turn after which a SessionRegistry
+            writes a session out of memory (0 turns it off)
     """
 
     history_file_path: Path
     history_max_turns: int
     log_level: int
     log_file_path: Path
+    response_cache_size: int = 0
+    session_max_bytes: int = 0
+    process_max_bytes: int = 0
+    session_resident_turns: int = 0
+    session_idle_ttl: int = 0
 
 
 DEFAULT_SETTINGS_PATH = Path("config") / "settings.json"
@@ -102,12 +114,47 @@ def _apply_overrides(defaults: Settings, obj: Mapping[str, Any]) -> Settings:
     )
     log_level = _parse_log_level(obj.get("log_level"), defaults.log_level)
     log_file_path = _parse_path(obj.get("log_file_path"), defaults.log_file_path)
+    response_cache_size = _parse_int_range(
+        obj.get("response_cache_size"),
+        default=defaults.response_cache_size,
+        min_value=0,
+        max_value=100000,
+    )
+    session_max_bytes = _parse_int_range(
+        obj.get("session_max_bytes"),
+        default=defaults.session_max_bytes,
+        min_value=0,
+        max_value=1 << 40,
+    )
+    process_max_bytes = _parse_int_range(
+        obj.get("process_max_bytes"),
+        default=defaults.process_max_bytes,
+        min_value=0,
+        max_value=1 << 40,
+    )
+    session_resident_turns = _parse_int_range(
+        obj.get("session_resident_turns"),
+        default=defaults.session_resident_turns,
+        min_value=0,
+        max_value=10000,
+    )
+    session_idle_ttl = _parse_int_range(
+        obj.get("session_idle_ttl"),
+        default=defaults.session_idle_ttl,
+        min_value=0,
+        max_value=365 * 24 * 3600,
+    )
 
     return Settings(
         history_file_path=history_file_path,
         history_max_turns=history_max_turns,
         log_level=log_level,
         log_file_path=log_file_path,
+        response_cache_size=response_cache_size,
+        session_max_bytes=session_max_bytes,
+        process_max_bytes=process_max_bytes,
+        session_resident_turns=session_resident_turns,
+        session_idle_ttl=session_idle_ttl,
     )
 
 
@@ -30,6 +30,75 @@ _WHITESPACE_RUN = re.compile(r"\s+")
 # Collapse repeated punctuation deterministically. We allow up to 3 repeats.
 _REPEAT_PUNCT = re.compile(r"([!?.,])\1{3,}")
 
+# ASCII fast path (user story 51).
+# Rule 3 maps tab, carriage return and newline to a space and rule 4 deletes
+# every other ASCII control character, so both are one bytes.translate call.
+_ASCII_SPACE_TABLE = bytes.maketrans(b"\t\n\r", b"   ")
+_ASCII_CONTROL_DELETE = bytes(
+    code for code in [*range(0x20), 0x7F] if code not in (0x09, 0x0A, 0x0D)
+)
+
+# Runs that rule 6 would collapse. Checking with substring search first keeps
+# the common case free of any regex work.
+_ASCII_PUNCT_RUNS = ("!!!!", "????", "....", ",,,,")
+
+
+# Characters with combining class 0 that NFC can still compose onto the
+# character before them (NFC_Quick_Check=Maybe), plus the Hangul medial
+# vowel and final consonant jamo, which compose algorithmically. Cutting
+# the input right before one of these could change the normalised text.
+_NFC_MAYBE_STARTERS = frozenset(
+    "\u09be\u09d7\u0b3e\u0b56\u0b57\u0bbe\u0bd7\u0cc2\u0cd5\u0cd6"
+    "\u0d3e\u0d57\u0dcf\u0ddf\u0fb5\u0fb7\u102e\u1b35"
+    "\U00011127\U0001133e\U00011357\U000114b0\U000114ba\U000114bd"
+    "\U000115af\U00011930"
+    + "".join(chr(cp) for cp in range(0x1161, 0x1176))
+    + "".join(chr(cp) for cp in range(0x11A8, 0x11C3))
+)
+
+
+def _is_stable_starter(ch: str) -> bool:
+    """True if NFC never combines ch with, or reorders it across, what precedes it."""
+    if ch < "\x80":
+        return True
+    if unicodedata.combining(ch) or ch in _NFC_MAYBE_STARTERS:
+        return False
+    first = unicodedata.normalize("NFD", ch)[0]
+    return not unicodedata.combining(first) and first not in _NFC_MAYBE_STARTERS
+
+
+def _nfc_presorted(text: str) -> str:
+    """NFC of text in linear time, however long its combining mark runs are.
+
+    unicodedata.normalize puts each run of combining marks in canonical
+    order with an insertion sort, which is quadratic in the run length.
+    Decomposing character by character and stable sorting each run by
+    combining class first gives the same canonical order, which the final
+    normalize then only has to walk.
+    """
+    combining = unicodedata.combining
+    out: list[str] = []
+    run: list[str] = []
+    for ch in text:
+        for part in unicodedata.normalize("NFD", ch):
+            if combining(part):
+                run.append(part)
+                continue
+            if run:
+                run.sort(key=combining)
+                out.extend(run)
+                run = []
+            out.append(part)
+    if run:
+        run.sort(key=combining)
+        out.extend(run)
+    return unicodedata.normalize("NFC", "".join(out))
+
+
+def _keep_three(match: re.Match[str]) -> str:
+    # A callable replacement is cheaper than expanding a template per match.
+    return match.group(1) * 3
+
 
 @dataclass(frozen=True)
 class CleanResult:
@@ -50,10 +119,46 @@ class InputValidator:
     7 Truncate extremely long input to a fixed max length
 
     These rules are predictable and safe for CLI usage.
+
+    User story 51 fast path
+    Pure ASCII input takes a compiled path that gives the same output as the
+    rules above. ASCII text is already NFC, so rule 2 is skipped. Rules 3 and
+    4 are a single translate table. After that the only whitespace left is
+    the space, so rule 5 is a split and join. Collapsing a run of one
+    punctuation mark can never create or extend another run (the greedy
+    match consumes the whole run and its neighbours are different
+    characters), so rule 6 needs one regex pass instead of a fixpoint loop,
+    and only when such a run exists. Any non ASCII input goes through the
+    full rule order.
+
+    User story 52 bounded work
+    Only a prefix of the input is normalised. Rules 2 to 6 are local, so
+    cleaning a prefix that ends right before a stable starter gives a
+    prefix of the fully cleaned text. A stable starter is a character with
+    combining class 0 that NFC never composes onto the character before it
+    (every ASCII character is one), so no composition or reordering crosses
+    the cut. The window starts at SCAN_WINDOW characters and doubles until
+    the cleaned prefix is longer than MAX_LEN, which gives exactly the old
+    output and was_truncated flag. The window never grows past
+    MAX_SCAN_CHARS. Input that is still longer than that, because it is
+    almost all whitespace or control characters, or because a run of
+    combining marks goes on past it, is cleaned up to that point and
+    reported as truncated. Windows that end after a long run of combining
+    marks are normalised with a presorting NFC, because the NFC of the
+    standard library is quadratic in the length of such a run.
     """
 
     MAX_LEN = 2000
 
+    # Raw characters cleaned in the first window and the hard cap on how many
+    # raw characters are ever looked at (user story 52).
+    SCAN_WINDOW = 4 * MAX_LEN
+    MAX_SCAN_CHARS = 64 * MAX_LEN
+
+    # Windows whose cut point is further than this past the window end hold
+    # a long run of combining marks (user story 52).
+    _CUT_LOOKAHEAD = 64
+
     def clean(self, raw_text: object) -> CleanResult:
         # 1 Convert to string
         if raw_text is None:
@@ -61,9 +166,87 @@ class InputValidator:
         else:
             text = str(raw_text)
 
+        # 2 to 6 Normalise a bounded prefix
+        text, was_truncated = self._normalise_bounded(text)
+
+        # 7 Truncate long input
+        if len(text) > self.MAX_LEN:
+            text = text[: self.MAX_LEN]
+            was_truncated = True
+
+        return CleanResult(text=text, was_truncated=was_truncated)
+
+    def _normalise_bounded(self, text: str) -> tuple[str, bool]:
+        """Normalise just enough of text to produce the first MAX_LEN chars.
+
+        Returns the normalised text and whether raw input was left unread
+        because the scan cap was reached.
+        """
+        window = max(self.SCAN_WINDOW, self.MAX_LEN + 1)
+        while True:
+            if len(text) <= window:
+                return self._normalise(text), False
+
+            end = self._cut_point(text, window)
+            if end is None:
+                # A run of combining marks reaches past the scan cap.
+                cap = max(window, self.MAX_SCAN_CHARS)
+                return self._normalise(text[:cap], presort=True), True
+            cleaned = self._normalise(
+                text[:end], presort=end - window > self._CUT_LOOKAHEAD
+            )
+            if end >= len(text):
+                return cleaned, False
+            if len(cleaned) > self.MAX_LEN:
+                return cleaned, True
+            if window >= self.MAX_SCAN_CHARS:
+                return cleaned, True
+            window = min(window * 2, self.MAX_SCAN_CHARS)
+
+    def _cut_point(self, text: str, end: int) -> int | None:
+        """Return the first index at or after end that sits before a stable starter.
+
+        Returns len(text) if there is none before the end of text, and None
+        if there is none before MAX_SCAN_CHARS.
+        """
+        limit = max(end + self._CUT_LOOKAHEAD, self.MAX_SCAN_CHARS)
+        for i in range(end, min(len(text), limit)):
+            if _is_stable_starter(text[i]):
+                return i
+        if len(text) <= limit:
+            return len(text)
+        return None
+
+    @classmethod
+    def _normalise(cls, text: str, presort: bool = False) -> str:
+        # Use the ASCII fast path when possible
+        if text.isascii():
+            return cls._normalise_ascii(text)
+        return cls._normalise_unicode(text, presort)
+
+    @staticmethod
+    def _normalise_ascii(text: str) -> str:
+        """Rules 2 to 6 for pure ASCII text with at most one regex pass."""
+        text = (
+            text.encode("ascii")
+            .translate(_ASCII_SPACE_TABLE, _ASCII_CONTROL_DELETE)
+            .decode("ascii")
+        )
+        text = " ".join(text.split())
+        for run in _ASCII_PUNCT_RUNS:
+            if run in text:
+                return _REPEAT_PUNCT.sub(_keep_three, text)
+        return text
+
+    @staticmethod
+    def _normalise_unicode(text: str, presort: bool = False) -> str:
+        """Rules 2 to 6 applied one by one in the documented order."""
         # 2 Unicode normalisation (emoji safe)
         try:
-            text = unicodedata.normalize("NFC", text)
+            if presort:
+                text = _nfc_presorted(text)
+            else:
+                text = unicodedata.normalize("NFC", text)
         except Exception:
             pass
 
@@ -88,10 +271,4 @@ class InputValidator:
                 break
             text = new_text
 
-        # 7 Truncate long input
-        was_truncated = False
-        if len(text) > self.MAX_LEN:
-            text = text[: self.MAX_LEN]
-            was_truncated = True
-
-        return CleanResult(text=text, was_truncated=was_truncated)
+        return text
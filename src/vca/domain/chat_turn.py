@@ -1,9 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from vca.domain.timestamps import iso_to_ns, ns_to_iso
 
-@dataclass(frozen=True)
+
+class _CompactTimestamp:
+    """Dataclass field descriptor for an ISO timestamp (user story 65).
+
+    The value is stored in the slot named after the field with a leading
+    underscore, as a time.time_ns() integer when it is a UTC ISO string,
+    and read back as the ISO string.
+    """
+
+    __slots__ = ("_member",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._member = owner.__dict__["_" + name]
+
+    def __get__(self, obj: object, owner: type | None = None) -> str | None:
+        if obj is None:
+            # Read by @dataclass as the field default.
+            return None
+        return _iso_ts(self._member.__get__(obj, owner))
+
+    def __set__(self, obj: object, value: int | str | None) -> None:
+        self._member.__set__(obj, _compact_ts(value))
+
+
+@dataclass(frozen=True, init=False, eq=False)
 class ChatTurn:
     """Represents one complete conversation turn (user message + assistant response).
 
@@ -12,25 +37,115 @@ class ChatTurn:
         assistant_text: The assistant's response text
         user_ts: Optional timestamp when the user message was created (ISO format)
         assistant_ts: Optional timestamp when the assistant response was created (ISO format)
+        intent: Optional intent the engine answered the turn with
+        confidence: Optional classifier confidence for that intent
+        rule: Optional label of the classifier rule that matched
+
+    The last three are recorded when the turn is saved (user story 62) and
+    are None for turns saved by older versions.
+
+    User story 65: the timestamps are kept as time.time_ns() integers and
+    formatted when user_ts or assistant_ts is read. The constructor takes
+    either an ISO string or an integer. A string that would not format back
+    unchanged, such as a non UTC offset, is kept as it is. user_ts and
+    assistant_ts stay dataclass fields, so asdict() and replace() see the
+    ISO strings.
     """
 
+    __slots__ = (
+        "user_text",
+        "assistant_text",
+        "_user_ts",
+        "_assistant_ts",
+        "intent",
+        "confidence",
+        "rule",
+    )
+
     user_text: str
     assistant_text: str
-    user_ts: str | None = None
-    assistant_ts: str | None = None
+    user_ts: int | str | None = _CompactTimestamp()  # type: ignore[assignment]
+    assistant_ts: int | str | None = _CompactTimestamp()  # type: ignore[assignment]
+    intent: str | None
+    confidence: float | None
+    rule: str | None
+
+    def __init__(
+        self,
+        user_text: str,
+        assistant_text: str,
+        user_ts: int | str | None = None,
+        assistant_ts: int | str | None = None,
+        intent: str | None = None,
+        confidence: float | None = None,
+        rule: str | None = None,
+    ) -> None:
+        init = object.__setattr__
+        init(self, "user_text", user_text)
+        init(self, "assistant_text", assistant_text)
+        init(self, "_user_ts", _compact_ts(user_ts))
+        init(self, "_assistant_ts", _compact_ts(assistant_ts))
+        init(self, "intent", intent)
+        init(self, "confidence", confidence)
+        init(self, "rule", rule)
 
-    def to_dict(self) -> dict[str, str | None]:
+    def _key(self) -> tuple:
+        # Compares the stored timestamps without formatting them.
+        return (
+            self.user_text,
+            self.assistant_text,
+            self._user_ts,
+            self._assistant_ts,
+            self.intent,
+            self.confidence,
+            self.rule,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __getstate__(self) -> tuple:
+        return self._key()
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @property
+    def user_ns(self) -> int | None:
+        """The user timestamp in nanoseconds, or None if it is not UTC ISO."""
+        return self._user_ts if isinstance(self._user_ts, int) else None
+
+    @property
+    def assistant_ns(self) -> int | None:
+        """The assistant timestamp in nanoseconds, or None if it is not UTC ISO."""
+        return self._assistant_ts if isinstance(self._assistant_ts, int) else None
+
+    def to_dict(self) -> dict[str, str | float | None]:
         """Convert the ChatTurn to a dictionary representation.
 
         Returns:
-            Dictionary with keys: user_text, assistant_text, user_ts, assistant_ts
+            Dictionary with keys: user_text, assistant_text, user_ts, assistant_ts,
+            plus intent, confidence and rule when they are set
         """
-        return {
+        data: dict[str, str | float | None] = {
             "user_text": self.user_text,
             "assistant_text": self.assistant_text,
             "user_ts": self.user_ts,
             "assistant_ts": self.assistant_ts,
         }
+        if self.intent is not None:
+            data["intent"] = self.intent
+        if self.confidence is not None:
+            data["confidence"] = self.confidence
+        if self.rule is not None:
+            data["rule"] = self.rule
+        return data
 
     @staticmethod
     def from_dict(data: dict) -> "ChatTurn":
@@ -38,6 +153,7 @@ class ChatTurn:
 
         Args:
             data: Dictionary with keys: user_text, assistant_text, user_ts, assistant_ts
+                and optionally intent, confidence and rule
 
         Returns:
             New ChatTurn instance with values from the dictionary
@@ -47,4 +163,28 @@ class ChatTurn:
             assistant_text=str(data.get("assistant_text", "")),
             user_ts=data.get("user_ts"),
             assistant_ts=data.get("assistant_ts"),
+            intent=data.get("intent"),
+            confidence=turn_confidence(data.get("confidence")),
+            rule=data.get("rule"),
         )
+
+
+def turn_confidence(value: object) -> float | None:
+    """Return a stored confidence as a float, or None if it is missing or invalid."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+def _compact_ts(value: int | str | None) -> int | str | None:
+    if value is None or isinstance(value, int):
+        return value
+    ns = iso_to_ns(value)
+    return value if ns is None else ns
+
+
+def _iso_ts(value: int | str | None) -> str | None:
+    return ns_to_iso(value) if isinstance(value, int) else value
@@ -10,5 +10,6 @@ storage durability settings.
 HISTORY_MAX_TURNS = 500
 
 CONTEXT_WINDOW_TURNS = 3
+HISTORY_PAGE_SIZE = 10
 HISTORY_FSYNC_EVERY_WRITES = 10
 HISTORY_LOAD_LIMIT_TURNS = HISTORY_MAX_TURNS
@@ -0,0 +1,81 @@
+"""vca.domain.memory_budget
+
+Byte budgets for the message text a session keeps in memory.
+
+User story 68 byte budgets
+Counting messages does not bound memory, because one message can hold up to
+InputValidator.MAX_LEN characters and a reply can be longer. Each
+ConversationSession adds up the size of the texts it retains as messages
+are added and trimmed, and drops its oldest messages once that size passes
+its own max_bytes. Sessions that share one process can also share a
+MemoryBudget. While the shared total is past the limit, a session that adds
+a message trims its own oldest messages, but only down to its fair share
+(the limit divided by the number of sessions), so a small active session
+keeps its context while a large one gives up its older messages the next
+time it is used. A session always keeps its newest message.
+
+Sizes are sys.getsizeof of the text, which is what the string object takes,
+including its header. The Message and ChatTurn objects around the texts are
+not counted.
+"""
+
+from __future__ import annotations
+
+import sys
+import weakref
+
+
+def content_bytes(text: str) -> int:
+    """Return the approximate bytes a retained message text takes."""
+    return sys.getsizeof(text)
+
+
+class MemoryBudget:
+    """Byte budget shared by the sessions of one process.
+
+    Sessions charge it as their retained size changes. The share of a
+    session is given back when the session is cleared, released or garbage
+    collected.
+    """
+
+    def __init__(self, limit_bytes: int) -> None:
+        self.limit_bytes = max(0, int(limit_bytes))
+        self.used_bytes = 0
+        self._usage: dict[int, int] = {}
+        self._finalizers: dict[int, weakref.finalize] = {}
+
+    @property
+    def exceeded(self) -> bool:
+        """True if a limit is set and the sessions use more than it."""
+        return 0 < self.limit_bytes < self.used_bytes
+
+    @property
+    def sessions(self) -> int:
+        return len(self._usage)
+
+    @property
+    def fair_share(self) -> int:
+        """The limit divided evenly between the sessions charging it."""
+        return self.limit_bytes // max(1, len(self._usage))
+
+    def charge(self, owner: object, delta: int) -> None:
+        """Add delta bytes (negative to give bytes back) to owner's share."""
+        key = id(owner)
+        if key not in self._usage:
+            self._usage[key] = 0
+            finalizer = self._finalizers.get(key)
+            if finalizer is None or not finalizer.alive:
+                self._finalizers[key] = weakref.finalize(owner, self._forget, key)
+        self._usage[key] += delta
+        self.used_bytes += delta
+
+    def release(self, owner: object) -> None:
+        """Give back everything owner has charged."""
+        self._release(id(owner))
+
+    def _release(self, key: int) -> None:
+        self.used_bytes -= self._usage.pop(key, 0)
+
+    def _forget(self, key: int) -> None:
+        self._finalizers.pop(key, None)
+        self._release(key)
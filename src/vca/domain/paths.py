@@ -9,6 +9,9 @@ Paths can be overridden using environment variables:
 - VCA_HISTORY_PATH: Override the history file path
 - VCA_INTERACTIONS_PATH: Override the interaction log path
 - VCA_ERROR_LOG_PATH: Override the error log path
+- VCA_FAQ_PATH: Override the FAQ data file path
+- VCA_KB_PATH: Override the knowledge base index path
+- VCA_SNAPSHOT_PATH: Override the session snapshot path
 """
 
 from pathlib import Path
@@ -44,6 +47,9 @@ INTERACTION_LOG_PATH = _env_path(
     "VCA_INTERACTIONS_PATH", DATA_DIR / "interaction_log.jsonl"
 )
 ERROR_LOG_PATH = _env_path("VCA_ERROR_LOG_PATH", LOGS_DIR / "system_errors.log")
+FAQ_PATH = _env_path("VCA_FAQ_PATH", DATA_DIR / "faq.jsonl")
+KB_PATH = _env_path("VCA_KB_PATH", DATA_DIR / "kb.idx")
+SESSION_SNAPSHOT_PATH = _env_path("VCA_SNAPSHOT_PATH", DATA_DIR / "session.snapshot")
 
 
 def ensure_runtime_dirs() -> None:
@@ -1,75 +1,445 @@
 from __future__ import annotations
 
+import time
 from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Deque, List, Optional
+from itertools import islice
+from typing import Deque, Iterator, List, Optional, Protocol
 from uuid import uuid4
 
 from vca.domain.chat_turn import ChatTurn
-from vca.domain.constants import HISTORY_MAX_TURNS
+from vca.domain.constants import HISTORY_MAX_TURNS, HISTORY_PAGE_SIZE
+from vca.domain.memory_budget import MemoryBudget, content_bytes
+from vca.domain.session_stats import SessionStats
+from vca.domain.timestamps import datetime_to_ns, ns_to_datetime
+from vca.domain.topics import extract_topic
 
+MAX_SESSION_MESSAGES = HISTORY_MAX_TURNS * 2
 
-@dataclass(frozen=True)
+
+class _TurnPage(Protocol):
+    turns: List[ChatTurn]
+    total: int
+
+
+class TurnPager(Protocol):
+    """A history store the turn view can page older turns in from (US70)."""
+
+    def read_turns(self, start: int, count: int) -> _TurnPage: ...
+
+
+def _created_ns(created_ns: int | datetime | None, created_at: datetime | None) -> int:
+    """Return the creation time the constructor was given, in ns (US65).
+
+    created_at is the datetime callers passed before US65, by keyword or as
+    the third positional argument.
+    """
+    if created_at is not None:
+        if created_ns is not None:
+            raise TypeError("pass created_ns or created_at, not both")
+        created_ns = created_at
+    if isinstance(created_ns, datetime):
+        return datetime_to_ns(created_ns)
+    return int(created_ns)
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Message:
-    role: str
-    content: str
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    """One session message.
 
+    topic is the cached extract_topic result for user messages, set by
+    ConversationSession.add_message. None means it was never computed.
+    intent is the intent of the turn, recorded on the assistant reply.
 
-@dataclass(frozen=True)
+    US65: created_ns is the time.time_ns() creation time. created_at turns
+    it into a UTC datetime when it is read. The constructor still takes a
+    created_at datetime.
+    """
+
+    role: str
+    content: str
+    created_ns: int = field(default_factory=time.time_ns)
+    topic: str | None = None
+    intent: str | None = None
+
+    def __init__(
+        self,
+        role: str,
+        content: str,
+        created_ns: int | datetime | None = None,
+        topic: str | None = None,
+        intent: str | None = None,
+        *,
+        created_at: datetime | None = None,
+    ) -> None:
+        init = object.__setattr__
+        init(self, "role", role)
+        init(self, "content", content)
+        if created_ns is None and created_at is None:
+            created_ns = time.time_ns()
+        elif created_at is not None or created_ns.__class__ is not int:
+            created_ns = _created_ns(created_ns, created_at)
+        init(self, "created_ns", created_ns)
+        init(self, "topic", topic)
+        init(self, "intent", intent)
+
+    @property
+    def created_at(self) -> datetime:
+        return ns_to_datetime(self.created_ns)
+
+
+def _restored_turn(fields: tuple) -> ChatTurn:
+    """Build a ChatTurn from the fields snapshot_state wrote (US69).
+
+    The timestamps are already in their stored form, which the constructor
+    takes as they are.
+    """
+    user_text, assistant_text, user_ts, assistant_ts, intent, confidence, rule = fields
+    return ChatTurn(
+        user_text, assistant_text, user_ts, assistant_ts, intent, confidence, rule
+    )
+
+
+def _turn_fields(turn: ChatTurn) -> tuple:
+    return (
+        turn.user_text,
+        turn.assistant_text,
+        turn._user_ts,
+        turn._assistant_ts,
+        turn.intent,
+        turn.confidence,
+        turn.rule,
+    )
+
+
+def _message_fields(message: Message) -> tuple:
+    return (
+        message.role,
+        message.content,
+        message.created_ns,
+        message.topic,
+        message.intent,
+    )
+
+
+class RecentMessages(List[Message]):
+    """A list of recent messages that also carries the session's stats.
+
+    Handlers receive it as their recent argument. Plain lists still work,
+    stats is just not available on them.
+    """
+
+    def __init__(self, messages=(), stats: SessionStats | None = None) -> None:
+        super().__init__(messages)
+        self.stats = stats
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class ClarificationState:
     original_text: str
     options: List[str]
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_ns: int = field(default_factory=time.time_ns)
     attempts: int = 0
 
+    def __init__(
+        self,
+        original_text: str,
+        options: List[str],
+        created_ns: int | datetime | None = None,
+        attempts: int = 0,
+        *,
+        created_at: datetime | None = None,
+    ) -> None:
+        init = object.__setattr__
+        init(self, "original_text", original_text)
+        init(self, "options", options)
+        if created_ns is None and created_at is None:
+            created_ns = time.time_ns()
+        elif created_at is not None or created_ns.__class__ is not int:
+            created_ns = _created_ns(created_ns, created_at)
+        init(self, "created_ns", created_ns)
+        init(self, "attempts", attempts)
+
+    @property
+    def created_at(self) -> datetime:
+        return ns_to_datetime(self.created_ns)
+
+
+def _slice(view: Sequence, index: slice) -> list:
+    """Return view[index] as a list, reading only the tail for [-k:] (US67)."""
+    start = index.start
+    if index.stop is None and index.step is None and start is not None and start < 0:
+        tail = list(islice(reversed(view), -start))
+        tail.reverse()
+        return tail
+    return list(view)[index]
+
+
+class SessionMessages(Sequence[Message]):
+    """Read only view of a session's messages in the order they were added.
+
+    US66: the messages are not stored. Each one is built from the turn ring
+    or taken from the buffer of messages outside any turn when the view is
+    read. Reading from the end (reversed, negative indexes) only touches the
+    messages it returns.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self, session: "ConversationSession") -> None:
+        self._session = session
+
+    def __len__(self) -> int:
+        return self._session._message_count()
+
+    def __iter__(self) -> Iterator[Message]:
+        return self._session._iter_messages()
+
+    def __reversed__(self) -> Iterator[Message]:
+        return self._session._iter_messages_reversed()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _slice(self, index)
+        count = len(self)
+        if index < -count or index >= count:
+            raise IndexError("message index out of range")
+        if index < 0:
+            return next(islice(reversed(self), -index - 1, None))
+        return next(islice(iter(self), index, None))
+
+
+class SessionTurns(Sequence[ChatTurn]):
+    """Read only view of the turns a session keeps for its context window.
+
+    US70: with a backing store, turns older than the resident ones are read
+    from the store when the view reaches them, up to max_turns turns in all.
+    """
+
+    __slots__ = ("_session", "_backed")
+
+    def __init__(self, session: "ConversationSession") -> None:
+        self._session = session
+        # (store index of the first backed turn, backed turn count)
+        self._backed = session._backed_range()
+
+    def __len__(self) -> int:
+        return self._session._visible_turns() + self._backed[1]
+
+    def __iter__(self) -> Iterator[ChatTurn]:
+        session = self._session
+        start, count = self._backed
+        for offset in range(0, count, HISTORY_PAGE_SIZE):
+            size = min(HISTORY_PAGE_SIZE, count - offset)
+            yield from session.backing.read_turns(start + offset, size).turns
+        yield from islice(session._ring, session._hidden, None)
+
+    def __reversed__(self) -> Iterator[ChatTurn]:
+        session = self._session
+        yield from islice(reversed(session._ring), session._visible_turns())
+        start, count = self._backed
+        for stop in range(count, 0, -HISTORY_PAGE_SIZE):
+            size = min(HISTORY_PAGE_SIZE, stop)
+            page = session.backing.read_turns(start + stop - size, size).turns
+            yield from reversed(page)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _slice(self, index)
+        count = len(self)
+        if index < -count or index >= count:
+            raise IndexError("turn index out of range")
+        index %= count
+        start, backed = self._backed
+        if index >= backed:
+            return self._session._ring[self._session._hidden + index - backed]
+        page = self._session.backing.read_turns(start + index, 1).turns
+        if not page:
+            raise IndexError("stored turn could not be read")
+        return page[0]
+
 
 @dataclass
 class ConversationSession:
+    """In memory state of one conversation.
+
+    US66: every user message answered by the assistant is kept once, as a
+    ChatTurn in one ring (_ring), with the user topic and the answered intent
+    in deques aligned with it. messages and turns are read only views of
+    that ring. Messages that belong to no turn (assistant only replies such
+    as clarifying questions and fallbacks, or a user message that was never
+    answered) go to a small buffer, each tagged with the number of turns
+    added before it so the message view keeps their order.
+
+    The message view holds at most max_messages messages and the turn view
+    at most max_turns turns. Turns trimmed from the turn view stay in the
+    ring until the message limit drops them, and without a backing store
+    turns whose messages the message limit trimmed stay until the turn view
+    drops them, so messages outside any turn do not cost it any turns.
+
+    US68: retained_bytes is the size of the message texts the session keeps,
+    updated as messages are added and trimmed. The oldest messages are also
+    dropped while it is above max_bytes, or while the shared budget is
+    exceeded and the session holds more than its fair share of it. 0 means
+    no byte limit. The newest message is always kept. A turn whose messages
+    are trimmed for size leaves the turn view as well.
+
+    US70: with a backing history store, only the last max_messages messages
+    stay in memory and the turn view pages older turns in from the store.
+    The store is expected to hold every resident turn, except the one just
+    answered until adopt_stored_turn marks it as saved.
+    """
+
     session_id: str = field(default_factory=lambda: str(uuid4()))
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    messages: Deque[Message] = field(default_factory=deque)
-
-    # US42: canonical turn buffer aligned with storage
-    turns: Deque[ChatTurn] = field(default_factory=deque)
+    max_turns: int = HISTORY_MAX_TURNS
+    max_bytes: int = 0
+    budget: MemoryBudget | None = field(default=None, repr=False, compare=False)
+    max_messages: int = MAX_SESSION_MESSAGES
+    backing: TurnPager | None = field(default=None, repr=False, compare=False)
 
     pending_clarification: Optional[ClarificationState] = None
 
+    # US59: running counters, updated on every add and trim
+    stats: SessionStats = field(default_factory=SessionStats)
+
+    # US66: turn ring and the buffers around it
+    _ring: Deque[ChatTurn] = field(default_factory=deque, init=False, repr=False)
+    _topics: Deque[str | None] = field(default_factory=deque, init=False, repr=False)
+    _intents: Deque[str | None] = field(default_factory=deque, init=False, repr=False)
+    _loose: Deque[tuple[int, Message]] = field(
+        default_factory=deque, init=False, repr=False
+    )
+    _pending_user: Message | None = field(default=None, init=False, repr=False)
+    _seq: int = field(default=0, init=False, repr=False)
+    _hidden: int = field(default=0, init=False, repr=False)
+    _muted: int = field(default=0, init=False, repr=False)
+    _head_user_trimmed: bool = field(default=False, init=False, repr=False)
+    _paired_tail: bool = field(default=False, init=False, repr=False)
+    _bytes: int = field(default=0, init=False, repr=False)
+    # US70: turns in the backing store, None until first needed
+    _stored_total: int | None = field(default=None, init=False, repr=False)
+
+    @property
+    def messages(self) -> SessionMessages:
+        return SessionMessages(self)
+
+    @property
+    def retained_bytes(self) -> int:
+        """Approximate bytes of the message texts the session keeps (US68)."""
+        return self._bytes
+
+    @property
+    def turns(self) -> SessionTurns:
+        return SessionTurns(self)
+
     def clear(self) -> None:
         """Clear all session state: messages, turns, and pending clarifications."""
-        self.messages.clear()
-        self.turns.clear()
+        self._ring.clear()
+        self._topics.clear()
+        self._intents.clear()
+        self._loose.clear()
+        self._pending_user = None
+        self._hidden = 0
+        self._muted = 0
+        self._head_user_trimmed = False
+        self._paired_tail = False
         self.pending_clarification = None
-
-    def add_message(self, role: str, content: str) -> None:
+        self._stored_total = None
+        self.stats.clear()
+        if self.budget is not None:
+            # An empty session does not count against the fair share (US68).
+            self.budget.release(self)
+        self._bytes = 0
+
+    def add_message(self, role: str, content: str, intent: str | None = None) -> None:
         """Add a message to the session and enforce size limits.
 
+        User messages get their topic computed here, once (US58). The
+        session stats are updated for the new message and for every
+        message trimmed (US59). An assistant message that answers the
+        pending user message completes a turn (US66).
+
         Args:
             role: Message role, typically "user" or "assistant"
             content: Message content text
+            intent: Optional intent of the turn the message belongs to
         """
-        self.messages.append(Message(role=role, content=content))
+        user = self._pending_user
+        if role == "assistant" and user is not None and user.intent is None:
+            self._pending_user = None
+            turn = ChatTurn(
+                user.content, content, user.created_ns, time.time_ns(), intent
+            )
+            self._push_turn(turn, user.topic, intent)
+            self._message_added(self._assistant_message(turn, intent))
+            self._paired_tail = True
+            self.trim_to_last_turns(self.max_turns)
+        elif role == "user":
+            self._flush_pending_user()
+            message = Message(
+                role, content, topic=extract_topic(content), intent=intent
+            )
+            self._pending_user = message
+            self._message_added(message)
+        else:
+            self._add_unpaired(role, content, intent)
+            return
+        self._trim_messages()
 
-        max_messages = HISTORY_MAX_TURNS * 2
-        while len(self.messages) > max_messages:
-            self.messages.popleft()
+    def add_assistant_message(self, content: str, intent: str | None = None) -> None:
+        """Add an assistant message that is not the reply of a turn.
+
+        Used for clarifying questions and fallbacks. A pending user message
+        stays in the message view but no longer waits for a reply.
+        """
+        self._add_unpaired("assistant", content, intent)
 
     # ---------------- US42 helpers ----------------
 
-    def add_turn(self, turn: ChatTurn, max_turns: int = HISTORY_MAX_TURNS) -> None:
+    def add_turn(self, turn: ChatTurn, max_turns: int | None = None) -> None:
         """Add a turn to memory, prevent duplicates, and enforce trimming."""
-        if len(self.turns) > 0 and self.turns[-1] == turn:
+        if max_turns is None:
+            max_turns = self.max_turns
+        if self._visible_turns() > 0 and self._ring[-1] == turn:
             return
 
-        self.turns.append(turn)
+        self._flush_pending_user()
+        topic = extract_topic(turn.user_text)
+        self._push_turn(turn, topic, None)
+        self._message_added(self._user_message(turn, topic))
+        self._message_added(self._assistant_message(turn, None))
+        self.trim_to_last_turns(max_turns)
+        self._trim_messages()
 
-        if max_turns <= 0:
-            self.turns.clear()
-            return
+    def adopt_stored_turn(self, turn: ChatTurn) -> bool:
+        """Replace the turn just completed by add_message with its stored copy.
 
-        while len(self.turns) > max_turns:
-            self.turns.popleft()
+        The stored copy carries the timestamps and metadata the history
+        store wrote. Nothing changes unless it has the same texts as the
+        last turn. Returns True if the turn was replaced.
+        """
+        if not self._paired_tail or self._visible_turns() == 0:
+            return False
+        last = self._ring[-1]
+        if (last.user_text, last.assistant_text) != (
+            turn.user_text,
+            turn.assistant_text,
+        ):
+            return False
+        self._ring[-1] = turn
+        self._paired_tail = False
+        return True
+
+    def set_stored_total(self, total: int) -> None:
+        """Record how many turns the backing store holds (US70).
+
+        Called when the store has changed, after a turn is saved. Until
+        then the turn view reads the count from the store once and keeps it.
+        """
+        self._stored_total = max(0, int(total))
 
     def trim_to_last_turns(self, max_turns: int) -> None:
         """Trim the turns buffer to keep only the most recent N turns.
@@ -77,11 +447,15 @@ class ConversationSession:
         Args:
             max_turns: Maximum number of turns to retain. If <= 0, clears all turns.
         """
-        if max_turns <= 0:
-            self.turns.clear()
-            return
-        while len(self.turns) > max_turns:
-            self.turns.popleft()
+        visible = len(self._ring) - self._hidden
+        drop = visible if max_turns <= 0 else max(0, visible - max_turns)
+        self._hidden += drop
+        self.stats.turns -= drop
+        # Turns out of both views are not kept.
+        while self._hidden and self._muted:
+            self._pop_turn()
+            self._hidden -= 1
+            self._muted -= 1
 
     def recent_messages(self, limit: int = 10) -> List[Message]:
         """Get the most recent messages from the session.
@@ -90,13 +464,14 @@ class ConversationSession:
             limit: Maximum number of messages to return
 
         Returns:
-            List of recent Message objects, up to the specified limit
+            RecentMessages list of recent Message objects, up to the
+            specified limit, carrying the session stats
         """
         if limit <= 0:
-            return []
-        if len(self.messages) <= limit:
-            return list(self.messages)
-        return list(self.messages)[-limit:]
+            return RecentMessages(stats=self.stats)
+        recent = list(islice(self._iter_messages_reversed(), limit))
+        recent.reverse()
+        return RecentMessages(recent, self.stats)
 
     def recent_turns(self, limit: int = 3) -> List[ChatTurn]:
         """Return the last completed turns.
@@ -108,30 +483,39 @@ class ConversationSession:
             return []
 
         # US42: use canonical turns if present
-        if len(self.turns) > 0:
-            turns = list(self.turns)
-            return turns if len(turns) <= limit else turns[-limit:]
-
-        # fallback to old behaviour (derive from messages)
-        msgs = list(self.messages)
+        visible = self._visible_turns()
+        if visible >= limit or (visible > 0 and self.backing is None):
+            turns = list(islice(reversed(self._ring), min(limit, visible)))
+            turns.reverse()
+            return turns
+        if self.backing is not None:
+            # US70: the resident turns do not fill the window, page in the rest.
+            turns = list(islice(reversed(self.turns), limit))
+            if turns:
+                turns.reverse()
+                return turns
+
+        # fallback to old behaviour (derive from messages). A user message
+        # followed by an assistant message is a turn; walking back from the
+        # newest message stops after limit turns (US67).
         turns: List[ChatTurn] = []
-        i = 0
-        while i < len(msgs) - 1:
-            m = msgs[i]
-            n = msgs[i + 1]
-            if m.role == "user" and n.role == "assistant":
-                turns.append(ChatTurn(user_text=m.content, assistant_text=n.content))
-                i += 2
+        later: Message | None = None
+        for m in self._iter_messages_reversed():
+            if m.role == "user" and later is not None and later.role == "assistant":
+                turns.append(
+                    ChatTurn(user_text=m.content, assistant_text=later.content)
+                )
+                if len(turns) == limit:
+                    break
+                later = None
             else:
-                i += 1
-
-        if len(turns) <= limit:
-            return turns
-        return turns[-limit:]
+                later = m
+        turns.reverse()
+        return turns
 
     def last_user_message(self) -> str:
         """Return the most recent user message in memory, or empty string if none."""
-        for m in reversed(self.messages):
+        for m in self._iter_messages_reversed():
             if m.role == "user":
                 return m.content
         return ""
@@ -155,3 +539,308 @@ class ConversationSession:
     def clear_pending_clarification(self) -> None:
         """Clear any pending clarification state."""
         self.pending_clarification = None
+
+    # ---------------- US69 snapshots ----------------
+
+    def snapshot_state(self) -> tuple:
+        """Return the session state as nested tuples of plain values.
+
+        The result holds only str, int, float, bool, None, tuples and one
+        dict, so marshal can write it. restore_state reads it back.
+        """
+        clarification = self.pending_clarification
+        stats = self.stats
+        return (
+            self.session_id,
+            datetime_to_ns(self.started_at),
+            tuple(map(_turn_fields, self._ring)),
+            tuple(self._topics),
+            tuple(self._intents),
+            tuple((seq, *_message_fields(m)) for seq, m in self._loose),
+            None if self._pending_user is None else _message_fields(self._pending_user),
+            self._seq,
+            self._hidden,
+            self._muted,
+            self._head_user_trimmed,
+            (
+                None
+                if clarification is None
+                else (
+                    clarification.original_text,
+                    tuple(clarification.options),
+                    clarification.created_ns,
+                    clarification.attempts,
+                )
+            ),
+            (
+                stats.user_messages,
+                stats.assistant_messages,
+                stats.total_chars,
+                stats.turns,
+                dict(stats.intent_counts),
+                tuple(stats.recent_topics),
+            ),
+        )
+
+    def restore_state(self, state: tuple) -> None:
+        """Replace the session contents with a snapshot_state result.
+
+        The session keeps its own limits: the restored state is trimmed to
+        max_turns, max_messages and the byte budgets. Raises
+        ValueError or TypeError if state is not a snapshot, leaving the
+        session empty.
+        """
+        self.clear()
+        try:
+            (
+                session_id,
+                started_ns,
+                turns,
+                topics,
+                intents,
+                loose,
+                pending_user,
+                seq,
+                hidden,
+                muted,
+                head_user_trimmed,
+                clarification,
+                (users, assistants, chars, turn_count, intent_counts, topics_seen),
+            ) = state
+            if not len(turns) == len(topics) == len(intents):
+                raise ValueError("snapshot turn columns differ in length")
+            if (
+                not 0 <= hidden <= len(turns)
+                or not 0 <= muted <= len(turns)
+                or (hidden and muted)
+                or seq < len(turns)
+            ):
+                raise ValueError("snapshot turn counters are out of range")
+            self._ring.extend(map(_restored_turn, turns))
+            self._topics.extend(topics)
+            self._intents.extend(intents)
+            self._loose.extend((item[0], Message(*item[1:])) for item in loose)
+            if pending_user is not None:
+                self._pending_user = Message(*pending_user)
+            if clarification is not None:
+                text, options, created_ns, attempts = clarification
+                self.pending_clarification = ClarificationState(
+                    text, list(options), created_ns, attempts
+                )
+            self.session_id = str(session_id)
+            self.started_at = ns_to_datetime(started_ns)
+            self._seq = int(seq)
+            self._hidden = int(hidden)
+            self._muted = int(muted)
+            self._head_user_trimmed = bool(head_user_trimmed)
+            stats = self.stats
+            stats.user_messages = int(users)
+            stats.assistant_messages = int(assistants)
+            stats.total_chars = int(chars)
+            stats.turns = int(turn_count)
+            stats.intent_counts.update(intent_counts)
+            stats.recent_topics.extend(topics_seen)
+        except (ValueError, TypeError):
+            self.clear()
+            raise
+        except (AttributeError, IndexError, KeyError) as ex:
+            self.clear()
+            raise ValueError(f"malformed session snapshot: {ex}") from ex
+
+        size = sum(content_bytes(m.content) for m in self._iter_messages())
+        self._bytes = size
+        if self.budget is not None:
+            self.budget.charge(self, size)
+        self.trim_to_last_turns(self.max_turns)
+        self._trim_messages()
+
+    # ---------------- US66 ring internals ----------------
+
+    def _user_message(self, turn: ChatTurn, topic: str | None) -> Message:
+        return Message("user", turn.user_text, turn.user_ns or 0, topic)
+
+    def _assistant_message(self, turn: ChatTurn, intent: str | None) -> Message:
+        return Message(
+            "assistant", turn.assistant_text, turn.assistant_ns or 0, None, intent
+        )
+
+    def _add_unpaired(self, role: str, content: str, intent: str | None) -> None:
+        self._flush_pending_user()
+        message = Message(role, content, intent=intent)
+        self._loose.append((self._seq, message))
+        self._message_added(message)
+        self._trim_messages()
+
+    def _push_turn(self, turn: ChatTurn, topic: str | None, intent: str | None) -> None:
+        self._ring.append(turn)
+        self._topics.append(topic)
+        self._intents.append(intent)
+        self._seq += 1
+        self.stats.turns += 1
+        self._paired_tail = False
+
+    def _flush_pending_user(self) -> None:
+        """Move an unanswered user message to the buffer of unpaired messages."""
+        self._paired_tail = False
+        if self._pending_user is not None:
+            self._loose.append((self._seq, self._pending_user))
+            self._pending_user = None
+
+    def _message_added(self, message: Message) -> None:
+        self.stats.message_added(message)
+        size = content_bytes(message.content)
+        self._bytes += size
+        if self.budget is not None:
+            self.budget.charge(self, size)
+
+    def _message_removed(self, message: Message) -> None:
+        self.stats.message_removed(message)
+        size = content_bytes(message.content)
+        self._bytes -= size
+        if self.budget is not None:
+            self.budget.charge(self, -size)
+
+    def _over_limits(self) -> bool:
+        count = self._message_count()
+        if count > self.max_messages:
+            return True
+        if self.max_bytes <= 0 and self.budget is None:
+            return False
+        if count <= 1:
+            return False
+        if 0 < self.max_bytes < self._bytes:
+            return True
+        budget = self.budget
+        return (
+            budget is not None and budget.exceeded and self._bytes > budget.fair_share
+        )
+
+    def _visible_turns(self) -> int:
+        return len(self._ring) - self._hidden
+
+    def _backed_range(self) -> tuple[int, int]:
+        """Return (start, count) of the stored turns older than the ring (US70).
+
+        The resident turns are the newest turns of the store, apart from a
+        turn that was answered but not yet adopted, which the store may not
+        have yet. The store is asked for its turn count only once, later
+        counts come from set_stored_total.
+        """
+        visible = self._visible_turns()
+        room = self.max_turns - visible
+        if self.backing is None or room <= 0:
+            return (0, 0)
+        stored = len(self._ring) - (self._paired_tail and len(self._ring) > 0)
+        total = self._stored_total
+        if total is None:
+            try:
+                total = self.backing.read_turns(0, 0).total
+            except Exception:
+                return (0, 0)
+            self._stored_total = total
+        count = max(0, min(total - stored, room))
+        return (total - stored - count, count)
+
+    def _message_count(self) -> int:
+        return (
+            2 * (len(self._ring) - self._muted)
+            - self._head_user_trimmed
+            + len(self._loose)
+            + (self._pending_user is not None)
+        )
+
+    def _trim_messages(self) -> None:
+        """Drop the oldest messages until the session is within its limits.
+
+        The limits are max_messages messages and, when set, max_bytes
+        and the shared budget (US68).
+        """
+        while self._over_limits():
+            by_count = self._message_count() > self.max_messages
+            first = self._muted
+            in_view = len(self._ring) - first
+            head = self._seq - in_view
+            if self._loose and (not in_view or self._loose[0][0] <= head):
+                self._message_removed(self._loose.popleft()[1])
+            elif not in_view:
+                return
+            elif not self._head_user_trimmed:
+                # Drop the first half of the oldest turn. The turn itself
+                # stays in the turn view until its reply goes as well.
+                self._head_user_trimmed = True
+                self._message_removed(
+                    self._user_message(self._ring[first], self._topics[first])
+                )
+            else:
+                turn = self._ring[first]
+                self._head_user_trimmed = False
+                self._message_removed(
+                    self._assistant_message(turn, self._intents[first])
+                )
+                if self._hidden:
+                    # Not in the turn view either (then nothing is muted).
+                    self._pop_turn()
+                    self._hidden -= 1
+                elif by_count and self.backing is None:
+                    # Trimmed for the message limit: keep it for the turn view.
+                    self._muted += 1
+                else:
+                    # Trimmed for size, or the store holds it (US70): the
+                    # muted turns and this one go.
+                    for _ in range(first + 1):
+                        self._pop_turn()
+                    self._muted = 0
+                    self.stats.turns -= first + 1
+
+    def _pop_turn(self) -> None:
+        self._ring.popleft()
+        self._topics.popleft()
+        self._intents.popleft()
+
+    def _iter_messages(self) -> Iterator[Message]:
+        loose = iter(self._loose)
+        unpaired = next(loose, None)
+        muted = self._muted
+        head = self._seq - len(self._ring) + muted
+        entries = islice(zip(self._ring, self._topics, self._intents), muted, None)
+        for offset, (turn, topic, intent) in enumerate(entries):
+            while unpaired is not None and unpaired[0] <= head + offset:
+                yield unpaired[1]
+                unpaired = next(loose, None)
+            if offset or not self._head_user_trimmed:
+                yield self._user_message(turn, topic)
+            yield self._assistant_message(turn, intent)
+        while unpaired is not None:
+            yield unpaired[1]
+            unpaired = next(loose, None)
+        if self._pending_user is not None:
+            yield self._pending_user
+
+    def _iter_messages_reversed(self) -> Iterator[Message]:
+        # The newest messages are read on every turn, so the builders are
+        # inlined here (US67).
+        if self._pending_user is not None:
+            yield self._pending_user
+        loose = reversed(self._loose)
+        unpaired = next(loose, None)
+        in_view = len(self._ring) - self._muted
+        head = self._seq - in_view
+        seq = self._seq
+        skip_head_user = self._head_user_trimmed
+        entries = islice(
+            zip(reversed(self._ring), reversed(self._topics), reversed(self._intents)),
+            in_view,
+        )
+        for turn, topic, intent in entries:
+            seq -= 1
+            while unpaired is not None and unpaired[0] > seq:
+                yield unpaired[1]
+                unpaired = next(loose, None)
+            yield Message(
+                "assistant", turn.assistant_text, turn.assistant_ns or 0, None, intent
+            )
+            if seq != head or not skip_head_user:
+                yield Message("user", turn.user_text, turn.user_ns or 0, topic)
+        while unpaired is not None:
+            yield unpaired[1]
+            unpaired = next(loose, None)
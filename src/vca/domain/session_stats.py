@@ -0,0 +1,88 @@
+"""vca.domain.session_stats
+
+Running statistics for a conversation session.
+
+User story 59 incremental session statistics
+ConversationSession keeps one SessionStats up to date as messages and turns
+are added and trimmed, so reading a count never scans the session. Every
+update is O(1): adding a message increments the counters for its role, its
+intent and its length, and trimming a message decrements the same counters.
+The last RECENT_TOPICS user topics are kept in a bounded deque. Trimming
+never touches it, because trimmed messages are always older than the topics
+it holds.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Protocol
+
+RECENT_TOPICS = 5
+
+
+class _MessageLike(Protocol):
+    role: str
+    content: str
+    topic: str | None
+    intent: str | None
+
+
+@dataclass
+class SessionStats:
+    user_messages: int = 0
+    assistant_messages: int = 0
+    total_chars: int = 0
+    turns: int = 0
+    intent_counts: Dict[str, int] = field(default_factory=dict)
+    recent_topics: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=RECENT_TOPICS)
+    )
+
+    @property
+    def messages(self) -> int:
+        return self.user_messages + self.assistant_messages
+
+    def message_added(self, message: _MessageLike) -> None:
+        if message.role == "user":
+            self.user_messages += 1
+            if message.topic:
+                self.recent_topics.append(message.topic)
+        elif message.role == "assistant":
+            self.assistant_messages += 1
+        self.total_chars += len(message.content)
+        if message.intent:
+            self.intent_counts[message.intent] = (
+                self.intent_counts.get(message.intent, 0) + 1
+            )
+
+    def message_removed(self, message: _MessageLike) -> None:
+        if message.role == "user":
+            self.user_messages -= 1
+        elif message.role == "assistant":
+            self.assistant_messages -= 1
+        self.total_chars -= len(message.content)
+        if message.intent:
+            remaining = self.intent_counts.get(message.intent, 0) - 1
+            if remaining > 0:
+                self.intent_counts[message.intent] = remaining
+            else:
+                self.intent_counts.pop(message.intent, None)
+
+    def clear(self) -> None:
+        self.user_messages = 0
+        self.assistant_messages = 0
+        self.total_chars = 0
+        self.turns = 0
+        self.intent_counts.clear()
+        self.recent_topics.clear()
+
+    def to_dict(self) -> dict:
+        return {
+            "user_messages": self.user_messages,
+            "assistant_messages": self.assistant_messages,
+            "total_chars": self.total_chars,
+            "turns": self.turns,
+            "intent_counts": dict(self.intent_counts),
+            "recent_topics": list(self.recent_topics),
+        }
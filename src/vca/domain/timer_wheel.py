@@ -0,0 +1,165 @@
+"""vca.domain.timer_wheel
+
+Hierarchical timer wheel for idle session expiry.
+
+User story 72 idle expiry
+Finding idle sessions by scanning all of them costs time in proportion to
+the number of sessions on every check. A timer wheel files each deadline in
+a bucket instead, so scheduling, moving and cancelling a deadline take
+constant time, and advancing the clock only looks at buckets whose time
+has come.
+
+Time is counted in ticks of tick seconds. Level 0 has one bucket per tick
+for the next slots ticks. Each higher level has buckets that are slots
+times wider than the one below. When level 0 wraps around, the next bucket
+of level 1 is emptied and its keys are filed again one level lower, and so
+on up the levels. Each key moves down at most once per level, so the work
+per key is bounded by the number of levels. Deadlines further away than the
+top level can hold are parked in its furthest bucket and filed again when
+it is emptied.
+
+A deadline fires on the first advance whose time is at or past it, rounded
+up to a whole tick.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Hashable, Iterator
+
+DEFAULT_TICK = 1.0
+DEFAULT_SLOTS = 64
+DEFAULT_LEVELS = 4
+
+
+class TimerWheel:
+    """Deadlines for hashable keys, at most one deadline per key."""
+
+    def __init__(
+        self,
+        *,
+        tick: float = DEFAULT_TICK,
+        slots: int = DEFAULT_SLOTS,
+        levels: int = DEFAULT_LEVELS,
+        start: float = 0.0,
+    ) -> None:
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if slots < 2 or levels < 1:
+            raise ValueError("a timer wheel needs at least 2 slots and 1 level")
+        self.tick = float(tick)
+        self.slots = int(slots)
+        self.levels = int(levels)
+        self._now = self._ticks(start)
+        # Ticks each level can hold ahead of the current tick.
+        self._spans = [self.slots ** (level + 1) for level in range(self.levels)]
+        self._wheels: list[list[dict[Hashable, None]]] = [
+            [{} for _ in range(self.slots)] for _ in range(self.levels)
+        ]
+        # key -> (deadline in ticks, the bucket holding the key)
+        self._entries: dict[Hashable, tuple[int, dict[Hashable, None]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    @property
+    def now(self) -> float:
+        """Time of the last tick the wheel has advanced to."""
+        return self._now * self.tick
+
+    def deadline(self, key: Hashable) -> float | None:
+        """Return the deadline of key, rounded up to its tick, or None."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0] * self.tick
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Set the deadline of key, replacing any earlier one."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            del entry[1][key]
+        # The bucket of the current tick has already fired.
+        self._file(key, self._ticks(deadline), self._now + 1)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Forget the deadline of key. Returns False if it had none."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        del entry[1][key]
+        return True
+
+    def advance(self, now: float) -> list[Hashable]:
+        """Move the clock to now and return the keys whose deadline passed.
+
+        Keys are returned in deadline order, and keys with the same tick in
+        the order they were scheduled. They no longer have a deadline.
+        """
+        target = self._ticks(now)
+        expired: list[Hashable] = []
+        if not self._entries:
+            self._now = max(self._now, target)
+            return expired
+        wheel0 = self._wheels[0]
+        slots = self.slots
+        while self._now < target:
+            self._now += 1
+            index = self._now % slots
+            if index == 0:
+                self._cascade(1)
+            bucket = wheel0[index]
+            if bucket:
+                wheel0[index] = {}
+                for key in bucket:
+                    due = self._entries[key][0]
+                    if due > self._now:
+                        # Parked past the range of a one level wheel.
+                        self._file(key, due, self._now + 1)
+                        continue
+                    del self._entries[key]
+                    expired.append(key)
+            if not self._entries:
+                self._now = target
+                break
+        return expired
+
+    def _ticks(self, seconds: float) -> int:
+        return math.ceil(seconds / self.tick)
+
+    def _file(self, key: Hashable, due: int, earliest: int) -> None:
+        due = max(due, earliest)
+        delta = due - self._now
+        level = 0
+        while level < self.levels - 1 and delta >= self._spans[level]:
+            level += 1
+        if delta >= self._spans[level]:
+            # Beyond the top level: park in its furthest bucket for now.
+            slot_tick = self._now + self._spans[level] - 1
+        else:
+            slot_tick = due
+        width = self.slots**level
+        bucket = self._wheels[level][(slot_tick // width) % self.slots]
+        bucket[key] = None
+        self._entries[key] = (due, bucket)
+
+    def _cascade(self, level: int) -> None:
+        """Refile the current bucket of level into the levels below it."""
+        if level >= self.levels:
+            return
+        width = self.slots**level
+        index = (self._now // width) % self.slots
+        if index == 0:
+            self._cascade(level + 1)
+        wheel = self._wheels[level]
+        bucket = wheel[index]
+        if not bucket:
+            return
+        wheel[index] = {}
+        entries = self._entries
+        for key in bucket:
+            self._file(key, entries[key][0], self._now)
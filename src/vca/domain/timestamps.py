@@ -0,0 +1,56 @@
+"""vca.domain.timestamps
+
+Integer timestamps for the in memory domain objects.
+
+User story 65 compact domain objects
+Message, ClarificationState and ChatTurn keep their timestamps as
+time.time_ns() integers, which are cheaper to take and smaller to keep than
+datetime objects or ISO strings. The helpers here convert between the three
+forms when a caller reads the public datetime or ISO attribute.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Return the UTC datetime for ns, truncated to microseconds."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Return value as nanoseconds since the epoch. Naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (
+        (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    ) * 1000
+
+
+def ns_to_iso(ns: int) -> str:
+    return ns_to_datetime(ns).isoformat()
+
+
+def iso_to_ns(text: str) -> int | None:
+    """Return text as nanoseconds, or None if it would not format back as text.
+
+    Only UTC timestamps in the form datetime.isoformat() writes are converted,
+    so reading the ISO attribute back always gives the original string. The
+    shape is checked directly because formatting the parsed value to compare
+    costs several times more than the parse.
+    """
+    try:
+        parsed = datetime.fromisoformat(text)
+    except (TypeError, ValueError):
+        return None
+    if not text.endswith("+00:00") or text[10] != "T":
+        return None
+    if len(text) == 25 and parsed.microsecond == 0:
+        return datetime_to_ns(parsed)
+    if len(text) == 32 and text[19] == "." and parsed.microsecond != 0:
+        return datetime_to_ns(parsed)
+    return None
@@ -0,0 +1,132 @@
+"""vca.domain.topics
+
+Topic extraction for user messages.
+
+User story 58 per message topic cache
+The topic of a user message is the word a follow up question refers back to.
+ConversationSession.add_message computes it once, when the message is added,
+and stores it on the Message, so answering a follow up question no longer
+re-scans the earlier message. The stop word sets are module level frozensets
+and the patterns are compiled once.
+
+The rules, in order:
+    the first capitalised word longer than two letters that is not a
+    question or request word ("Tell", "What", ...)
+    the word after "about" or "regarding"
+    the first word longer than two letters that is not a stop word
+    otherwise the first word
+"""
+
+from __future__ import annotations
+
+import re
+
+IGNORED_CAPITALISED = frozenset(
+    {
+        "I",
+        "Tell",
+        "Please",
+        "Can",
+        "Could",
+        "Would",
+        "Should",
+        "Do",
+        "Does",
+        "Did",
+        "What",
+        "Where",
+        "When",
+        "Why",
+        "How",
+    }
+)
+
+TOPIC_STOP_WORDS = frozenset(
+    {
+        "i",
+        "you",
+        "we",
+        "they",
+        "it",
+        "is",
+        "are",
+        "was",
+        "were",
+        "the",
+        "a",
+        "an",
+        "to",
+        "for",
+        "of",
+        "on",
+        "in",
+        "and",
+        "what",
+        "where",
+        "when",
+        "why",
+        "how",
+        "tell",
+        "me",
+        "about",
+        "regarding",
+        "please",
+        "can",
+        "could",
+        "would",
+        "should",
+        "do",
+        "does",
+        "did",
+        "am",
+        "im",
+        "be",
+        "been",
+        "being",
+        "want",
+        "need",
+        "like",
+        "visiting",
+        "going",
+        "this",
+        "that",
+        "these",
+        "those",
+    }
+)
+
+_CAPITALISED_RE = re.compile(r"\b[A-Z][a-zA-Z]+\b")
+_ABOUT_RE = re.compile(r"\babout\s+([a-z0-9]+)\b")
+_REGARDING_RE = re.compile(r"\bregarding\s+([a-z0-9]+)\b")
+_NON_WORD_RE = re.compile(r"[^a-z0-9\s]")
+
+
+def extract_topic(text: str) -> str:
+    """Return the topic word of a user message, or "" when there is none."""
+    if not text:
+        return ""
+
+    for m in _CAPITALISED_RE.finditer(text):
+        w = m.group(0)
+        if w not in IGNORED_CAPITALISED and len(w) > 2:
+            return w.lower()
+
+    lowered = text.strip().lower()
+
+    m = _ABOUT_RE.search(lowered)
+    if m:
+        return m.group(1)
+
+    m = _REGARDING_RE.search(lowered)
+    if m:
+        return m.group(1)
+
+    words = _NON_WORD_RE.sub(" ", lowered).split()
+    if not words:
+        return ""
+
+    for w in words:
+        if w not in TOPIC_STOP_WORDS and len(w) > 2:
+            return w
+
+    return words[0]
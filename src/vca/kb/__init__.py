@@ -0,0 +1,7 @@
+"""vca.kb
+
+Local knowledge base for answering questions from project documents.
+
+Build an index with python -m vca.kb build. The assistant uses it when the
+index file exists and answers questions with the best matching passage.
+"""
@@ -0,0 +1,94 @@
+"""vca.kb command line
+
+Usage
+    python -m vca.kb build [--docs DIR] [--out PATH]
+    python -m vca.kb query "how is history stored" [--index PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Sequence
+
+from vca.domain.paths import KB_PATH, PROJECT_ROOT
+from vca.kb.index import (
+    KnowledgeBase,
+    KnowledgeBaseError,
+    build_index,
+    iter_documents,
+    split_passages,
+)
+
+DEFAULT_DOCS_DIR = PROJECT_ROOT / "docs"
+
+
+def _build(args: argparse.Namespace) -> int:
+    docs_dir = Path(args.docs)
+    if not docs_dir.exists():
+        print(f"Documents folder not found: {docs_dir}")
+        return 2
+
+    start = time.perf_counter()
+    files = 0
+
+    def passages():
+        nonlocal files
+        for name, text in iter_documents(docs_dir):
+            files += 1
+            yield from split_passages(name, text)
+
+    count = build_index(passages(), Path(args.out))
+    elapsed = time.perf_counter() - start
+    size = Path(args.out).stat().st_size
+    print(
+        f"Indexed {count} passages from {files} files in {elapsed:.2f}s "
+        f"({size} bytes) -> {args.out}"
+    )
+    return 0
+
+
+def _query(args: argparse.Namespace) -> int:
+    try:
+        kb = KnowledgeBase(Path(args.index))
+    except KnowledgeBaseError as ex:
+        print(str(ex))
+        return 2
+
+    with kb:
+        start = time.perf_counter()
+        hit = kb.search(args.question, budget_s=args.budget_ms / 1000.0)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        if hit is None:
+            print(f"No match ({elapsed_ms:.2f}ms)")
+            return 1
+        print(f"{hit.source} score={hit.score:.2f} ({elapsed_ms:.2f}ms)")
+        print(hit.text)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vca.kb", description="Build or query the knowledge base."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="index a folder of Markdown or text files")
+    build.add_argument("--docs", default=str(DEFAULT_DOCS_DIR))
+    build.add_argument("--out", default=str(KB_PATH))
+    build.set_defaults(func=_build)
+
+    query = sub.add_parser("query", help="print the best passage for a question")
+    query.add_argument("question")
+    query.add_argument("--index", default=str(KB_PATH))
+    query.add_argument("--budget-ms", type=float, default=50.0)
+    query.set_defaults(func=_query)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,441 @@
+"""vca.kb.index
+
+On disk BM25 index over passages of local Markdown and text documents.
+
+User story 56 knowledge base answers
+build_index splits documents into passages (paragraphs, with the nearest
+heading kept as context), tokenises them with the same word pattern as the
+classifier and writes one binary file. KnowledgeBase memory maps that file
+and answers a question with the best scoring passage. Nothing is decoded up
+front: terms are found by binary search over the term dictionary, and
+postings, document lengths and passage text are read from the map on
+demand, so opening an index is constant time whatever its size.
+
+File layout (little endian)
+    header      magic, version, doc count, term count, average doc length
+                and the byte offset of every section below
+    terms       fixed size records sorted by term: term offset and length in
+                the term blob, document frequency, first postings slot
+    term blob   UTF-8 terms
+    doc ids     uint32 per posting, grouped by term
+    tfs         uint16 term frequency per posting, same order as doc ids
+    doc lens    uint32 token count per passage
+    doc offsets uint64 per passage plus one, into the passage blob
+    passages    UTF-8 "source\\ntext" per passage
+
+Common English words are not indexed, so a question only matches on its
+content words. Search processes query terms from the rarest to the most
+common and checks a deadline between blocks of postings. When the budget
+runs out it returns the best passage found so far, which is already scored
+on the most selective terms.
+
+load_knowledge_base shares one open index per file until the file changes.
+The index it replaces then is not closed, since callers may still hold it.
+Its mapping is released with the last reference to it.
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import re
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from vca.core.prepared_input import WORD_RE
+
+MAGIC = b"VCAKB\x00\x00\x01"
+VERSION = 1
+
+# BM25 parameters, the usual defaults.
+K1 = 1.2
+B = 0.75
+
+DOC_SUFFIXES = (".md", ".markdown", ".txt")
+MAX_PASSAGE_CHARS = 1200
+MIN_PASSAGE_WORDS = 4
+
+# magic, version, docs, terms, avgdl, then 8 section offsets
+_HEADER = struct.Struct("<8sIIId8Q")
+# term offset, term length, document frequency, first postings slot
+_TERM = struct.Struct("<IHxxII")
+_POSTINGS_BLOCK = 4096
+_TF_MAX = 0xFFFF
+
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_TABLE_ROW = re.compile(r"^\s*\|")
+_EMPHASIS = re.compile(r"\*\*|__|`")
+
+STOP_WORDS = frozenset("""
+    a about an and are as at be been being but by can could did do does for
+    from had has have how i if in into is it its me my not of on or our should
+    so than that the their them then there these they this those to was we
+    were what when where which who why will with would you your
+    """.split())
+
+
+class KnowledgeBaseError(Exception):
+    """Raised when an index file is missing, truncated or not an index."""
+
+
+@dataclass(frozen=True)
+class Passage:
+    source: str
+    text: str
+
+
+@dataclass(frozen=True)
+class KbHit:
+    doc_id: int
+    score: float
+    source: str
+    text: str
+    timed_out: bool
+    coverage: float
+
+
+def tokenize(text: str) -> list[str]:
+    """Word tokens of text without stop words."""
+    return [t for t in WORD_RE.findall(text.casefold()) if t not in STOP_WORDS]
+
+
+def split_passages(source: str, text: str) -> Iterator[Passage]:
+    """Yield paragraphs of a document, prefixed with their nearest heading.
+
+    Code fences and table rows are skipped and Markdown emphasis markers are
+    removed. Paragraphs longer than MAX_PASSAGE_CHARS are cut at the last
+    sentence end before the limit.
+    """
+    heading = ""
+    block: list[str] = []
+    in_fence = False
+
+    def flush() -> Iterator[Passage]:
+        body = " ".join(line.strip() for line in block if line.strip())
+        body = _EMPHASIS.sub("", body)
+        block.clear()
+        if len(body.split()) < MIN_PASSAGE_WORDS:
+            return
+        if len(body) > MAX_PASSAGE_CHARS:
+            cut = body.rfind(". ", 0, MAX_PASSAGE_CHARS)
+            body = body[: cut + 1] if cut > 0 else body[:MAX_PASSAGE_CHARS]
+        yield Passage(source, f"{heading}: {body}" if heading else body)
+
+    for line in text.splitlines():
+        if _FENCE.match(line):
+            in_fence = not in_fence
+            yield from flush()
+            continue
+        if in_fence:
+            continue
+        m = _HEADING.match(line)
+        if m:
+            yield from flush()
+            heading = _EMPHASIS.sub("", m.group(1))
+            continue
+        if not line.strip() or _TABLE_ROW.match(line):
+            yield from flush()
+            continue
+        block.append(line)
+    yield from flush()
+
+
+def iter_documents(root: Path) -> Iterator[tuple[str, str]]:
+    """Yield (relative path, text) for every document under root, sorted."""
+    root = Path(root)
+    paths = [root] if root.is_file() else sorted(root.rglob("*"))
+    for path in paths:
+        if path.is_file() and path.suffix.lower() in DOC_SUFFIXES:
+            try:
+                text = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            name = path.name if path == root else path.relative_to(root).as_posix()
+            yield name, text
+
+
+def _le_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_index(passages: Iterable[Passage], out_path: Path) -> int:
+    """Write a BM25 index for passages to out_path and return the doc count.
+
+    The file is written next to the target and renamed into place, so a
+    running assistant never maps a half written index.
+    """
+    postings: dict[str, list[tuple[int, int]]] = {}
+    doc_lens = array("I")
+    texts: list[bytes] = []
+
+    for doc_id, passage in enumerate(passages):
+        tokens = tokenize(passage.text)
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, tf in counts.items():
+            postings.setdefault(token, []).append((doc_id, min(tf, _TF_MAX)))
+        doc_lens.append(len(tokens))
+        texts.append(f"{passage.source}\n{passage.text}".encode("utf-8"))
+
+    n_docs = len(doc_lens)
+    avgdl = (sum(doc_lens) / n_docs) if n_docs else 0.0
+
+    terms = sorted(postings)
+    term_records = bytearray()
+    term_blob = bytearray()
+    doc_ids = array("I")
+    tfs = array("H")
+    for term in terms:
+        encoded = term.encode("utf-8")
+        items = postings[term]
+        term_records += _TERM.pack(
+            len(term_blob), len(encoded), len(items), len(doc_ids)
+        )
+        term_blob += encoded
+        for doc_id, tf in items:
+            doc_ids.append(doc_id)
+            tfs.append(tf)
+
+    doc_offsets = array("Q", [0])
+    for blob in texts:
+        doc_offsets.append(doc_offsets[-1] + len(blob))
+
+    sections = [
+        bytes(term_records),
+        bytes(term_blob),
+        _le_bytes(doc_ids),
+        _le_bytes(tfs),
+        _le_bytes(doc_lens),
+        _le_bytes(doc_offsets),
+        b"".join(texts),
+    ]
+    offsets: list[int] = []
+    position = _HEADER.size
+    for section in sections:
+        # Keep every section 8 byte aligned so the arrays can be cast in place.
+        position += -position % 8
+        offsets.append(position)
+        position += len(section)
+    offsets.append(position)
+
+    header = _HEADER.pack(MAGIC, VERSION, n_docs, len(terms), avgdl, *offsets)
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(header)
+        written = _HEADER.size
+        for offset, section in zip(offsets, sections):
+            fh.write(b"\x00" * (offset - written))
+            fh.write(section)
+            written = offset + len(section)
+    tmp_path.replace(out_path)
+    return n_docs
+
+
+class KnowledgeBase:
+    """Read only view of an index file built by build_index."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        try:
+            with self.path.open("rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as ex:
+            raise KnowledgeBaseError(f"cannot open index {self.path}") from ex
+
+        if len(self._mm) < _HEADER.size:
+            self.close()
+            raise KnowledgeBaseError("index file is truncated")
+        fields = _HEADER.unpack_from(self._mm, 0)
+        magic, version, self.doc_count, self.term_count, self.avgdl = fields[:5]
+        offsets = fields[5:]
+        if magic != MAGIC or version != VERSION or offsets[-1] > len(self._mm):
+            self.close()
+            raise KnowledgeBaseError("not a knowledge base index")
+
+        (
+            self._terms_off,
+            self._blob_off,
+            ids_off,
+            tfs_off,
+            lens_off,
+            doc_off,
+            self._text_off,
+            _end,
+        ) = offsets
+
+        postings_total = 0
+        if self.term_count:
+            _term, df, start = self._term_at(self.term_count - 1)
+            postings_total = start + df
+
+        view = memoryview(self._mm)
+        self._doc_ids = self._array_view(view, ids_off, postings_total, "I")
+        self._tfs = self._array_view(view, tfs_off, postings_total, "H")
+        self._doc_lens = self._array_view(view, lens_off, self.doc_count, "I")
+        self._doc_offsets = self._array_view(view, doc_off, self.doc_count + 1, "Q")
+
+    @staticmethod
+    def _array_view(view: memoryview, offset: int, count: int, code: str):
+        size = array(code).itemsize
+        raw = view[offset : offset + count * size]
+        if sys.byteorder == "little":
+            return raw.cast(code)
+        values = array(code, raw.tobytes())
+        values.byteswap()
+        return values
+
+    def close(self) -> None:
+        for name in ("_doc_ids", "_tfs", "_doc_lens", "_doc_offsets"):
+            value = getattr(self, name, None)
+            if isinstance(value, memoryview):
+                value.release()
+        try:
+            self._mm.close()
+        except (AttributeError, BufferError, ValueError):
+            pass
+
+    def __enter__(self) -> KnowledgeBase:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _term_at(self, i: int) -> tuple[bytes, int, int]:
+        term_off, term_len, df, start = _TERM.unpack_from(
+            self._mm, self._terms_off + i * _TERM.size
+        )
+        begin = self._blob_off + term_off
+        return self._mm[begin : begin + term_len], df, start
+
+    def lookup_term(self, term: str) -> tuple[int, int] | None:
+        """Return (document frequency, first postings slot) for term."""
+        target = term.encode("utf-8")
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found, df, start = self._term_at(mid)
+            if found < target:
+                lo = mid + 1
+            elif found > target:
+                hi = mid
+            else:
+                return df, start
+        return None
+
+    def passage(self, doc_id: int) -> tuple[str, str]:
+        begin = self._text_off + self._doc_offsets[doc_id]
+        end = self._text_off + self._doc_offsets[doc_id + 1]
+        raw = self._mm[begin:end].decode("utf-8", errors="replace")
+        source, _sep, text = raw.partition("\n")
+        return source, text
+
+    def search(
+        self,
+        question: str,
+        *,
+        budget_s: float | None = None,
+        clock=time.perf_counter,
+    ) -> KbHit | None:
+        """Return the best BM25 passage for question, or None.
+
+        budget_s bounds the time spent scoring. When it runs out the best
+        passage scored so far is returned with timed_out set. The hit's
+        coverage is the share of the question's content words that the
+        passage contains, including words the index has never seen.
+        """
+        if self.doc_count == 0:
+            return None
+        deadline = None if budget_s is None else clock() + max(0.0, budget_s)
+
+        query_terms = set(tokenize(question))
+        terms: list[tuple[int, int]] = []
+        for token in query_terms:
+            found = self.lookup_term(token)
+            if found is not None:
+                terms.append(found)
+        if not terms:
+            return None
+        terms.sort()
+
+        n = self.doc_count
+        avgdl = self.avgdl or 1.0
+        doc_ids = self._doc_ids
+        tfs = self._tfs
+        doc_lens = self._doc_lens
+        scores: dict[int, float] = {}
+        matched: dict[int, int] = {}
+        timed_out = False
+
+        for df, start in terms:
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            for block in range(start, start + df, _POSTINGS_BLOCK):
+                # At least one block is scored, so a search that runs out
+                # of time still returns a hit marked timed_out.
+                if deadline is not None and scores and clock() > deadline:
+                    timed_out = True
+                    break
+                stop = min(block + _POSTINGS_BLOCK, start + df)
+                for i in range(block, stop):
+                    doc_id = doc_ids[i]
+                    tf = tfs[i]
+                    norm = K1 * (1.0 - B + B * doc_lens[doc_id] / avgdl)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                        tf * (K1 + 1.0) / (tf + norm)
+                    )
+                    matched[doc_id] = matched.get(doc_id, 0) + 1
+            if timed_out:
+                break
+
+        if not scores:
+            return None
+        best_id = min(scores, key=lambda d: (-scores[d], d))
+        source, text = self.passage(best_id)
+        coverage = matched[best_id] / len(query_terms)
+        return KbHit(best_id, scores[best_id], source, text, timed_out, coverage)
+
+
+_OPEN: dict[tuple, KnowledgeBase | None] = {}
+
+
+def load_knowledge_base(path: Path) -> KnowledgeBase | None:
+    """Return the shared KnowledgeBase for path, or None when it is unusable.
+
+    A missing or invalid index gives None, which is cached like a real index
+    until the file's size or modification time changes. Each call stats the
+    file, so callers keep the result rather than call this per lookup.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+        signature = (str(path), stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        signature = (str(path), -1, -1)
+
+    if signature in _OPEN:
+        return _OPEN[signature]
+
+    kb: KnowledgeBase | None = None
+    if signature[1] >= 0:
+        try:
+            kb = KnowledgeBase(path)
+        except KnowledgeBaseError:
+            kb = None
+    # Older versions of the file are never looked up again. They are left
+    # open for whoever still holds them.
+    for stale in [k for k in _OPEN if k[0] == signature[0]]:
+        del _OPEN[stale]
+    _OPEN[signature] = kb
+    return kb
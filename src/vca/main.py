@@ -6,11 +6,14 @@ import logging
 from vca.cli.app import CliApp
 from vca.core.engine import ChatEngine
 from vca.core.logging_config import configure_logging
+from vca.core.response_cache import ResponseCache
 from vca.core.settings import load_settings
+from vca.domain.memory_budget import MemoryBudget
 from vca.domain.paths import (
     ensure_runtime_dirs,
     ERROR_LOG_PATH,
     HISTORY_PATH,
+    SESSION_SNAPSHOT_PATH,
 )
 from vca.storage.history_store import HistoryStore
 
@@ -54,7 +57,24 @@ def main() -> None:
         )
 
         # 5 initialise engine
-        engine = ChatEngine(history=history)
+        response_cache = (
+            ResponseCache(settings.response_cache_size)
+            if settings.response_cache_size > 0
+            else None
+        )
+        memory_budget = (
+            MemoryBudget(settings.process_max_bytes)
+            if settings.process_max_bytes > 0
+            else None
+        )
+        engine = ChatEngine(
+            history=history,
+            response_cache=response_cache,
+            session_max_bytes=settings.session_max_bytes,
+            memory_budget=memory_budget,
+            snapshot_path=SESSION_SNAPSHOT_PATH,
+            resident_turns=settings.session_resident_turns,
+        )
 
         # 6 run cli
         app = CliApp(engine=engine)
@@ -0,0 +1,316 @@
+"""
+Inverted index for searching persisted chat history.
+
+US61: history search
+- Every saved turn gets a sequence id. Its words (user and assistant text)
+  and its intent, as the facet term "intent:<name>", are appended to a
+  sidecar log next to the history file (history.jsonl.search)
+- Appending is the only work done per saved turn
+- The history file keeps only its last N turns, so the live turns are the
+  last N ids. Postings of older ids are skipped at query time and the log
+  is compacted once it holds more dead entries than live ones
+- In memory each posting list is split into blocks of BLOCK_SIZE ids. A
+  block keeps its first id uncompressed and the rest as varint deltas, so
+  an intersection decodes the shortest list and only the blocks of the
+  longer lists that can hold a candidate
+- If the log does not match the history file (missing, written by an older
+  version, edited by hand) it is rebuilt from the history file once
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+BLOCK_SIZE = 128
+INTENT_PREFIX = "intent:"
+
+_TERM_RE = re.compile(r"[a-z0-9]+")
+
+
+def search_terms(text: str) -> set[str]:
+    """Return the distinct search terms of text."""
+    return set(_TERM_RE.findall((text or "").casefold()))
+
+
+def intent_term(intent: str) -> str:
+    """Return the facet term that marks turns saved with intent."""
+    return INTENT_PREFIX + "_".join(str(intent).casefold().split())
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class PostingList:
+    """Increasing turn ids stored as blocks of varint deltas."""
+
+    __slots__ = ("firsts", "starts", "data", "count", "last", "_in_block", "_cache")
+
+    def __init__(self) -> None:
+        self.firsts = array("Q")
+        self.starts = array("Q")
+        self.data = bytearray()
+        self.count = 0
+        self.last = -1
+        self._in_block = 0
+        self._cache: tuple[int, list[int]] | None = None
+
+    def append(self, turn_id: int) -> None:
+        """Add turn_id, which must be larger than every id already added."""
+        if turn_id <= self.last:
+            return
+        if self._in_block == 0 or self._in_block >= BLOCK_SIZE:
+            self.firsts.append(turn_id)
+            self.starts.append(len(self.data))
+            self._in_block = 1
+        else:
+            _encode_varint(turn_id - self.last, self.data)
+            self._in_block += 1
+        self.last = turn_id
+        self.count += 1
+        self._cache = None
+
+    def block(self, b: int) -> list[int]:
+        """Return the ids in block b."""
+        cached = self._cache
+        if cached is not None and cached[0] == b:
+            return cached[1]
+        data = self.data
+        pos = self.starts[b]
+        last_block = b + 1 == len(self.starts)
+        end = len(data) if last_block else self.starts[b + 1]
+        size = self._in_block if last_block else BLOCK_SIZE
+        if end - pos == size - 1:
+            # Every delta fits in one byte, the common case for frequent terms.
+            ids = list(accumulate(data[pos:end], initial=self.firsts[b]))
+        else:
+            current = self.firsts[b]
+            ids = [current]
+            value = 0
+            shift = 0
+            while pos < end:
+                byte = data[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                if byte & 0x80:
+                    shift += 7
+                    continue
+                current += value
+                ids.append(current)
+                value = 0
+                shift = 0
+        self._cache = (b, ids)
+        return ids
+
+    def ids_from(self, low: int) -> list[int]:
+        """Return every id >= low."""
+        b = max(0, bisect_right(self.firsts, low) - 1)
+        out: list[int] = []
+        for i in range(b, len(self.firsts)):
+            ids = self.block(i)
+            if i == b:
+                ids = ids[bisect_left(ids, low) :]
+            out.extend(ids)
+        return out
+
+    def __contains__(self, turn_id: int) -> bool:
+        b = bisect_right(self.firsts, turn_id) - 1
+        if b < 0:
+            return False
+        ids = self.block(b)
+        i = bisect_left(ids, turn_id)
+        return i < len(ids) and ids[i] == turn_id
+
+
+class HistorySearchIndex:
+    """Search log for one history file plus its in memory posting lists.
+
+    The store calls append for every saved turn. load reads the log into
+    posting lists. search intersects them for the live turns.
+    """
+
+    def __init__(self, history_path: Path) -> None:
+        self.history_path = Path(history_path)
+        self.path = self.history_path.with_name(self.history_path.name + ".search")
+        self._postings: dict[str, PostingList] = {}
+        self._loaded_sig: tuple[int, int, int] | None = None
+        self.next_id = 0
+        self.entries = 0
+        self.last_ts: str | None = None
+
+    # ---------------- writing ----------------
+
+    def _read_next_id(self) -> int:
+        """Return one past the last id in the log, reading only its tail."""
+        try:
+            with self.path.open("rb") as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - 4096))
+                tail = f.read().rstrip(b"\n").rsplit(b"\n", 1)[-1]
+        except FileNotFoundError:
+            return 0
+        try:
+            return int(tail.split(b"\t", 1)[0]) + 1
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _line(turn_id: int, ts: str | None, terms: Iterable[str]) -> str:
+        return f"{turn_id}\t{ts or ''}\t{' '.join(sorted(terms))}\n"
+
+    @staticmethod
+    def turn_terms(user_text: str, assistant_text: str, intent: str | None) -> set[str]:
+        terms = search_terms(user_text) | search_terms(assistant_text)
+        if intent:
+            terms.add(intent_term(intent))
+        return terms
+
+    def append(
+        self,
+        user_text: str,
+        assistant_text: str,
+        ts: str | None,
+        intent: str | None = None,
+    ) -> None:
+        """Log one saved turn. The caller holds the history write lock."""
+        turn_id = self._read_next_id()
+        terms = self.turn_terms(user_text, assistant_text, intent)
+        with self.path.open("a", encoding="utf-8", newline="\n") as f:
+            f.write(self._line(turn_id, ts, terms))
+
+    def clear(self) -> None:
+        self._postings = {}
+        self._loaded_sig = None
+        self.next_id = 0
+        self.entries = 0
+        self.last_ts = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write_log(self, lines: list[str]) -> None:
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=self.path.name + ".tmp.", dir=str(self.path.parent)
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                f.writelines(lines)
+            Path(tmp_name).replace(self.path)
+        except Exception:
+            try:
+                Path(tmp_name).unlink()
+            except OSError:
+                pass
+            raise
+
+    def rebuild(self, turns: list[tuple[str, str, str | None, str | None]]) -> None:
+        """Rewrite the log from (user, assistant, ts, intent) for every turn."""
+        lines = [
+            self._line(i, ts, self.turn_terms(user, assistant, intent))
+            for i, (user, assistant, ts, intent) in enumerate(turns)
+        ]
+        self._write_log(lines)
+        self._loaded_sig = None
+
+    # ---------------- reading ----------------
+
+    def _signature(self) -> tuple[int, int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def load(self) -> None:
+        """Load the log into posting lists if it changed since the last load."""
+        sig = self._signature()
+        if sig is not None and sig == self._loaded_sig:
+            return
+        postings: dict[str, PostingList] = {}
+        next_id = 0
+        entries = 0
+        last_ts: str | None = None
+        if sig is not None:
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) != 3:
+                        continue
+                    try:
+                        turn_id = int(parts[0])
+                    except ValueError:
+                        continue
+                    if turn_id < next_id:
+                        continue
+                    next_id = turn_id + 1
+                    entries += 1
+                    last_ts = parts[1] or None
+                    for term in parts[2].split():
+                        plist = postings.get(term)
+                        if plist is None:
+                            plist = postings[term] = PostingList()
+                        plist.append(turn_id)
+        self._postings = postings
+        self._loaded_sig = sig
+        self.next_id = next_id
+        self.entries = entries
+        self.last_ts = last_ts
+
+    def compact(self, first_live: int) -> None:
+        """Drop log entries for turns the history file no longer holds."""
+        if first_live <= 0:
+            return
+        kept: list[str] = []
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                head = line.split("\t", 1)[0]
+                if head.isdigit() and int(head) >= first_live:
+                    kept.append(line)
+        self._write_log(kept)
+        self._loaded_sig = None
+        self.load()
+
+    def search(
+        self, terms: Iterable[str], first_live: int, limit: int
+    ) -> tuple[list[int], int]:
+        """Return the newest limit matching live ids and the total matches.
+
+        Every term must match. Ids are returned newest first.
+        """
+        lists: list[PostingList] = []
+        for term in set(terms):
+            plist = self._postings.get(term)
+            if plist is None:
+                return [], 0
+            lists.append(plist)
+        if not lists:
+            return [], 0
+        lists.sort(key=lambda p: p.count)
+
+        matches = lists[0].ids_from(first_live)
+        for other in lists[1:]:
+            if not matches:
+                break
+            if len(matches) * 16 < other.count:
+                # Few candidates: probe only the blocks that can hold them.
+                matches = [i for i in matches if i in other]
+            else:
+                present = set(other.ids_from(matches[0]))
+                matches = [i for i in matches if i in present]
+        newest = matches[::-1][: max(0, limit)]
+        return newest, len(matches)
@@ -11,6 +11,34 @@ US44: long running stability
 - Default load path reads only last N turns to keep startup stable
 - Corruption handling safe and does not crash startup
 - Logs basic metrics (turns loaded)
+
+US60: paged history reads
+- read_turns, read_page and read_since read only the requested window
+- A turn offset index (built once by scanning the lines, then kept up to
+  date by this store's own writes) lets a read seek straight to a turn. It
+  pairs lines the way load_turns does: blank lines are skipped, a user line
+  followed by another user line is dropped and so is an assistant line
+  without a user line, so a torn write costs one turn and not the alignment
+  of every later one. A line that is not a user or assistant record also
+  ends an unanswered user line
+- A since query binary searches the turn timestamps, reading one line per
+  probe, so neither query parses the whole file
+
+US61: history search
+- save_turn stores the turn's intent when the caller passes it, and logs
+  the turn's words and intent to a HistorySearchIndex next to the file
+- search_turns answers from that index and reads only the matching turns
+- Log ids map to turns by position, so a turn whose log append failed
+  would shift every later id. A failed append deletes the log so the next
+  search rebuilds it, and every turn a search returns is checked against
+  the query terms. A mismatch rebuilds the log and runs the search again
+- The first search in a process loads the whole log into memory (about a
+  second at 100k turns). Later searches only reload it if it changed
+
+US62: turn metadata
+- save_turn also takes the classifier confidence and matched rule, and
+  every reader fills ChatTurn.intent, confidence and rule from the user
+  record. Records without them (older files) load with None
 """
 
 from __future__ import annotations
@@ -20,13 +48,16 @@ import json
 import logging
 import os
 import tempfile
+from array import array
 from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Protocol, Union, runtime_checkable
 
-from vca.domain.chat_turn import ChatTurn
+from vca.domain.chat_turn import ChatTurn, turn_confidence
 from vca.domain.constants import HISTORY_MAX_TURNS
 from vca.storage.file_lock import FileLock, FileLockTimeout
+from vca.storage.history_search import HistorySearchIndex, intent_term, search_terms
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +71,117 @@ class HistoryStoreProtocol(Protocol):
     def close(self) -> None: ...
 
 
+@dataclass(frozen=True)
+class HistoryPage:
+    """A window of persisted turns, oldest first.
+
+    start is the index of the first turn in the whole history (0 is the
+    oldest) and total the number of turns in the history.
+    """
+
+    turns: list[ChatTurn]
+    start: int
+    total: int
+    page: int = 1
+    pages: int = 1
+
+
+@dataclass(frozen=True)
+class HistorySearchResult:
+    """Matching turns, newest first, and how many turns matched in total."""
+
+    turns: list[ChatTurn]
+    total: int
+
+
+# The role key as json.dumps writes it, checked before parsing a line.
+_ROLE_KEY = b'"role": "'
+
+
+def _line_role(line: bytes) -> str | None:
+    """Return "user" or "assistant" for a history line, None if it is neither."""
+    try:
+        obj = json.loads(line)
+    except Exception:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    role = str(obj.get("role", "")).strip().lower()
+    return role if role in ("user", "assistant") else None
+
+
+def _line_at(data: bytes, start: int) -> bytes:
+    end = data.find(b"\n", start)
+    return data[start:] if end < 0 else data[start:end]
+
+
+@dataclass
+class _TurnOffsets:
+    """US60: where each turn of a history file starts.
+
+    starts[i] is the offset of the user line of turn i and replies[i] the
+    offset of its assistant line. end is the offset after the last complete
+    line scanned and pending the offset of a user line still waiting for
+    its reply (-1 for none), so appended bytes can be scanned on their own.
+    """
+
+    starts: array = field(default_factory=lambda: array("Q"))
+    replies: array = field(default_factory=lambda: array("Q"))
+    end: int = 0
+    pending: int = -1
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def scan(self, data: bytes) -> None:
+        """Add the complete lines of data, which starts at offset end."""
+        pos = self.end
+        pending = self.pending
+        starts: list[int] = []
+        replies: list[int] = []
+        lines = data.split(b"\n")
+        # The last piece has no newline yet, it is not a complete line.
+        tail = len(lines.pop())
+        # What follows the first role key of each line. If no line has a
+        # second role key this is the role of every line that ends like a
+        # whole object; torn, unusual or doubled lines are parsed instead.
+        kinds = [line.partition(_ROLE_KEY)[2][:10] for line in lines]
+        single = data.count(b'"role"', 0, len(data) - tail) == len(
+            kinds
+        ) - kinds.count(b"")
+        for line, kind in zip(lines, kinds):
+            if not line.strip():
+                pos += len(line) + 1
+                continue
+            if (
+                kind
+                and line.endswith(b"}")
+                and (single or line.count(b'"role"') == 1)
+            ):
+                if kind[:5] == b'user"':
+                    role = "user"
+                elif kind == b'assistant"':
+                    role = "assistant"
+                else:
+                    role = _line_role(line)
+            else:
+                role = _line_role(line)
+            if role == "user":
+                pending = pos
+            elif role == "assistant":
+                if pending >= 0:
+                    starts.append(pending)
+                    replies.append(pos)
+                pending = -1
+            else:
+                pending = -1
+            pos += len(line) + 1
+        self.starts.extend(starts)
+        self.replies.extend(replies)
+        self.end = pos
+        self.pending = pending
+
+
 class HistoryStore:
     """Stores and loads chat history from disk."""
 
@@ -83,6 +225,16 @@ class HistoryStore:
             if self._default_load_limit_turns <= 0:
                 self._default_load_limit_turns = self._max_turns
 
+        # US60: offsets of every turn, and the (inode, size, mtime) they
+        # were built for
+        self._turn_offsets: _TurnOffsets | None = None
+        self._turn_offsets_sig: tuple[int, int, int] | None = None
+
+        # US61: search log next to the history file, and whether an append
+        # to it failed since it was last rebuilt
+        self._search = HistorySearchIndex(self._path)
+        self._search_stale = False
+
     @property
     def path(self) -> Path:
         return self._path
@@ -95,6 +247,14 @@ class HistoryStore:
 
     def clear_file(self) -> None:
         """Delete history file if it exists (non fatal)."""
+        self._turn_offsets = None
+        self._turn_offsets_sig = None
+        try:
+            self._search.clear()
+        except Exception as ex:
+            logger.exception(
+                "History search index clear failed error_type=%s", type(ex).__name__
+            )
         try:
             if self._path.exists():
                 self._path.unlink()
@@ -102,8 +262,20 @@ class HistoryStore:
             logger.exception("History clear failed error_type=%s", type(ex).__name__)
             return
 
-    def save_turn(self, user_text: str, assistant_text: str) -> None:
-        """Append one conversation turn to the history file safely."""
+    def save_turn(
+        self,
+        user_text: str,
+        assistant_text: str,
+        *,
+        intent: str | None = None,
+        confidence: float | None = None,
+        rule: str | None = None,
+    ) -> None:
+        """Append one conversation turn to the history file safely.
+
+        intent (US61), confidence and rule (US62) are stored with the user
+        record when given.
+        """
         try:
             self._path.parent.mkdir(parents=True, exist_ok=True)
         except Exception as ex:
@@ -139,6 +311,13 @@ class HistoryStore:
                     },
                 ]
 
+                if intent:
+                    records[0]["intent"] = str(intent)
+                if confidence is not None:
+                    records[0]["confidence"] = round(float(confidence), 4)
+                if rule:
+                    records[0]["rule"] = str(rule)
+
                 # newline discipline for JSONL + US44 periodic fsync
                 with self._path.open("a", encoding="utf-8", newline="\n") as f:
                     for rec in records:
@@ -153,6 +332,19 @@ class HistoryStore:
                         except Exception:
                             pass
 
+                # US61: the search log only ever grows here, trimmed turns
+                # are pruned lazily when searching
+                try:
+                    self._search.append(
+                        records[0]["content"], records[1]["content"], user_ts, intent
+                    )
+                except Exception as ex:
+                    logger.exception(
+                        "History search index append failed error_type=%s",
+                        type(ex).__name__,
+                    )
+                    self._drop_search_index()
+
                 # US44/US43: bounded storage policy
                 self._trim_file_to_last_n_turns(self._max_turns)
 
@@ -221,7 +413,7 @@ class HistoryStore:
                 )
                 return []
 
-            records: list[tuple[str, str, str | None]] = []
+            records: list[tuple[str, str, str | None, dict]] = []
             corruption_detected = False
 
             for line in lines:
@@ -268,7 +460,9 @@ class HistoryStore:
                 else:
                     ts_str = str(ts)
 
-                records.append((role, "" if content is None else str(content), ts_str))
+                records.append(
+                    (role, "" if content is None else str(content), ts_str, obj)
+                )
 
             if corruption_detected:
                 return []
@@ -276,11 +470,13 @@ class HistoryStore:
             turns: list[ChatTurn] = []
             pending_user_text: str | None = None
             pending_user_ts: str | None = None
+            pending_user: dict = {}
 
-            for role, content, ts in records:
+            for role, content, ts, obj in records:
                 if role == "user":
                     pending_user_text = content
                     pending_user_ts = ts
+                    pending_user = obj
                 elif role == "assistant":
                     if pending_user_text is not None:
                         turns.append(
@@ -289,10 +485,12 @@ class HistoryStore:
                                 assistant_text=content,
                                 user_ts=pending_user_ts,
                                 assistant_ts=ts,
+                                **self._turn_metadata(pending_user),
                             )
                         )
                         pending_user_text = None
                         pending_user_ts = None
+                        pending_user = {}
 
             # US43: update last known good only on successful parse
             self._last_good_turns = list(turns)
@@ -367,6 +565,7 @@ class HistoryStore:
                     pass
 
             tmp_path.replace(self._path)
+            self._remember_turn_offsets(lines)
 
         except Exception as ex:
             logger.exception(
@@ -422,6 +621,305 @@ class HistoryStore:
             logger.exception("History trim failed error_type=%s", type(ex).__name__)
             return
 
+    # ---------------- US60 paged reads ----------------
+
+    def count_turns(self) -> int:
+        """Return how many turns the history file holds."""
+        return self.read_turns(0, 0).total
+
+    def read_turns(self, start: int, count: int) -> HistoryPage:
+        """Return up to count turns starting at turn index start.
+
+        Only the bytes of the requested turns are read. Turns whose lines
+        do not parse are skipped.
+        """
+        start = max(0, int(start))
+        count = max(0, int(count))
+        if self._path.suffix.lower() == ".txt":
+            every = self.load_turns(max_turns=0)
+            return HistoryPage(every[start : start + count], start, len(every))
+
+        try:
+            with self._path.open("rb") as f:
+                index = self._turn_index(f)
+                total = len(index)
+                stop = min(total, start + count)
+                if start >= stop:
+                    return HistoryPage([], min(start, total), total)
+
+                base = index.starts[start]
+                f.seek(base)
+                raw = f.read(index.replies[stop - 1] - base) + f.readline()
+        except FileNotFoundError:
+            return HistoryPage([], 0, 0)
+        except Exception as ex:
+            logger.exception(
+                "History page read failed error_type=%s", type(ex).__name__
+            )
+            return HistoryPage([], 0, 0)
+
+        turns: list[ChatTurn] = []
+        for i in range(start, stop):
+            turn = self._turn_from_lines(
+                _line_at(raw, index.starts[i] - base),
+                _line_at(raw, index.replies[i] - base),
+            )
+            if turn is not None:
+                turns.append(turn)
+        return HistoryPage(turns, start, total)
+
+    def read_page(self, page: int, page_size: int = 10) -> HistoryPage:
+        """Return page number page, where page 1 holds the most recent turns."""
+        page = max(1, int(page))
+        page_size = max(1, int(page_size))
+        total = self.count_turns()
+        pages = max(1, -(-total // page_size))
+
+        stop = total - (page - 1) * page_size
+        begin = max(0, stop - page_size)
+        window = self.read_turns(begin, max(0, stop - begin))
+        return HistoryPage(window.turns, begin, window.total, page, pages)
+
+    def find_turn_since(self, since: _dt.datetime) -> int:
+        """Return the index of the first turn at or after since.
+
+        Turns are appended in time order, so this is a binary search that
+        reads one line per probe. A naive since is taken as UTC.
+        """
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=_dt.timezone.utc)
+        try:
+            with self._path.open("rb") as f:
+                starts = self._turn_index(f).starts
+                lo, hi = 0, len(starts)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    f.seek(starts[mid])
+                    ts = self._line_ts(f.readline())
+                    if ts is not None and ts < since:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                return lo
+        except FileNotFoundError:
+            return 0
+
+    def read_since(self, since: _dt.datetime, page_size: int = 10) -> HistoryPage:
+        """Return the first page_size turns at or after since."""
+        if self._path.suffix.lower() == ".txt":
+            # The legacy format has no timestamps.
+            return HistoryPage([], 0, self.count_turns())
+        start = self.find_turn_since(since)
+        return self.read_turns(start, max(1, int(page_size)))
+
+    def _turn_index(self, f) -> _TurnOffsets:
+        """Return the turn offsets of the open file f, rebuilding when stale."""
+        st = os.fstat(f.fileno())
+        sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+        index = self._turn_offsets
+        if index is not None and self._turn_offsets_sig == sig:
+            return index
+
+        old = self._turn_offsets_sig
+        if (
+            index is not None
+            and old is not None
+            and old[0] == sig[0]
+            and old[1] <= sig[1]
+        ):
+            # Same file, only appended to: scan just the new bytes.
+            index = _TurnOffsets(
+                array("Q", index.starts),
+                array("Q", index.replies),
+                index.end,
+                index.pending,
+            )
+        else:
+            index = _TurnOffsets()
+
+        f.seek(index.end)
+        index.scan(f.read())
+        self._turn_offsets = index
+        self._turn_offsets_sig = sig
+        return index
+
+    def _remember_turn_offsets(self, lines: list[str]) -> None:
+        """Keep the turn index in step after this store rewrote the file."""
+        if self._turn_offsets is None or self._path.suffix.lower() == ".txt":
+            return
+        try:
+            st = self._path.stat()
+        except OSError:
+            self._turn_offsets = None
+            return
+        index = _TurnOffsets()
+        index.scan("".join(str(ln) + "\n" for ln in lines).encode("utf-8"))
+        self._turn_offsets = index
+        self._turn_offsets_sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    @staticmethod
+    def _line_ts(line: bytes) -> _dt.datetime | None:
+        try:
+            ts = json.loads(line).get("ts")
+            parsed = _dt.datetime.fromisoformat(str(ts))
+        except Exception:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=_dt.timezone.utc)
+        return parsed
+
+    @staticmethod
+    def _turn_from_lines(user_line: bytes, assistant_line: bytes) -> ChatTurn | None:
+        try:
+            user = json.loads(user_line)
+            assistant = json.loads(assistant_line)
+        except Exception:
+            return None
+        if not isinstance(user, dict) or not isinstance(assistant, dict):
+            return None
+        if str(user.get("role", "")).strip().lower() != "user":
+            return None
+        if str(assistant.get("role", "")).strip().lower() != "assistant":
+            return None
+        user_ts = user.get("ts")
+        assistant_ts = assistant.get("ts")
+        return ChatTurn(
+            user_text=str(user.get("content") or ""),
+            assistant_text=str(assistant.get("content") or ""),
+            user_ts=None if user_ts is None else str(user_ts),
+            assistant_ts=None if assistant_ts is None else str(assistant_ts),
+            **HistoryStore._turn_metadata(user),
+        )
+
+    @staticmethod
+    def _turn_metadata(user: dict) -> dict:
+        """Return the US62 ChatTurn fields stored on a user record."""
+        intent = user.get("intent")
+        rule = user.get("rule")
+        return {
+            "intent": None if intent is None else str(intent),
+            "confidence": turn_confidence(user.get("confidence")),
+            "rule": None if rule is None else str(rule),
+        }
+
+    # ---------------- US61 search ----------------
+
+    def search_turns(
+        self, text: str, intent: str | None = None, limit: int = 10
+    ) -> HistorySearchResult:
+        """Return saved turns containing every word of text, newest first.
+
+        intent restricts the result to turns saved with that intent.
+        """
+        terms = search_terms(text)
+        if intent:
+            terms.add(intent_term(intent))
+        if not terms or self._path.suffix.lower() == ".txt":
+            return HistorySearchResult([], 0)
+
+        try:
+            total = self.count_turns()
+            if total == 0:
+                return HistorySearchResult([], 0)
+            index = self._search
+            index.load()
+            if self._search_stale or not self._search_index_matches(total):
+                self._rebuild_search_index_locked(total)
+
+            for attempt in range(2):
+                first_live = index.next_id - total
+                if index.entries > 2 * total + 1024:
+                    self._with_write_lock(lambda: index.compact(first_live))
+
+                ids, matched = index.search(terms, first_live, limit)
+                turns: list[ChatTurn] = []
+                for turn_id in ids:
+                    turns.extend(self.read_turns(turn_id - first_live, 1).turns)
+                checked = [t for t in turns if self._turn_has_terms(t, terms)]
+                if len(checked) == len(turns) or attempt:
+                    dropped = len(turns) - len(checked)
+                    return HistorySearchResult(checked, max(0, matched - dropped))
+                # The log is out of step with the file: rebuild and retry.
+                logger.warning("History search index out of step, rebuilding")
+                self._rebuild_search_index_locked(total)
+            return HistorySearchResult([], 0)
+        except Exception as ex:
+            logger.exception("History search failed error_type=%s", type(ex).__name__)
+            return HistorySearchResult([], 0)
+
+    @staticmethod
+    def _turn_has_terms(turn: ChatTurn, terms: set[str]) -> bool:
+        found = HistorySearchIndex.turn_terms(
+            turn.user_text, turn.assistant_text, turn.intent
+        )
+        return terms <= found
+
+    def _drop_search_index(self) -> None:
+        """Forget a search log that missed a turn, so it is rebuilt."""
+        self._search_stale = True
+        try:
+            self._search.clear()
+        except Exception as ex:
+            logger.exception(
+                "History search index clear failed error_type=%s", type(ex).__name__
+            )
+
+    def _rebuild_search_index_locked(self, total: int) -> None:
+        """Rebuild and reload the search log, unless the write lock is busy."""
+        done: list[bool] = []
+
+        def rebuild() -> None:
+            self._rebuild_search_index(total)
+            done.append(True)
+
+        self._with_write_lock(rebuild)
+        self._search.load()
+        if done:
+            self._search_stale = False
+
+    def _search_index_matches(self, total: int) -> bool:
+        index = self._search
+        if index.next_id < total or index.entries < total:
+            return False
+        last = self.read_turns(total - 1, 1).turns
+        return not last or index.last_ts == last[-1].user_ts
+
+    def _rebuild_search_index(self, total: int) -> None:
+        with self._path.open("rb") as f:
+            index = self._turn_index(f)
+            total = min(total, len(index))
+            data = b""
+            if total:
+                f.seek(0)
+                data = f.read(index.replies[total - 1]) + f.readline()
+        rows: list[tuple[str, str, str | None, str | None]] = []
+        for i in range(total):
+            try:
+                user = json.loads(_line_at(data, index.starts[i]))
+                assistant = json.loads(_line_at(data, index.replies[i]))
+            except Exception:
+                user, assistant = {}, {}
+            rows.append(
+                (
+                    str(user.get("content") or ""),
+                    str(assistant.get("content") or ""),
+                    user.get("ts"),
+                    user.get("intent"),
+                )
+            )
+        self._search.rebuild(rows)
+        logger.info("History search index rebuilt turns=%d", total)
+
+    def _with_write_lock(self, fn: Callable[[], None]) -> None:
+        """Run fn under the history write lock, or skip it if that is busy."""
+        lock = FileLock(self._path, retries=1, delay_s=0.0)
+        if not lock.try_acquire():
+            return
+        try:
+            fn()
+        finally:
+            lock.release()
+
     # ---------------- Legacy format ----------------
 
     def _save_turn_legacy(self, user_text: str, assistant_text: str) -> None:
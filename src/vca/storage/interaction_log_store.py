@@ -30,6 +30,7 @@ class InteractionEvent:
     processing_time_ms: int
     rule_match_count: int
     multiple_rules_matched: bool
+    session_bytes: int = 0
 
 
 @runtime_checkable
@@ -43,6 +44,7 @@ class InteractionLogStoreProtocol(Protocol):
         processing_time_ms: int = 0,
         rule_match_count: int = 0,
         multiple_rules_matched: bool = False,
+        session_bytes: int = 0,
     ) -> None: ...
     def flush(self) -> None: ...
     def close(self) -> None: ...
@@ -83,6 +85,7 @@ class InteractionLogStore:
         processing_time_ms: int = 0,
         rule_match_count: int = 0,
         multiple_rules_matched: bool = False,
+        session_bytes: int = 0,
     ) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -99,6 +102,7 @@ class InteractionLogStore:
             processing_time_ms=max(0, int(processing_time_ms)),
             rule_match_count=max(0, int(rule_match_count)),
             multiple_rules_matched=bool(multiple_rules_matched),
+            session_bytes=max(0, int(session_bytes)),
         )
 
         line = json.dumps(asdict(event), ensure_ascii=False)
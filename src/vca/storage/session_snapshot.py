@@ -0,0 +1,113 @@
+"""
+Binary snapshot of the in memory session, written at shutdown.
+
+US69: fast session resume
+- ChatEngine.shutdown writes the session state (turns, unpaired messages,
+  pending clarification, counters) to one file next to the history data
+- The next start reads it in one read and restores the session without
+  replaying the history file turn by turn
+- The snapshot records the size and modification time of the history file
+  and the turn limit it was written with. If either differs at startup the
+  history was changed by someone else, and the engine replays it as before
+- A snapshot that is truncated, fails its checksum or was written by
+  another format version is ignored the same way
+
+File layout (little endian)
+    header   magic, format version, payload length, crc32 of the payload
+    payload  marshal of (history signature, max turns, session state)
+"""
+
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"VCASS\x00\x00\x01"
+VERSION = 2
+
+# magic, version, payload length, payload crc32
+_HEADER = struct.Struct("<8sIII")
+
+HistorySignature = Union[tuple[int, int], None]
+
+
+def history_signature(path: Path | None) -> HistorySignature:
+    """Return (size, mtime_ns) of the history file, or None if it is missing."""
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def write_snapshot(
+    path: Path, signature: HistorySignature, max_turns: int, state: tuple
+) -> bool:
+    """Atomically write a snapshot file. Returns False if it could not be written."""
+    tmp_path: Path | None = None
+    try:
+        payload = marshal.dumps((signature, int(max_turns), state))
+        header = _HEADER.pack(MAGIC, VERSION, len(payload), zlib.crc32(payload))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=path.name + ".tmp.", dir=str(path.parent)
+        )
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(payload)
+        tmp_path.replace(path)
+        return True
+    except Exception as ex:
+        logger.warning("Session snapshot write failed error_type=%s", type(ex).__name__)
+        try:
+            if tmp_path is not None and tmp_path.exists():
+                tmp_path.unlink()
+        except Exception:
+            pass
+        return False
+
+
+def read_snapshot(
+    path: Path, signature: HistorySignature, max_turns: int
+) -> tuple | None:
+    """Return the session state of a valid snapshot that matches the history.
+
+    Returns None if there is no snapshot, it is damaged, or it was written
+    for a different history file or turn limit.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, length, crc = _HEADER.unpack_from(data, 0)
+    payload = memoryview(data)[_HEADER.size :]
+    if magic != MAGIC or version != VERSION or len(payload) != length:
+        logger.info("Session snapshot ignored reason=format")
+        return None
+    if zlib.crc32(payload) != crc:
+        logger.info("Session snapshot ignored reason=checksum")
+        return None
+    try:
+        saved_signature, saved_max_turns, state = marshal.loads(payload)
+    except Exception:
+        logger.info("Session snapshot ignored reason=payload")
+        return None
+    if saved_signature is not None:
+        saved_signature = tuple(saved_signature)
+    if saved_signature != signature or saved_max_turns != max_turns:
+        logger.info("Session snapshot ignored reason=stale")
+        return None
+    return state
@@ -0,0 +1,203 @@
+"""
+Chat history kept in one file per session.
+
+US73: sharded history
+- HistoryStore keeps every conversation in one file and FileLock lets one
+  writer at a time append to it. With many sessions in one process (or many
+  processes) every turn waits for the same lock
+- ShardedHistoryStore gives each session id its own HistoryStore file. The
+  file is named after a hash of the session id and placed in one of 256
+  subdirectories picked by the first two hex digits of the hash, so no
+  directory grows past a few thousand files and ids need no escaping
+- Writers of different sessions lock different files and never wait for
+  each other
+- manifest.jsonl in the root lists the shards, one line per shard with the
+  session id and the path of its file. A line is appended when a turn is
+  first saved to a shard whose file did not exist when it was opened, so
+  reads never write the manifest. Each line is written with a single
+  O_APPEND write, so appends from several processes do not interleave and
+  no lock is needed. Readers keep the last line of each shard and skip
+  lines that cannot be parsed
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import functools
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.constants import HISTORY_MAX_TURNS
+from vca.storage.history_store import HistoryStore
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.jsonl"
+SHARD_SUFFIX = ".jsonl"
+DEFAULT_MAX_OPEN = 1024
+
+
+def session_key(session_id: str) -> str:
+    """Return the hex digest that names the files of session_id."""
+    return hashlib.blake2b(session_id.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def session_path(root: Path, session_id: str, suffix: str) -> Path:
+    """Return root/<first two hex digits>/<digest><suffix> for session_id."""
+    key = session_key(session_id)
+    return root / key[:2] / f"{key}{suffix}"
+
+
+@dataclass(frozen=True)
+class ShardInfo:
+    """One manifest entry: a session id and its history file."""
+
+    session_id: str
+    path: Path
+    created: str = ""
+
+
+class _Shard(HistoryStore):
+    """HistoryStore of one session that lists itself on its first save."""
+
+    def __init__(
+        self, path: Path, on_created: Callable[[], None], **kwargs: Any
+    ) -> None:
+        super().__init__(path=path, **kwargs)
+        self._on_created: Callable[[], None] | None = (
+            None if path.exists() else on_created
+        )
+
+    def save_turn(self, user_text: str, assistant_text: str, **metadata: Any) -> None:
+        super().save_turn(user_text, assistant_text, **metadata)
+        if self._on_created is not None and self.path.exists():
+            on_created, self._on_created = self._on_created, None
+            on_created()
+
+
+class ShardedHistoryStore:
+    """Routes the history of each session id to its own HistoryStore."""
+
+    DEFAULT_ROOT = Path("data") / "sessions"
+
+    def __init__(
+        self,
+        root: Union[str, Path, None] = None,
+        *,
+        max_turns: int = HISTORY_MAX_TURNS,
+        max_open: int = DEFAULT_MAX_OPEN,
+        **store_kwargs: Any,
+    ) -> None:
+        self._root = Path(root) if root is not None else self.DEFAULT_ROOT
+        self._max_turns = max_turns
+        self._max_open = max(1, int(max_open))
+        self._store_kwargs = store_kwargs
+        # Recently used shards. A HistoryStore holds no open files, so
+        # dropping one only loses its cached line index and, once it has
+        # been searched, its search postings. max_open bounds both.
+        self._open: OrderedDict[str, HistoryStore] = OrderedDict()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._root / MANIFEST_NAME
+
+    def shard_path(self, session_id: str) -> Path:
+        return session_path(self._root, session_id, SHARD_SUFFIX)
+
+    def shard(self, session_id: str) -> HistoryStore:
+        """Return the HistoryStore of session_id."""
+        store = self._open.get(session_id)
+        if store is not None:
+            self._open.move_to_end(session_id)
+            return store
+        path = self.shard_path(session_id)
+        store = _Shard(
+            path,
+            functools.partial(self._register, session_id, path),
+            max_turns=self._max_turns,
+            **self._store_kwargs,
+        )
+        self._open[session_id] = store
+        if len(self._open) > self._max_open:
+            self._open.popitem(last=False)
+        return store
+
+    def save_turn(
+        self, session_id: str, user_text: str, assistant_text: str, **metadata: Any
+    ) -> None:
+        """Append one turn to the history of session_id."""
+        self.shard(session_id).save_turn(user_text, assistant_text, **metadata)
+
+    def load_turns(
+        self, session_id: str, max_turns: int | None = None
+    ) -> list[ChatTurn]:
+        """Load the persisted turns of session_id."""
+        return self.shard(session_id).load_turns(max_turns)
+
+    def clear_session(self, session_id: str) -> None:
+        """Delete the history file of session_id. It stays in the manifest."""
+        self.shard(session_id).clear_file()
+
+    def shards(self) -> dict[str, ShardInfo]:
+        """Read the manifest: session id -> shard, in order of creation."""
+        found: dict[str, ShardInfo] = {}
+        try:
+            with self.manifest_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                        session_id = str(rec["session"])
+                        path = self._root / str(rec["path"])
+                    except Exception:
+                        continue
+                    found[session_id] = ShardInfo(
+                        session_id, path, str(rec.get("created", ""))
+                    )
+        except FileNotFoundError:
+            return {}
+        except Exception as ex:
+            logger.exception(
+                "History manifest read failed error_type=%s", type(ex).__name__
+            )
+        return found
+
+    def flush(self) -> None:
+        for store in self._open.values():
+            store.flush()
+
+    def close(self) -> None:
+        for store in self._open.values():
+            store.close()
+        self._open.clear()
+
+    def _register(self, session_id: str, path: Path) -> None:
+        rec = {
+            "session": session_id,
+            "path": path.relative_to(self._root).as_posix(),
+            "created": _dt.datetime.now(tz=_dt.timezone.utc).isoformat(),
+        }
+        data = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            fd = os.open(
+                str(self.manifest_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        except Exception as ex:
+            logger.exception(
+                "History manifest append failed error_type=%s", type(ex).__name__
+            )
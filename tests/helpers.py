@@ -5,7 +5,7 @@ These are used across multiple test files.
 
 from typing import List
 from vca.domain.chat_turn import ChatTurn
-from vca.storage.history_store import HistoryStore
+from vca.storage.history_store import HistoryPage, HistorySearchResult, HistoryStore
 from vca.storage.interaction_log_store import InteractionLogStore
 from vca.core.engine import ChatEngine
 
@@ -33,6 +33,28 @@ class FakeHistory(HistoryStore):
             turns = turns[-max_turns:]
         return turns
 
+    def read_turns(self, start: int, count: int) -> HistoryPage:
+        start = max(0, start)
+        return HistoryPage(
+            self.turns[start : start + max(0, count)], start, len(self.turns)
+        )
+
+    def find_turn_since(self, since) -> int:
+        return 0
+
+    def search_turns(
+        self, text: str, intent: str | None = None, limit: int = 10
+    ) -> HistorySearchResult:
+        words = text.casefold().split()
+        found = [
+            t
+            for t in reversed(self.turns)
+            if all(
+                w in (t.user_text + " " + t.assistant_text).casefold() for w in words
+            )
+        ]
+        return HistorySearchResult(found[:limit], len(found))
+
     def clear_file(self) -> None:
         self.turns.clear()
         self.saved.clear()
@@ -0,0 +1,66 @@
+# Test file for User Story 50
+# Testing Type: blackbox
+# Technique: random_based
+# Team Member: sa1068
+# Original file: test_user_story_50.py
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from vca.bench import fuzz_latency as fuzz
+from vca.core.validator import InputValidator
+
+
+def test_user_story_50_fuzz_reports_worst_cases_per_stage() -> None:
+    report = fuzz.run_fuzz(iterations=60, seed=7, max_raw_chars=8000)
+
+    assert set(report.worst) == set(fuzz.DEFAULT_BUDGETS_MS)
+    for cases in report.worst.values():
+        assert cases
+        times = [c.elapsed_us for c in cases]
+        assert times == sorted(times, reverse=True)
+        assert all(c.raw_length <= 8000 for c in cases)
+
+
+def test_user_story_50_pathological_inputs_reach_later_stages_bounded() -> None:
+    # The wall time budgets are checked by the benchmark command. Here the
+    # structural bound behind them: however long or odd the paste, the
+    # classifier, multi intent check and topic extraction get at most
+    # MAX_LEN characters.
+    validator = InputValidator()
+    rng = random.Random(50)
+    for name in sorted(fuzz._GENERATORS):
+        for size in (8000, InputValidator.MAX_SCAN_CHARS * 2):
+            text = fuzz._GENERATORS[name](rng, size)
+            result = validator.clean(text)
+            assert len(result.text) <= InputValidator.MAX_LEN, name
+
+
+def test_user_story_50_budget_assertion_reports_offending_stage() -> None:
+    report = fuzz.run_fuzz(iterations=15, seed=1, max_raw_chars=2000)
+
+    with pytest.raises(AssertionError) as info:
+        fuzz.assert_within_budgets(report, {"validate": 0.0})
+
+    assert "stage=validate" in str(info.value)
+
+
+def test_user_story_50_main_writes_report(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    out = tmp_path / "fuzz.json"
+    argv = ["--iterations", "15", "--max-raw-chars", "2000", "--out", str(out)]
+    for stage in fuzz.DEFAULT_BUDGETS_MS:
+        monkeypatch.setitem(fuzz.DEFAULT_BUDGETS_MS, stage, float("inf"))
+    assert fuzz.main(argv) == 0
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert payload["benchmark"] == "fuzz_latency"
+    assert set(payload["report"]["worst"]) == set(fuzz.DEFAULT_BUDGETS_MS)
+
+    monkeypatch.setitem(fuzz.DEFAULT_BUDGETS_MS, "topic", -1.0)
+    assert fuzz.main(argv) == 1
@@ -0,0 +1,61 @@
+# Test file for User Story 51
+# Testing Type: blackbox
+# Technique: random_based
+# Team Member: sa1068
+# Original file: test_user_story_51.py
+
+from __future__ import annotations
+
+import random
+
+from vca.bench import validator as bench
+from vca.core.validator import InputValidator
+
+_ALPHABET = [chr(c) for c in range(128)] + [
+    "!!!!",
+    "?????",
+    "....",
+    ",,,,,,",
+    "\r\n",
+    "    ",
+    "\t\t",
+]
+
+
+def test_user_story_51_ascii_fast_path_matches_full_rule_order() -> None:
+    rng = random.Random(51)
+    for _ in range(20000):
+        raw = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 60)))
+        assert InputValidator._normalise_ascii(raw) == (
+            InputValidator._normalise_unicode(raw)
+        ), repr(raw)
+
+
+def test_user_story_51_clean_output_is_unchanged_for_known_inputs() -> None:
+    v = InputValidator()
+    cases = {
+        "hi": "hi",
+        "  hello\tworld\r\nnew\rline  ": "hello world new line",
+        "wow!!!!!! really???? ...": "wow!!! really??? ...",
+        "a\x00b\x7fc\x1fd": "abcd",
+        "!!!!\n!!!!": "!!! !!!",
+        "!!\x01!!": "!!!",
+        "\x0b\x0c": "",
+    }
+    for raw, expected in cases.items():
+        assert v.clean(raw).text == expected
+
+
+def test_user_story_51_non_ascii_input_uses_full_rules() -> None:
+    v = InputValidator()
+    decomposed = "cafe\u0301!!!!!  ok"
+    out = v.clean(decomposed)
+    assert out.text == "caf\u00e9!!! ok"
+
+
+def test_user_story_51_benchmark_reports_every_category() -> None:
+    payload = bench.run_benchmark(calls=200)
+    categories = {c["category"] for c in payload["cases"]}
+    assert categories == set(bench.build_inputs())
+    fast_cases = [c for c in payload["cases"] if c["case"].endswith("_clean")]
+    assert all("speedup_vs_full_rules" in c for c in fast_cases)
@@ -0,0 +1,111 @@
+# Test file for User Story 55
+# Testing Type: blackbox
+# Technique: random_based
+# Team Member: sa1068
+# Original file: test_user_story_55.py
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from pathlib import Path
+
+from vca.bench import faq as bench
+from vca.core.faq_index import FaqIndex, faq_key, load_faq_index, read_faq_file
+from vca.core.responses import ResponseGenerator
+
+
+def test_user_story_55_exact_near_and_miss_lookups() -> None:
+    index = FaqIndex(
+        [
+            ("How do I exit?", "Type exit."),
+            ("How is history stored?", "In a JSONL file."),
+            ("What can you do?", "Lots."),
+        ]
+    )
+    assert index.is_built is False
+
+    exact = index.match(faq_key("  HOW DO I EXIT? "))
+    assert exact is not None and exact.exact and exact.answer == "Type exit."
+    assert index.is_built is True
+
+    near = index.match(faq_key("history stored, how is?"))
+    assert near is not None and not near.exact
+    assert near.answer == "In a JSONL file."
+
+    assert index.match(faq_key("how do i cook pasta")) is None
+    assert index.match(faq_key("tell me a joke")) is None
+    assert index.match("") is None
+
+
+def test_user_story_55_reads_json_and_jsonl_files(tmp_path: Path) -> None:
+    jsonl = tmp_path / "faq.jsonl"
+    jsonl.write_text(
+        '{"question": "Where are logs?", "answer": "In logs/."}\n'
+        "not json\n"
+        '{"question": "missing answer"}\n'
+        "\n"
+        '{"question": "Who made you?", "answer": "Students."}\n',
+        encoding="utf-8",
+    )
+    assert read_faq_file(jsonl) == [
+        ("Where are logs?", "In logs/."),
+        ("Who made you?", "Students."),
+    ]
+
+    as_map = tmp_path / "faq.json"
+    as_map.write_text(json.dumps({"Ping?": "Pong."}), encoding="utf-8")
+    assert read_faq_file(as_map) == [("Ping?", "Pong.")]
+    assert read_faq_file(tmp_path / "absent.jsonl") == []
+
+
+def test_user_story_55_index_is_cached_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "faq.jsonl"
+    path.write_text('{"question": "a b c", "answer": "one"}\n', encoding="utf-8")
+
+    first = load_faq_index(path, {"help": "builtin"})
+    assert load_faq_index(path, {"help": "builtin"}) is first
+    assert first.match("a b c").answer == "one"
+    assert first.match("help").answer == "builtin"
+
+    path.write_text(
+        '{"question": "a b c", "answer": "two"}\n{"question": "help", "answer": "file"}\n',
+        encoding="utf-8",
+    )
+    second = load_faq_index(path, {"help": "builtin"})
+    assert second is not first
+    assert second.match("a b c").answer == "two"
+    assert second.match("help").answer == "file"
+
+
+def test_user_story_55_response_generator_uses_index() -> None:
+    r = ResponseGenerator(
+        faq_index=FaqIndex([("how do i reset my password", "Use reset.")])
+    )
+    assert r.faq_response_for("How do I reset my password?") == "Use reset."
+    assert r.faq_response_for("reset my password how do i") == "Use reset."
+    assert r.faq_response_for("what is the weather") is None
+
+    default = ResponseGenerator()
+    assert default.faq_response_for("how is history stored") is not None
+    assert default.faq_response_for("tell me a joke") is None
+
+
+def test_user_story_55_lookups_are_sub_millisecond_at_100k() -> None:
+    pairs = bench.build_faq_pairs(100_000, seed=5)
+    index = FaqIndex(pairs)
+    index.match("warm up")
+    queries = bench.build_queries(pairs, 300, seed=5)
+
+    rng = random.Random(55)
+    for kind in ("exact", "near", "miss"):
+        keys = [faq_key(q) for q in queries[kind]]
+        rng.shuffle(keys)
+        times: list[float] = []
+        for key in keys:
+            start = time.perf_counter()
+            index.match(key)
+            times.append(time.perf_counter() - start)
+        times.sort()
+        assert times[len(times) // 2] < 0.001, kind
@@ -0,0 +1,87 @@
+# Test file for User Story 59
+# Testing Type: blackbox
+# Technique: random_based
+# Team Member: sa1068
+# Original file: test_user_story_59.py
+
+from __future__ import annotations
+
+import random
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.cli.app import CliApp
+from vca.cli.commands import Command, parse_user_input
+from vca.core.engine import ChatEngine
+from vca.core.responses import ResponseGenerator
+from vca.domain.constants import HISTORY_MAX_TURNS
+from vca.domain.session import ConversationSession
+
+
+def _recount(session: ConversationSession) -> dict:
+    intents: dict[str, int] = {}
+    for m in session.messages:
+        if m.intent:
+            intents[m.intent] = intents.get(m.intent, 0) + 1
+    return {
+        "user_messages": sum(1 for m in session.messages if m.role == "user"),
+        "assistant_messages": sum(1 for m in session.messages if m.role == "assistant"),
+        "total_chars": sum(len(m.content) for m in session.messages),
+        "turns": len(session.turns),
+        "intent_counts": intents,
+    }
+
+
+def test_user_story_59_counters_match_a_full_rescan_after_trimming() -> None:
+    rng = random.Random(59)
+    session = ConversationSession()
+    for i in range(HISTORY_MAX_TURNS * 2 + 300):
+        role = rng.choice(("user", "assistant"))
+        intent = rng.choice((None, "greeting", "question")) if role != "user" else None
+        session.add_message(role, "x" * rng.randint(0, 30), intent=intent)
+
+    stats = session.stats.to_dict()
+    assert len(session.messages) == HISTORY_MAX_TURNS * 2
+    assert {k: v for k, v in stats.items() if k != "recent_topics"} == _recount(session)
+
+    session.clear()
+    assert session.stats.messages == 0 and session.stats.intent_counts == {}
+
+
+def test_user_story_59_engine_turns_update_stats_and_suffix() -> None:
+    engine = ChatEngine(history=FakeHistory(), interaction_log=FakeInteractionLog())
+    for text in ("hello", "tell me about Python", "what is it?", "thanks"):
+        engine.process_turn(text)
+
+    stats = engine.session.stats
+    assert stats.user_messages == 4 and stats.assistant_messages == 4
+    assert stats.turns == 4
+    assert stats.intent_counts["greeting"] == 1
+    assert stats.intent_counts["question"] >= 1
+    assert "python" in stats.recent_topics
+
+    recent = engine.session.recent_messages(limit=2)
+    assert recent.stats is stats
+    assert len(recent) == 2
+    assert ResponseGenerator()._session_suffix(recent).endswith(": 4")
+
+
+def test_user_story_59_stats_command() -> None:
+    assert parse_user_input("stats").command == Command.STATS
+    assert parse_user_input("/Statistics").command == Command.STATS
+
+    engine = ChatEngine(history=FakeHistory(), interaction_log=FakeInteractionLog())
+    inputs = iter(["hello", "stats"])
+
+    def read(_prompt: str) -> str:
+        for line in inputs:
+            return line
+        raise EOFError
+
+    out: list[str] = []
+    CliApp(engine=engine).run_with_io(read, out.append, 80)
+
+    assert "Assistant: Session statistics" in out
+    assert "Assistant: Messages: 1 from you, 1 from me" in out
+    assert any(line.startswith("Assistant: Intents: greeting 1") for line in out)
+    # The command itself is not a message.
+    assert engine.session.stats.user_messages == 1
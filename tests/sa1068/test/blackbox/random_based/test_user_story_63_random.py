@@ -0,0 +1,110 @@
+# Test file for User Story 63
+# Testing Type: blackbox
+# Technique: random_based
+# Team Member: sa1068
+# Original file: test_user_story_63.py
+
+from __future__ import annotations
+
+import io
+import random
+from pathlib import Path
+
+from helpers import FakeHistory, FakeInteractionLog, _FakeEngine
+from vca.cli.app import ChunkWriter, CliApp
+from vca.core.engine import ChatEngine
+from vca.storage.history_store import HistoryStore
+
+_INPUTS = (
+    "hello",
+    "what is python?",
+    "tell me about Paris",
+    "history",
+    "history page 1",
+    "history page 2",
+    "history search paris",
+    "history search intent:question",
+    "how do i exit",
+    "asdf qwerty",
+    "x" * 900,
+)
+
+
+def _engine(tmp_path: Path, name: str) -> tuple[ChatEngine, HistoryStore]:
+    store = HistoryStore(tmp_path / name / "history.jsonl", max_turns=30)
+    return ChatEngine(history=store, interaction_log=FakeInteractionLog()), store
+
+
+def test_user_story_63_stream_matches_process_turn(tmp_path: Path) -> None:
+    rng = random.Random(63)
+    plain, plain_store = _engine(tmp_path, "plain")
+    streamed, streamed_store = _engine(tmp_path, "streamed")
+    for _ in range(40):
+        text = rng.choice(_INPUTS)
+        chunks = list(streamed.process_turn_stream(text))
+        assert chunks
+        assert "".join(chunks) == plain.process_turn(text)
+
+    # Both engines saved the same complete responses.
+    expected = [t.assistant_text for t in plain_store.load_turns()]
+    assert [t.assistant_text for t in streamed_store.load_turns()] == expected
+
+
+def test_user_story_63_history_views_stream_line_by_line(tmp_path: Path) -> None:
+    engine, _store = _engine(tmp_path, "lines")
+    for i in range(5):
+        engine.process_turn(f"tell me about paris {i}")
+    chunks = list(engine.process_turn_stream("history search paris"))
+    assert len(chunks) > 5
+    assert all(c.startswith("\n") for c in chunks[1:])
+
+
+def test_user_story_63_turn_is_saved_when_reader_stops(tmp_path: Path) -> None:
+    engine, store = _engine(tmp_path, "early")
+    for i in range(4):
+        engine.process_turn(f"tell me about paris {i}")
+    stream = engine.process_turn_stream("history page 1")
+    first = next(stream)
+    stream.close()
+
+    saved = store.load_turns()[-1]
+    assert saved.user_text == "history page 1"
+    assert saved.assistant_text.startswith(first)
+    assert saved.assistant_text.count("user: ") == 4
+
+
+def test_user_story_63_cli_writes_chunks_and_flushes(tmp_path: Path) -> None:
+    class _Out(io.StringIO):
+        flushes = 0
+
+        def flush(self) -> None:
+            _Out.flushes += 1
+
+    out = _Out()
+    inputs = iter(["tell me about paris", "history search paris", "exit"])
+    lines: list[str] = []
+    engine, _store = _engine(tmp_path, "cli")
+    CliApp(engine).run_with_io(
+        input_fn=lambda _p: next(inputs),
+        output_fn=lines.append,
+        write_fn=ChunkWriter(out),
+    )
+    text = out.getvalue()
+    assert text.startswith("Assistant: ")
+    assert 'Found 1 saved turns matching "paris":\nuser: tell me' in text
+    assert _Out.flushes >= 6
+    assert lines[-1] == "Assistant: Goodbye."
+
+
+def test_user_story_63_engines_without_streaming_still_work() -> None:
+    lines: list[str] = []
+    inputs = iter(["hi there", "exit"])
+    CliApp(_FakeEngine()).run_with_io(
+        input_fn=lambda _p: next(inputs),
+        output_fn=lines.append,
+        write_fn=lines.append,
+    )
+    assert "reply: hi there" in lines
+
+    fake = ChatEngine(history=FakeHistory(), interaction_log=FakeInteractionLog())
+    assert "".join(fake.process_turn_stream("hello")).startswith("Hello")
@@ -0,0 +1,72 @@
+# Test file for User Story 67
+# Testing Type: blackbox
+# Technique: random_based
+# Team Member: sa1068
+# Original file: test_user_story_67.py
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from vca.bench import session_tail as bench
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.session import ConversationSession, RecentMessages
+
+
+def _reference_turns(messages: list, limit: int) -> list[tuple[str, str]]:
+    pairs = [
+        (m.content, n.content)
+        for m, n in zip(messages, messages[1:])
+        if m.role == "user" and n.role == "assistant"
+    ]
+    return pairs[-limit:] if limit > 0 else []
+
+
+def _random_session(rng: random.Random, steps: int) -> ConversationSession:
+    session = ConversationSession(max_turns=rng.choice((0, 2, 50)))
+    for i in range(steps):
+        op = rng.random()
+        if op < 0.45:
+            session.add_message("user", f"user {i}")
+        elif op < 0.85:
+            session.add_message("assistant", f"assistant {i}", intent="question")
+        elif op < 0.95:
+            session.add_assistant_message(f"fallback {i}")
+        else:
+            session.add_turn(ChatTurn(f"loaded {i}", f"reply {i}"))
+    return session
+
+
+def test_user_story_67_tails_match_full_copies() -> None:
+    rng = random.Random(67)
+    for _ in range(40):
+        session = _random_session(rng, rng.randint(0, 1200))
+        messages = list(session.messages)
+        turns = list(session.turns)
+        for k in (1, 3, 10, 2000):
+            recent = session.recent_messages(limit=k)
+            assert isinstance(recent, RecentMessages)
+            assert recent == messages[-k:]
+            assert session.messages[-k:] == messages[-k:]
+            assert session.turns[-k:] == turns[-k:]
+            tail = session.recent_turns(limit=k)
+            if turns:
+                assert tail == turns[-k:]
+            else:
+                assert [
+                    (t.user_text, t.assistant_text) for t in tail
+                ] == _reference_turns(messages, k)
+        assert session.messages[1:5] == messages[1:5]
+        assert session.recent_messages(limit=0) == []
+        assert session.recent_turns(limit=0) == []
+
+
+def test_user_story_67_benchmark_reports_tail_reads(tmp_path: Path) -> None:
+    out = tmp_path / "tail.json"
+    argv = ["--sizes", "20,200", "--calls", "20", "--out", str(out)]
+    assert bench.main(argv) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    assert cases["session_200_recent_messages"]["messages"] == 200
+    assert cases["session_20_copy_then_slice"]["turns"] > 0
@@ -0,0 +1,145 @@
+# Test file for User Story 71
+# Testing Type: blackbox
+# Technique: random_based
+# Team Member: sa1068
+# Original file: test_user_story_71.py
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.bench import session_registry as bench
+from vca.core.engine import ChatEngine
+from vca.core.session_registry import SessionRegistry, session_key, session_path
+from vca.domain.memory_budget import MemoryBudget
+
+_TEXTS = (
+    "hello",
+    "what is python?",
+    "tell me about Paris",
+    "help me and exit",
+    "help",
+    "thanks",
+    "history",
+    "",
+)
+
+
+def _registry(tmp_path: Path, max_hot: int, **kwargs) -> tuple[SessionRegistry, dict]:
+    histories: dict[str, FakeHistory] = {}
+
+    def factory(session_id: str) -> FakeHistory:
+        return histories.setdefault(session_id, FakeHistory())
+
+    registry = SessionRegistry(
+        tmp_path / "sessions",
+        max_hot=max_hot,
+        history_factory=factory,
+        interaction_log=FakeInteractionLog(),
+        **kwargs,
+    )
+    return registry, histories
+
+
+def test_user_story_71_random_traffic_matches_separate_engines(
+    tmp_path: Path,
+) -> None:
+    rng = random.Random(71)
+    registry, histories = _registry(tmp_path, max_hot=3)
+    reference: dict[str, ChatEngine] = {}
+    ids = [f"user-{i}" for i in range(8)]
+    for _ in range(400):
+        session_id = rng.choice(ids)
+        text = rng.choice(_TEXTS)
+        expected = reference.setdefault(
+            session_id,
+            ChatEngine(history=FakeHistory(), interaction_log=FakeInteractionLog()),
+        ).process_turn(text)
+        assert registry.process_turn(session_id, text) == expected
+        assert len(registry) <= 3
+
+    for session_id, engine in reference.items():
+        assert histories[session_id].saved == engine._history.saved
+    stats = registry.stats()
+    assert stats["hits"] + stats["misses"] == 400
+    assert stats["rehydrated"] == stats["misses"] - len(reference)
+    assert stats["evictions"] == stats["misses"] - len(registry)
+    assert 0.0 < stats["hit_rate"] < 1.0
+
+
+def test_user_story_71_least_recently_used_is_evicted(tmp_path: Path) -> None:
+    registry, _ = _registry(tmp_path, max_hot=2)
+    registry.process_turn("a", "hello")
+    registry.process_turn("b", "hello")
+    registry.process_turn("a", "thanks")
+    registry.process_turn("c", "hello")
+    assert list(registry) == ["a", "c"]
+    assert "b" not in registry
+    assert registry.snapshot_path("b").exists()
+    assert not registry.snapshot_path("c").exists()
+
+    session = registry.engine("b").session
+    assert registry.rehydrated == 1
+    assert [m.content for m in session.messages][0] == "hello"
+    assert len(session.messages) == 2
+    assert list(registry) == ["c", "b"]
+
+
+def test_user_story_71_evict_close_and_shared_parts(tmp_path: Path) -> None:
+    budget = MemoryBudget(1 << 20)
+    registry, _ = _registry(tmp_path, max_hot=4, memory_budget=budget)
+    for session_id in ("a", "b", "c"):
+        registry.process_turn(session_id, "what is python?")
+    engines = [registry.engine(s) for s in ("a", "b", "c")]
+    assert len({id(e._classifier) for e in engines}) == 1
+    assert len({id(e._responder) for e in engines}) == 1
+    assert budget.used_bytes > 0
+
+    assert registry.evict("a")
+    assert not registry.evict("a")
+    assert "a" not in registry
+    registry.close()
+    assert len(registry) == 0
+    assert budget.used_bytes == 0
+    assert registry.evictions == 3
+    assert registry.max_hot == 4
+    assert SessionRegistry(tmp_path, max_hot=0).max_hot == 1
+
+
+def test_user_story_71_session_files_fan_out(tmp_path: Path) -> None:
+    rng = random.Random(7)
+    keys = set()
+    for _ in range(200):
+        session_id = "".join(rng.choice("abcxyz0123 é") for _ in range(12))
+        key = session_key(session_id)
+        assert len(key) == 32 and key == session_key(session_id)
+        path = session_path(tmp_path, session_id, ".snapshot")
+        assert path == tmp_path / key[:2] / f"{key}.snapshot"
+        keys.add(key[:2])
+    assert len(keys) > 100
+
+    registry = SessionRegistry(tmp_path, interaction_log=FakeInteractionLog())
+    registry.process_turn("user-1", "hello")
+    registry.close()
+    assert session_path(tmp_path, "user-1", ".jsonl").exists()
+    assert session_path(tmp_path, "user-1", ".snapshot").exists()
+    reopened = SessionRegistry(tmp_path, interaction_log=FakeInteractionLog())
+    assert len(reopened.engine("user-1").session.turns) == 1
+    assert reopened.rehydrated == 1
+    reopened.close()
+
+
+def test_user_story_71_benchmark_runs(tmp_path: Path) -> None:
+    out = tmp_path / "registry.json"
+    argv = ["--sessions", "60", "--max-hot", "10", "--turns", "80", "--out", str(out)]
+    assert bench.main(argv) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    assert cases["create"]["calls"] == 60
+    assert cases["create"]["evictions"] == 50
+    assert cases["create"]["bytes_per_hot_session"] > 0
+    skewed = cases["skewed_hit"]
+    assert skewed["hits"] + skewed["misses"] == 80
+    assert skewed["calls"] + cases["skewed_miss"]["calls"] == 80
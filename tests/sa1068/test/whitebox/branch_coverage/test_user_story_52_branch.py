@@ -0,0 +1,120 @@
+# Test file for User Story 52
+# Testing Type: whitebox
+# Technique: branch_coverage
+# Team Member: sa1068
+# Original file: test_user_story_52.py
+
+from __future__ import annotations
+
+import random
+import time
+
+from vca.core.validator import InputValidator
+
+
+class _SmallValidator(InputValidator):
+    MAX_LEN = 20
+    SCAN_WINDOW = 25
+    MAX_SCAN_CHARS = 400
+
+
+def _reference(raw: str, max_len: int) -> tuple[str, bool]:
+    text = InputValidator._normalise_unicode(raw)
+    return text[:max_len], len(text) > max_len
+
+
+def _median_seconds(fn, arg, repeats: int = 7) -> float:
+    times: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def test_user_story_52_prefix_cleaning_matches_full_cleaning() -> None:
+    alphabet = list("ab !!??..,,\t\n\r\x00\x01") + [
+        "\u00e9",
+        "e\u0301",
+        "\u0301",
+        "\U0001f600",
+        "\u3000",
+        "\uac00",
+    ]
+    v = _SmallValidator()
+    rng = random.Random(52)
+    for _ in range(20000):
+        raw = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 300)))
+        out = v.clean(raw)
+        assert (out.text, out.was_truncated) == _reference(raw, 20), repr(raw)
+
+
+def test_user_story_52_window_grows_for_whitespace_heavy_prefix() -> None:
+    v = _SmallValidator()
+    raw = " " * 60 + "\x00" * 60 + "x" * 30
+    out = v.clean(raw)
+    assert out.text == "x" * 20
+    assert out.was_truncated is True
+
+
+def test_user_story_52_scan_cap_reports_truncation() -> None:
+    v = _SmallValidator()
+    out = v.clean(" " * 1000 + "hello")
+    assert out.text == ""
+    assert out.was_truncated is True
+
+
+def test_user_story_52_cut_point_waits_for_a_stable_starter() -> None:
+    v = _SmallValidator()
+    assert v._cut_point("a" * 10 + "\u00e9" * 200, 30) == 30
+    assert v._cut_point("\u00e9" * 30 + "\u0301" * 5 + "b", 30) == 35
+    # A Hangul final consonant composes onto the syllable before it.
+    assert v._cut_point("\uac00" * 30 + "\u11a8\uac00", 30) == 31
+    assert v._cut_point("a" + "\u0301" * 50, 10) == 51
+    assert v._cut_point("a" + "\u0301" * 500, 10) is None
+
+
+def test_user_story_52_long_combining_run_across_the_window() -> None:
+    # The run crosses the end of the first window, and canonical ordering
+    # moves the later, lower class marks ahead of the earlier ones.
+    v = InputValidator()
+    raw = "c" * 1950 + "\x00" * 5900 + "a" + "\u0301" * 300 + "\u0316" * 100
+    raw += "b" * 3000
+    out = v.clean(raw)
+    assert (out.text, out.was_truncated) == _reference(raw, v.MAX_LEN)
+    assert out.text.endswith("\u0316\u0316")
+
+    small = _SmallValidator()
+    rng = random.Random(29)
+    marks = ["\u0301", "\u0316", "\u0327", "\u0308", "\u1161", "\u11a8"]
+    for _ in range(2000):
+        raw = "".join(
+            rng.choice(marks) if rng.random() < 0.8 else rng.choice("ab\x00 \uac00")
+            for _ in range(rng.randint(0, 450))
+        )
+        out = small.clean(raw)
+        assert (out.text, out.was_truncated) == _reference(raw, 20), repr(raw)
+
+
+def test_user_story_52_combining_marks_past_the_scan_cap_stay_bounded() -> None:
+    v = InputValidator()
+    raw = "a" + "\u0316\u0301" * 2_000_000
+    start = time.perf_counter()
+    out = v.clean(raw)
+    assert time.perf_counter() - start < 5.0
+    assert out.was_truncated is True
+    assert out.text == "\u00e1" + "\u0316" * (v.MAX_LEN - 1)
+
+
+def test_user_story_52_ten_megabytes_costs_about_the_same_as_ten_kilobytes() -> None:
+    v = InputValidator()
+    line = "Tell me about Python please,\tit looks great!!!!\n"
+    small = (line * (10_000 // len(line) + 1))[:10_000]
+    huge = (line * (10_000_000 // len(line) + 1))[:10_000_000]
+
+    assert v.clean(huge) == v.clean(small)
+
+    small_s = _median_seconds(v.clean, small)
+    huge_s = _median_seconds(v.clean, huge)
+    assert huge_s < small_s * 3 + 0.002
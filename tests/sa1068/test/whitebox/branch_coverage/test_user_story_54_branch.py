@@ -0,0 +1,114 @@
+# Test file for User Story 54
+# Testing Type: whitebox
+# Technique: branch_coverage
+# Team Member: sa1068
+# Original file: test_user_story_54.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.bench import routing as bench
+from vca.core.engine import ChatEngine
+from vca.core.handler_registry import HandlerRegistry, call_adapter
+from vca.core.intents import Intent
+from vca.core.responses import ResponseGenerator
+
+
+def test_user_story_54_adapter_matches_handler_arity() -> None:
+    def two(text, recent):
+        return f"two:{text}"
+
+    def three(text, recent, context):
+        return f"three:{text}:{context}"
+
+    def star(*args):
+        return f"star:{len(args)}"
+
+    class Holder:
+        def method(self, text, recent):
+            return f"method:{text}"
+
+    assert call_adapter(two)(two, "a", None, "ctx") == "two:a"
+    assert call_adapter(three)(three, "a", None, "ctx") == "three:a:ctx"
+    assert call_adapter(star)(star, "a", None, "ctx") == "star:3"
+    bound = Holder().method
+    assert call_adapter(bound)(bound, "a", None, "ctx") == "method:a"
+
+
+def test_user_story_54_type_error_inside_handler_is_not_retried() -> None:
+    calls = {"count": 0}
+
+    def broken(text, recent, context=None):
+        calls["count"] += 1
+        raise TypeError("inside handler")
+
+    r = ResponseGenerator()
+    with pytest.raises(TypeError, match="inside handler"):
+        r._invoke(broken, "x", None, None)
+    assert calls["count"] == 1
+
+
+def test_user_story_54_registry_normalises_keys_and_falls_back() -> None:
+    registry = HandlerRegistry()
+    registry.register("unknown", lambda t, r: "unknown")
+    registry.register(" HELP ", lambda t, r, c: "help")
+
+    assert registry.lookup(Intent.HELP)("x", None) == "help"
+    assert registry.lookup("nothing")("x", None) == "unknown"
+    assert registry.lookup(None)("x", None) == "unknown"
+    assert "help" in registry
+    with pytest.raises(TypeError):
+        registry.register("bad", "not callable")  # type: ignore[arg-type]
+
+
+def test_user_story_54_register_handler_for_new_intent() -> None:
+    r = ResponseGenerator()
+    r.register_handler("weather", lambda text, recent: f"Sunny, you said {text}")
+
+    assert r.generate("weather", "forecast?") == "Sunny, you said forecast?"
+    assert r.route("weather")("x", None) == "Sunny, you said x"
+    assert r.generate("ambiguous", "hmm") == r.fallback_unknown()
+
+    r.register_handler(Intent.GREETING, lambda text, recent, context: "Howdy")
+    engine = ChatEngine(history=FakeHistory(), interaction_log=FakeInteractionLog())
+    engine._responder = r
+    assert engine.process_turn("hello").startswith("Howdy")
+
+
+def test_user_story_54_replaced_methods_are_used_after_construction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    r = ResponseGenerator()
+    r.handle_greeting = lambda text, recent: "Hi from the instance"
+    assert r.generate("greeting", "hello") == "Hi from the instance"
+    assert r.route(Intent.GREETING)("x", None) == "Hi from the instance"
+
+    monkeypatch.setattr(
+        ResponseGenerator, "handle_thanks", lambda self, text, recent, context: "np"
+    )
+    assert r.generate("thanks", "thank you") == "np"
+    # Unknown names fall back to the current unknown handler.
+    r.handle_unknown = lambda text, recent, context: "unknown here"
+    assert r.generate("no such intent", "x") == "unknown here"
+
+    # register_handler still wins over the method.
+    r.register_handler("greeting", lambda text, recent: "registered")
+    assert r.generate("greeting", "hello") == "registered"
+
+
+def test_user_story_54_routing_benchmark_writes_results(tmp_path: Path) -> None:
+    out = tmp_path / "routing.json"
+    assert bench.main(["--calls", "200", "--out", str(out)]) == 0
+
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert {c["case"] for c in payload["cases"]} == {
+        "legacy_three_args",
+        "registry_three_args",
+        "legacy_two_args",
+        "registry_two_args",
+    }
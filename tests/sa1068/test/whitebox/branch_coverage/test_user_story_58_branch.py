@@ -0,0 +1,79 @@
+# Test file for User Story 58
+# Testing Type: whitebox
+# Technique: branch_coverage
+# Team Member: sa1068
+# Original file: test_user_story_58.py
+
+from __future__ import annotations
+
+import time
+
+from vca.core.responses import ResponseGenerator
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.session import ConversationSession, Message
+from vca.domain.topics import TOPIC_STOP_WORDS, extract_topic
+
+
+def test_user_story_58_extract_topic_branches() -> None:
+    assert extract_topic("") == ""
+    assert extract_topic("Tell me about Python") == "python"
+    assert extract_topic("what do you know about rust") == "rust"
+    assert extract_topic("anything regarding exams") == "exams"
+    assert extract_topic("I am visiting london") == "london"
+    assert extract_topic("is it") == "is"
+    assert extract_topic("?!") == ""
+    assert isinstance(TOPIC_STOP_WORDS, frozenset)
+
+
+def test_user_story_58_add_message_caches_user_topics() -> None:
+    session = ConversationSession()
+    session.add_message("user", "Tell me about Python")
+    session.add_message("assistant", "Python is a language")
+
+    user, assistant = session.messages
+    assert user.topic == "python"
+    assert assistant.topic is None
+
+
+def test_user_story_58_handle_question_reuses_cached_topic() -> None:
+    r = ResponseGenerator()
+    recent = [
+        Message(role="user", content="Tell me about Python", topic="cached"),
+        Message(role="assistant", content="ok"),
+        Message(role="user", content="why?"),
+    ]
+    assert r.handle_question("why?", recent).startswith(
+        "Following up on your earlier message about cached: why?"
+    )
+
+    # Messages built without a topic still get one.
+    recent[0] = Message(role="user", content="Tell me about Python")
+    assert "about python: why?" in r.handle_question("why?", recent)
+
+    # An empty earlier message falls back to the context turns.
+    recent[0] = Message(role="user", content="")
+    context = [ChatTurn(user_text="about cats", assistant_text="ok")]
+    assert "about cats: why?" in r.handle_question("why?", recent, context)
+    assert r.handle_question("why?", None).startswith("I think you are asking")
+
+
+def test_user_story_58_cost_does_not_grow_with_earlier_message() -> None:
+    r = ResponseGenerator()
+
+    def per_call(length: int) -> float:
+        session = ConversationSession()
+        session.add_message("user", "word " * length + "about Python")
+        session.add_message("assistant", "ok")
+        session.add_message("user", "and then?")
+        recent = session.recent_messages(10)
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(200):
+                r.handle_question("and then?", recent)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    short = per_call(2)
+    long = per_call(20000)
+    assert long < short * 3
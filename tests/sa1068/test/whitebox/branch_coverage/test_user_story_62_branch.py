@@ -0,0 +1,102 @@
+# Test file for User Story 62
+# Testing Type: whitebox
+# Technique: branch_coverage
+# Team Member: sa1068
+# Original file: test_user_story_62.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.core.engine import ChatEngine
+from vca.domain.chat_turn import ChatTurn, turn_confidence
+from vca.storage.history_store import HistoryStore
+
+
+def test_user_story_62_chat_turn_round_trip() -> None:
+    plain = ChatTurn("hi", "hello")
+    assert set(plain.to_dict()) == {
+        "user_text",
+        "assistant_text",
+        "user_ts",
+        "assistant_ts",
+    }
+    assert ChatTurn.from_dict(plain.to_dict()) == plain
+
+    tagged = ChatTurn("hi", "hello", intent="greeting", confidence=0.9, rule="keyword")
+    assert ChatTurn.from_dict(tagged.to_dict()) == tagged
+    assert turn_confidence("0.5") == 0.5
+    assert turn_confidence("high") is None
+    assert turn_confidence(True) is None
+    assert turn_confidence(None) is None
+
+
+def test_user_story_62_store_writes_and_reads_metadata(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    store = HistoryStore(path)
+    store.save_turn(
+        "what is python",
+        "A language.",
+        intent="question",
+        confidence=0.87654,
+        rule="question_word",
+    )
+    store.save_turn("plain", "turn")
+
+    user = json.loads(path.read_text().splitlines()[0])
+    assert (user["intent"], user["confidence"], user["rule"]) == (
+        "question",
+        0.8765,
+        "question_word",
+    )
+    assert "intent" not in json.loads(path.read_text().splitlines()[1])
+
+    for turns in (store.load_turns(), store.read_turns(0, 2).turns):
+        assert (turns[0].intent, turns[0].confidence, turns[0].rule) == (
+            "question",
+            0.8765,
+            "question_word",
+        )
+        assert (turns[1].intent, turns[1].confidence, turns[1].rule) == (
+            None,
+            None,
+            None,
+        )
+
+
+def test_user_story_62_older_files_still_load(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    with path.open("w", encoding="utf-8") as f:
+        f.write(
+            json.dumps(
+                {"ts": "t1", "role": "user", "content": "old", "confidence": "bad"}
+            )
+            + "\n"
+        )
+        f.write(
+            json.dumps({"ts": "t2", "role": "assistant", "content": "reply"}) + "\n"
+        )
+    turn = HistoryStore(path).load_turns()[0]
+    assert (turn.user_text, turn.intent, turn.confidence, turn.rule) == (
+        "old",
+        None,
+        None,
+        None,
+    )
+
+
+def test_user_story_62_engine_passes_telemetry(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl")
+    engine = ChatEngine(history=store, interaction_log=FakeInteractionLog())
+    engine.process_turn("hello")
+    turn = store.load_turns()[-1]
+    assert turn.intent == "greeting"
+    assert turn.rule and 0.0 < turn.confidence <= 1.0
+
+    # Fake stores that only take the two texts keep working.
+    fake = FakeHistory()
+    engine = ChatEngine(history=fake, interaction_log=FakeInteractionLog())
+    engine.process_turn("hello")
+    assert fake.saved[-1][0] == "hello"
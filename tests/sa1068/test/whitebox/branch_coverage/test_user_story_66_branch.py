@@ -0,0 +1,146 @@
+# Test file for User Story 66
+# Testing Type: whitebox
+# Technique: branch_coverage
+# Team Member: sa1068
+# Original file: test_user_story_66.py
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.core.engine import ChatEngine
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.session import MAX_SESSION_MESSAGES, ConversationSession
+
+
+def _pairs(session: ConversationSession) -> list[tuple[str, str]]:
+    return [(m.role, m.content) for m in session.messages]
+
+
+def test_user_story_66_turns_and_messages_share_one_ring() -> None:
+    session = ConversationSession()
+    session.add_message("user", "hello")
+    assert len(session.turns) == 0 and _pairs(session) == [("user", "hello")]
+    session.add_message("assistant", "Hi!", intent="greeting")
+    session.add_message("user", "one")
+    session.add_message("user", "two")  # "one" is never answered
+    session.add_assistant_message("Did you mean help or exit?")
+    session.add_message("user", "help")
+    session.add_message("assistant", "Here is help.")
+    session.add_message("system", "note")
+
+    expected = [
+        ("user", "hello"),
+        ("assistant", "Hi!"),
+        ("user", "one"),
+        ("user", "two"),
+        ("assistant", "Did you mean help or exit?"),
+        ("user", "help"),
+        ("assistant", "Here is help."),
+        ("system", "note"),
+    ]
+    assert _pairs(session) == expected
+    assert [(m.role, m.content) for m in reversed(session.messages)] == expected[::-1]
+    assert [t.user_text for t in session.turns] == ["hello", "help"]
+    assert session.turns[-1].assistant_text == "Here is help."
+    assert session.messages[1].intent == "greeting"
+    assert session.messages[0].topic == "hello"
+    assert session.messages[-2].content == "Here is help."
+    assert len(session.messages[2:4]) == 2 and len(session.turns[:1]) == 1
+    with pytest.raises(IndexError):
+        session.messages[len(expected)]
+    with pytest.raises(IndexError):
+        session.turns[-3]
+    assert session.last_user_message() == "help"
+    assert session.stats.turns == 2 and session.stats.user_messages == 4
+
+
+def test_user_story_66_adopts_only_the_matching_stored_turn() -> None:
+    session = ConversationSession()
+    stored = ChatTurn("hi", "Hello", "2026-01-02T03:04:05+00:00", None, "greeting")
+    assert not session.adopt_stored_turn(stored)
+    session.add_message("user", "hi")
+    session.add_message("assistant", "Hello", intent="greeting")
+    assert not session.adopt_stored_turn(ChatTurn("hi", "other"))
+    assert session.adopt_stored_turn(stored)
+    assert session.turns[-1] is stored
+    assert not session.adopt_stored_turn(stored)  # only once
+    session.add_turn(stored)  # duplicate of the last turn
+    assert len(session.turns) == 1 and len(session.messages) == 2
+
+
+def test_user_story_66_message_limit_trims_half_turns_and_keeps_stats() -> None:
+    rng = random.Random(66)
+    session = ConversationSession(max_turns=3)
+    for i in range(MAX_SESSION_MESSAGES + 301):
+        role = rng.choice(("user", "user", "assistant", "assistant", "system"))
+        session.add_message(
+            role, f"m{i}", intent="question" if role != "user" else None
+        )
+        if i % 97 == 0:
+            session.add_assistant_message("fallback")
+
+    messages = list(session.messages)
+    assert len(messages) == len(session.messages) == MAX_SESSION_MESSAGES
+    assert messages == list(reversed(session.messages))[::-1]
+    assert session.stats.user_messages == sum(m.role == "user" for m in messages)
+    assert session.stats.total_chars == sum(len(m.content) for m in messages)
+    assert session.stats.turns == len(session.turns) <= 3
+    numbers = [int(m.content[1:]) for m in messages if m.content != "fallback"]
+    assert numbers == sorted(numbers)
+
+
+def test_user_story_66_unpaired_messages_do_not_cost_turns() -> None:
+    session = ConversationSession(max_turns=3, max_messages=6)
+    for i in range(40):
+        session.add_message("user", f"u{i}")
+        session.add_message("assistant", f"a{i}")
+        session.add_assistant_message(f"fallback {i}")
+
+    assert [m.content for m in session.messages] == [
+        "u38",
+        "a38",
+        "fallback 38",
+        "u39",
+        "a39",
+        "fallback 39",
+    ]
+    assert [t.user_text for t in session.turns] == ["u37", "u38", "u39"]
+    assert session.stats.turns == 3 and session.stats.messages == 6
+    assert len(session._ring) == 3
+    assert [t.user_text for t in session.recent_turns(3)] == ["u37", "u38", "u39"]
+
+    restored = ConversationSession(max_turns=3, max_messages=6)
+    restored.restore_state(session.snapshot_state())
+    assert list(restored.messages) == list(session.messages)
+    assert list(restored.turns) == list(session.turns)
+
+
+def test_user_story_66_turn_limit_hides_turns_but_keeps_messages() -> None:
+    session = ConversationSession()
+    for i in range(4):
+        session.add_turn(ChatTurn(f"u{i}", f"a{i}"), max_turns=2)
+    assert [t.user_text for t in session.turns] == ["u2", "u3"]
+    assert len(session.messages) == 8
+    session.trim_to_last_turns(0)
+    assert len(session.turns) == 0 and session.stats.turns == 0
+    assert session.recent_turns(limit=2)[-1].user_text == "u3"  # from messages
+    session.clear()
+    assert len(session.messages) == 0 and session.recent_turns() == []
+
+
+def test_user_story_66_engine_keeps_clarifications_out_of_turns() -> None:
+    history = FakeHistory()
+    engine = ChatEngine(history=history, interaction_log=FakeInteractionLog())
+    engine.process_turn("hello")
+    engine.process_turn("help me exit")  # asks a clarifying question
+    engine.process_turn("help")
+
+    session = engine.session
+    assert [t.user_text for t in session.turns] == ["hello", "help"]
+    assert session.turns[0] is history.turns[0]
+    assert [m.content for m in session.messages][2] == "help me exit"
+    assert len(session.messages) == 6 and session.stats.messages == 6
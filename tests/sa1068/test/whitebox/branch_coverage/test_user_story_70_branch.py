@@ -0,0 +1,246 @@
+# Test file for User Story 70
+# Testing Type: whitebox
+# Technique: branch_coverage
+# Team Member: sa1068
+# Original file: test_user_story_70.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.bench import session_resume as bench
+from vca.core.engine import ChatEngine
+from vca.core.settings import load_settings
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.session import ConversationSession
+from vca.storage.history_store import HistoryPage, HistoryStore
+
+
+class _CountingStore(HistoryStore):
+    """HistoryStore that records how many turns each read returned."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path=path)
+        self.turns_read = 0
+        self.counts_read = 0
+
+    def read_turns(self, start: int, count: int) -> HistoryPage:
+        page = super().read_turns(start, count)
+        self.turns_read += len(page.turns)
+        self.counts_read += count == 0
+        return page
+
+    def load_turns(self, max_turns: int | None = None) -> list[ChatTurn]:
+        turns = super().load_turns(max_turns)
+        self.turns_read += len(turns)
+        return turns
+
+
+def _fill(path: Path, turns: int) -> None:
+    store = HistoryStore(path=path)
+    for i in range(turns):
+        store.save_turn(f"question {i}", f"answer {i}")
+
+
+def _resident_engine(path: Path, resident: int = 5) -> ChatEngine:
+    return ChatEngine(
+        history=_CountingStore(path),
+        interaction_log=FakeInteractionLog(),
+        resident_turns=resident,
+    )
+
+
+def test_user_story_70_startup_reads_only_resident_turns(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    _fill(path, 40)
+    engine = _resident_engine(path)
+    # The resident turns are paged in and checked against load_turns.
+    assert engine._history.turns_read == 2 * 5
+    assert len(engine.session.messages) == 10
+    assert engine.loaded_turns_count == 40
+
+    engine._history.turns_read = 0
+    engine.reset_session()
+    assert engine._history.turns_read == 2 * 5
+    assert engine.loaded_turns_count == 40
+
+
+def test_user_story_70_resident_mode_loads_what_load_turns_loads(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "history.jsonl"
+    _fill(path, 3)
+    with path.open("a", encoding="utf-8") as f:
+        f.write("\n" + json.dumps({"role": "user", "content": "torn"}) + "\n")
+    HistoryStore(path=path).save_turn("question 3", "answer 3")
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"role": "assistant", "content": "orphan"}) + "\n")
+    HistoryStore(path=path).save_turn("question 4", "answer 4")
+
+    def texts(engine: ChatEngine) -> list[str]:
+        return [t.user_text for t in engine.session.turns]
+
+    plain = ChatEngine(
+        history=HistoryStore(path=path), interaction_log=FakeInteractionLog()
+    )
+    resident = _resident_engine(path)
+    assert texts(resident) == texts(plain) == [f"question {i}" for i in range(5)]
+    assert resident._turn_pager is not None
+
+    # load_turns gives up on a file with a line it cannot read.
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"role": "user", "cont\n')
+    plain = ChatEngine(
+        history=HistoryStore(path=path), interaction_log=FakeInteractionLog()
+    )
+    resident = _resident_engine(path)
+    assert texts(resident) == texts(plain) == []
+    assert resident._turn_pager is None
+    assert resident.loaded_turns_count == plain.loaded_turns_count == 0
+
+
+def test_user_story_70_turn_view_pages_older_turns(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    _fill(path, 25)
+    engine = _resident_engine(path)
+    turns = engine.session.turns
+    assert len(turns) == 25
+    assert [t.user_text for t in turns] == [f"question {i}" for i in range(25)]
+    assert [t.user_text for t in reversed(turns)][:7] == [
+        f"question {i}" for i in range(24, 17, -1)
+    ]
+    assert turns[0].user_text == "question 0"
+    assert turns[-1].user_text == "question 24"
+    assert turns[19].user_text == "question 19"
+    assert [t.user_text for t in turns[-7:]] == [f"question {i}" for i in range(18, 25)]
+    with pytest.raises(IndexError):
+        turns[25]
+
+
+def test_user_story_70_new_turns_push_old_ones_to_disk(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    _fill(path, 10)
+    engine = _resident_engine(path, resident=3)
+    for text in ("hello", "what is python?", "thanks", "help"):
+        engine.process_turn(text)
+    session = engine.session
+    assert len(session.messages) == 6
+    assert len(session.turns) == 14
+    assert [t.user_text for t in session.turns][9:] == [
+        "question 9",
+        "hello",
+        "what is python?",
+        "thanks",
+        "help",
+    ]
+    assert [t.user_text for t in session.recent_turns(3)] == [
+        "what is python?",
+        "thanks",
+        "help",
+    ]
+
+
+def test_user_story_70_recent_turns_fills_window_from_store(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    _fill(path, 4)
+    store = HistoryStore(path=path)
+    session = ConversationSession(max_messages=2, backing=store)
+    session.add_turn(ChatTurn("question 3", "answer 3"))
+    session.add_assistant_message("Did you mean help or exit?")
+    session.add_assistant_message("Sorry, something went wrong.")
+    assert session._visible_turns() == 0
+    assert [t.user_text for t in session.recent_turns(3)] == [
+        "question 1",
+        "question 2",
+        "question 3",
+    ]
+
+    # A turn answered but not yet saved is not looked up in the store.
+    session.add_message("user", "new question")
+    session.add_message("assistant", "new answer")
+    assert [t.user_text for t in session.turns][-2:] == ["question 3", "new question"]
+    store.save_turn("new question", "new answer")
+    assert session.adopt_stored_turn(store.load_turns(max_turns=1)[-1])
+    session.set_stored_total(store.count_turns())
+    assert len(session.turns) == 5
+
+
+def test_user_story_70_turn_view_keeps_the_store_count(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    _fill(path, 10)
+    engine = _resident_engine(path, resident=3)
+    store = engine._history
+    engine.process_turn("hello")
+    store.counts_read = 0
+    for _ in range(5):
+        assert len(engine.session.turns) == 11
+        engine.session.recent_turns(3)
+    assert store.counts_read == 0
+
+    # Each saved turn updates the count once, when it is adopted.
+    engine.process_turn("thanks")
+    assert store.counts_read == 1
+    assert [t.user_text for t in engine.session.turns][-3:] == [
+        "question 9",
+        "hello",
+        "thanks",
+    ]
+    engine.session.clear()
+    assert len(engine.session.turns) == 12
+    assert store.counts_read == 2
+
+
+def test_user_story_70_without_backing_or_room(tmp_path: Path) -> None:
+    plain = ConversationSession()
+    assert plain.recent_turns(3) == []
+    plain.add_turn(ChatTurn("a", "b"))
+    assert [t.user_text for t in plain.recent_turns(3)] == ["a"]
+
+    path = tmp_path / "history.jsonl"
+    _fill(path, 6)
+    full = ConversationSession(max_turns=1, backing=HistoryStore(path=path))
+    full.add_turn(ChatTurn("question 5", "answer 5"))
+    assert len(full.turns) == 1
+
+    class _Broken:
+        def read_turns(self, start, count):
+            raise OSError("gone")
+
+    broken = ConversationSession(backing=_Broken())
+    broken.add_turn(ChatTurn("a", "b"))
+    assert len(broken.turns) == 1
+
+    # Stores without paged reads keep the last resident turns only.
+    class _LoadOnly(FakeHistory):
+        read_turns = None
+
+    history = _LoadOnly()
+    for i in range(8):
+        history.save_turn(f"q{i}", f"a{i}")
+    engine = ChatEngine(
+        history=history, interaction_log=FakeInteractionLog(), resident_turns=1
+    )
+    assert engine._resident_turns == 3
+    assert [t.user_text for t in engine.session.turns] == ["q5", "q6", "q7"]
+    assert engine.loaded_turns_count == 3
+
+
+def test_user_story_70_resident_setting(tmp_path: Path) -> None:
+    settings_path = tmp_path / "settings.json"
+    assert load_settings(settings_path).session_resident_turns == 0
+    settings_path.write_text(json.dumps({"session_resident_turns": 8}))
+    assert load_settings(settings_path).session_resident_turns == 8
+    settings_path.write_text(json.dumps({"session_resident_turns": -1}))
+    assert load_settings(settings_path).session_resident_turns == 0
+
+
+def test_user_story_70_benchmark_resident_cases(tmp_path: Path) -> None:
+    out = tmp_path / "resume.json"
+    assert bench.main(["--sizes", "30", "--calls", "3", "--out", str(out)]) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    assert cases["resume_30_resident"]["turns"] == 30
+    assert cases["resume_30_restart_resident"]["turns"] == 30
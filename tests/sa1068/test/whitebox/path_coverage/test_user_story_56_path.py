@@ -0,0 +1,170 @@
+# Test file for User Story 56
+# Testing Type: whitebox
+# Technique: path_coverage
+# Team Member: sa1068
+# Original file: test_user_story_56.py
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from vca.core import responses
+from vca.core.responses import ResponseGenerator
+from vca.kb.__main__ import main
+from vca.kb.index import (
+    KnowledgeBase,
+    KnowledgeBaseError,
+    Passage,
+    build_index,
+    load_knowledge_base,
+    split_passages,
+)
+
+_DOC = """# Storage
+
+History is appended to a JSONL file after every turn of the conversation.
+
+```
+history appended history appended history appended
+```
+
+| column | value |
+| --- | --- |
+
+## Exiting
+
+Type **exit** or quit to close the assistant at any time.
+"""
+
+
+def _build(tmp_path: Path) -> Path:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "guide.md").write_text(_DOC, encoding="utf-8")
+    (docs / "notes.txt").write_text(
+        "Velocity is the number of story points completed per sprint.\n",
+        encoding="utf-8",
+    )
+    (docs / "image.png").write_bytes(b"\x89PNG")
+    out = tmp_path / "kb.idx"
+    assert main(["build", "--docs", str(docs), "--out", str(out)]) == 0
+    return out
+
+
+def test_user_story_56_split_passages_keeps_headings_and_skips_code() -> None:
+    passages = list(split_passages("guide.md", _DOC))
+    assert [p.text for p in passages] == [
+        "Storage: History is appended to a JSONL file after every turn of the conversation.",
+        "Exiting: Type exit or quit to close the assistant at any time.",
+    ]
+
+
+def test_user_story_56_search_paths(tmp_path: Path) -> None:
+    with KnowledgeBase(_build(tmp_path)) as kb:
+        assert kb.doc_count == 3
+
+        hit = kb.search("How is the history appended?")
+        assert hit is not None and hit.source == "guide.md"
+        assert hit.text.startswith("Storage:") and not hit.timed_out
+        assert hit.coverage == 1.0
+
+        partial = kb.search("is history stored")
+        assert partial is not None and partial.coverage == 0.5
+
+        hit = kb.search("what is velocity")
+        assert hit is not None and hit.source == "notes.txt"
+
+        assert kb.search("the of and") is None
+        assert kb.search("zzqx blorp") is None
+
+
+def test_user_story_56_budget_returns_best_so_far(tmp_path: Path) -> None:
+    passages = [Passage("a.md", f"common word number {i}") for i in range(10000)]
+    passages.append(Passage("b.md", "rare common word"))
+    out = tmp_path / "kb.idx"
+    build_index(passages, out)
+
+    ticks = iter(range(100))
+    with KnowledgeBase(out) as kb:
+        hit = kb.search("rare common", budget_s=1.5, clock=lambda: next(ticks))
+        assert hit is not None and hit.timed_out
+        # The rare term is scored first, so the right passage still wins.
+        assert hit.source == "b.md"
+
+        full = kb.search("rare common")
+        assert full is not None and not full.timed_out and full.source == "b.md"
+
+
+def test_user_story_56_bad_index_files(tmp_path: Path) -> None:
+    with pytest.raises(KnowledgeBaseError):
+        KnowledgeBase(tmp_path / "absent.idx")
+
+    truncated = tmp_path / "short.idx"
+    truncated.write_bytes(b"VCAKB")
+    with pytest.raises(KnowledgeBaseError):
+        KnowledgeBase(truncated)
+
+    wrong = tmp_path / "wrong.idx"
+    wrong.write_bytes(b"x" * 200)
+    with pytest.raises(KnowledgeBaseError):
+        KnowledgeBase(wrong)
+    assert load_knowledge_base(wrong) is None
+    assert main(["query", "anything", "--index", str(wrong)]) == 2
+
+
+def test_user_story_56_query_command(tmp_path: Path, capsys) -> None:
+    out = _build(tmp_path)
+    assert main(["query", "how do I exit", "--index", str(out)]) == 0
+    assert "guide.md" in capsys.readouterr().out
+    assert main(["query", "zzqx", "--index", str(out)]) == 1
+    assert main(["build", "--docs", str(tmp_path / "none")]) == 2
+
+
+def test_user_story_56_handle_question_answers_from_index(tmp_path: Path) -> None:
+    out = _build(tmp_path)
+    kb = load_knowledge_base(out)
+    assert kb is not None and load_knowledge_base(out) is kb
+
+    r = ResponseGenerator(knowledge_base=kb)
+    reply = r.handle_question("How do I exit the assistant?", None)
+    assert reply == (
+        "From guide.md: Exiting: Type exit or quit to close the assistant at any time."
+    )
+
+    # A passage sharing only some of the content words is not good enough.
+    reply = r.handle_question("how do I exit the spaceship?", None)
+    assert reply.startswith("I think you are asking a question")
+
+
+def test_user_story_56_generator_keeps_its_index(tmp_path: Path, monkeypatch) -> None:
+    out = _build(tmp_path)
+    loads: list[Path] = []
+
+    def counting_load(path: Path):
+        loads.append(path)
+        return load_knowledge_base(path)
+
+    monkeypatch.setattr(responses, "KB_PATH", out)
+    monkeypatch.setattr(responses, "load_knowledge_base", counting_load)
+    question = "How do I exit the assistant?"
+    r = ResponseGenerator()
+    for _ in range(20):
+        assert r.handle_question(question, None).startswith("From guide.md:")
+    assert loads == [out]
+    old = r.knowledge_base
+
+    # A rebuilt index is used once it is checked for. The old one is left
+    # open for whoever still holds it.
+    build_index([Passage("new.md", "To exit the assistant press control d.")], out)
+    assert r.knowledge_base is old
+    r.reload_knowledge_base()
+    assert r.handle_question(question, None).startswith("From new.md:")
+    assert len(loads) == 2
+    hit = old.search(question)
+    assert hit is not None and hit.source == "guide.md"
+
+    r.KB_RECHECK_S = 0.0
+    r.handle_question(question, None)
+    assert len(loads) == 3
@@ -0,0 +1,149 @@
+# Test file for User Story 60
+# Testing Type: whitebox
+# Technique: path_coverage
+# Team Member: sa1068
+# Original file: test_user_story_60.py
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+from pathlib import Path
+
+from helpers import FakeInteractionLog
+from vca.bench import history_pages as bench
+from vca.core.engine import ChatEngine
+from vca.core.history_query import parse_history_query
+from vca.storage.history_store import HistoryStore
+
+UTC = dt.timezone.utc
+
+
+def _store(tmp_path: Path, turns: int, max_turns: int = 1000) -> HistoryStore:
+    clock = [dt.datetime(2026, 10, 1, tzinfo=UTC)]
+
+    # Each saved turn reads the clock twice, so turn i starts at 2i+1 hours.
+    def now() -> dt.datetime:
+        clock[0] += dt.timedelta(hours=1)
+        return clock[0]
+
+    store = HistoryStore(tmp_path / "history.jsonl", max_turns=max_turns, now_utc=now)
+    for i in range(turns):
+        store.save_turn(f"u{i}", f"a{i}")
+    return store
+
+
+def test_user_story_60_parse_history_query() -> None:
+    assert parse_history_query("history") is None
+    assert parse_history_query("history page 3").page == 3
+    assert parse_history_query("show history page 0").page == 1
+    since = parse_history_query("History since 2026-10-02").since
+    assert since == dt.datetime(2026, 10, 2, tzinfo=UTC)
+    assert parse_history_query("history since 2026-10-02T05:30").since.hour == 5
+    assert parse_history_query("history since 2026-99-02") is None
+
+
+def test_user_story_60_pages_count_back_from_newest(tmp_path: Path) -> None:
+    store = _store(tmp_path, 25)
+    assert store.count_turns() == 25
+
+    first = store.read_page(1, 10)
+    assert [t.user_text for t in first.turns] == [f"u{i}" for i in range(15, 25)]
+    assert (first.page, first.pages, first.start) == (1, 3, 15)
+
+    last = store.read_page(3, 10)
+    assert [t.user_text for t in last.turns] == [f"u{i}" for i in range(5)]
+    assert store.read_page(4, 10).turns == []
+    assert store.read_turns(23, 10).turns[-1].assistant_text == "a24"
+
+
+def test_user_story_60_index_follows_writes_and_trimming(tmp_path: Path) -> None:
+    store = _store(tmp_path, 5, max_turns=5)
+    assert store.read_page(1, 2).turns[-1].user_text == "u4"
+
+    store.save_turn("u5", "a5")
+    page = store.read_page(1, 10)
+    assert [t.user_text for t in page.turns] == ["u1", "u2", "u3", "u4", "u5"]
+
+    # Another process appending is picked up by scanning only the new bytes.
+    with (tmp_path / "history.jsonl").open("a", encoding="utf-8") as f:
+        for role in ("user", "assistant"):
+            rec = {"ts": "2026-10-09T00:00:00+00:00", "role": role, "content": role}
+            f.write(json.dumps(rec) + "\n")
+        f.write('{"ts": "partial')
+    assert store.count_turns() == 6
+    assert store.read_page(1, 1).turns[0].user_text == "user"
+
+    store.clear_file()
+    assert store.read_page(1, 10).total == 0
+
+
+def test_user_story_60_torn_writes_do_not_shift_later_turns(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    user = {"ts": "2026-09-30T00:00:00+00:00", "role": "user", "content": "torn"}
+    path.write_text(json.dumps(user) + "\n", encoding="utf-8")
+    store = _store(tmp_path, 3)
+    with path.open("a", encoding="utf-8") as f:
+        f.write("\n")
+        f.write(json.dumps({"role": "assistant", "content": "no question"}) + "\n")
+    for i in range(3, 5):
+        store.save_turn(f"u{i}", f"a{i}")
+
+    loaded = store.load_turns(max_turns=0)
+    assert [t.user_text for t in loaded] == [f"u{i}" for i in range(5)]
+    page = store.read_turns(0, 10)
+    assert page.total == 5
+    assert page.turns == loaded
+    assert store.read_turns(3, 1).turns[0].user_text == "u3"
+    assert [t.user_text for t in store.read_page(1, 2).turns] == ["u3", "u4"]
+    since = dt.datetime(2026, 10, 1, 5, 30, tzinfo=UTC)
+    assert store.find_turn_since(since) == 3
+
+    # A fresh store builds the same index in one scan.
+    fresh = HistoryStore(path)
+    assert fresh.read_turns(0, 10).turns == loaded
+    # A user line waiting for its reply is paired when the reply arrives.
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"role": "user", "content": "q"}) + "\n")
+    assert fresh.count_turns() == 5
+    with path.open("a", encoding="utf-8") as f:
+        f.write("\n" + json.dumps({"role": "assistant", "content": "r"}) + "\n")
+    assert fresh.read_turns(5, 1).turns[0].assistant_text == "r"
+    # A cut off user line is not a user record, the reply after it is dropped.
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"role": "user", "content": "cut"})[:-5] + "\n")
+        f.write(json.dumps({"role": "assistant", "content": "lost"}) + "\n")
+    assert HistoryStore(path).count_turns() == 6
+
+
+def test_user_story_60_since_binary_search(tmp_path: Path) -> None:
+    store = _store(tmp_path, 30)
+    since = store.read_since(dt.datetime(2026, 10, 1, 10, 30), page_size=3)
+    assert [t.user_text for t in since.turns] == ["u5", "u6", "u7"]
+    assert store.read_since(dt.datetime(2030, 1, 1, tzinfo=UTC)).turns == []
+    assert store.read_since(dt.datetime(2000, 1, 1, tzinfo=UTC)).start == 0
+
+
+def test_user_story_60_engine_answers_page_and_since(tmp_path: Path) -> None:
+    store = _store(tmp_path, 12)
+    engine = ChatEngine(history=store, interaction_log=FakeInteractionLog())
+
+    reply = engine.process_turn("history page 2")
+    assert reply.startswith("History page 2 of 2 (turns 1-2 of 12):")
+    assert "user: u0" in reply and "assistant: a1" in reply
+
+    reply = engine.process_turn("history since 2026-10-01T12:00")
+    assert reply.startswith("History since 2026-10-01T12:00:00+00:00 (turns 7-")
+    assert engine.process_turn("history page 9").startswith(
+        "There is no history page 9"
+    )
+    assert engine.process_turn("history").startswith("Recent messages:")
+
+
+def test_user_story_60_page_latency_does_not_grow(tmp_path: Path) -> None:
+    out = tmp_path / "pages.json"
+    assert bench.main(["--sizes", "100,10000", "--calls", "60", "--out", str(out)]) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    small = cases["history_100_page_oldest"]["p50_us"]
+    large = cases["history_10000_page_oldest"]["p50_us"]
+    assert large < small * 3
@@ -0,0 +1,175 @@
+# Test file for User Story 64
+# Testing Type: whitebox
+# Technique: path_coverage
+# Team Member: sa1068
+# Original file: test_user_story_64.py
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.bench import response_cache as bench
+from vca.core.engine import ChatEngine
+from vca.core.response_cache import ResponseCache, declared_inputs, pure
+from vca.core.responses import ResponseGenerator
+from vca.core.settings import load_settings
+from vca.domain.session import Message
+from vca.kb.index import KnowledgeBase, Passage, build_index
+
+_CORPUS = (
+    "hello",
+    "hi",
+    "what is python?",
+    "what is python?",
+    "  what is python?  ",
+    "tell me about Paris",
+    "what is it?",
+    "thanks",
+    "help me",
+    "asdf qwerty",
+    "history",
+    "how do i exit",
+    "?",
+)
+
+
+def test_user_story_64_pure_declarations() -> None:
+    @pure("message_count", "text")
+    def handler(text, recent, context=None) -> str:
+        return text
+
+    assert declared_inputs(handler) == ("text", "message_count")
+    assert declared_inputs(lambda text, recent: text) is None
+    assert declared_inputs(ResponseGenerator().handle_question) == (
+        "text",
+        "topic",
+        "message_count",
+        "knowledge_base",
+    )
+    assert declared_inputs(ResponseGenerator().handle_history) is None
+    with pytest.raises(ValueError):
+        pure("weather")
+
+
+def test_user_story_64_lru_eviction_and_counters() -> None:
+    cache = ResponseCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")  # evicts b, the least recently used
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("A", "C")
+    cache.bypass()
+    assert cache.stats() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 3,
+        "misses": 2,
+        "bypassed": 1,
+        "hit_rate": 0.6,
+    }
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 3
+
+
+def test_user_story_64_key_follows_declared_inputs() -> None:
+    cache = ResponseCache()
+    r = ResponseGenerator(response_cache=cache)
+    about_python = [Message("user", "Tell me about Python"), Message("user", "x")]
+    about_paris = [Message("user", "Tell me about Paris"), Message("user", "x")]
+
+    first = r.generate("question", "what is it?", about_python)
+    assert r.generate("question", " what is it? ", about_python) == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert "paris" in r.generate("question", "what is it?", about_paris)
+    assert cache.misses == 2
+
+    # Undeclared and registered handlers bypass the cache.
+    r.generate("history", "history", about_python)
+    r.register_handler("weather", lambda text, recent: "Sunny")
+    assert r.generate("weather", "rain?") == "Sunny"
+    assert cache.bypassed == 2
+    assert ResponseGenerator().response_cache is None
+
+
+def test_user_story_64_replayed_engine_corpus_matches_uncached() -> None:
+    rng = random.Random(64)
+    cache = ResponseCache(maxsize=8)
+    plain = ChatEngine(history=FakeHistory(), interaction_log=FakeInteractionLog())
+    cached = ChatEngine(
+        history=FakeHistory(),
+        interaction_log=FakeInteractionLog(),
+        response_cache=cache,
+    )
+    for _ in range(300):
+        text = rng.choice(_CORPUS)
+        assert cached.process_turn(text) == plain.process_turn(text)
+    assert cache.hits > 0 and cache.misses > 0 and cache.bypassed > 0
+    assert len(cache) <= 8
+
+
+def test_user_story_64_knowledge_base_answers_are_cached(tmp_path: Path) -> None:
+    path = tmp_path / "kb.idx"
+    build_index([Passage("guide.md", "Velocity is story points per sprint.")], path)
+    kb = KnowledgeBase(path)
+    try:
+        plain = ResponseGenerator(knowledge_base=kb)
+        cached = ResponseGenerator(knowledge_base=kb, response_cache=ResponseCache())
+        for intent, text, recent in bench.replay_corpus(200, 10):
+            assert cached.generate(intent, text, recent) == plain.generate(
+                intent, text, recent
+            )
+        question = "what is sprint velocity"
+        answer = cached.generate("question", question)
+        assert answer.startswith("From guide.md:")
+        assert cached.generate("question", question) == answer
+
+        # A search cut short by its budget: its reply is not reused.
+        real_search = KnowledgeBase.search
+        ticks = iter(range(10**6))
+
+        def slow_search(self, question, *, budget_s=None, clock=None):
+            if budget_s is None:
+                return real_search(self, question)
+            return real_search(
+                self, question, budget_s=budget_s, clock=lambda: next(ticks) * 10
+            )
+
+        question = "how many story points per sprint"
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(KnowledgeBase, "search", slow_search)
+            assert kb.search(question, budget_s=0.02).timed_out
+            partial = cached.generate("question", question)
+            assert partial == plain.generate("question", question)
+            assert not partial.startswith("From guide.md:")
+        puts = len(cached.response_cache)
+        full = cached.generate("question", question)
+        assert full == plain.generate("question", question)
+        assert full.startswith("From guide.md:")
+        assert len(cached.response_cache) == puts + 1
+    finally:
+        kb.close()
+
+
+def test_user_story_64_cache_size_setting(tmp_path: Path) -> None:
+    settings_path = tmp_path / "settings.json"
+    assert load_settings(settings_path).response_cache_size == 0
+    settings_path.write_text(json.dumps({"response_cache_size": 512}))
+    assert load_settings(settings_path).response_cache_size == 512
+    settings_path.write_text(json.dumps({"response_cache_size": -1}))
+    assert load_settings(settings_path).response_cache_size == 0
+
+
+def test_user_story_64_benchmark_reports_hits(tmp_path: Path) -> None:
+    out = tmp_path / "cache.json"
+    argv = ["--turns", "400", "--passages", "200", "--out", str(out)]
+    assert bench.main(argv) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    assert cases["replay_400_cached"]["hit_rate"] > 0.5
+    assert cases["replay_400_cached"]["mismatches"] == 0
@@ -0,0 +1,196 @@
+# Test file for User Story 68
+# Testing Type: whitebox
+# Technique: path_coverage
+# Team Member: sa1068
+# Original file: test_user_story_68.py
+
+from __future__ import annotations
+
+import gc
+import json
+from pathlib import Path
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.bench import session_memory as bench
+from vca.core.engine import ChatEngine
+from vca.core.settings import load_settings
+from vca.domain.memory_budget import MemoryBudget, content_bytes
+from vca.domain.session import MAX_SESSION_MESSAGES, ConversationSession
+from vca.storage.interaction_log_store import InteractionLogStore
+
+
+def _texts(session: ConversationSession) -> list[str]:
+    return [m.content for m in session.messages]
+
+
+def _expected_bytes(session: ConversationSession) -> int:
+    return sum(content_bytes(m.content) for m in session.messages)
+
+
+def test_user_story_68_bytes_follow_every_add_and_trim() -> None:
+    session = ConversationSession()
+    assert session.retained_bytes == 0
+    session.add_message("user", "hello")
+    session.add_message("assistant", "hi there", "greeting")
+    session.add_assistant_message("Did you mean help?")
+    session.add_message("user", "unanswered")
+    assert session.retained_bytes == _expected_bytes(session)
+    for i in range(MAX_SESSION_MESSAGES):
+        session.add_message("user", f"question {i}")
+        session.add_message("assistant", f"answer {i}")
+    assert len(session.messages) == MAX_SESSION_MESSAGES
+    assert session.retained_bytes == _expected_bytes(session)
+    session.clear()
+    assert session.retained_bytes == 0
+
+
+def test_user_story_68_session_budget_drops_oldest_first() -> None:
+    long = "x" * 400
+    limit = 4 * content_bytes(f"0{long}")
+    session = ConversationSession(max_bytes=limit)
+    for i in range(6):
+        session.add_message("user", f"{i}{long}")
+        session.add_message("assistant", f"{i}{long}")
+    assert session.retained_bytes <= limit
+    assert _texts(session) == [f"4{long}", f"4{long}", f"5{long}", f"5{long}"]
+    # Turns keep their own count limit; the message view decides the bytes.
+    assert [t.user_text[0] for t in session.turns] == ["4", "5"]
+
+
+def test_user_story_68_newest_message_is_always_kept() -> None:
+    session = ConversationSession(max_bytes=10)
+    session.add_message("user", "far longer than ten bytes")
+    assert _texts(session) == ["far longer than ten bytes"]
+    session.add_assistant_message("also longer than ten bytes")
+    assert _texts(session) == ["also longer than ten bytes"]
+    assert session.retained_bytes > session.max_bytes
+
+
+def test_user_story_68_shared_budget_across_sessions() -> None:
+    text = "y" * 200
+    budget = MemoryBudget(6 * content_bytes(text) + content_bytes(text) // 2)
+    first = ConversationSession(budget=budget)
+    second = ConversationSession(budget=budget)
+    for _ in range(3):
+        first.add_message("user", text)
+        first.add_message("assistant", text)
+    assert budget.exceeded is False and budget.sessions == 1
+    second.add_message("user", text)
+    # The total is over the limit, but the new session is within its share.
+    assert len(second.messages) == 1 and len(first.messages) == 6
+    second.add_message("assistant", text)
+    assert len(second.messages) == 2 and budget.exceeded
+    assert budget.used_bytes == first.retained_bytes + second.retained_bytes
+    # The large session trims the next time it is used, until the total fits.
+    first.add_message("user", text)
+    assert len(first.messages) == 4 and not budget.exceeded
+
+    first.clear()
+    assert budget.used_bytes == second.retained_bytes and not budget.exceeded
+    assert budget.sessions == 1 and budget.fair_share == budget.limit_bytes
+    budget.release(second)
+    assert budget.sessions == 0 and budget.used_bytes == 0
+    first.add_message("user", text)
+    assert budget.sessions == 1 and budget.used_bytes == first.retained_bytes
+    first.clear()
+
+    third = ConversationSession(budget=budget)
+    third.add_message("user", text)
+    assert budget.used_bytes > 0
+    del third
+    gc.collect()
+    assert budget.used_bytes == 0
+    assert MemoryBudget(0).exceeded is False
+
+
+def test_user_story_68_small_active_session_keeps_its_context() -> None:
+    text = "z" * 300
+    budget = MemoryBudget(20 * content_bytes(text))
+    idle = ConversationSession(budget=budget)
+    for _ in range(10):
+        idle.add_message("user", text)
+        idle.add_message("assistant", text)
+    active = ConversationSession(budget=budget)
+    for i in range(4):
+        active.add_message("user", f"{i}{text}")
+        active.add_message("assistant", f"{i}{text}")
+        assert budget.exceeded
+    assert len(active.messages) == 8
+    assert len(idle.messages) == 20
+    idle.add_message("user", text)
+    assert len(idle.messages) == 11 and not budget.exceeded
+    assert len(active.messages) == 8
+
+
+def test_user_story_68_owner_is_finalized_once() -> None:
+    budget = MemoryBudget(1 << 20)
+    session = ConversationSession(budget=budget)
+    for _ in range(5):
+        session.add_message("user", "hello")
+        budget.release(session)
+    assert budget.sessions == 0 and len(budget._finalizers) == 1
+    session.add_message("user", "hello")
+    del session
+    gc.collect()
+    assert budget.sessions == 0 and budget._finalizers == {}
+    assert budget.used_bytes == 0
+
+
+def test_user_story_68_engine_reports_session_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    engine = ChatEngine(
+        history=FakeHistory(),
+        interaction_log=InteractionLogStore(path),
+        session_max_bytes=4096,
+    )
+    engine.process_turn("hello")
+    engine.process_turn("what is python?")
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [e["session_bytes"] for e in events][-1] == engine.session.retained_bytes
+    assert events[0]["session_bytes"] < events[1]["session_bytes"]
+    assert engine.session.max_bytes == 4096
+
+    # Logs that do not take session_bytes keep working.
+    fake_log = FakeInteractionLog()
+    plain = ChatEngine(history=FakeHistory(), interaction_log=fake_log)
+    plain.process_turn("hello")
+    assert len(fake_log.events) == 1
+
+
+def test_user_story_68_reset_releases_the_old_session() -> None:
+    budget = MemoryBudget(1 << 20)
+    engine = ChatEngine(
+        history=FakeHistory(),
+        interaction_log=FakeInteractionLog(),
+        memory_budget=budget,
+    )
+    engine.process_turn("hello")
+    assert budget.used_bytes == engine.session.retained_bytes > 0
+    engine.reset_session()
+    assert budget.used_bytes == engine.session.retained_bytes
+
+
+def test_user_story_68_byte_settings(tmp_path: Path) -> None:
+    settings_path = tmp_path / "settings.json"
+    settings = load_settings(settings_path)
+    assert (settings.session_max_bytes, settings.process_max_bytes) == (0, 0)
+    settings_path.write_text(
+        json.dumps({"session_max_bytes": 65536, "process_max_bytes": 1 << 24})
+    )
+    settings = load_settings(settings_path)
+    assert (settings.session_max_bytes, settings.process_max_bytes) == (
+        65536,
+        1 << 24,
+    )
+    settings_path.write_text(json.dumps({"session_max_bytes": -5}))
+    assert load_settings(settings_path).session_max_bytes == 0
+
+
+def test_user_story_68_benchmark_budget_case(tmp_path: Path) -> None:
+    out = tmp_path / "memory.json"
+    argv = ["--sessions", "2", "--turns", "40", "--max-bytes", "2048"]
+    assert bench.main(argv + ["--out", str(out)]) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    budgeted = cases["session_ring_budget"]
+    assert budgeted["messages"] < cases["session_ring"]["messages"]
+    assert budgeted["bytes_per_session"] < cases["session_ring"]["bytes_per_session"]
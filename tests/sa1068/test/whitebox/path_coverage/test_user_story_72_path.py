@@ -0,0 +1,205 @@
+# Test file for User Story 72
+# Testing Type: whitebox
+# Technique: path_coverage
+# Team Member: sa1068
+# Original file: test_user_story_72.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.bench import idle_expiry as bench
+from vca.core.session_registry import SessionRegistry
+from vca.core.settings import load_settings
+from vca.domain.memory_budget import MemoryBudget
+from vca.domain.timer_wheel import TimerWheel
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FlushCounting(FakeHistory):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+class _LogFlushCounting(FakeInteractionLog):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+def test_user_story_72_one_million_expiries() -> None:
+    wheel = TimerWheel()
+    total = 1_000_000
+    for key in range(total):
+        # Spread over about three days so every level takes part.
+        wheel.schedule(key, (key * 7919) % 250_000 + 0.5)
+    assert len(wheel) == total
+
+    fired = 0
+    last_due = 0.0
+    for now in (10, 63, 64, 4095, 4096, 100_000, 262_143, 262_144, 300_000):
+        expired = wheel.advance(now)
+        for key in expired:
+            due = (key * 7919) % 250_000 + 1
+            assert last_due <= due <= now
+            last_due = due
+        fired += len(expired)
+        assert len(wheel) == total - fired
+    assert fired == total
+    assert wheel.advance(400_000) == []
+
+
+def test_user_story_72_schedule_move_and_cancel() -> None:
+    wheel = TimerWheel(tick=0.5, slots=4, levels=2)
+    wheel.schedule("a", 1.2)
+    assert wheel.deadline("a") == 1.5
+    wheel.schedule("b", 30.0)
+    wheel.schedule("a", 3.0)
+    assert wheel.advance(2.0) == []
+    assert wheel.cancel("b")
+    assert not wheel.cancel("b")
+    assert "b" not in wheel and wheel.deadline("b") is None
+    assert wheel.advance(3.0) == ["a"]
+    assert wheel.now == 3.0
+
+    # Deadlines already past fire on the next advance, not the current tick.
+    wheel.schedule("late", 1.0)
+    assert list(wheel) == ["late"]
+    assert wheel.advance(3.0) == []
+    assert wheel.advance(3.5) == ["late"]
+
+    # An empty wheel jumps straight to the new time.
+    assert wheel.advance(1000.0) == []
+    assert wheel.now == 1000.0
+
+
+def test_user_story_72_deadlines_past_top_level_are_parked() -> None:
+    for levels in (1, 2):
+        wheel = TimerWheel(slots=4, levels=levels)
+        wheel.schedule("far", 100)
+        wheel.schedule("near", 2)
+        fired = {}
+        for now in range(1, 120):
+            for key in wheel.advance(now):
+                fired[key] = now
+        assert fired == {"near": 2, "far": 100}
+
+
+def test_user_story_72_invalid_wheels() -> None:
+    with pytest.raises(ValueError):
+        TimerWheel(tick=0)
+    with pytest.raises(ValueError):
+        TimerWheel(slots=1)
+    with pytest.raises(ValueError):
+        TimerWheel(levels=0)
+
+
+def test_user_story_72_registry_expires_idle_sessions(tmp_path: Path) -> None:
+    clock = _Clock()
+    histories: dict[str, _FlushCounting] = {}
+    log = _LogFlushCounting()
+    budget = MemoryBudget(1 << 20)
+    registry = SessionRegistry(
+        tmp_path,
+        max_hot=10,
+        history_factory=lambda s: histories.setdefault(s, _FlushCounting()),
+        interaction_log=log,
+        memory_budget=budget,
+        idle_ttl=30,
+        clock=clock,
+    )
+    registry.process_turn("a", "hello")
+    clock.now = 20
+    registry.process_turn("b", "hello")
+    clock.now = 40
+    assert registry.expire_idle() == 1
+    assert list(registry) == ["b"]
+    assert histories["a"].flushes == 1
+    assert log.flushes == 1
+    assert registry.snapshot_path("a").exists()
+
+    # A turn first expires what went idle, then moves its own deadline.
+    clock.now = 55
+    registry.process_turn("c", "thanks")
+    assert list(registry) == ["c"]
+    assert registry.expired == 2
+    assert budget.sessions == 1
+    clock.now = 80
+    registry.process_turn("c", "help")
+    assert registry.expire_idle(100) == 0
+    assert registry.expire_idle(110) == 1
+    assert registry.stats()["expired"] == 3
+    assert budget.used_bytes == 0
+
+    # Sessions evicted for room or by hand stop being timed.
+    registry.process_turn("a", "hello")
+    assert registry.rehydrated == 1
+    assert registry.evict("a")
+    assert registry.expire_idle(10_000) == 0
+    registry.close()
+
+
+def test_user_story_72_idle_expiry_is_opt_in(tmp_path: Path) -> None:
+    registry = SessionRegistry(tmp_path, interaction_log=FakeInteractionLog())
+    assert registry.idle_ttl == 0
+    assert registry.expire_idle() == 0
+
+    lru = SessionRegistry(
+        tmp_path,
+        max_hot=1,
+        history_factory=lambda s: FakeHistory(),
+        interaction_log=FakeInteractionLog(),
+        idle_ttl=5,
+        clock=_Clock(),
+    )
+    lru.process_turn("a", "hello")
+    lru.process_turn("b", "hello")
+    assert lru.evictions == 1
+    assert "a" not in lru._idle
+    assert lru.expire_idle(100) == 1
+
+
+def test_user_story_72_ttl_setting(tmp_path: Path) -> None:
+    settings_path = tmp_path / "settings.json"
+    assert load_settings(settings_path).session_idle_ttl == 0
+    settings_path.write_text(
+        json.dumps(
+            {"session_idle_ttl": 900, "response_cache_size": 8, "process_max_bytes": 64}
+        )
+    )
+    settings = load_settings(settings_path)
+    assert settings.session_idle_ttl == 900
+    registry = SessionRegistry.from_settings(
+        tmp_path, settings, interaction_log=FakeInteractionLog()
+    )
+    assert registry.idle_ttl == 900
+    assert registry._memory_budget.limit_bytes == 64
+    assert registry._responder.response_cache is not None
+
+
+def test_user_story_72_benchmark_matches_scan(tmp_path: Path) -> None:
+    out = tmp_path / "idle.json"
+    argv = ["--sizes", "500", "--ttl", "20", "--steps", "30", "--out", str(out)]
+    assert bench.main(argv) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    assert cases["idle_500_wheel_check"]["same_expired"]
+    assert cases["idle_500_wheel_check"]["expired"] > 0
+    assert cases["idle_500_scan_check"]["calls"] == 30
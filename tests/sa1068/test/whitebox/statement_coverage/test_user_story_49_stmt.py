@@ -0,0 +1,99 @@
+# Test file for User Story 49
+# Testing Type: whitebox
+# Technique: statement_coverage
+# Team Member: sa1068
+# Original file: test_user_story_49.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from vca.bench import classifier as bench
+from vca.bench.timing import compare_to_baseline, summarise
+from vca.core.intents import Intent, IntentClassifier
+from vca.core.validator import InputValidator
+
+
+def _phrase_total(groups) -> int:
+    return sum(len(values) for gs in groups.values() for _m, values, _r in gs)
+
+
+def test_user_story_49_rule_set_has_requested_size_and_is_deterministic() -> None:
+    a = bench.build_rule_set(500, seed=3)
+    b = bench.build_rule_set(500, seed=3)
+    assert _phrase_total(a) == 500
+    assert a == b
+
+
+def test_user_story_49_synthetic_classifier_does_not_replace_default_rules() -> None:
+    groups = bench.build_rule_set(20, seed=1)
+    synthetic = bench.synthetic_classifier(groups)
+    assert synthetic.classify_result("hello").intent is not None
+
+    default = IntentClassifier()
+    assert default.classify("hello").value == "greeting"
+    assert IntentClassifier._SYNONYM_GROUPS is not groups
+
+
+def test_user_story_49_subclass_compiled_after_base_uses_its_own_rules() -> None:
+    assert IntentClassifier().classify("hello") == Intent.GREETING
+
+    class OnlyThanks(IntentClassifier):
+        _SYNONYM_GROUPS = {Intent.THANKS: [("token", {"hello"}, "hello_thanks")]}
+
+    assert "_COMPILED_GROUPS" not in OnlyThanks.__dict__
+    assert OnlyThanks().classify("hello") == Intent.THANKS
+    assert list(OnlyThanks._COMPILED_GROUPS) == [Intent.THANKS]
+    assert IntentClassifier().classify("hello") == Intent.GREETING
+
+
+def test_user_story_49_corpus_includes_inputs_at_max_len() -> None:
+    groups = bench.build_rule_set(50)
+    corpus = bench.build_corpus(20, groups, bucket="max_len")
+    assert all(len(t) == InputValidator.MAX_LEN for t in corpus)
+
+    mixed = bench.build_corpus(200, groups)
+    lengths = sorted(len(t) for t in mixed)
+    assert lengths[0] < 60
+    assert lengths[-1] <= InputValidator.MAX_LEN
+
+
+def test_user_story_49_main_writes_json_and_flags_regressions(tmp_path: Path) -> None:
+    out = tmp_path / "run.json"
+    baseline = tmp_path / "baseline.json"
+
+    code = bench.main(
+        [
+            "--sizes",
+            "10",
+            "--calls",
+            "20",
+            "--out",
+            str(out),
+            "--baseline",
+            str(baseline),
+            "--save-baseline",
+        ]
+    )
+    assert code == 0
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert {c["case"] for c in payload["cases"]} == {
+        "rules_10_mixed",
+        "rules_10_max_len",
+    }
+    assert all(c["calls"] > 0 and c["p99_us"] >= c["p50_us"] for c in payload["cases"])
+
+    slower = json.loads(baseline.read_text(encoding="utf-8"))
+    for case in slower["cases"]:
+        case["p99_us"] = case["p99_us"] * 3
+    regressions = compare_to_baseline(slower, payload, tolerance=0.5)
+    assert {r.metric for r in regressions} == {"p99_us"}
+
+
+def test_user_story_49_summarise_reports_percentiles() -> None:
+    stats = summarise([1000 * i for i in range(1, 101)])
+    assert stats.calls == 100
+    assert stats.p50_us in (50.0, 51.0)
+    assert stats.max_us == 100.0
+    assert stats.throughput_per_s > 0
@@ -0,0 +1,99 @@
+# Test file for User Story 53
+# Testing Type: whitebox
+# Technique: statement_coverage
+# Team Member: sa1068
+# Original file: test_user_story_53.py
+
+from __future__ import annotations
+
+import json
+import random
+import re
+from pathlib import Path
+
+from vca.bench import turn_allocations as bench
+from vca.core import prepared_input as prepared_module
+from vca.core.engine import ChatEngine
+from vca.core.intents import IntentClassifier
+from vca.core.prepared_input import PreparedInput, prepare
+from vca.core.responses import ResponseGenerator
+
+
+def test_user_story_53_prepared_input_derives_every_feature() -> None:
+    p = PreparedInput.from_text("  Help me, PLEASE!! ")
+    assert p.stripped == "Help me, PLEASE!!"
+    assert p.lower == "help me, please!!"
+    assert p.lower_no_edges == "help me, please"
+    assert p.words == ("help", "me", "please")
+    assert p.word_set == frozenset({"help", "me", "please"})
+    assert prepare(p) is p
+    assert prepare(None).text == ""
+
+
+def test_user_story_53_string_and_prepared_apis_agree() -> None:
+    classifier = IntentClassifier()
+    engine = ChatEngine.__new__(ChatEngine)
+    responder = ResponseGenerator()
+    words = ["help", "exit", "what", "can", "you", "do", "hi", "thanks", "bye", "x"]
+    rng = random.Random(53)
+    for _ in range(500):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        text += rng.choice(["", "?", "!", " ?"])
+        p = PreparedInput.from_text(text)
+        assert classifier.classify_result(p) == classifier.classify_result(text)
+        assert engine._looks_like_multi_intent(p) == engine._looks_like_multi_intent(
+            text
+        )
+        assert responder.faq_response_for(p) == responder.faq_response_for(text)
+
+
+def test_user_story_53_process_turn_prepares_input_once(monkeypatch) -> None:
+    calls = {"count": 0}
+    original = PreparedInput.from_text.__func__
+
+    def counting(cls, raw_text, *word_re):
+        calls["count"] += 1
+        return original(cls, raw_text, *word_re)
+
+    monkeypatch.setattr(
+        prepared_module.PreparedInput, "from_text", classmethod(counting)
+    )
+    engine = bench._new_engine()
+
+    engine.process_turn("what can you do?")
+    engine.process_turn("Tell me about Python please")
+
+    assert calls["count"] == 2
+
+
+def test_user_story_53_subclass_word_pattern_is_used() -> None:
+    hyphenated = re.compile(r"[a-z]+(?:-[a-z]+)*")
+
+    class HyphenClassifier(IntentClassifier):
+        _WORD_RE = hyphenated
+
+    class HyphenEngine(ChatEngine):
+        _WORD_RE = hyphenated
+
+    text = "help-exit"
+    p = PreparedInput.from_text(text)
+    assert p.words == ("help", "exit")
+    assert IntentClassifier().classify_result(p).intent != "unknown"
+    engine = HyphenEngine(
+        history=bench._MemoryHistory(), interaction_log=bench._NullInteractionLog()
+    )
+    for value in (text, p):
+        assert HyphenClassifier().classify_result(value).intent == "unknown"
+        assert not engine._looks_like_multi_intent(value)
+    assert prepare(p, hyphenated).words == ("help-exit",)
+    assert engine._stage_validate(text).prepared.words == ("help-exit",)
+
+
+def test_user_story_53_allocation_benchmark_writes_results(tmp_path: Path) -> None:
+    out = tmp_path / "alloc.json"
+    assert bench.main(["--turns", "20", "--out", str(out)]) == 0
+
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    names = {c["case"] for c in payload["cases"]}
+    assert {"features_strings", "features_prepared"} <= names
+    assert set(bench._INPUTS) <= names
@@ -0,0 +1,122 @@
+# Test file for User Story 57
+# Testing Type: whitebox
+# Technique: statement_coverage
+# Team Member: sa1068
+# Original file: test_user_story_57.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from vca.core.faq_index import FaqIndex
+from vca.core.intents import Intent
+from vca.core.faq_semantic import (
+    hashed_features,
+    load_semantic_matcher,
+    main,
+    vectors_path_for,
+)
+from vca.core.responses import ResponseGenerator
+
+np = pytest.importorskip("numpy")
+
+from vca.bench import faq_semantic as bench  # noqa: E402
+from vca.core.faq_semantic import SemanticFaqMatcher  # noqa: E402
+
+
+def test_user_story_57_features_are_deterministic() -> None:
+    first = hashed_features("how do i exit", 512)
+    assert first == hashed_features("how do i exit", 512)
+    assert all(0 <= bucket < 512 for bucket in first)
+    assert hashed_features("", 512) == {}
+    assert vectors_path_for(Path("data/faq.jsonl")) == Path("data/faq.jsonl.vec.npz")
+
+
+def test_user_story_57_matches_paraphrases_and_rejects_others() -> None:
+    matcher = SemanticFaqMatcher.build(ResponseGenerator._FAQ_MAP.items())
+    assert matcher.matrix.dtype == np.float32
+    norms = np.linalg.norm(matcher.matrix, axis=1)
+    assert np.allclose(norms, 1.0, atol=1e-5)
+
+    hit = matcher.match("where is history stored")
+    assert hit is not None and hit.question == "how is history stored"
+    hit = matcher.match("who are you exactly")
+    assert hit is not None and hit.question == "who are you"
+
+    assert matcher.match("how do i cook pasta") is None
+    assert matcher.match("tell me a joke") is None
+    assert matcher.match("") is None
+
+
+def test_user_story_57_saved_vectors_are_checked_against_entries(
+    tmp_path: Path,
+) -> None:
+    pairs = [("where are the logs", "In logs/."), ("who wrote you", "Students.")]
+    path = tmp_path / "faq.jsonl.vec.npz"
+    SemanticFaqMatcher.build(pairs, dimensions=64).save(path)
+
+    loaded = SemanticFaqMatcher.load(path, pairs)
+    assert loaded is not None and loaded.dimensions == 64
+    assert loaded.match("where are logs").answer == "In logs/."
+
+    assert SemanticFaqMatcher.load(path, pairs + [("new", "entry")]) is None
+    assert SemanticFaqMatcher.load(tmp_path / "absent.npz", pairs) is None
+    (tmp_path / "junk.npz").write_bytes(b"junk")
+    assert SemanticFaqMatcher.load(tmp_path / "junk.npz", pairs) is None
+
+
+def test_user_story_57_build_command_and_response_generator(
+    tmp_path: Path, monkeypatch
+) -> None:
+    faq = tmp_path / "faq.jsonl"
+    faq.write_text(
+        json.dumps({"question": "where are the log files kept", "answer": "logs/"})
+        + "\n",
+        encoding="utf-8",
+    )
+    assert load_semantic_matcher(faq, ResponseGenerator._FAQ_MAP) is None
+
+    assert main(["build", "--faq", str(faq)]) == 0
+    matcher = load_semantic_matcher(faq, ResponseGenerator._FAQ_MAP)
+    assert matcher is not None and len(matcher) == 6
+    assert load_semantic_matcher(faq, ResponseGenerator._FAQ_MAP) is matcher
+
+    monkeypatch.setattr("vca.core.responses.FAQ_PATH", faq)
+    r = ResponseGenerator()
+    assert r.faq_response_for("where are the log files kept?") == "logs/"
+    assert r.faq_response_for("where are log files kept") == "logs/"
+    assert r.faq_response_for("where is history stored") is not None
+    assert r.faq_response_for("what is the weather") is None
+
+    # Only question like intents pay for the paraphrase search.
+    calls: list[str] = []
+    original = SemanticFaqMatcher.match
+    monkeypatch.setattr(
+        SemanticFaqMatcher,
+        "match",
+        lambda self, key: calls.append(key) or original(self, key),
+    )
+    assert r.faq_response_for("where are my log files kept", "question") == "logs/"
+    assert r.faq_response_for("where are my log files kept", Intent.UNKNOWN) == "logs/"
+    assert r.faq_response_for("where are my log files kept", Intent.GREETING) is None
+    assert r.faq_response_for("where are my log files kept", "weather") is None
+    assert len(calls) == 2
+    assert r.generate(Intent.THANKS, "where are my log files kept").startswith("You")
+    assert len(calls) == 2
+
+    # A custom FAQ index does not pick up vectors built for the defaults.
+    custom = ResponseGenerator(faq_index=FaqIndex([("ping", "pong")]))
+    assert custom.semantic_faq is None
+
+
+def test_user_story_57_benchmark_writes_results(tmp_path: Path) -> None:
+    out = tmp_path / "semantic.json"
+    assert bench.main(["--sizes", "500", "--calls", "50", "--out", str(out)]) == 0
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert {c["case"] for c in payload["cases"]} == {
+        "semantic_500_near",
+        "semantic_500_miss",
+    }
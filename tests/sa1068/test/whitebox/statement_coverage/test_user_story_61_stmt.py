@@ -0,0 +1,191 @@
+# Test file for User Story 61
+# Testing Type: whitebox
+# Technique: statement_coverage
+# Team Member: sa1068
+# Original file: test_user_story_61.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from helpers import FakeInteractionLog
+from vca.bench import history_search as bench
+from vca.core.engine import ChatEngine
+from vca.core.history_query import parse_history_query
+from vca.storage.history_search import (
+    BLOCK_SIZE,
+    HistorySearchIndex,
+    PostingList,
+    search_terms,
+)
+from vca.storage.history_store import HistoryStore
+
+
+def test_user_story_61_parse_search_query() -> None:
+    query = parse_history_query("history search Paris trip intent:question")
+    assert (query.search, query.intent) == ("paris trip", "question")
+    query = parse_history_query("history search")
+    assert (query.search, query.intent) == ("", None)
+    assert search_terms("Paris, paris! TRIP") == {"paris", "trip"}
+
+
+def test_user_story_61_posting_list_blocks() -> None:
+    plist = PostingList()
+    ids = [3, 4, 200, 201, 5000] + list(range(6000, 6000 + BLOCK_SIZE * 2))
+    for turn_id in ids:
+        plist.append(turn_id)
+    plist.append(4)  # out of order ids are ignored
+    assert plist.count == len(ids)
+    assert len(plist.firsts) == 3
+    assert plist.ids_from(0) == ids
+    assert plist.ids_from(201) == ids[3:]
+    assert 5000 in plist and 6100 in plist
+    assert 4999 not in plist and 1 not in plist
+
+
+def test_user_story_61_search_with_intent_and_trimming(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl", max_turns=4)
+    for i in range(6):
+        intent = "question" if i % 2 else "greeting"
+        store.save_turn(f"about paris {i}", f"reply {i}", intent=intent)
+
+    result = store.search_turns("Paris")
+    assert result.total == 4
+    assert [t.user_text for t in result.turns] == [
+        "about paris 5",
+        "about paris 4",
+        "about paris 3",
+        "about paris 2",
+    ]
+    result = store.search_turns("paris", intent="question", limit=1)
+    assert (result.total, result.turns[0].user_text) == (2, "about paris 5")
+    assert store.search_turns("paris 0").total == 0
+    assert store.search_turns("london").total == 0
+    assert store.search_turns("").total == 0
+
+    first = json.loads((tmp_path / "history.jsonl").read_text().splitlines()[0])
+    assert first["intent"] == "greeting"
+
+
+def test_user_story_61_missing_or_stale_index_is_rebuilt(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl", max_turns=10)
+    for i in range(3):
+        store.save_turn(f"note {i}", "ok", intent="question")
+    search_log = tmp_path / "history.jsonl.search"
+    search_log.unlink()
+    assert store.search_turns("note", intent="question").total == 3
+    assert search_log.exists()
+
+    # A turn appended by a process that does not know about the log.
+    with (tmp_path / "history.jsonl").open("a", encoding="utf-8") as f:
+        for role in ("user", "assistant"):
+            rec = {"ts": "2030-01-01T00:00:00+00:00", "role": role, "content": "late"}
+            f.write(json.dumps(rec) + "\n")
+    assert store.search_turns("late").total == 1
+
+    store.clear_file()
+    assert not search_log.exists()
+    assert store.search_turns("note").total == 0
+
+
+def test_user_story_61_failed_log_append_does_not_shift_results(
+    tmp_path: Path, monkeypatch
+) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl", max_turns=50)
+    store.save_turn("apple pie", "ok")
+    assert store.search_turns("apple").total == 1
+
+    real_append = HistorySearchIndex.append
+
+    def failing_append(self, *args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(HistorySearchIndex, "append", failing_append)
+    store.save_turn("banana split", "ok")
+    monkeypatch.setattr(HistorySearchIndex, "append", real_append)
+    for word in ("cherry", "damson"):
+        store.save_turn(f"{word} tart", "ok")
+
+    for word in ("apple", "banana", "cherry", "damson"):
+        result = store.search_turns(word)
+        assert [t.user_text.split()[0] for t in result.turns] == [word]
+    assert not store._search_stale
+
+
+def test_user_story_61_torn_write_does_not_shift_results(
+    tmp_path: Path, monkeypatch
+) -> None:
+    rebuilds: list[int] = []
+    real_rebuild = HistoryStore._rebuild_search_index
+
+    def counting_rebuild(self, total: int) -> None:
+        rebuilds.append(total)
+        real_rebuild(self, total)
+
+    monkeypatch.setattr(HistoryStore, "_rebuild_search_index", counting_rebuild)
+    path = tmp_path / "history.jsonl"
+    store = HistoryStore(path, max_turns=50)
+    for word in ("apple", "banana"):
+        store.save_turn(f"{word} pie", "ok")
+    # A process died between the user and assistant lines of a turn.
+    with path.open("a", encoding="utf-8") as f:
+        rec = {"ts": "2026-10-01T00:00:00+00:00", "role": "user", "content": "lost"}
+        f.write(json.dumps(rec) + "\n\n")
+    for word in ("cherry", "damson"):
+        store.save_turn(f"{word} pie", "ok")
+
+    for fresh in (False, True):
+        if fresh:
+            (tmp_path / "history.jsonl.search").unlink()
+            store = HistoryStore(path, max_turns=50)
+        for word in ("apple", "banana", "cherry", "damson"):
+            result = store.search_turns(word)
+            assert [t.user_text for t in result.turns] == [f"{word} pie"]
+        assert store.search_turns("lost").total == 0
+        assert store.search_turns("pie").total == 4
+        assert not store._search_stale
+        # The log lines up with the turns, only a missing log is rebuilt.
+        assert rebuilds == ([4] if fresh else [])
+
+
+def test_user_story_61_out_of_step_log_is_caught_at_read(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl", max_turns=50)
+    for word in ("apple", "banana", "cherry"):
+        store.save_turn(f"{word} pie", "ok")
+    search_log = tmp_path / "history.jsonl.search"
+    lines = search_log.read_text(encoding="utf-8").splitlines(keepends=True)
+    # Same count and last timestamp, but the terms sit one turn too late.
+    heads = [line.split("\t")[:2] for line in lines]
+    terms = ["ok", lines[0].split("\t")[2], lines[1].split("\t")[2]]
+    search_log.write_text(
+        "".join(f"{i}\t{ts}\t{t.strip()}\n" for (i, ts), t in zip(heads, terms)),
+        encoding="utf-8",
+    )
+    result = store.search_turns("apple")
+    assert [t.user_text for t in result.turns] == ["apple pie"]
+    assert result.total == 1
+
+
+def test_user_story_61_engine_answers_search(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl", max_turns=50)
+    engine = ChatEngine(history=store, interaction_log=FakeInteractionLog())
+    engine.process_turn("What is Python?")
+    engine.process_turn("hello")
+
+    reply = engine.process_turn("history search python")
+    assert reply.startswith('Found 1 saved turns matching "python":')
+    assert "user: What is Python?" in reply
+    assert "What is Python?" in engine.process_turn("history search intent:question")
+    assert engine.process_turn("history search kangaroo") == (
+        'No saved turns match "kangaroo".'
+    )
+    assert engine.process_turn("history search").startswith("Type history search")
+
+
+def test_user_story_61_search_is_faster_than_a_scan(tmp_path: Path) -> None:
+    out = tmp_path / "search.json"
+    assert bench.main(["--sizes", "2000", "--calls", "40", "--out", str(out)]) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    scan = cases["history_2000_linear_scan"]["p50_us"]
+    assert cases["history_2000_rare"]["p50_us"] * 5 < scan
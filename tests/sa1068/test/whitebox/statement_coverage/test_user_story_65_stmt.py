@@ -0,0 +1,122 @@
+# Test file for User Story 65
+# Testing Type: whitebox
+# Technique: statement_coverage
+# Team Member: sa1068
+# Original file: test_user_story_65.py
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import json
+import pickle
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from vca.bench import session_memory as bench
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.session import ClarificationState, ConversationSession, Message
+from vca.domain.timestamps import datetime_to_ns, iso_to_ns, ns_to_datetime, ns_to_iso
+
+
+def test_user_story_65_objects_are_slotted() -> None:
+    for obj in (
+        Message("user", "hi"),
+        ClarificationState("x", ["a"]),
+        ChatTurn("hi", "hello"),
+    ):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        Message("user", "hi").content = "changed"  # type: ignore[misc]
+
+
+def test_user_story_65_message_times_are_lazy_datetimes() -> None:
+    before = time.time_ns()
+    message = Message("user", "hi")
+    assert isinstance(message.created_ns, int)
+    assert before <= message.created_ns <= time.time_ns()
+    assert message.created_at.tzinfo == timezone.utc
+    assert datetime_to_ns(message.created_at) == message.created_ns // 1000 * 1000
+
+    session = ConversationSession()
+    session.set_pending_clarification("what?", ["Question", "question", ""])
+    state = session.pending_clarification
+    assert state is not None and state.options == ["question"]
+    assert ns_to_datetime(state.created_ns) == state.created_at
+
+
+def test_user_story_65_constructors_still_take_created_at() -> None:
+    at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    for message in (
+        Message("user", "hi", created_at=at),
+        Message(role="user", content="hi", created_at=at),
+        Message("user", "hi", at),
+    ):
+        assert message.created_at == at
+        assert message.created_ns == datetime_to_ns(at)
+    assert Message("user", "hi", created_at=at) == Message("user", "hi", at)
+    state = ClarificationState("what?", ["help"], created_at=at, attempts=1)
+    assert (state.created_at, state.attempts) == (at, 1)
+    assert ClarificationState("what?", ["help"], at).created_at == at
+    assert dataclasses.replace(state, attempts=2).created_at == at
+    with pytest.raises(TypeError):
+        Message("user", "hi", 5, created_at=at)
+
+
+def test_user_story_65_timestamp_conversions() -> None:
+    naive = datetime(2026, 1, 2, 3, 4, 5, 678901)
+    ns = datetime_to_ns(naive)
+    assert ns_to_datetime(ns) == naive.replace(tzinfo=timezone.utc)
+    assert ns_to_iso(ns) == "2026-01-02T03:04:05.678901+00:00"
+    assert iso_to_ns("2026-01-02T03:04:05.678901+00:00") == ns
+    assert iso_to_ns("2026-01-02T03:04:05+00:00") == ns // 10**9 * 10**9
+    for text in ("t1", "2026-01-02T03:04:05Z", "2026-01-02T03:04:05+02:00"):
+        assert iso_to_ns(text) is None
+
+
+def test_user_story_65_chat_turn_keeps_iso_attributes() -> None:
+    turn = ChatTurn("hi", "hello", "2026-01-02T03:04:05+00:00", "t2", intent="greeting")
+    assert turn.user_ts == "2026-01-02T03:04:05+00:00"
+    assert turn.user_ns == iso_to_ns("2026-01-02T03:04:05+00:00")
+    assert (turn.assistant_ts, turn.assistant_ns) == ("t2", None)
+    assert ChatTurn.from_dict(turn.to_dict()) == turn
+    assert turn == ChatTurn("hi", "hello", turn.user_ns, "t2", "greeting")
+    assert ChatTurn("a", "b").user_ts is None
+
+
+def test_user_story_65_chat_turn_works_with_dataclass_helpers() -> None:
+    stamp = "2024-05-06T07:08:09+00:00"
+    turn = ChatTurn("hi", "hello", stamp, "2024-05-06T07:08:10Z", "greeting")
+    assert dataclasses.asdict(turn) == {
+        "user_text": "hi",
+        "assistant_text": "hello",
+        "user_ts": stamp,
+        "assistant_ts": "2024-05-06T07:08:10Z",
+        "intent": "greeting",
+        "confidence": None,
+        "rule": None,
+    }
+    changed = dataclasses.replace(turn, intent="thanks")
+    assert changed.intent == "thanks" and changed.user_ts == stamp
+    assert changed.user_ns == turn.user_ns == iso_to_ns(stamp)
+    assert dataclasses.replace(turn) == turn
+    assert copy.copy(turn) == turn and hash(copy.deepcopy(turn)) == hash(turn)
+    assert pickle.loads(pickle.dumps(turn)) == turn
+    assert [f.name for f in dataclasses.fields(ChatTurn)][2:4] == [
+        "user_ts",
+        "assistant_ts",
+    ]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        turn.user_ts = stamp  # type: ignore[misc]
+
+
+def test_user_story_65_benchmark_reports_bytes_per_session(tmp_path: Path) -> None:
+    out = tmp_path / "memory.json"
+    assert bench.main(["--sessions", "2", "--turns", "50", "--out", str(out)]) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    ring = cases["session_ring"]
+    assert ring["messages"] == 100 and ring["turns"] == 50
+    assert ring["bytes_per_session"] < cases["session_legacy"]["bytes_per_session"]
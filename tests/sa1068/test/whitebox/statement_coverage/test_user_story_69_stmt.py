@@ -0,0 +1,157 @@
+# Test file for User Story 69
+# Testing Type: whitebox
+# Technique: statement_coverage
+# Team Member: sa1068
+# Original file: test_user_story_69.py
+
+from __future__ import annotations
+
+import json
+import marshal
+from pathlib import Path
+
+import pytest
+
+from helpers import FakeHistory, FakeInteractionLog
+from vca.bench import session_resume as bench
+from vca.core.engine import ChatEngine
+from vca.domain.chat_turn import ChatTurn
+from vca.domain.memory_budget import MemoryBudget
+from vca.domain.session import ConversationSession
+from vca.storage.history_store import HistoryStore
+from vca.storage import session_snapshot as snapshots
+
+
+def _view(session: ConversationSession) -> list[tuple]:
+    return [(m.role, m.content, m.topic, m.intent) for m in session.messages]
+
+
+def _engine(tmp_path: Path, **kwargs) -> ChatEngine:
+    return ChatEngine(
+        history=HistoryStore(path=tmp_path / "history.jsonl"),
+        interaction_log=FakeInteractionLog(),
+        snapshot_path=tmp_path / "session.snapshot",
+        **kwargs,
+    )
+
+
+def test_user_story_69_state_round_trip() -> None:
+    session = ConversationSession()
+    session.add_message("user", "tell me about Python")
+    session.add_message("assistant", "Python is a language.", "question")
+    session.add_assistant_message("Did you mean help or exit?")
+    session.add_turn(ChatTurn("hi", "hello", "2024-01-01T00:00:00+00:00"))
+    session.add_message("user", "still waiting")
+    session.set_pending_clarification("help me and exit", ["help", "exit"])
+
+    state = marshal.loads(marshal.dumps(session.snapshot_state()))
+    restored = ConversationSession()
+    restored.restore_state(state)
+
+    assert _view(restored) == _view(session)
+    assert list(restored.turns) == list(session.turns)
+    assert restored.turns[-1].user_ts == "2024-01-01T00:00:00+00:00"
+    assert restored.stats.to_dict() == session.stats.to_dict()
+    assert restored.pending_clarification == session.pending_clarification
+    assert restored.session_id == session.session_id
+    assert restored.started_at == session.started_at
+    assert restored.retained_bytes == session.retained_bytes
+
+
+def test_user_story_69_restore_applies_own_limits() -> None:
+    session = ConversationSession()
+    for i in range(6):
+        session.add_message("user", f"question {i}")
+        session.add_message("assistant", f"answer {i}")
+    budget = MemoryBudget(1 << 20)
+    small = ConversationSession(max_turns=2, budget=budget)
+    small.restore_state(session.snapshot_state())
+    assert [t.user_text for t in small.turns] == ["question 4", "question 5"]
+    assert len(small.messages) == 12
+    assert budget.used_bytes == small.retained_bytes > 0
+
+
+def test_user_story_69_malformed_state_is_rejected() -> None:
+    session = ConversationSession()
+    session.add_message("user", "hello")
+    session.add_message("assistant", "hi")
+    good = session.snapshot_state()
+    target = ConversationSession()
+    for bad in (
+        (),
+        good[:2] + ((),) + good[3:],
+        good[:8] + (5,) + good[9:],
+        good[:2] + ((("too", "short"),),) + good[3:],
+    ):
+        with pytest.raises((TypeError, ValueError)):
+            target.restore_state(bad)
+        assert len(target.messages) == 0 and target.retained_bytes == 0
+
+
+def test_user_story_69_engine_resumes_from_snapshot(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    for text in ("hello", "what is python?", "thanks"):
+        engine.process_turn(text)
+    engine.process_turn("help me and exit")
+    before = _view(engine.session)
+    engine.shutdown()
+    assert (tmp_path / "session.snapshot").exists()
+
+    resumed = _engine(tmp_path)
+    assert _view(resumed.session) == before
+    assert resumed.loaded_turns_count == 3
+    assert resumed.session.pending_clarification is not None
+    assert resumed.process_turn("help").startswith("Commands:")
+
+
+def test_user_story_69_stale_or_damaged_snapshot_replays(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    engine.process_turn("hello")
+    engine.process_turn("help me and exit")
+    engine.shutdown()
+    snapshot = tmp_path / "session.snapshot"
+    data = snapshot.read_bytes()
+
+    # History changed after the snapshot was written.
+    HistoryStore(path=tmp_path / "history.jsonl").save_turn("late", "turn")
+    stale = _engine(tmp_path)
+    assert stale.session.turns[-1].user_text == "late"
+    assert stale.session.pending_clarification is None
+
+    signature = snapshots.history_signature(tmp_path / "history.jsonl")
+    assert snapshots.read_snapshot(snapshot, signature, 500) is None
+    snapshot.write_bytes(data[:-1] + bytes([data[-1] ^ 0xFF]))
+    assert snapshots.read_snapshot(snapshot, signature, 500) is None
+    snapshot.write_bytes(data[:10])
+    assert snapshots.read_snapshot(snapshot, signature, 500) is None
+    snapshot.write_bytes(b"not a snapshot" + data)
+    assert snapshots.read_snapshot(snapshot, signature, 500) is None
+    assert snapshots.read_snapshot(tmp_path / "missing", signature, 500) is None
+
+
+def test_user_story_69_snapshot_file_format(tmp_path: Path) -> None:
+    path = tmp_path / "s.snapshot"
+    assert snapshots.history_signature(None) is None
+    assert snapshots.history_signature(tmp_path / "missing") is None
+    assert snapshots.write_snapshot(path, (10, 20), 5, ("state",))
+    assert path.read_bytes()[:8] == snapshots.MAGIC
+    assert snapshots.read_snapshot(path, (10, 20), 5) == ("state",)
+    assert snapshots.read_snapshot(path, (10, 20), 6) is None
+    assert snapshots.read_snapshot(path, (10, 21), 5) is None
+    assert not snapshots.write_snapshot(path, None, 5, (object(),))
+
+
+def test_user_story_69_snapshots_are_opt_in() -> None:
+    engine = ChatEngine(history=FakeHistory(), interaction_log=FakeInteractionLog())
+    engine.process_turn("hello")
+    engine.shutdown()
+    assert engine._snapshot_path is None
+    assert engine.session.turns[-1].user_text == "hello"
+
+
+def test_user_story_69_benchmark_reports_both_paths(tmp_path: Path) -> None:
+    out = tmp_path / "resume.json"
+    assert bench.main(["--sizes", "20", "--calls", "3", "--out", str(out)]) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    assert cases["resume_20_replay"]["turns"] == 20
+    assert cases["resume_20_snapshot"]["turns"] == 20
@@ -0,0 +1,156 @@
+# Test file for User Story 73
+# Testing Type: whitebox
+# Technique: statement_coverage
+# Team Member: sa1068
+# Original file: test_user_story_73.py
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from helpers import FakeInteractionLog
+from vca.bench import sharded_history as bench
+from vca.core.session_registry import SessionRegistry
+from vca.storage.sharded_history import (
+    MANIFEST_NAME,
+    ShardedHistoryStore,
+    session_key,
+    session_path,
+)
+
+
+def test_user_story_73_turns_go_to_their_own_shard(tmp_path: Path) -> None:
+    store = ShardedHistoryStore(tmp_path)
+    assert store.root == tmp_path
+    store.save_turn("alice", "hi", "hello alice", intent="greeting")
+    store.save_turn("bob", "hi", "hello bob")
+    store.save_turn("alice", "bye", "goodbye")
+
+    alice = store.load_turns("alice")
+    assert [t.assistant_text for t in alice] == ["hello alice", "goodbye"]
+    assert alice[0].intent == "greeting"
+    assert [t.assistant_text for t in store.load_turns("bob")] == ["hello bob"]
+    assert store.load_turns("alice", max_turns=1)[0].user_text == "bye"
+
+    key = session_key("alice")
+    assert store.shard_path("alice") == tmp_path / key[:2] / f"{key}.jsonl"
+    assert store.shard_path("alice") == session_path(tmp_path, "alice", ".jsonl")
+    assert store.shard("alice").path.exists()
+    assert not (tmp_path / "history.jsonl").exists()
+
+
+def test_user_story_73_manifest_lists_shards(tmp_path: Path) -> None:
+    store = ShardedHistoryStore(tmp_path)
+    assert store.shards() == {}
+    store.save_turn("alice", "hi", "hello")
+    store.save_turn("bob", "hi", "hello")
+    store.save_turn("alice", "again", "hello")
+
+    shards = store.shards()
+    assert list(shards) == ["alice", "bob"]
+    assert shards["bob"].path == store.shard_path("bob")
+    assert shards["bob"].created
+    assert store.manifest_path == tmp_path / MANIFEST_NAME
+    assert len(store.manifest_path.read_text().splitlines()) == 2
+
+    # A new store on the same root finds the existing files and the manifest.
+    reopened = ShardedHistoryStore(tmp_path)
+    assert len(reopened.load_turns("alice")) == 2
+    assert len(store.manifest_path.read_text().splitlines()) == 2
+
+    # Damaged lines are skipped and a repeated shard keeps its last line.
+    with store.manifest_path.open("a", encoding="utf-8") as f:
+        f.write("not json\n")
+        f.write(json.dumps({"session": "bob", "path": "x/y.jsonl"}) + "\n")
+        f.write(json.dumps({"path": "no/session.jsonl"}) + "\n")
+    shards = reopened.shards()
+    assert list(shards) == ["alice", "bob"]
+    assert shards["bob"].path == tmp_path / "x" / "y.jsonl"
+    assert shards["bob"].created == ""
+
+
+def test_user_story_73_open_shards_are_bounded(tmp_path: Path) -> None:
+    store = ShardedHistoryStore(tmp_path, max_open=2, max_turns=3)
+    for i in range(5):
+        for j in range(4):
+            store.save_turn(f"s{i}", f"q{j}", f"a{j}")
+    assert len(store._open) == 2
+    assert [t.user_text for t in store.load_turns("s0")] == ["q1", "q2", "q3"]
+    assert len(store.shards()) == 5
+
+    store.clear_session("s0")
+    assert store.load_turns("s0") == []
+    assert not store.shard_path("s0").exists()
+    store.flush()
+    store.close()
+    assert len(store._open) == 0
+
+
+def test_user_story_73_reads_never_write_the_manifest(tmp_path: Path) -> None:
+    store = ShardedHistoryStore(tmp_path, max_open=1)
+    assert store.load_turns("ghost") == []
+    store.shard("ghost")
+    assert not store.manifest_path.exists()
+
+    store.save_turn("alice", "hi", "hello")
+    store.save_turn("alice", "again", "hello")
+    lines = store.manifest_path.read_text()
+    assert len(lines.splitlines()) == 1
+    # Reopening a shard after it was evicted, or from a new store, reads only.
+    for _ in range(3):
+        store.load_turns("bob")
+        store.load_turns("alice")
+        store.save_turn("alice", "more", "hello")
+    ShardedHistoryStore(tmp_path).load_turns("alice")
+    assert store.manifest_path.read_text() == lines
+    assert list(store.shards()) == ["alice"]
+
+
+def test_user_story_73_manifest_write_failure_is_not_fatal(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / MANIFEST_NAME).mkdir()
+    store = ShardedHistoryStore(root)
+    store.save_turn("alice", "hi", "hello")
+    assert len(store.load_turns("alice")) == 1
+    assert store.shards() == {}
+
+
+def test_user_story_73_writers_of_different_sessions_lose_nothing(
+    tmp_path: Path,
+) -> None:
+    store = ShardedHistoryStore(tmp_path)
+    ids = [f"user-{i}" for i in range(8)]
+
+    def work(session_id: str) -> None:
+        for i in range(40):
+            store.save_turn(session_id, f"q{i}", f"a{i}")
+
+    threads = [threading.Thread(target=work, args=(s,)) for s in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(len(store.load_turns(s)) == 40 for s in ids)
+    assert sorted(store.shards()) == sorted(ids)
+
+
+def test_user_story_73_registry_uses_shards(tmp_path: Path) -> None:
+    registry = SessionRegistry(tmp_path, interaction_log=FakeInteractionLog())
+    registry.process_turn("alice", "hello")
+    registry.process_turn("bob", "hello")
+    registry.close()
+    store = ShardedHistoryStore(tmp_path)
+    assert sorted(store.shards()) == ["alice", "bob"]
+    assert len(store.load_turns("alice")) == 1
+
+
+def test_user_story_73_benchmark_runs(tmp_path: Path) -> None:
+    out = tmp_path / "sharded.json"
+    assert bench.main(["--workers", "2", "--turns", "5", "--out", str(out)]) == 0
+    cases = {c["case"]: c for c in json.loads(out.read_text())["cases"]}
+    assert cases["writers_2_sharded"]["turns_saved"] == 10
+    assert cases["writers_2_sharded"]["turns_lost"] == 0
+    assert cases["writers_2_shared"]["calls"] == 10